@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Report the top import costs of claude-mpm CLI commands.
+
+Each command is measured in a fresh interpreter with ``python -X importtime``,
+up to the point where its handler would run.
+
+Usage:
+    python scripts/import_cost_report.py                 # every command
+    python scripts/import_cost_report.py run doctor -n 5  # selected commands
+"""
+
+import argparse
+
+from claude_mpm.cli.import_costs import format_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "commands", nargs="*", help="Commands to measure (default: all)"
+    )
+    parser.add_argument(
+        "-n", "--limit", type=int, default=10, help="Modules listed per command"
+    )
+    args = parser.parse_args()
+    print(format_report(args.commands or None, limit=args.limit))
+
+
+if __name__ == "__main__":
+    main()
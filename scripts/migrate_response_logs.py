@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Migrate per-response JSON logs to the segmented response log.
+
+Moves the one-file-per-response layout (``*.json`` / ``*.json.gz`` in the
+response directory) into per-session JSONL segments with a sidecar index,
+the layout written with ``response_logging.format: segmented``. Migrated
+files are deleted unless ``--keep`` is given; unreadable files are left in
+place.
+
+Usage:
+    python scripts/migrate_response_logs.py [--dry-run] [--responses-dir PATH]
+
+Examples:
+    # Preview migration without making changes
+    python scripts/migrate_response_logs.py --dry-run
+
+    # Migrate the project's response logs into compressed segments
+    python scripts/migrate_response_logs.py --compress
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from claude_mpm.services.response_log import migrate_legacy_responses
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Migrate per-response JSON logs to the segmented response log",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Preview migration
+  %(prog)s --dry-run
+
+  # Migrate and keep the original files
+  %(prog)s --keep
+        """,
+    )
+
+    parser.add_argument(
+        "--responses-dir",
+        type=Path,
+        default=Path(".claude-mpm") / "responses",
+        help="Response directory (default: .claude-mpm/responses)",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip-compressed segments",
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep the per-response files after migrating them",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count the files that would be migrated without making changes",
+    )
+
+    args = parser.parse_args()
+
+    if not args.responses_dir.is_dir():
+        logger.error(f"Response directory not found: {args.responses_dir}")
+        return 1
+
+    result = migrate_legacy_responses(
+        args.responses_dir,
+        compress=args.compress,
+        remove=not args.keep,
+        dry_run=args.dry_run,
+    )
+
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    logger.info(f"{verb} {result['migrated']} response files")
+    if not args.dry_run:
+        logger.info(f"Segments created: {result['segments_created']}")
+    if result["failed"]:
+        logger.warning(f"Unreadable files left in place: {result['failed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..constants import CLICommands
+from ..core import tracing
 from ..utils.progress import ProgressBar, StartupProgressBar
 from .executor import ensure_run_attributes, execute_command
 
@@ -46,11 +47,16 @@ else:
 
 def main(argv: list | None = None):
     """Main CLI entry point orchestrating argument parsing and command execution."""
+    tracing.enable_from_env("claude-mpm")
     argv = setup_early_environment(argv)
 
-    parser = create_parser(version=__version__)
-    processed_argv = preprocess_args(argv)
-    args = parser.parse_args(processed_argv)
+    # Only the requested command's parser (and modules) are loaded
+    with tracing.span("cli.parse", "startup"):
+        processed_argv = preprocess_args(argv)
+        parser = create_parser(version=__version__, argv=processed_argv)
+        args = parser.parse_args(processed_argv)
+    if getattr(args, "trace_profile", False):
+        tracing.enable("claude-mpm")
 
     # Configuration prompt removed - users can run `/mpm-configure` manually
     # See: handle_missing_configuration() in helpers.py if re-enabling
@@ -214,7 +220,8 @@ def main(argv: list | None = None):
         ensure_run_attributes(args)
 
     try:
-        return execute_command(args.command, args)
+        with tracing.span(f"command.{args.command}", "command"):
+            return execute_command(args.command, args)
     except KeyboardInterrupt:
         logger.info("Session interrupted by user")
         return 0
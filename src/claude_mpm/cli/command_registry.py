@@ -0,0 +1,394 @@
+"""
+Lazy command registry for the claude-mpm CLI.
+
+WHY: ``claude_mpm.cli.main`` used to import every command module (through
+``cli/commands/__init__.py`` and the executor) and build every subparser
+before it knew which subcommand was requested. For ``claude-mpm`` itself or
+``claude-mpm doctor`` that meant loading agent builders, memory services,
+Socket.IO and TUI code that the command never touches, roughly two seconds
+of imports on every invocation.
+
+DESIGN DECISIONS:
+- Each subcommand declares where its parser builder and handler live as
+  ``"module:attribute"`` strings (relative to ``claude_mpm.cli``). Nothing is
+  imported until a command is selected, so ``COMMANDS`` doubles as the
+  import manifest of each command.
+- ``select_commands()`` finds the subcommand in argv without argparse: it
+  skips top-level options and their values and returns the first
+  positional. Only that command's parser is built. Help requests and
+  unknown commands still build every parser so ``--help`` lists all
+  commands and typos get "did you mean" suggestions.
+- Handlers are resolved and called through ``load_handler()`` only for the
+  command being executed. Class-based commands declare the method that
+  returns a ``CommandResult``.
+- Registry order is the order commands appear in ``--help``.
+"""
+
+import argparse
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+PACKAGE = "claude_mpm.cli"
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """Where a subcommand's parser builder and handler live.
+
+    Attributes:
+        name: Command name as dispatched by the executor
+        parser: ``"module:function"`` adding the subparser(s), or None
+        handler: ``"module:attribute"`` executing the command, or None
+        aliases: Other names the parser builder registers
+        method: For class handlers, the method returning a CommandResult
+    """
+
+    name: str
+    parser: str | None = None
+    handler: str | None = None
+    aliases: tuple[str, ...] = ()
+    method: str | None = None
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return (self.name, *self.aliases)
+
+    @property
+    def modules(self) -> list[str]:
+        """Fully qualified modules imported when this command runs."""
+        modules = []
+        for target in (self.parser, self.handler):
+            if target:
+                module = f"{PACKAGE}.{target.split(':')[0]}"
+                if module not in modules:
+                    modules.append(module)
+        return modules
+
+
+COMMANDS: tuple[CommandSpec, ...] = (
+    CommandSpec(
+        "run", "parsers.run_parser:add_run_subparser", "commands.run:run_session"
+    ),
+    CommandSpec(
+        "tickets",
+        "parsers.tickets_parser:add_tickets_subparser",
+        "commands.tickets:manage_tickets",
+    ),
+    CommandSpec(
+        "agents",
+        "parsers.agents_parser:add_agents_subparser",
+        "commands.agents:manage_agents",
+    ),
+    CommandSpec("source", "parsers.source_parser:add_source_subparser"),
+    CommandSpec(
+        "skill-source",
+        "parsers.skill_source_parser:add_skill_source_subparser",
+        "commands.skill_source:skill_source_command",
+    ),
+    CommandSpec(
+        "agent-source",
+        "parsers.agent_source_parser:add_agent_source_subparser",
+        "commands.agent_source:agent_source_command",
+    ),
+    CommandSpec(
+        "auto-configure",
+        "parsers.auto_configure_parser:add_auto_configure_subparser",
+        "commands.auto_configure:AutoConfigureCommand",
+        method="run",
+    ),
+    CommandSpec(
+        "memory",
+        "parsers.memory_parser:add_memory_subparser",
+        "commands.memory:manage_memory",
+    ),
+    CommandSpec(
+        "skills",
+        "parsers.skills_parser:add_skills_subparser",
+        "commands.skills:manage_skills",
+    ),
+    CommandSpec(
+        "message",
+        "parsers.messages_parser:add_messages_subparser",
+        "commands.messages:manage_messages",
+    ),
+    CommandSpec(
+        "queue",
+        "parsers.queue_parser:add_queue_subparser",
+        "commands.message_queue:message_queue",
+    ),
+    CommandSpec(
+        "config",
+        "parsers.config_parser:add_config_subparser",
+        "commands.config:manage_config",
+    ),
+    CommandSpec(
+        "profile",
+        "parsers.profile_parser:add_profile_subparser",
+        "commands.profile:ProfileCommand",
+        method="run",
+    ),
+    CommandSpec(
+        "monitor",
+        "parsers.monitor_parser:add_monitor_subparser",
+        "commands.monitor:manage_monitor",
+    ),
+    CommandSpec(
+        "dashboard",
+        "parsers.dashboard_parser:add_dashboard_subparser",
+        "commands.dashboard:manage_dashboard",
+    ),
+    CommandSpec(
+        "local-deploy",
+        "parsers.local_deploy_parser:add_local_deploy_arguments",
+        "commands.local_deploy:LocalDeployCommand",
+        method="run",
+    ),
+    CommandSpec(
+        "mcp", "parsers.mcp_parser:add_mcp_subparser", "commands.mcp:manage_mcp"
+    ),
+    CommandSpec(
+        "agent-manager",
+        "parsers.agent_manager_parser:add_agent_manager_subparser",
+        "commands.agent_manager:manage_agent_manager",
+    ),
+    CommandSpec(
+        "configure",
+        "parsers.configure_parser:add_configure_subparser",
+        "commands.configure:manage_configure",
+    ),
+    CommandSpec(
+        "oauth",
+        "parsers.oauth_parser:add_oauth_subparser",
+        "commands.oauth:manage_oauth",
+    ),
+    CommandSpec(
+        "auth", "parsers.auth_parser:add_auth_subparser", "commands.auth:manage_auth"
+    ),
+    CommandSpec(
+        "setup",
+        "parsers.setup_parser:add_setup_subparser",
+        "commands.setup:manage_setup",
+    ),
+    CommandSpec(
+        "install",
+        "parsers.install_parser:add_install_subparser",
+        "commands.install:manage_install",
+    ),
+    CommandSpec(
+        "slack",
+        "parsers.slack_parser:add_slack_subparser",
+        "commands.slack:manage_slack",
+    ),
+    CommandSpec(
+        "tools",
+        "parsers.tools_parser:add_tools_subparser",
+        "commands.tools:manage_tools",
+    ),
+    CommandSpec(
+        "provider",
+        "parsers.provider_parser:add_provider_subparser",
+        "commands.provider:manage_provider",
+    ),
+    CommandSpec(
+        "uninstall",
+        "commands.uninstall:add_uninstall_parser",
+        "commands.uninstall:UninstallCommand",
+        method="execute",
+    ),
+    CommandSpec(
+        "debug",
+        "parsers.debug_parser:add_debug_subparser",
+        "commands.debug:manage_debug",
+    ),
+    CommandSpec(
+        "analyze",
+        "parsers.analyze_parser:add_analyze_subparser",
+        aliases=("analysis", "code-analyze"),
+    ),
+    CommandSpec(
+        "analyze-code",
+        "parsers.analyze_code_parser:add_analyze_code_subparser",
+        "commands.analyze_code:manage_analyze_code",
+    ),
+    CommandSpec(
+        "mpm-init",
+        "parsers.mpm_init_parser:add_mpm_init_subparser",
+        "commands.mpm_init_handler:manage_mpm_init",
+    ),
+    CommandSpec(
+        "mpm-search",
+        "parsers.search_parser:add_search_subparser",
+        aliases=("search",),
+    ),
+    CommandSpec(
+        "channels",
+        "commands.channels:add_channels_subcommand",
+        "commands.channels:handle_channels_command",
+    ),
+    CommandSpec(
+        "serve",
+        "parsers.serve_parser:add_serve_subparser",
+        "commands.serve:manage_serve",
+    ),
+    CommandSpec(
+        "aggregate",
+        "commands.aggregate:add_aggregate_parser",
+        "commands.aggregate:aggregate_command",
+    ),
+    CommandSpec(
+        "cleanup-memory",
+        "commands.cleanup:add_cleanup_parser",
+        "commands.cleanup:cleanup_memory",
+        aliases=("cleanup", "clean"),
+    ),
+    CommandSpec("mcp-pipx-config", "commands.mcp_pipx_config:add_parser"),
+    CommandSpec(
+        "doctor",
+        "commands.doctor:add_doctor_parser",
+        "commands.doctor:run_doctor",
+        aliases=("diagnose", "check-health"),
+    ),
+    CommandSpec("gh", "commands.gh:add_gh_parser", "commands.gh:manage_gh"),
+    CommandSpec(
+        "postmortem",
+        "commands.postmortem:add_postmortem_parser",
+        aliases=("pm-analysis",),
+    ),
+    CommandSpec(
+        "upgrade",
+        "commands.upgrade:add_upgrade_parser",
+        "commands.upgrade:upgrade",
+    ),
+    CommandSpec(
+        "migrate",
+        "commands.migrate:add_migrate_parser",
+        "commands.migrate:manage_migrate",
+    ),
+    CommandSpec(
+        "verify", "commands.verify:add_parser", "commands.verify:handle_verify"
+    ),
+    CommandSpec(
+        "hook-errors",
+        "parsers.hook_errors_parser:add_hook_errors_subparser",
+        "executor:execute_hook_errors",
+    ),
+    CommandSpec(
+        "autotodos",
+        "parsers.autotodos_parser:add_autotodos_subparser",
+        "executor:execute_autotodos",
+    ),
+    CommandSpec(
+        "summarize",
+        "commands.summarize:add_summarize_parser",
+        "commands.summarize:summarize_command",
+    ),
+    # Commands without a parser, reachable through execute_command() only
+    CommandSpec("run-guarded", handler="commands.run_guarded:execute_run_guarded"),
+    CommandSpec("info", handler="commands.info:show_info"),
+)
+
+_BY_NAME: dict[str, CommandSpec] = {
+    name: spec for spec in COMMANDS for name in spec.names
+}
+
+HELP_FLAGS = ("-h", "--help")
+
+
+def get_command(name: str | None) -> CommandSpec | None:
+    """Look up a command by name or parser alias."""
+    return _BY_NAME.get(name) if name else None
+
+
+def _resolve(target: str) -> Any:
+    module_name, attribute = target.split(":")
+    module = importlib.import_module(f"{PACKAGE}.{module_name}")
+    return getattr(module, attribute)
+
+
+def load_parser_builder(spec: CommandSpec) -> Callable[[Any], Any]:
+    """Import the function adding *spec*'s subparser."""
+    return _resolve(spec.parser)
+
+
+def load_handler(spec: CommandSpec) -> Callable[[Any], int]:
+    """Import *spec*'s handler as a callable returning an exit code."""
+    handler = _resolve(spec.handler)
+    if spec.method is None:
+
+        def run_function(args) -> int:
+            result = handler(args)
+            # Commands may return None (success) or an exit code
+            return result if result is not None else 0
+
+        return run_function
+
+    def run_command(args) -> int:
+        result = getattr(handler(), spec.method)(args)
+        # Convert CommandResult to exit code
+        return result.exit_code if result else 0
+
+    return run_command
+
+
+def find_command_token(parser: argparse.ArgumentParser, argv: list[str]) -> str | None:
+    """Return the first positional argument of *argv*, if any.
+
+    Options of *parser* that take a value consume the following token, the
+    same way argparse does (``nargs='?'`` options consume it greedily).
+    """
+    options = {
+        option: action for action in parser._actions for option in action.option_strings
+    }
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if token == "--":
+            return None
+        if not token.startswith("-") or token == "-":
+            return token
+        action = options.get(token)
+        if action is not None and action.nargs != 0:
+            if action.nargs not in (None, "?"):
+                # Variadic top-level options make the position ambiguous
+                return None
+            has_value = index + 1 < len(argv) and (
+                action.nargs is None or not argv[index + 1].startswith("-")
+            )
+            if has_value:
+                index += 1
+        index += 1
+    return None
+
+
+def select_commands(
+    parser: argparse.ArgumentParser, argv: list[str] | None
+) -> tuple[CommandSpec, ...]:
+    """Commands whose parsers must be built to parse *argv*.
+
+    Args:
+        parser: Main parser with its top-level options already added
+        argv: Preprocessed arguments, or None when they are not known
+
+    Returns:
+        A single command when argv names one, no command for a bare
+        invocation, and every command for help, unknown commands or
+        unknown argv
+    """
+    if argv is None:
+        return COMMANDS
+    token = find_command_token(parser, argv)
+    if token is None:
+        if any(arg in HELP_FLAGS for arg in argv):
+            return COMMANDS
+        return ()
+    spec = get_command(token)
+    if spec is None or spec.parser is None:
+        return COMMANDS
+    return (spec,)
+
+
+def command_names() -> list[str]:
+    """Every name the CLI accepts, for suggestions."""
+    return list(_BY_NAME)
@@ -3,29 +3,39 @@ CLI commands for claude-mpm.
 
 WHY: This package contains individual command implementations, organized into
 separate modules for better maintainability and code organization.
+
+DESIGN DECISION: Exports are resolved lazily. Importing any command module
+imports this package first, so eager re-exports made every command load
+every other command's dependencies.
 """
 
-from .agent_manager import manage_agent_manager
-from .agents import manage_agents
-from .aggregate import aggregate_command
-from .analyze import analyze_command
-from .analyze_code import AnalyzeCodeCommand
-from .cleanup import cleanup_memory
-from .config import manage_config
-from .configure import manage_configure
-from .debug import manage_debug
-from .doctor import run_doctor
-from .gh import manage_gh
-from .info import show_info
-from .mcp import manage_mcp
-from .memory import manage_memory
-from .message_queue import message_queue
-from .messages import manage_messages
-from .monitor import manage_monitor
-from .postmortem import run_postmortem
-from .run import run_session
-from .skills import manage_skills
-from .tickets import list_tickets, manage_tickets
+from importlib import import_module
+
+# Dictionary mapping: name -> submodule defining it
+_LAZY_IMPORTS = {
+    "AnalyzeCodeCommand": "analyze_code",
+    "aggregate_command": "aggregate",
+    "analyze_command": "analyze",
+    "cleanup_memory": "cleanup",
+    "list_tickets": "tickets",
+    "manage_agent_manager": "agent_manager",
+    "manage_agents": "agents",
+    "manage_config": "config",
+    "manage_configure": "configure",
+    "manage_debug": "debug",
+    "manage_gh": "gh",
+    "manage_mcp": "mcp",
+    "manage_memory": "memory",
+    "manage_messages": "messages",
+    "manage_monitor": "monitor",
+    "manage_skills": "skills",
+    "manage_tickets": "tickets",
+    "message_queue": "message_queue",
+    "run_doctor": "doctor",
+    "run_postmortem": "postmortem",
+    "run_session": "run",
+    "show_info": "info",
+}
 
 __all__ = [
     "AnalyzeCodeCommand",
@@ -52,3 +62,11 @@ __all__ = [
     "run_session",
     "show_info",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import for command exports."""
+    if name in _LAZY_IMPORTS:
+        module = import_module(f"{__name__}.{_LAZY_IMPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
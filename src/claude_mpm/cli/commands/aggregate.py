@@ -12,6 +12,7 @@ DESIGN DECISIONS:
 - Support multiple output formats (json, yaml, table, text)
 """
 
+import argparse
 import json
 import sys
 
@@ -39,7 +40,16 @@ class AggregateCommand(BaseCommand):
         if not hasattr(args, "aggregate_subcommand") or not args.aggregate_subcommand:
             return "No aggregate subcommand specified"
 
-        valid_commands = ["start", "stop", "status", "sessions", "view", "export"]
+        valid_commands = [
+            "start",
+            "stop",
+            "status",
+            "sessions",
+            "view",
+            "export",
+            "migrate",
+            "query",
+        ]
         if args.aggregate_subcommand not in valid_commands:
             return f"Unknown aggregate command: {args.aggregate_subcommand}. Valid commands: {', '.join(valid_commands)}"
 
@@ -56,6 +66,8 @@ class AggregateCommand(BaseCommand):
                 "sessions": self._sessions_command,
                 "view": self._view_command,
                 "export": self._export_command,
+                "migrate": self._migrate_command,
+                "query": self._query_command,
             }
 
             if args.aggregate_subcommand in command_map:
@@ -99,6 +111,14 @@ class AggregateCommand(BaseCommand):
         """Export a session to a file."""
         return export_command_legacy(args)
 
+    def _migrate_command(self, args) -> int:
+        """Compress legacy session files and catalog them."""
+        return migrate_command_legacy(args)
+
+    def _query_command(self, args) -> int:
+        """Run a cross-session analytics query."""
+        return query_command_legacy(args)
+
 
 def aggregate_command(args):
     """
@@ -139,6 +159,10 @@ def aggregate_command_legacy(args):
         return view_command_legacy(args)
     if subcommand == "export":
         return export_command_legacy(args)
+    if subcommand == "migrate":
+        return migrate_command_legacy(args)
+    if subcommand == "query":
+        return query_command_legacy(args)
     print(f"Unknown subcommand: {subcommand}", file=sys.stderr)
     return 1
 
@@ -454,6 +478,87 @@ def export_command_legacy(args):
     return 0
 
 
+def migrate_command_legacy(args):
+    """Compress plain-JSON session files and add them to the session catalog.
+
+    WHY: Sessions saved before compression was introduced stay readable, but
+    migrating them reclaims disk space and makes listing them instant.
+    """
+    aggregator = get_aggregator()
+    stats = aggregator.migrate_sessions()
+
+    if not stats["migrated"] and not stats["failed"]:
+        print("No uncompressed sessions to migrate")
+        return 0
+
+    print(f"Migrated {stats['migrated']} session(s)")
+    if stats["bytes_before"]:
+        saved = 100 * (1 - stats["bytes_after"] / stats["bytes_before"])
+        print(
+            f"  {stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes "
+            f"({saved:.0f}% smaller)"
+        )
+    if stats["failed"]:
+        print(f"  {stats['failed']} file(s) could not be migrated", file=sys.stderr)
+        return 1
+    return 0
+
+
+def query_command_legacy(args):
+    """Aggregate captured sessions, e.g. p95 tool duration by agent.
+
+    WHY: Answers questions across many sessions that view/export cannot,
+    using the analytics store populated as sessions are saved.
+    """
+    filters = {}
+    for condition in args.where or []:
+        column, sep, value = condition.partition("=")
+        if not sep:
+            print(f"Invalid --where {condition!r}; use column=value", file=sys.stderr)
+            return 1
+        filters[column.strip()] = value.strip()
+
+    group_by = [
+        column.strip()
+        for spec in args.group_by or []
+        for column in spec.split(",")
+        if column.strip()
+    ]
+
+    aggregator = get_aggregator()
+    try:
+        rows = aggregator.query_sessions(
+            table=args.table,
+            metrics=args.metric or ["count"],
+            group_by=group_by,
+            since_days=args.since,
+            filters=filters,
+            limit=args.limit,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+
+    if not rows:
+        print("No matching sessions")
+        return 0
+
+    headers = list(rows[0])
+    cells = [["-" if row[h] is None else str(row[h]) for h in headers] for row in rows]
+    widths = [
+        max(len(h), *(len(line[i]) for line in cells)) for i, h in enumerate(headers)
+    ]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths, strict=True)))
+    print("  ".join("-" * w for w in widths))
+    for line in cells:
+        print("  ".join(c.ljust(w) for c, w in zip(line, widths, strict=True)))
+    return 0
+
+
 def add_aggregate_parser(subparsers):
     """Add the aggregate command parser.
 
@@ -536,4 +641,57 @@ def add_aggregate_parser(subparsers):
         help="Export format (default: json)",
     )
 
+    # Migrate command
+    aggregate_subparsers.add_parser(
+        "migrate",
+        help="Compress legacy session files and add them to the session catalog",
+    )
+
+    # Query command
+    query_parser = aggregate_subparsers.add_parser(
+        "query",
+        help="Aggregate metrics across captured sessions",
+        description=(
+            "Examples:\n"
+            "  aggregate query --metric p95:duration_ms --group-by agent --since 30\n"
+            "  aggregate query --table delegations --group-by project,session_id"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    query_parser.add_argument(
+        "--table",
+        "-t",
+        choices=["sessions", "events", "tools", "delegations"],
+        default="tools",
+        help="Table to aggregate (default: tools)",
+    )
+    query_parser.add_argument(
+        "--metric",
+        "-m",
+        action="append",
+        help=(
+            "Metric to compute; repeatable. count, sum:<col>, avg:<col>, "
+            "min:<col>, max:<col> or p<N>:<col> (default: count)"
+        ),
+    )
+    query_parser.add_argument(
+        "--group-by",
+        "-g",
+        action="append",
+        help="Column(s) to group by, comma separated (e.g. agent,tool)",
+    )
+    query_parser.add_argument(
+        "--since", type=float, help="Only include the last N days"
+    )
+    query_parser.add_argument(
+        "--where",
+        "-w",
+        action="append",
+        help="Exact-match filter column=value; repeatable",
+    )
+    query_parser.add_argument("--limit", "-l", type=int, help="Maximum rows to show")
+    query_parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON"
+    )
+
     aggregate_parser.set_defaults(func=aggregate_command)
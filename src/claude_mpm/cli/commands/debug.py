@@ -7,6 +7,7 @@ This module provides comprehensive debugging tools for developers, including:
 - Hook system debugging (list, trace, performance)
 - Cache inspection and management
 - Performance profiling and analysis
+- Summaries of recorded startup/hook traces
 - SocketIO event monitoring
 """
 
@@ -52,6 +53,8 @@ def manage_debug(args):
         return debug_cache(args, logger)
     if args.debug_command == "performance":
         return debug_performance(args, logger)
+    if args.debug_command == "profile":
+        return debug_profile(args, logger)
     logger.error(f"Unknown debug command: {args.debug_command}")
     return 1
 
@@ -1025,6 +1028,57 @@ def debug_performance(args, logger):
 
 
 # Helper functions for profiling
+def debug_profile(args, logger):
+    """
+    Summarize the slowest spans of the last traced runs.
+
+    Args:
+        args: Parsed command-line arguments
+        logger: Logger instance
+
+    Returns:
+        int: Exit code
+    """
+    from ...core import tracing
+
+    try:
+        traces = tracing.load_traces(args.runs, process=args.process)
+        rows = tracing.summarize_spans(traces, args.category)[: args.top]
+
+        if args.json:
+            print(
+                json.dumps(
+                    {"runs": [trace["path"] for trace in traces], "spans": rows},
+                    indent=2,
+                )
+            )
+            return 0
+
+        print("\n⏱️  Trace Profile:")
+        print("=" * 60)
+
+        if not traces:
+            print(f"\nNo traces found in {tracing.trace_dir()}")
+            print("Record one with 'claude-mpm --profile run' or CLAUDE_MPM_PROFILE=1")
+            return 0
+
+        print(f"\nSlowest spans over the last {len(traces)} traced run(s):\n")
+        print(f"{'max ms':>10} {'mean ms':>10} {'count':>6}  {'category':<10} span")
+        for row in rows:
+            print(
+                f"{row['max_ms']:>10.1f} {row['mean_ms']:>10.1f} "
+                f"{row['count']:>6}  {row['category']:<10} {row['name']}"
+            )
+
+        print(f"\nLatest trace: {traces[0]['path']}")
+        print("Open it in https://ui.perfetto.dev or chrome://tracing for the timeline")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Profile summary failed: {e}")
+        return 1
+
+
 def _profile_agent_load():
     """Profile agent loading operation."""
     from ...services.agents.deployment import AgentDeploymentService
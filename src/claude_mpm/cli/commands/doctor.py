@@ -75,6 +75,19 @@ def add_doctor_parser(subparsers):
         help="Run checks in parallel for faster execution",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and re-run every check",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Per-check timeout in seconds for --parallel (default: per-check)",
+    )
+
     parser.add_argument(
         "--no-color", action="store_true", help="Disable colored output"
     )
@@ -151,7 +164,12 @@ def doctor_command(args):
         output_format = "terminal"
 
     # Create diagnostic runner
-    runner = DiagnosticRunner(verbose=args.verbose, fix=args.fix)
+    runner = DiagnosticRunner(
+        verbose=args.verbose,
+        fix=args.fix,
+        use_cache=not args.no_cache,
+        check_timeout=args.timeout,
+    )
 
     # Run diagnostics
     try:
@@ -236,6 +254,8 @@ if __name__ == "__main__":
     parser.add_argument("--no-color", action="store_true")
     parser.add_argument("--checks", nargs="+")
     parser.add_argument("--parallel", action="store_true")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--timeout", type=float)
     parser.add_argument("--output", "-o", type=Path)
     parser.add_argument("--output-file", type=Path)
 
@@ -35,10 +35,10 @@ class TicketsCommand(BaseCommand):
         super().__init__("tickets")
 
         # Initialize services using dependency injection
-        self.crud_service = TicketCRUDService()
+        self.search_service = TicketSearchService()
+        self.crud_service = TicketCRUDService(search_service=self.search_service)
         self.formatter = TicketFormatterService()
         self.validator = TicketValidationService()
-        self.search_service = TicketSearchService()
         self.workflow_service = TicketWorkflowService()
 
     def validate_args(self, args) -> str | None:
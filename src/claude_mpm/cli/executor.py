@@ -7,31 +7,7 @@ This module handles command execution routing and argument preparation.
 Part of cli/__init__.py refactoring to reduce file size and improve modularity.
 """
 
-from ..constants import CLICommands
-from .commands import (
-    aggregate_command,
-    cleanup_memory,
-    manage_agent_manager,
-    manage_agents,
-    manage_configure,
-    manage_debug,
-    manage_gh,
-    manage_mcp,
-    manage_memory,
-    manage_messages,
-    manage_monitor,
-    manage_tickets,
-    message_queue,
-    run_doctor,
-    run_session,
-    show_info,
-)
-from .commands.analyze_code import manage_analyze_code
-from .commands.config import manage_config
-from .commands.dashboard import manage_dashboard
-from .commands.migrate import manage_migrate
-from .commands.skills import manage_skills
-from .commands.upgrade import upgrade
+from .command_registry import command_names, get_command, load_handler
 
 
 def ensure_run_attributes(args):
@@ -78,365 +54,203 @@ def ensure_run_attributes(args):
     args.force_prompt = getattr(args, "force_prompt", False)
 
 
-def execute_command(command: str, args) -> int:
+def execute_hook_errors(args) -> int:
     """
-    Execute the specified command.
+    Execute the hook-errors command.
 
-    WHY: This function maps command names to their implementations, providing
-    a single place to manage command routing. Experimental commands are imported
-    lazily to avoid loading unnecessary code.
-
-    DESIGN DECISION: run_guarded is imported only when needed to maintain
-    separation between stable and experimental features. Command suggestions
-    are provided for unknown commands to improve user experience.
+    WHY: hook-errors subcommands are Click commands, so the argparse
+    namespace is translated into Click arguments here.
 
     Args:
-        command: The command name to execute
         args: Parsed command line arguments
 
     Returns:
         Exit code from the command
     """
-    # Handle experimental run-guarded command separately with lazy import
-    if command == "run-guarded":
-        # Lazy import to avoid loading experimental code unless needed
-        from .commands.run_guarded import execute_run_guarded
-
-        result = execute_run_guarded(args)
-        return result if result is not None else 0
-
-    # Handle mpm-init command with lazy import
-    if command == "mpm-init":
-        # Lazy import to avoid loading unless needed
-        from .commands.mpm_init_handler import manage_mpm_init
+    # Lazy import to avoid loading unless needed
+    from .commands.hook_errors import (
+        clear_errors,
+        diagnose_errors,
+        list_errors,
+        show_status,
+        show_summary,
+    )
+
+    # Get subcommand
+    subcommand = getattr(args, "hook_errors_command", "status")
+    if not subcommand:
+        subcommand = "status"
+
+    # Map subcommands to functions
+    handlers = {
+        "list": list_errors,
+        "summary": show_summary,
+        "clear": clear_errors,
+        "diagnose": diagnose_errors,
+        "status": show_status,
+    }
 
-        result = manage_mpm_init(args)
-        return result if result is not None else 0
-
-    # Handle uninstall command with lazy import
-    if command == "uninstall":
-        # Lazy import to avoid loading unless needed
-        from .commands.uninstall import UninstallCommand
-
-        cmd = UninstallCommand()
-        result = cmd.execute(args)
-        # Convert CommandResult to exit code
-        return result.exit_code if result else 0
-
-    # Handle verify command with lazy import
-    if command == "verify":
-        # Lazy import to avoid loading unless needed
-        from .commands.verify import handle_verify
-
-        result = handle_verify(args)
-        return result if result is not None else 0
-
-    # Handle skill-source command with lazy import
-    if command == "skill-source":
-        # Lazy import to avoid loading unless needed
-        from .commands.skill_source import skill_source_command
-
-        result = skill_source_command(args)
-        return result if result is not None else 0
-
-    # Handle agent-source command with lazy import
-    if command == "agent-source":
-        # Lazy import to avoid loading unless needed
-        from .commands.agent_source import agent_source_command
-
-        result = agent_source_command(args)
-        return result if result is not None else 0
-
-    # Handle summarize command with lazy import
-    if command == "summarize":
-        # Lazy import to avoid loading unless needed
-        from .commands.summarize import summarize_command
-
-        result = summarize_command(args)
-        return result if result is not None else 0
-
-    # Handle oauth command with lazy import
-    if command == "oauth":
-        # Lazy import to avoid loading unless needed
-        from .commands.oauth import manage_oauth
-
-        result = manage_oauth(args)
-        return result if result is not None else 0
-
-    # Handle auth command with lazy import
-    if command == "auth":
-        from .commands.auth import manage_auth
-
-        result = manage_auth(args)
-        return result if result is not None else 0
-
-    # Handle slack command with lazy import
-    if command == "slack":
-        # Lazy import to avoid loading unless needed
-        from .commands.slack import manage_slack
-
-        result = manage_slack(args)
-        return result if result is not None else 0
-
-    # Handle install command with lazy import
-    if command == "install":
-        from .commands.install import manage_install
-
-        result = manage_install(args)
-        return result if result is not None else 0
-
-    # Handle setup command with lazy import
-    if command == "setup":
-        # Lazy import to avoid loading unless needed
-        from .commands.setup import manage_setup
-
-        result = manage_setup(args)
-        return result if result is not None else 0
-
-    # Handle tools command with lazy import
-    if command == "tools":
-        # Lazy import to avoid loading unless needed
-        from .commands.tools import manage_tools
-
-        result = manage_tools(args)
-        return result if result is not None else 0
-
-    # Handle provider command with lazy import
-    if command == "provider":
-        # Lazy import to avoid loading unless needed
-        from .commands.provider import manage_provider
-
-        result = manage_provider(args)
-        return result if result is not None else 0
-
-    # Handle profile command with lazy import
-    if command == "profile":
-        # Lazy import to avoid loading unless needed
-        from .commands.profile import ProfileCommand
-
-        cmd = ProfileCommand()
-        result = cmd.run(args)
-        # Convert CommandResult to exit code
-        return result.exit_code if result else 0
-
-    # Handle auto-configure command with lazy import
-    if command == "auto-configure":
-        # Lazy import to avoid loading unless needed
-        from .commands.auto_configure import AutoConfigureCommand
-
-        cmd = AutoConfigureCommand()
-        result = cmd.run(args)
-        # Convert CommandResult to exit code
-        return result.exit_code if result else 0
-
-    # Handle local-deploy command with lazy import
-    if command == "local-deploy":
-        # Lazy import to avoid loading unless needed
-        from .commands.local_deploy import LocalDeployCommand
-
-        cmd = LocalDeployCommand()
-        result = cmd.run(args)
-        # Convert CommandResult to exit code
-        return result.exit_code if result else 0
-
-    # Handle hook-errors command with lazy import
-    if command == "hook-errors":
-        # Lazy import to avoid loading unless needed
-        from .commands.hook_errors import (
-            clear_errors,
-            diagnose_errors,
-            list_errors,
-            show_status,
-            show_summary,
-        )
-
-        # Get subcommand
-        subcommand = getattr(args, "hook_errors_command", "status")
-        if not subcommand:
-            subcommand = "status"
-
-        # Map subcommands to functions
-        handlers = {
-            "list": list_errors,
-            "summary": show_summary,
-            "clear": clear_errors,
-            "diagnose": diagnose_errors,
-            "status": show_status,
-        }
-
-        # Get handler and call it with argument list (same pattern as autotodos)
-        handler = handlers.get(subcommand)
-        if handler:
-            try:
-                # Build argument list for Click command based on subcommand
-                click_args = []
-
-                # list command: --format, --hook-type
-                if subcommand == "list":
-                    if hasattr(args, "format") and args.format:
-                        click_args.extend(["--format", args.format])
-                    if hasattr(args, "hook_type") and args.hook_type:
-                        click_args.extend(["--hook-type", args.hook_type])
-                # clear command: --hook-type, -y
-                elif subcommand == "clear":
-                    if hasattr(args, "hook_type") and args.hook_type:
-                        click_args.extend(["--hook-type", args.hook_type])
-                    if hasattr(args, "yes") and args.yes:
-                        click_args.append("-y")
-                # diagnose command: hook_type (positional argument)
-                elif subcommand == "diagnose":
-                    if hasattr(args, "hook_type") and args.hook_type:
-                        click_args.append(args.hook_type)
-                # status and summary commands: no options
-
-                # Call Click command with argument list and standalone_mode=False
-                handler(click_args, standalone_mode=False)
-                return 0
-            except SystemExit as e:
-                code = e.code
-                return int(code) if isinstance(code, int) else (1 if code else 0)
-            except Exception as e:
-                print(f"Error: {e}")
-                return 1
-        else:
-            print(f"Unknown hook-errors subcommand: {subcommand}")
+    # Get handler and call it with argument list (same pattern as autotodos)
+    handler = handlers.get(subcommand)
+    if handler:
+        try:
+            # Build argument list for Click command based on subcommand
+            click_args = []
+
+            # list command: --format, --hook-type
+            if subcommand == "list":
+                if hasattr(args, "format") and args.format:
+                    click_args.extend(["--format", args.format])
+                if hasattr(args, "hook_type") and args.hook_type:
+                    click_args.extend(["--hook-type", args.hook_type])
+            # clear command: --hook-type, -y
+            elif subcommand == "clear":
+                if hasattr(args, "hook_type") and args.hook_type:
+                    click_args.extend(["--hook-type", args.hook_type])
+                if hasattr(args, "yes") and args.yes:
+                    click_args.append("-y")
+            # diagnose command: hook_type (positional argument)
+            elif subcommand == "diagnose":
+                if hasattr(args, "hook_type") and args.hook_type:
+                    click_args.append(args.hook_type)
+            # status and summary commands: no options
+
+            # Call Click command with argument list and standalone_mode=False
+            handler(click_args, standalone_mode=False)
+            return 0
+        except SystemExit as e:
+            code = e.code
+            return int(code) if isinstance(code, int) else (1 if code else 0)
+        except Exception as e:
+            print(f"Error: {e}")
             return 1
+    else:
+        print(f"Unknown hook-errors subcommand: {subcommand}")
+        return 1
 
-    # Handle autotodos command with lazy import
-    if command == "autotodos":
-        # Lazy import to avoid loading unless needed
-        from .commands.autotodos import (
-            clear_autotodos,
-            inject_autotodos,
-            list_autotodos,
-            list_pm_violations,
-            scan_delegation_patterns,
-            show_autotodos_status,
-        )
-
-        # Get subcommand
-        subcommand = getattr(args, "autotodos_command", "status")
-        if not subcommand:
-            subcommand = "status"
-
-        # Map subcommands to functions
-        handlers = {
-            "list": list_autotodos,
-            "inject": inject_autotodos,
-            "clear": clear_autotodos,
-            "status": show_autotodos_status,
-            "scan": scan_delegation_patterns,
-            "violations": list_pm_violations,
-        }
-
-        # Get handler and call it with standalone_mode=False
-        handler = handlers.get(subcommand)
-        if handler:
-            try:
-                # Build argument list for Click command
-                click_args = []
-
-                if subcommand == "list":
-                    fmt = getattr(args, "format", "table")
-                    click_args = ["--format", fmt]
-                elif subcommand == "inject":
-                    output = getattr(args, "output", None)
-                    if output:
-                        click_args = ["--output", output]
-                elif subcommand == "clear":
-                    error_key = getattr(args, "error_key", None)
-                    event_type = getattr(args, "event_type", "all")
-                    if error_key:
-                        click_args.append("--error-key")
-                        click_args.append(error_key)
-                    if event_type != "all":
-                        click_args.append("--event-type")
-                        click_args.append(event_type)
-                    if getattr(args, "yes", False):
-                        click_args.append("-y")
-                elif subcommand == "scan":
-                    text = getattr(args, "text", None)
-                    file = getattr(args, "file", None)
-                    fmt = getattr(args, "format", "table")
-                    save = getattr(args, "save", False)
-
-                    if text:
-                        click_args.append(text)
-                    if file:
-                        click_args.extend(["--file", file])
-                    if fmt != "table":
-                        click_args.extend(["--format", fmt])
-                    if save:
-                        click_args.append("--save")
-                elif subcommand == "violations":
-                    fmt = getattr(args, "format", "table")
-                    if fmt != "table":
-                        click_args.extend(["--format", fmt])
-
-                # Call Click command with argument list and standalone_mode=False
-                handler(click_args, standalone_mode=False)
-                return 0
-            except SystemExit as e:
-                code = e.code
-                return int(code) if isinstance(code, int) else (1 if code else 0)
-            except Exception as e:
-                print(f"Error: {e}")
-                import traceback
-
-                traceback.print_exc()
-                return 1
-        else:
-            print(f"Unknown autotodos subcommand: {subcommand}")
-            return 1
 
-    # Handle channels command with lazy import
-    if command == "channels":
-        from .commands.channels import handle_channels_command
-
-        result = handle_channels_command(args)
-        return result if result is not None else 0
-
-    # Handle serve command with lazy import
-    if command == "serve":
-        from .commands.serve import manage_serve
-
-        result = manage_serve(args)
-        return result if result is not None else 0
-
-    # Map stable commands to their implementations
-    command_map = {
-        CLICommands.RUN.value: run_session,
-        # CLICommands.RUN_GUARDED.value is handled above
-        CLICommands.TICKETS.value: manage_tickets,
-        CLICommands.INFO.value: show_info,
-        CLICommands.AGENTS.value: manage_agents,
-        CLICommands.AGENT_MANAGER.value: manage_agent_manager,
-        CLICommands.MEMORY.value: manage_memory,
-        CLICommands.MONITOR.value: manage_monitor,
-        CLICommands.DASHBOARD.value: manage_dashboard,
-        # Configuration management commands
-        CLICommands.CONFIG.value: manage_config,  # Unified config with subcommands
-        CLICommands.CONFIGURE.value: manage_configure,  # Interactive configuration TUI
-        CLICommands.AGGREGATE.value: aggregate_command,
-        CLICommands.ANALYZE_CODE.value: manage_analyze_code,
-        CLICommands.CLEANUP.value: cleanup_memory,
-        CLICommands.MCP.value: manage_mcp,
-        CLICommands.DOCTOR.value: run_doctor,
-        CLICommands.UPGRADE.value: upgrade,
-        CLICommands.SKILLS.value: manage_skills,
-        "migrate": manage_migrate,  # Configuration migration command
-        "debug": manage_debug,  # Add debug command
-        "gh": manage_gh,  # GitHub multi-account management
-        "message": manage_messages,  # Cross-project messaging
-        "queue": message_queue,  # Message queue management
-        "mpm-init": None,  # Will be handled separately with lazy import
+def execute_autotodos(args) -> int:
+    """
+    Execute the autotodos command.
+
+    WHY: autotodos subcommands are Click commands, so the argparse
+    namespace is translated into Click arguments here.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code from the command
+    """
+    # Lazy import to avoid loading unless needed
+    from .commands.autotodos import (
+        clear_autotodos,
+        inject_autotodos,
+        list_autotodos,
+        list_pm_violations,
+        scan_delegation_patterns,
+        show_autotodos_status,
+    )
+
+    # Get subcommand
+    subcommand = getattr(args, "autotodos_command", "status")
+    if not subcommand:
+        subcommand = "status"
+
+    # Map subcommands to functions
+    handlers = {
+        "list": list_autotodos,
+        "inject": inject_autotodos,
+        "clear": clear_autotodos,
+        "status": show_autotodos_status,
+        "scan": scan_delegation_patterns,
+        "violations": list_pm_violations,
     }
 
-    # Execute command if found
-    if command in command_map:
-        result = command_map[command](args)
-        # Commands may return None (success) or an exit code
-        return result if result is not None else 0
+    # Get handler and call it with standalone_mode=False
+    handler = handlers.get(subcommand)
+    if handler:
+        try:
+            # Build argument list for Click command
+            click_args = []
+
+            if subcommand == "list":
+                fmt = getattr(args, "format", "table")
+                click_args = ["--format", fmt]
+            elif subcommand == "inject":
+                output = getattr(args, "output", None)
+                if output:
+                    click_args = ["--output", output]
+            elif subcommand == "clear":
+                error_key = getattr(args, "error_key", None)
+                event_type = getattr(args, "event_type", "all")
+                if error_key:
+                    click_args.append("--error-key")
+                    click_args.append(error_key)
+                if event_type != "all":
+                    click_args.append("--event-type")
+                    click_args.append(event_type)
+                if getattr(args, "yes", False):
+                    click_args.append("-y")
+            elif subcommand == "scan":
+                text = getattr(args, "text", None)
+                file = getattr(args, "file", None)
+                fmt = getattr(args, "format", "table")
+                save = getattr(args, "save", False)
+
+                if text:
+                    click_args.append(text)
+                if file:
+                    click_args.extend(["--file", file])
+                if fmt != "table":
+                    click_args.extend(["--format", fmt])
+                if save:
+                    click_args.append("--save")
+            elif subcommand == "violations":
+                fmt = getattr(args, "format", "table")
+                if fmt != "table":
+                    click_args.extend(["--format", fmt])
+
+            # Call Click command with argument list and standalone_mode=False
+            handler(click_args, standalone_mode=False)
+            return 0
+        except SystemExit as e:
+            code = e.code
+            return int(code) if isinstance(code, int) else (1 if code else 0)
+        except Exception as e:
+            print(f"Error: {e}")
+            import traceback
+
+            traceback.print_exc()
+            return 1
+    else:
+        print(f"Unknown autotodos subcommand: {subcommand}")
+        return 1
+
+
+def execute_command(command: str, args) -> int:
+    """
+    Execute the specified command.
+
+    WHY: This function maps command names to their implementations, providing
+    a single place to manage command routing. Commands are imported lazily
+    so only the executed command's code is loaded.
+
+    DESIGN DECISION: Handlers are looked up in the command registry, which
+    declares the module and attribute of each command (and the method of
+    class-based commands). Command suggestions are provided for unknown
+    commands to improve user experience.
+
+    Args:
+        command: The command name to execute
+        args: Parsed command line arguments
+
+    Returns:
+        Exit code from the command
+    """
+    spec = get_command(command)
+    if spec is not None and spec.handler is not None:
+        return load_handler(spec)(args)
 
     # Unknown command - provide suggestions
     from rich.console import Console
@@ -447,26 +261,7 @@ def execute_command(command: str, args) -> int:
 
     console.print(f"\n[red]Error:[/red] Unknown command: {command}\n", style="bold")
 
-    # Get all valid commands for suggestions
-    all_commands = [
-        *command_map.keys(),
-        "run-guarded",
-        "uninstall",
-        "verify",
-        "auto-configure",
-        "local-deploy",
-        "skill-source",
-        "agent-source",
-        "hook-errors",
-        "autotodos",
-        "oauth",
-        "install",
-        "setup",
-        "slack",
-        "provider",
-    ]
-
-    suggestion = suggest_similar_commands(command, all_commands)
+    suggestion = suggest_similar_commands(command, command_names())
     if suggestion:
         console.print(f"[yellow]{suggestion}[/yellow]\n")
 
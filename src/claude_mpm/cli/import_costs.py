@@ -0,0 +1,113 @@
+"""
+Import cost measurement for CLI commands.
+
+WHY: CLI start-up time is dominated by imports. Measuring it per command
+shows which modules a command pulls in and keeps the lazy command registry
+honest as new commands and dependencies are added.
+
+DESIGN DECISIONS:
+- Measurements run ``python -X importtime`` in a fresh interpreter, the
+  only way to see what a cold ``claude-mpm <command>`` imports.
+- The measured program mirrors ``main()`` up to dispatch: it imports
+  ``claude_mpm.cli``, builds the parser for the command's argv and loads the
+  command's handler, without executing it.
+- Self time ranks the modules that are expensive themselves; the sum of
+  self times is the command's total import cost.
+"""
+
+import re
+import subprocess  # nosec B404 - runs the current interpreter only
+import sys
+from dataclasses import dataclass
+
+from .command_registry import COMMANDS
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+_PROBE = """
+import sys
+from claude_mpm.cli import execute_command
+from claude_mpm.cli.command_registry import get_command, load_handler
+from claude_mpm.cli.parser import create_parser, preprocess_args
+argv = preprocess_args(sys.argv[1:])
+create_parser(argv=argv)
+spec = get_command(argv[0] if argv else "run")
+if spec is not None and spec.handler is not None:
+    load_handler(spec)
+"""
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportCost]:
+    """Parse the stderr of ``python -X importtime``."""
+    costs = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            costs.append(
+                ImportCost(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return costs
+
+
+def measure_command_imports(argv: list[str], timeout: float = 120) -> list[ImportCost]:
+    """Import costs of starting ``claude-mpm`` with *argv* up to dispatch.
+
+    Args:
+        argv: Command line arguments, e.g. ``["doctor"]`` or ``[]``
+        timeout: Seconds to wait for the measuring interpreter
+
+    Returns:
+        Every module imported, in import order
+    """
+    result = subprocess.run(  # nosec B603 - fixed program, no shell
+        [sys.executable, "-X", "importtime", "-c", _PROBE, *argv],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_import_us(costs: list[ImportCost]) -> int:
+    """Total time spent importing, including interpreter start-up modules."""
+    return sum(cost.self_us for cost in costs)
+
+
+def top_import_costs(costs: list[ImportCost], limit: int = 10) -> list[ImportCost]:
+    """The *limit* modules with the highest self import time."""
+    return sorted(costs, key=lambda cost: cost.self_us, reverse=True)[:limit]
+
+
+def format_report(commands: list[str] | None = None, limit: int = 10) -> str:
+    """Report total and top import costs for each command.
+
+    Args:
+        commands: Command names to measure (default: every registered
+            command with a parser, plus the bare ``claude-mpm`` invocation)
+        limit: Modules listed per command
+    """
+    if commands is None:
+        commands = ["", *(spec.name for spec in COMMANDS if spec.parser)]
+    lines = []
+    for command in commands:
+        costs = measure_command_imports([command] if command else [])
+        label = command or "(no command)"
+        total_ms = total_import_us(costs) / 1000
+        lines.append(f"{label}: {total_ms:.1f} ms, {len(costs)} modules")
+        lines.extend(
+            f"    {cost.self_us / 1000:8.1f} ms  {cost.module}"
+            for cost in top_import_costs(costs, limit)
+        )
+    return "\n".join(lines)
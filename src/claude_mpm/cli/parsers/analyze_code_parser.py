@@ -167,3 +167,21 @@ class AnalyzeCodeParser:
             "claude-mpm analyze-code -o tree",
             "claude-mpm analyze-code -o stats --include-metrics",
         ]
+
+
+def add_analyze_code_subparser(subparsers) -> argparse.ArgumentParser:
+    """Add the analyze-code subparser.
+
+    Args:
+        subparsers: The subparsers object from the main parser
+
+    Returns:
+        The configured analyze-code subparser
+    """
+    parser_obj = AnalyzeCodeParser()
+    analyze_code_parser = subparsers.add_parser(
+        parser_obj.command_name, help=parser_obj.help_text
+    )
+    parser_obj.add_arguments(analyze_code_parser)
+    analyze_code_parser.set_defaults(command=parser_obj.command_name)
+    return analyze_code_parser
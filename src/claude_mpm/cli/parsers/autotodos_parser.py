@@ -0,0 +1,71 @@
+"""
+Autotodos command parser for claude-mpm CLI.
+
+WHY: Provides the arguments of the autotodos command, which auto-generates
+todos from hook errors and delegation patterns.
+"""
+
+import argparse
+
+
+def add_autotodos_subparser(subparsers) -> argparse.ArgumentParser:
+    """Add the autotodos subparser.
+
+    Args:
+        subparsers: The subparsers object from the main parser
+
+    Returns:
+        The configured autotodos subparser
+    """
+    autotodos_parser = subparsers.add_parser(
+        "autotodos",
+        help="Auto-generate todos from hook errors and delegation patterns",
+    )
+    autotodos_parser.add_argument(
+        "autotodos_command",
+        nargs="?",
+        choices=["list", "inject", "clear", "status", "scan", "violations"],
+        help="AutoTodos subcommand",
+    )
+    autotodos_parser.add_argument(
+        "text",
+        nargs="?",
+        help="Text to scan for delegation patterns (scan command only)",
+    )
+    autotodos_parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format for list/scan commands",
+    )
+    autotodos_parser.add_argument(
+        "--output",
+        help="Output file path for inject command",
+    )
+    autotodos_parser.add_argument(
+        "--error-key",
+        help="Specific error key to clear",
+    )
+    autotodos_parser.add_argument(
+        "--event-type",
+        choices=["error", "violation", "all"],
+        default="all",
+        help="Type of events to clear (clear command only)",
+    )
+    autotodos_parser.add_argument(
+        "--file",
+        "-f",
+        help="Scan text from file (scan command only)",
+    )
+    autotodos_parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Save detections to event log (scan command only)",
+    )
+    autotodos_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompts",
+    )
+    return autotodos_parser
@@ -13,7 +13,7 @@ import sys
 from pathlib import Path
 from typing import NoReturn
 
-from ...constants import CLICommands, CLIPrefix, LogLevel
+from ...constants import CLIPrefix, LogLevel
 
 
 class SuggestingArgumentParser(argparse.ArgumentParser):
@@ -185,6 +185,16 @@ def add_common_arguments(
         "--project-dir", type=Path, help="Project directory (overrides auto-detection)"
     )
 
+    # SUPPRESS keeps subparsers from resetting a flag given before the command
+    logging_group.add_argument(
+        "--profile",
+        dest="trace_profile",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Record a startup/hook trace to ~/.claude-mpm/traces "
+        "(summarize with 'claude-mpm debug profile')",
+    )
+
 
 def create_main_parser(
     prog_name: str = "claude-mpm", version: str = "0.0.0"
@@ -417,10 +427,13 @@ def add_top_level_run_arguments(parser: argparse.ArgumentParser) -> None:
 
 
 def create_parser(
-    prog_name: str = "claude-mpm", version: str = "0.0.0"
+    prog_name: str = "claude-mpm",
+    version: str = "0.0.0",
+    *,
+    argv: list[str] | None = None,
 ) -> argparse.ArgumentParser:
     """
-    Create the main argument parser with all subcommands.
+    Create the main argument parser with its subcommands.
 
     WHY: This factory function creates a complete parser with all commands and their
     arguments. It's the single entry point for creating the CLI parser, ensuring
@@ -428,14 +441,21 @@ def create_parser(
 
     DESIGN DECISION: We use subparsers for commands to provide a clean, git-like
     interface while maintaining backward compatibility with the original CLI.
+    Subparser builders come from the lazy command registry. When ``argv`` is
+    given, only the parser of the command it names is imported and built
+    (none for a bare invocation); help requests and unknown commands still
+    get every subparser.
 
     Args:
         prog_name: The program name to use
         version: The version string to display
+        argv: Preprocessed arguments that will be parsed, if known
 
     Returns:
         Configured ArgumentParser instance
     """
+    from ..command_registry import load_parser_builder, select_commands
+
     # Create main parser
     parser = create_main_parser(prog_name, version)
 
@@ -447,390 +467,15 @@ def create_parser(
         dest="command", help="Available commands", metavar="COMMAND"
     )
 
-    # Import and add core subparsers one by one to avoid issues
-    try:
-        from .run_parser import add_run_subparser
-
-        add_run_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .tickets_parser import add_tickets_subparser
-
-        add_tickets_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .agents_parser import add_agents_subparser
-
-        add_agents_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .source_parser import add_source_subparser
-
-        add_source_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .skill_source_parser import add_skill_source_subparser
-
-        add_skill_source_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .agent_source_parser import add_agent_source_subparser
-
-        add_agent_source_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .auto_configure_parser import add_auto_configure_subparser
-
-        add_auto_configure_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .memory_parser import add_memory_subparser
-
-        add_memory_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .skills_parser import add_skills_subparser
-
-        add_skills_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .messages_parser import add_messages_subparser
-
-        add_messages_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .queue_parser import add_queue_subparser
-
-        add_queue_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .config_parser import add_config_subparser
-
-        add_config_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .profile_parser import add_profile_subparser
-
-        add_profile_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .monitor_parser import add_monitor_subparser
-
-        add_monitor_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .dashboard_parser import add_dashboard_subparser
-
-        add_dashboard_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .local_deploy_parser import add_local_deploy_arguments
-
-        add_local_deploy_arguments(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .mcp_parser import add_mcp_subparser
-
-        add_mcp_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .agent_manager_parser import add_agent_manager_subparser
-
-        add_agent_manager_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .configure_parser import add_configure_subparser
-
-        add_configure_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .oauth_parser import add_oauth_subparser
-
-        add_oauth_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .auth_parser import add_auth_subparser
-
-        add_auth_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .setup_parser import add_setup_subparser
-
-        add_setup_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .install_parser import add_install_subparser
-
-        add_install_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .slack_parser import add_slack_subparser
-
-        add_slack_subparser(subparsers)
-    except ImportError:
-        pass
-
-    try:
-        from .tools_parser import add_tools_subparser
-
-        add_tools_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add provider command parser for API backend management
-    try:
-        from .provider_parser import add_provider_subparser
-
-        add_provider_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add uninstall command parser
-    try:
-        from ..commands.uninstall import add_uninstall_parser
-
-        add_uninstall_parser(subparsers)
-    except ImportError:
-        pass
-
-    # Add debug command parser
-    try:
-        from .debug_parser import add_debug_subparser
-
-        add_debug_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add analyze command parser
-    try:
-        from .analyze_parser import add_analyze_subparser
-
-        add_analyze_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add analyze-code command parser
-    try:
-        from .analyze_code_parser import AnalyzeCodeParser
-
-        parser_obj = AnalyzeCodeParser()
-        analyze_code_parser = subparsers.add_parser(
-            "analyze-code", help=parser_obj.help_text
-        )
-        parser_obj.add_arguments(analyze_code_parser)
-        analyze_code_parser.set_defaults(command="analyze-code")
-    except ImportError:
-        pass
-
-    # Add mpm-init command parser
-    try:
-        from .mpm_init_parser import add_mpm_init_subparser
-
-        add_mpm_init_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add search command parser
-    try:
-        from .search_parser import add_search_subparser
-
-        add_search_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Add channels command parser
-    try:
-        from ..commands.channels import add_channels_subcommand
-
-        add_channels_subcommand(subparsers)
-    except ImportError:
-        pass
-
-    # Add serve command parser
-    try:
-        from .serve_parser import add_serve_subparser
-
-        add_serve_subparser(subparsers)
-    except ImportError:
-        pass
-
-    # Import and add additional command parsers from commands module
-    try:
-        from ..commands.aggregate import add_aggregate_parser
-
-        add_aggregate_parser(subparsers)
-
-        from ..commands.cleanup import add_cleanup_parser
-
-        add_cleanup_parser(subparsers)
-
-        # MCP pipx configuration command
-        if hasattr(CLICommands, "MCP_PIPX_CONFIG") or True:  # Always add for now
-            from ..commands.mcp_pipx_config import add_parser as add_mcp_pipx_parser
-
-            add_mcp_pipx_parser(subparsers)
-
-        from ..commands.doctor import add_doctor_parser
-
-        add_doctor_parser(subparsers)
-
-        from ..commands.gh import add_gh_parser
-
-        add_gh_parser(subparsers)
-
-        from ..commands.postmortem import add_postmortem_parser
-
-        add_postmortem_parser(subparsers)
-
-        # Add upgrade command
-        from ..commands.upgrade import add_upgrade_parser
-
-        add_upgrade_parser(subparsers)
-
-        # Add migrate command for configuration migrations
-        from ..commands.migrate import add_migrate_parser
-
-        add_migrate_parser(subparsers)
-
-        # Add verify command for MCP service verification
-        from ..commands.verify import add_parser as add_verify_parser
-
-        add_verify_parser(subparsers)
-
-        # Add hook-errors command for managing hook error memory
-        hook_errors_parser = subparsers.add_parser(
-            "hook-errors",
-            help="Manage hook error memory and diagnostics",
-        )
-        hook_errors_parser.add_argument(
-            "hook_errors_command",
-            nargs="?",
-            choices=["list", "summary", "clear", "diagnose", "status"],
-            help="Hook errors subcommand",
-        )
-        hook_errors_parser.add_argument(
-            "--format",
-            choices=["table", "json"],
-            default="table",
-            help="Output format for list command",
-        )
-        hook_errors_parser.add_argument(
-            "--hook-type",
-            help="Filter by specific hook type",
-        )
-        hook_errors_parser.add_argument(
-            "-y",
-            "--yes",
-            action="store_true",
-            help="Skip confirmation prompts",
-        )
-
-        # Add autotodos command for auto-generating todos from hook errors
-        autotodos_parser = subparsers.add_parser(
-            "autotodos",
-            help="Auto-generate todos from hook errors and delegation patterns",
-        )
-        autotodos_parser.add_argument(
-            "autotodos_command",
-            nargs="?",
-            choices=["list", "inject", "clear", "status", "scan", "violations"],
-            help="AutoTodos subcommand",
-        )
-        autotodos_parser.add_argument(
-            "text",
-            nargs="?",
-            help="Text to scan for delegation patterns (scan command only)",
-        )
-        autotodos_parser.add_argument(
-            "--format",
-            choices=["table", "json"],
-            default="table",
-            help="Output format for list/scan commands",
-        )
-        autotodos_parser.add_argument(
-            "--output",
-            help="Output file path for inject command",
-        )
-        autotodos_parser.add_argument(
-            "--error-key",
-            help="Specific error key to clear",
-        )
-        autotodos_parser.add_argument(
-            "--event-type",
-            choices=["error", "violation", "all"],
-            default="all",
-            help="Type of events to clear (clear command only)",
-        )
-        autotodos_parser.add_argument(
-            "--file",
-            "-f",
-            help="Scan text from file (scan command only)",
-        )
-        autotodos_parser.add_argument(
-            "--save",
-            action="store_true",
-            help="Save detections to event log (scan command only)",
-        )
-        autotodos_parser.add_argument(
-            "-y",
-            "--yes",
-            action="store_true",
-            help="Skip confirmation prompts",
-        )
-
-        # Add summarize command
-        from ..commands.summarize import add_summarize_parser
-
-        add_summarize_parser(subparsers)
-    except ImportError:
-        # Commands module may not be available during testing or refactoring
-        pass
+    # Add subparsers one by one so one broken command does not hide the others
+    for spec in select_commands(parser, argv):
+        if spec.parser is None:
+            continue
+        try:
+            load_parser_builder(spec)(subparsers)
+        except ImportError:
+            # Commands module may not be available during testing or refactoring
+            pass
 
     return parser
 
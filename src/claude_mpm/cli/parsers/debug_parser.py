@@ -59,6 +59,9 @@ def add_debug_subparser(subparsers) -> argparse.ArgumentParser:
     # Performance debugging
     _add_performance_parser(debug_subparsers)
 
+    # Recorded trace summaries
+    _add_profile_parser(debug_subparsers)
+
     return debug_parser
 
 
@@ -317,3 +320,41 @@ def _add_performance_parser(subparsers):
     perf_group.add_argument(
         "--benchmark", action="store_true", help="Run performance benchmarks"
     )
+
+
+def _add_profile_parser(subparsers):
+    """Add trace summary subcommand."""
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="Summarize the slowest spans of recent traced runs",
+        description=(
+            "Summarize traces recorded with 'claude-mpm --profile' or "
+            "CLAUDE_MPM_PROFILE=1 (stored in ~/.claude-mpm/traces)"
+        ),
+    )
+    profile_parser.add_argument(
+        "--runs",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Number of most recent traced runs to include (default: 10)",
+    )
+    profile_parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        metavar="K",
+        help="Number of spans to show (default: 20)",
+    )
+    profile_parser.add_argument(
+        "--process",
+        choices=["claude-mpm", "hook"],
+        help="Only include traces of the CLI or of hook invocations",
+    )
+    profile_parser.add_argument(
+        "--category",
+        help="Only include spans of this category (startup, registry, framework, hook, emit)",
+    )
+    profile_parser.add_argument(
+        "--json", action="store_true", help="Output the summary as JSON"
+    )
@@ -0,0 +1,46 @@
+"""
+Hook-errors command parser for claude-mpm CLI.
+
+WHY: Provides the arguments of the hook-errors command, which manages hook
+error memory and diagnostics.
+"""
+
+import argparse
+
+
+def add_hook_errors_subparser(subparsers) -> argparse.ArgumentParser:
+    """Add the hook-errors subparser.
+
+    Args:
+        subparsers: The subparsers object from the main parser
+
+    Returns:
+        The configured hook-errors subparser
+    """
+    hook_errors_parser = subparsers.add_parser(
+        "hook-errors",
+        help="Manage hook error memory and diagnostics",
+    )
+    hook_errors_parser.add_argument(
+        "hook_errors_command",
+        nargs="?",
+        choices=["list", "summary", "clear", "diagnose", "status"],
+        help="Hook errors subcommand",
+    )
+    hook_errors_parser.add_argument(
+        "--format",
+        choices=["table", "json"],
+        default="table",
+        help="Output format for list command",
+    )
+    hook_errors_parser.add_argument(
+        "--hook-type",
+        help="Filter by specific hook type",
+    )
+    hook_errors_parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompts",
+    )
+    return hook_errors_parser
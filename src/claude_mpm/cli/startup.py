@@ -16,6 +16,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from ..core import tracing
+
 # ─── Sync-state TTL helpers ──────────────────────────────────────────────────
 
 _DEFAULT_SYNC_TTL = 86400  # 24 hours — check for updates once per day
@@ -95,6 +97,35 @@ def _agent_sources_changed_since_last_sync() -> bool:
         return False
 
 
+def _pending_changes(kind: str, baseline_only: bool = False) -> list[str]:
+    """Return what changed for *kind* since this project was last reconciled.
+
+    See services/change_journal.py. With *baseline_only*, a project the
+    journal has not recorded yet reports no changes, so installs upgrading
+    from TTL-only startup keep waiting for the TTL instead of reconciling
+    on every start.
+    """
+    try:
+        from ..services.change_journal import ChangeJournal
+
+        journal = ChangeJournal()
+        if baseline_only and not journal.is_tracked(kind, Path.cwd()):
+            return []
+        return journal.pending_changes(kind, Path.cwd())
+    except Exception:
+        return ["change journal unavailable"]
+
+
+def _mark_reconciled(kind: str) -> None:
+    """Record this project's deployed *kind* as reconciled in the change journal."""
+    try:
+        from ..services.change_journal import ChangeJournal
+
+        ChangeJournal().mark_reconciled(kind, Path.cwd())
+    except Exception:
+        pass
+
+
 def _display_manifest_compatibility_warnings() -> None:
     """Display console warnings for repos whose min_cli_version exceeds the running CLI.
 
@@ -1027,6 +1058,126 @@ def _save_deployment_state_after_reconciliation(
         logger.debug(f"Failed to save deployment state: {e}")
 
 
+def _reconcile_agents_from_cache(pipeline_config, active_profile) -> bool:
+    """Deploy agents from the cache to .claude/agents/ via reconciliation.
+
+    Returns:
+        True if reconciliation completed without errors
+    """
+    from ..core.logger import get_logger
+    from ..utils.progress import ProgressBar
+
+    logger = get_logger("cli")
+
+    # Use reconciliation service to respect configuration.yaml settings
+    try:
+        from ..core.unified_config import UnifiedConfig
+        from ..services.agents.deployment.startup_reconciliation import (
+            perform_startup_reconciliation,
+        )
+
+        # Transitional bridge: build UnifiedConfig and overlay pipeline_config
+        # so that perform_startup_reconciliation() sees the resolved agent list.
+        unified_config = UnifiedConfig()
+
+        # Compute effective enabled set: enabled + required - excluded
+        effective_agents = pipeline_config.get_agents_to_deploy()
+        if effective_agents and (
+            active_profile or pipeline_config.has_explicit_agent_selection
+        ):
+            # Only override when there is an explicit agent selection
+            # (active profile or config-driven enabled list).  When
+            # neither is present, effective_agents contains only the
+            # default required set — overriding with that tiny list
+            # would cause the reconciler to remove all other agents.
+            unified_config.agents.enabled = list(effective_agents)
+            if active_profile:
+                logger.info(
+                    "Profile '%s': Using %d enabled agents",
+                    active_profile,
+                    len(effective_agents),
+                )
+        else:
+            # No explicit agent selection: keep agents.enabled empty
+            # and enable auto_discover so the reconciler preserves all
+            # currently deployed agents (its early-return path).
+            unified_config.agents.auto_discover = True
+
+        # Perform reconciliation to deploy configured agents
+        project_path = Path.cwd()
+        agent_result, _skill_result = perform_startup_reconciliation(
+            project_path=project_path, config=unified_config, silent=False
+        )
+
+        # Display results with progress bar
+        total_operations = (
+            len(agent_result.deployed)
+            + len(agent_result.removed)
+            + len(agent_result.unchanged)
+        )
+
+        if total_operations > 0:
+            deploy_progress = ProgressBar(
+                total=total_operations,
+                prefix="Deploying agents",
+                show_percentage=True,
+                show_counter=True,
+            )
+            deploy_progress.update(total_operations)
+
+            # Build summary message
+            deployed = len(agent_result.deployed)
+            removed = len(agent_result.removed)
+            unchanged = len(agent_result.unchanged)
+
+            summary_parts = []
+            if deployed > 0:
+                summary_parts.append(f"{deployed} new")
+            if removed > 0:
+                summary_parts.append(f"{removed} removed")
+            if unchanged > 0:
+                summary_parts.append(f"{unchanged} unchanged")
+
+            summary = f"Complete: {', '.join(summary_parts)}"
+            deploy_progress.finish(summary)
+
+        # Display errors if any
+        if agent_result.errors:
+            logger.warning(
+                f"Agent deployment completed with {len(agent_result.errors)} errors"
+            )
+            # Only show error details to TTY (avoid polluting stdout in headless mode)
+            if sys.stdout.isatty():
+                print("\n⚠️  Agent Deployment Errors:")
+                max_errors_to_show = 10
+                errors_to_display = agent_result.errors[:max_errors_to_show]
+
+                for error in errors_to_display:
+                    print(f"   - {error}")
+
+                if len(agent_result.errors) > max_errors_to_show:
+                    remaining = len(agent_result.errors) - max_errors_to_show
+                    print(f"   ... and {remaining} more error(s)")
+
+                print(
+                    f"\n❌ Failed to deploy {len(agent_result.errors)} agent(s). "
+                    "Please check the error messages above."
+                )
+                print("   Run with --verbose for detailed error information.\n")
+
+        # Save deployment state to prevent duplicate deployment in ClaudeRunner
+        # This ensures setup_agents() skips deployment since we already reconciled
+        _save_deployment_state_after_reconciliation(
+            agent_result=agent_result, project_path=project_path
+        )
+        return not agent_result.errors
+
+    except Exception as e:
+        # Deployment failure shouldn't block startup
+        logger.warning(f"Failed to deploy agents from cache: {e}")
+        return False
+
+
 def sync_remote_agents_on_startup(force_sync: bool = False):
     """Synchronize agent templates from remote sources on startup.
 
@@ -1039,37 +1190,48 @@ def sync_remote_agents_on_startup(force_sync: bool = False):
     The orchestrator knows nothing about TTL -- it just syncs repos.
 
     Behavioral invariants:
-        - Startup respects BOTH TTL AND _agent_sources_changed_since_last_sync().
-        - --force-sync bypasses TTL (passes force_sync=True).
+        - Remote sources are polled when the TTL expired OR
+          _agent_sources_changed_since_last_sync().
+        - Reconciliation runs only for changes recorded in the change journal
+          (source revisions, configuration, deployed files, watcher events).
+        - --force-sync bypasses TTL and journal (passes force_sync=True).
         - --no-sync skips this function entirely (handled by caller).
 
     Workflow:
-    1. TTL gate check (skip if recent sync AND sources unchanged)
+    1. TTL gate check (skip if recent sync, sources unchanged AND the change
+       journal reports nothing to reconcile)
     2. Resolve pipeline config (profile, enabled agents)
-    3. Sync files from Git sources via orchestrator
-    4. Deploy agents from cache to ~/.claude/agents/ via reconciliation
+    3. Sync files from Git sources via orchestrator (unless within TTL)
+    4. Deploy agents from cache to ~/.claude/agents/ via reconciliation, if
+       the change journal reports changes
     5. Cleanup legacy agent cache directories
     6. Record successful sync time for TTL
 
     Args:
         force_sync: Force download even if cache is fresh (bypasses ETag/TTL).
     """
-    # TTL-based skip: if last sync was recent AND sources haven't changed,
+    # TTL-based polling: if last sync was recent AND sources haven't changed,
     # skip network checks entirely for performance.
     # _agent_sources_changed_since_last_sync() ensures that adding/modifying
     # agent sources triggers an immediate re-sync regardless of TTL.
-    if (
+    # Within the TTL, local changes recorded in the change journal are still
+    # reconciled; with none, startup does no agent work at all.
+    ttl_fresh = (
         not force_sync
         and _is_sync_fresh("agents")
         and not _agent_sources_changed_since_last_sync()
-    ):
-        from ..core.logger import get_logger as _get_logger
+    )
+    pending: list[str] = []
+    if ttl_fresh:
+        pending = _pending_changes("agents", baseline_only=True)
+        if not pending:
+            from ..core.logger import get_logger as _get_logger
 
-        _get_logger("cli").debug(
-            f"Skipping agent sync (within {_get_sync_ttl()}s TTL, sources unchanged). "
-            "Use --force-sync to override."
-        )
-        return
+            _get_logger("cli").debug(
+                f"Skipping agent sync (within {_get_sync_ttl()}s TTL, no changes "
+                "since last reconciliation). Use --force-sync to override."
+            )
+            return
 
     try:
         # Resolve all agent pipeline config sources in one call
@@ -1078,7 +1240,6 @@ def sync_remote_agents_on_startup(force_sync: bool = False):
         from ..core.shared.config_loader import ConfigLoader
         from ..services.agents.pipeline_config import AgentPipelineConfig
         from ..services.agents.startup_sync import sync_agents_on_startup
-        from ..utils.progress import ProgressBar
 
         project_root = Path.cwd()
 
@@ -1113,141 +1274,51 @@ def sync_remote_agents_on_startup(force_sync: bool = False):
             )
 
         # Phase 1: Sync files from Git sources
-        result = sync_agents_on_startup(force_refresh=force_sync)
-
-        # Only proceed with deployment if sync was enabled and ran
-        if result.get("enabled") and result.get("sources_synced", 0) > 0:
+        if ttl_fresh:
+            # Sources were polled within the TTL: only reconcile the local
+            # changes recorded in the change journal
             from ..core.logger import get_logger
 
-            logger = get_logger("cli")
-
-            downloaded = result.get("total_downloaded", 0)
-            cached = result.get("cache_hits", 0)
-            duration = result.get("duration_ms", 0)
+            get_logger("cli").debug(
+                f"Reconciling agents without sync: {', '.join(pending)}"
+            )
+        else:
+            result = sync_agents_on_startup(force_refresh=force_sync)
 
-            if downloaded > 0 or cached > 0:
-                logger.debug(
-                    f"Agent sync: {downloaded} updated, {cached} cached ({duration}ms)"
-                )
+            # Only proceed with deployment if sync was enabled and ran
+            if result.get("enabled") and result.get("sources_synced", 0) > 0:
+                from ..core.logger import get_logger
 
-            # Log errors if any
-            errors = result.get("errors", [])
-            if errors:
-                logger.warning(f"Agent sync completed with {len(errors)} errors")
+                logger = get_logger("cli")
 
-            # Display manifest compatibility warnings to the console
-            # (after sync populates ManifestCache, before deployment)
-            _display_manifest_compatibility_warnings()
+                downloaded = result.get("total_downloaded", 0)
+                cached = result.get("cache_hits", 0)
+                duration = result.get("duration_ms", 0)
 
-            # Phase 2: Deploy agents from cache to ~/.claude/agents/
-            # Use reconciliation service to respect configuration.yaml settings
-            try:
-                from ..core.unified_config import UnifiedConfig
-                from ..services.agents.deployment.startup_reconciliation import (
-                    perform_startup_reconciliation,
-                )
+                if downloaded > 0 or cached > 0:
+                    logger.debug(
+                        f"Agent sync: {downloaded} updated, {cached} cached ({duration}ms)"
+                    )
 
-                # Transitional bridge: build UnifiedConfig and overlay pipeline_config
-                # so that perform_startup_reconciliation() sees the resolved agent list.
-                unified_config = UnifiedConfig()
-
-                # Compute effective enabled set: enabled + required - excluded
-                effective_agents = pipeline_config.get_agents_to_deploy()
-                if effective_agents and (
-                    active_profile or pipeline_config.has_explicit_agent_selection
-                ):
-                    # Only override when there is an explicit agent selection
-                    # (active profile or config-driven enabled list).  When
-                    # neither is present, effective_agents contains only the
-                    # default required set — overriding with that tiny list
-                    # would cause the reconciler to remove all other agents.
-                    unified_config.agents.enabled = list(effective_agents)
-                    if active_profile:
-                        logger.info(
-                            "Profile '%s': Using %d enabled agents",
-                            active_profile,
-                            len(effective_agents),
-                        )
-                else:
-                    # No explicit agent selection: keep agents.enabled empty
-                    # and enable auto_discover so the reconciler preserves all
-                    # currently deployed agents (its early-return path).
-                    unified_config.agents.auto_discover = True
-
-                # Perform reconciliation to deploy configured agents
-                project_path = Path.cwd()
-                agent_result, _skill_result = perform_startup_reconciliation(
-                    project_path=project_path, config=unified_config, silent=False
-                )
+                # Log errors if any
+                errors = result.get("errors", [])
+                if errors:
+                    logger.warning(f"Agent sync completed with {len(errors)} errors")
 
-                # Display results with progress bar
-                total_operations = (
-                    len(agent_result.deployed)
-                    + len(agent_result.removed)
-                    + len(agent_result.unchanged)
-                )
+                # Display manifest compatibility warnings to the console
+                # (after sync populates ManifestCache, before deployment)
+                _display_manifest_compatibility_warnings()
 
-                if total_operations > 0:
-                    deploy_progress = ProgressBar(
-                        total=total_operations,
-                        prefix="Deploying agents",
-                        show_percentage=True,
-                        show_counter=True,
+                pending = ["--force-sync"] if force_sync else _pending_changes("agents")
+                if not pending:
+                    logger.debug(
+                        "Deployed agents match synced sources, skipping deploy"
                     )
-                    deploy_progress.update(total_operations)
-
-                    # Build summary message
-                    deployed = len(agent_result.deployed)
-                    removed = len(agent_result.removed)
-                    unchanged = len(agent_result.unchanged)
-
-                    summary_parts = []
-                    if deployed > 0:
-                        summary_parts.append(f"{deployed} new")
-                    if removed > 0:
-                        summary_parts.append(f"{removed} removed")
-                    if unchanged > 0:
-                        summary_parts.append(f"{unchanged} unchanged")
-
-                    summary = f"Complete: {', '.join(summary_parts)}"
-                    deploy_progress.finish(summary)
-
-                # Display errors if any
-                if agent_result.errors:
-                    logger.warning(
-                        f"Agent deployment completed with {len(agent_result.errors)} errors"
-                    )
-                    # Only show error details to TTY (avoid polluting stdout in headless mode)
-                    if sys.stdout.isatty():
-                        print("\n⚠️  Agent Deployment Errors:")
-                        max_errors_to_show = 10
-                        errors_to_display = agent_result.errors[:max_errors_to_show]
-
-                        for error in errors_to_display:
-                            print(f"   - {error}")
-
-                        if len(agent_result.errors) > max_errors_to_show:
-                            remaining = len(agent_result.errors) - max_errors_to_show
-                            print(f"   ... and {remaining} more error(s)")
-
-                        print(
-                            f"\n❌ Failed to deploy {len(agent_result.errors)} agent(s). "
-                            "Please check the error messages above."
-                        )
-                        print("   Run with --verbose for detailed error information.\n")
-
-                # Save deployment state to prevent duplicate deployment in ClaudeRunner
-                # This ensures setup_agents() skips deployment since we already reconciled
-                _save_deployment_state_after_reconciliation(
-                    agent_result=agent_result, project_path=project_path
-                )
 
-            except Exception as e:
-                # Deployment failure shouldn't block startup
-                from ..core.logger import get_logger
-
-                logger = get_logger("cli")
-                logger.warning(f"Failed to deploy agents from cache: {e}")
+        # Phase 2: Deploy agents from cache to ~/.claude/agents/, only when
+        # something changed since the last reconciliation
+        if pending and _reconcile_agents_from_cache(pipeline_config, active_profile):
+            _mark_reconciled("agents")
 
         # Phase 4: Cleanup legacy agent cache directories (after sync/deployment)
         # CRITICAL: This must run AFTER sync completes because sync may recreate
@@ -1255,7 +1326,8 @@ def sync_remote_agents_on_startup(force_sync: bool = False):
         cleanup_legacy_agent_cache()
 
         # Record successful sync time for TTL-based skipping on next startup
-        _mark_sync_done("agents")
+        if not ttl_fresh:
+            _mark_sync_done("agents")
 
     except Exception as e:
         # Non-critical - log but don't fail startup
@@ -1272,6 +1344,109 @@ def sync_remote_agents_on_startup(force_sync: bool = False):
             pass  # Ignore cleanup errors
 
 
+def _sync_skill_sources(manager, enabled_sources, force_sync: bool) -> dict:
+    """Sync enabled skill sources with a cumulative progress bar.
+
+    We need to discover file count first to show accurate progress.
+    This requires pre-scanning repositories via GitHub API.
+
+    Returns:
+        Results of GitSkillSourceManager.sync_all_sources()
+    """
+    from ..core.logger import get_logger
+    from ..utils.progress import ProgressBar
+
+    logger = get_logger("cli")
+
+    # Discover total file count across all sources
+    total_file_count = 0
+    total_skill_dirs = 0  # Count actual skill directories (folders with SKILL.md)
+
+    for source in enabled_sources:
+        try:
+            # Parse GitHub URL
+            url_parts = source.url.rstrip("/").replace(".git", "").split("github.com/")
+            if len(url_parts) == 2:
+                repo_path = url_parts[1].strip("/")
+                owner_repo = "/".join(repo_path.split("/")[:2])
+
+                # Use Tree API to discover all files
+                all_files = manager._discover_repository_files_via_tree_api(
+                    owner_repo, source.branch
+                )
+
+                # Count relevant files (markdown, JSON)
+                relevant_files = [
+                    f
+                    for f in all_files
+                    if f.endswith(".md") or f.endswith(".json") or f == ".gitignore"
+                ]
+                total_file_count += len(relevant_files)
+
+                # Count skill directories (unique directories containing SKILL.md)
+                skill_dirs = set()
+                for f in all_files:
+                    if f.endswith("/SKILL.md"):
+                        # Extract directory path
+                        skill_dir = "/".join(f.split("/")[:-1])
+                        skill_dirs.add(skill_dir)
+                total_skill_dirs += len(skill_dirs)
+
+        except Exception as e:
+            logger.debug(f"Failed to discover files for {source.id}: {e}")
+            # Use estimate if discovery fails
+            total_file_count += 150
+            total_skill_dirs += 50  # Estimate ~50 skills
+
+    # Create progress bar for sync phase with actual file count
+    # Note: We sync files (md, json, etc.), but will deploy skill directories
+    sync_progress = ProgressBar(
+        total=total_file_count if total_file_count > 0 else 1,
+        prefix="Syncing skill files",
+        show_percentage=True,
+        show_counter=True,
+    )
+
+    # Wrap progress callback to accumulate across multiple sources.
+    # sync_all_sources calls callback(completed) with a PER-SOURCE absolute
+    # counter that resets to 1 at the start of each new source.  Without
+    # correction the bar jumps backward every time a new source begins,
+    # making it appear to "restart" several times.
+    _pb_max_seen = [0]
+    _pb_offset = [0]
+
+    def _cumulative_progress(completed: int) -> None:
+        if completed < _pb_max_seen[0]:
+            # Completed went backward → a new source has started.
+            # Bank the previous source's contribution into the offset.
+            _pb_offset[0] += _pb_max_seen[0]
+            _pb_max_seen[0] = 0
+        _pb_max_seen[0] = completed
+        sync_progress.update(_pb_offset[0] + completed)
+
+    # Sync all sources with cumulative progress callback
+    results = manager.sync_all_sources(
+        force=force_sync, progress_callback=_cumulative_progress
+    )
+
+    # Finish sync progress bar with clear breakdown
+    downloaded = results["total_files_updated"]
+    cached = results["total_files_cached"]
+    total_files = downloaded + cached
+
+    if cached > 0:
+        sync_progress.finish(
+            f"Complete: {downloaded} downloaded, {cached} cached ({total_files} files, {total_skill_dirs} skills)"
+        )
+    else:
+        # All new downloads (first sync)
+        sync_progress.finish(
+            f"Complete: {downloaded} files downloaded ({total_skill_dirs} skills)"
+        )
+
+    return results
+
+
 def sync_remote_skills_on_startup(force_sync: bool = False):
     """
     Synchronize skill templates from remote sources on startup.
@@ -1284,7 +1459,9 @@ def sync_remote_skills_on_startup(force_sync: bool = False):
     block startup to ensure claude-mpm remains functional.
 
     Workflow:
-    1. Sync all enabled Git sources (download/cache files) - Phase 1 progress bar
+    1. Sync all enabled Git sources (download/cache files) - Phase 1 progress bar.
+       Within the sync TTL this is skipped, and steps 2-6 only run if the
+       change journal reports changes since the last reconciliation
     2. Scan deployed agents for skill requirements → save to configuration.yaml
     3. Resolve which skills to deploy (user_defined vs agent_referenced)
     4. Apply profile filtering if active
@@ -1294,15 +1471,20 @@ def sync_remote_skills_on_startup(force_sync: bool = False):
     Args:
         force_sync: Force download even if cache is fresh (bypasses ETag).
     """
-    # TTL-based skip: if last sync was recent, skip network checks entirely
-    if not force_sync and _is_sync_fresh("skills"):
-        from ..core.logger import get_logger as _get_logger
+    # TTL-based polling: if last sync was recent, skip network checks entirely
+    # and only reconcile local changes recorded in the change journal
+    ttl_fresh = not force_sync and _is_sync_fresh("skills")
+    pending: list[str] = []
+    if ttl_fresh:
+        pending = _pending_changes("skills", baseline_only=True)
+        if not pending:
+            from ..core.logger import get_logger as _get_logger
 
-        _get_logger("cli").debug(
-            f"Skipping skills sync (within {_get_sync_ttl()}s TTL). "
-            "Use --force-sync to override."
-        )
-        return
+            _get_logger("cli").debug(
+                f"Skipping skills sync (within {_get_sync_ttl()}s TTL, no changes "
+                "since last reconciliation). Use --force-sync to override."
+            )
+            return
 
     try:
         from pathlib import Path
@@ -1348,100 +1530,24 @@ def sync_remote_skills_on_startup(force_sync: bool = False):
         if not enabled_sources:
             return  # No sources enabled, nothing to sync
 
-        # Phase 1: Sync files from Git sources
-        # We need to discover file count first to show accurate progress
-        # This requires pre-scanning repositories via GitHub API
         from ..core.logger import get_logger
 
         logger = get_logger("cli")
 
-        # Discover total file count across all sources
-        total_file_count = 0
-        total_skill_dirs = 0  # Count actual skill directories (folders with SKILL.md)
-
-        for source in enabled_sources:
-            try:
-                # Parse GitHub URL
-                url_parts = (
-                    source.url.rstrip("/").replace(".git", "").split("github.com/")
-                )
-                if len(url_parts) == 2:
-                    repo_path = url_parts[1].strip("/")
-                    owner_repo = "/".join(repo_path.split("/")[:2])
-
-                    # Use Tree API to discover all files
-                    all_files = manager._discover_repository_files_via_tree_api(
-                        owner_repo, source.branch
-                    )
-
-                    # Count relevant files (markdown, JSON)
-                    relevant_files = [
-                        f
-                        for f in all_files
-                        if f.endswith(".md") or f.endswith(".json") or f == ".gitignore"
-                    ]
-                    total_file_count += len(relevant_files)
-
-                    # Count skill directories (unique directories containing SKILL.md)
-                    skill_dirs = set()
-                    for f in all_files:
-                        if f.endswith("/SKILL.md"):
-                            # Extract directory path
-                            skill_dir = "/".join(f.split("/")[:-1])
-                            skill_dirs.add(skill_dir)
-                    total_skill_dirs += len(skill_dirs)
-
-            except Exception as e:
-                logger.debug(f"Failed to discover files for {source.id}: {e}")
-                # Use estimate if discovery fails
-                total_file_count += 150
-                total_skill_dirs += 50  # Estimate ~50 skills
-
-        # Create progress bar for sync phase with actual file count
-        # Note: We sync files (md, json, etc.), but will deploy skill directories
-        sync_progress = ProgressBar(
-            total=total_file_count if total_file_count > 0 else 1,
-            prefix="Syncing skill files",
-            show_percentage=True,
-            show_counter=True,
-        )
-
-        # Wrap progress callback to accumulate across multiple sources.
-        # sync_all_sources calls callback(completed) with a PER-SOURCE absolute
-        # counter that resets to 1 at the start of each new source.  Without
-        # correction the bar jumps backward every time a new source begins,
-        # making it appear to "restart" several times.
-        _pb_max_seen = [0]
-        _pb_offset = [0]
-
-        def _cumulative_progress(completed: int) -> None:
-            if completed < _pb_max_seen[0]:
-                # Completed went backward → a new source has started.
-                # Bank the previous source's contribution into the offset.
-                _pb_offset[0] += _pb_max_seen[0]
-                _pb_max_seen[0] = 0
-            _pb_max_seen[0] = completed
-            sync_progress.update(_pb_offset[0] + completed)
-
-        # Sync all sources with cumulative progress callback
-        results = manager.sync_all_sources(
-            force=force_sync, progress_callback=_cumulative_progress
-        )
-
-        # Finish sync progress bar with clear breakdown
-        downloaded = results["total_files_updated"]
-        cached = results["total_files_cached"]
-        total_files = downloaded + cached
-
-        if cached > 0:
-            sync_progress.finish(
-                f"Complete: {downloaded} downloaded, {cached} cached ({total_files} files, {total_skill_dirs} skills)"
-            )
+        if ttl_fresh:
+            # Sources were polled within the TTL: only reconcile the local
+            # changes recorded in the change journal
+            logger.debug(f"Reconciling skills without sync: {', '.join(pending)}")
+            results = {"failed_count": 0}
         else:
-            # All new downloads (first sync)
-            sync_progress.finish(
-                f"Complete: {downloaded} files downloaded ({total_skill_dirs} skills)"
-            )
+            # Phase 1: Sync files from Git sources
+            results = _sync_skill_sources(manager, enabled_sources, force_sync)
+
+            pending = ["--force-sync"] if force_sync else _pending_changes("skills")
+            if not pending:
+                logger.debug("Deployed skills match synced sources, skipping deploy")
+                _mark_sync_done("skills")
+                return
 
         # Phase 2: Scan agents and save to configuration.yaml
         # This step populates configuration.yaml with agent-referenced skills
@@ -1632,7 +1738,10 @@ def sync_remote_skills_on_startup(force_sync: bool = False):
                 )
 
             # Record successful sync time for TTL-based skipping on next startup
-            _mark_sync_done("skills")
+            if not ttl_fresh:
+                _mark_sync_done("skills")
+            if not errors:
+                _mark_reconciled("skills")
 
     except Exception as e:
         # Non-critical - log but don't fail startup
@@ -2053,14 +2162,23 @@ def run_background_services(
                   major startup step calls progress.step() to advance the bar.
     """
 
+    current_step = None
+
     def _step(label: str) -> None:
-        """Advance progress bar if one is active."""
+        """Advance progress bar if one is active and trace the new step."""
+        nonlocal current_step
+        if current_step is not None:
+            current_step.end()
+        current_step = tracing.span(f"startup.{label}", "startup")
         if progress is not None:
             progress.step(label)
 
     # Wrap all startup operations in quiet_startup_context for headless mode
     # This redirects stdout to stderr, keeping stdout clean for JSON output
-    with quiet_startup_context(headless=headless):
+    with (
+        tracing.span("startup.background_services", "startup"),
+        quiet_startup_context(headless=headless),
+    ):
         # Consolidated deployment block: hooks + agents
         # RATIONALE: Hooks and agents are deployed together before other services
         # This ensures the deployment phase is complete before configuration checks
@@ -2126,6 +2244,7 @@ def run_background_services(
         # Auto-install chrome-devtools-mcp for browser automation
         _step("Setting up browser tools")
         auto_install_chrome_devtools_on_startup()
+        current_step.end()
 
 
 def setup_mcp_server_logging(args):
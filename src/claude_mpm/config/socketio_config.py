@@ -41,7 +41,9 @@ CONNECTION_CONFIG = {
     "enable_extra_heartbeat": False,  # Disable redundant heartbeats
     "enable_health_monitoring": True,  # Enable connection health monitoring
     # Buffer settings
-    "max_events_buffer": 1000,  # Maximum events to buffer per client
+    "max_events_buffer": 1000,  # Events retained in the shared event log
+    "max_client_lag": 500,  # Events a client may fall behind before backpressure
+    "backpressure_policy": "coalesce",  # "coalesce" or "drop" for lagging clients
     "max_http_buffer_size": 1e8,  # 100MB max buffer for large payloads
 }
 
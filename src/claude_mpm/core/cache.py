@@ -14,11 +14,18 @@ WHY file system caching:
 """
 
 import asyncio
+import base64
+import bisect
+import contextlib
+import fnmatch
 import json
-import pickle
+import os
+import struct
+import sys
 import threading
+import zlib
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, TypeVar
@@ -27,6 +34,54 @@ from ..core.logger import get_logger
 
 T = TypeVar("T")
 
+# On-disk tier: a magic header followed by append-only records of
+# <key_len, payload_len, crc32(key + payload), kind> + key + JSON payload.
+DISK_MAGIC = b"MPMFSC1\n"
+_RECORD_HEADER = struct.Struct("<IIIB")
+_RECORD_ENTRY = 0
+_RECORD_TOMBSTONE = 1
+# Rewrite the log once it holds this many times more records than live keys
+COMPACT_RATIO = 2
+
+FileValidator = tuple[int, int, int]
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a value without serializing it.
+
+    Walks containers and instance dicts, summing sys.getsizeof() for every
+    distinct object once.
+    """
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return sys.getsizeof(value)
+
+    total = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 64)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+    return total
+
+
+def file_validator(stat_result: os.stat_result) -> FileValidator:
+    """Identity of a file version: (mtime_ns, size, inode)."""
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
 
 @dataclass
 class CacheEntry:
@@ -35,10 +90,12 @@ class CacheEntry:
     key: str
     value: Any
     size: int
-    created_at: datetime = field(default_factory=datetime.now)
-    last_accessed: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_utcnow)
+    last_accessed: datetime = field(default_factory=_utcnow)
     access_count: int = 0
     ttl: float | None = None
+    # For file entries: (mtime_ns, size, inode) of the version cached
+    validator: FileValidator | None = None
 
     def is_expired(self) -> bool:
         """Check if entry has expired based on TTL."""
@@ -70,6 +127,71 @@ class CacheStats:
         return self.hits / total if total > 0 else 0.0
 
 
+class _SortedKeys:
+    """Sorted key list supporting prefix range queries via bisect."""
+
+    def __init__(self):
+        self._keys: list[str] = []
+
+    def add(self, key: str) -> None:
+        index = bisect.bisect_left(self._keys, key)
+        if index == len(self._keys) or self._keys[index] != key:
+            self._keys.insert(index, key)
+
+    def discard(self, key: str) -> None:
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+        return self._keys[start:end]
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+def _encode_payload(entry: CacheEntry) -> bytes | None:
+    """JSON payload for the disk tier, or None if the value is not storable."""
+    value = entry.value
+    if isinstance(value, bytes):
+        kind, stored = "bytes", base64.b64encode(value).decode("ascii")
+    else:
+        kind, stored = "json", value
+    try:
+        return json.dumps(
+            {
+                "k": kind,
+                "v": stored,
+                "s": entry.size,
+                "c": entry.created_at.timestamp(),
+                "ttl": entry.ttl,
+                "val": entry.validator,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+
+
+def _decode_payload(key: str, payload: bytes) -> CacheEntry:
+    data = json.loads(payload)
+    value = data["v"]
+    if data["k"] == "bytes":
+        value = base64.b64decode(value)
+    return CacheEntry(
+        key=key,
+        value=value,
+        size=data["s"],
+        created_at=datetime.fromtimestamp(data["c"], UTC),
+        ttl=data["ttl"],
+        validator=tuple(data["val"]) if data["val"] else None,
+    )
+
+
 class FileSystemCache:
     """LRU cache for file system operations.
 
@@ -78,6 +200,19 @@ class FileSystemCache:
     - Thread-safe with fine-grained locking
     - Memory-aware with size limits
     - TTL support for dynamic content
+    - File entries are keyed by path and validated against
+      (mtime_ns, size, inode), so an edited file replaces its old version
+      instead of leaving it resident until eviction
+    - Sizes come from a getsizeof() walk (or a caller hint), not from
+      serializing every value
+    - A sorted key index answers prefix invalidation without scanning
+
+    Persistence (``persist_path``): entries are appended as checksummed JSON
+    records by ``_save_cache()``; invalidations append tombstones. Opening a
+    cache only indexes record offsets, and a value is read and verified the
+    first time its key is requested. Torn or corrupt records are ignored.
+    Values that are not JSON-serializable (other than bytes) stay in memory
+    only, and nothing is ever unpickled.
 
     Example:
         cache = FileSystemCache(max_size_mb=100, default_ttl=300)
@@ -106,7 +241,7 @@ class FileSystemCache:
             max_size_mb: Maximum cache size in megabytes
             max_entries: Maximum number of cache entries
             default_ttl: Default time-to-live in seconds
-            persist_path: Optional path to persist cache to disk
+            persist_path: Optional path of the append-only disk tier
         """
         self.max_size = int(max_size_mb * 1024 * 1024)  # Convert to bytes
         self.max_entries = max_entries
@@ -114,30 +249,53 @@ class FileSystemCache:
         self.persist_path = persist_path
 
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._keys = _SortedKeys()
         self._lock = threading.RLock()
         self._stats = CacheStats()
         self._logger = get_logger("fs_cache")
 
-        # Load persisted cache if available
+        # Disk tier: key -> (payload offset, payload length, crc32)
+        self._disk_index: dict[str, tuple[int, int, int]] = {}
+        self._disk_keys = _SortedKeys()
+        self._disk_records = 0
+        self._disk_end = 0
+        self._dirty: set[str] = set()
+        self._tombstones: set[str] = set()
+        self._rewrite_disk = False
+
+        # Index persisted entries if available (values load lazily)
         if persist_path and persist_path.exists():
             self._load_cache()
 
     def _estimate_size(self, value: Any) -> int:
         """Estimate memory size of a value in bytes."""
-        if isinstance(value, (str, bytes)):
-            return len(value)
-        if isinstance(value, (list, dict)):
-            # Rough estimate using JSON serialization
-            try:
-                return len(json.dumps(value))
-            except Exception:
-                return 1000  # Default estimate
+        try:
+            return estimate_size(value)
+        except Exception:
+            return 1000  # Default estimate
+
+    # --- In-memory bookkeeping ---
+
+    def _insert(self, entry: CacheEntry) -> None:
+        """Add or replace an entry in place (caller holds the lock)."""
+        old_entry = self._cache.pop(entry.key, None)
+        if old_entry is not None:
+            self._stats.total_size -= old_entry.size
+            self._stats.entry_count -= 1
         else:
-            # Use pickle for size estimation
-            try:
-                return len(pickle.dumps(value))
-            except Exception:
-                return 100  # Default small size
+            self._keys.add(entry.key)
+        self._cache[entry.key] = entry
+        self._stats.total_size += entry.size
+        self._stats.entry_count += 1
+
+    def _drop(self, key: str) -> CacheEntry | None:
+        """Remove an entry from memory (caller holds the lock)."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._keys.discard(key)
+            self._stats.total_size -= entry.size
+            self._stats.entry_count -= 1
+        return entry
 
     def _evict_lru(self):
         """Evict least recently used entries to make space."""
@@ -147,9 +305,9 @@ class FileSystemCache:
                 or self._stats.entry_count > self.max_entries
             ):
                 # Remove oldest entry (first in OrderedDict)
-                key, entry = self._cache.popitem(last=False)
-                self._stats.total_size -= entry.size
-                self._stats.entry_count -= 1
+                key = next(iter(self._cache))
+                self._drop(key)
+                self._dirty.discard(key)
                 self._stats.evictions += 1
                 self._logger.debug(f"Evicted cache entry: {key}")
 
@@ -161,11 +319,22 @@ class FileSystemCache:
             ]
 
             for key in expired_keys:
-                entry = self._cache.pop(key)
-                self._stats.total_size -= entry.size
-                self._stats.entry_count -= 1
+                self._drop(key)
                 self._logger.debug(f"Expired cache entry: {key}")
 
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Live entry for key from memory or the disk tier (caller holds lock)."""
+        entry = self._cache.get(key)
+        if entry is None and key in self._disk_index:
+            entry = self._read_disk_entry(key)
+            if entry is not None:
+                self._insert(entry)
+                self._evict_lru()
+        if entry is not None and entry.is_expired():
+            self._drop(key)
+            return None
+        return entry
+
     def get(self, key: str) -> Any | None:
         """Get value from cache.
 
@@ -176,20 +345,12 @@ class FileSystemCache:
             Cached value or None if not found/expired
         """
         with self._lock:
-            entry = self._cache.get(key)
+            entry = self._lookup(key)
 
             if entry is None:
                 self._stats.misses += 1
                 return None
 
-            # Check expiration
-            if entry.is_expired():
-                self._cache.pop(key)
-                self._stats.total_size -= entry.size
-                self._stats.entry_count -= 1
-                self._stats.misses += 1
-                return None
-
             # Update LRU order
             self._cache.move_to_end(key)
             entry.touch()
@@ -197,15 +358,24 @@ class FileSystemCache:
             self._stats.hits += 1
             return entry.value
 
-    def put(self, key: str, value: Any, ttl: float | None = None) -> None:
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        size_hint: int | None = None,
+        validator: FileValidator | None = None,
+    ) -> None:
         """Store value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (overrides default)
+            size_hint: Size in bytes if the caller already knows it
+            validator: File identity the value was read from (file entries)
         """
-        size = self._estimate_size(value)
+        size = size_hint if size_hint is not None else self._estimate_size(value)
 
         # Don't cache if single item exceeds max size
         if size > self.max_size:
@@ -213,21 +383,21 @@ class FileSystemCache:
             return
 
         with self._lock:
-            # Remove existing entry if present
-            if key in self._cache:
-                old_entry = self._cache.pop(key)
-                self._stats.total_size -= old_entry.size
-                self._stats.entry_count -= 1
-
-            # Create new entry
             entry = CacheEntry(
-                key=key, value=value, size=size, ttl=ttl or self.default_ttl
+                key=key,
+                value=value,
+                size=size,
+                ttl=ttl or self.default_ttl,
+                validator=validator,
             )
-
-            # Add to cache
-            self._cache[key] = entry
-            self._stats.total_size += size
-            self._stats.entry_count += 1
+            self._insert(entry)
+            if self.persist_path:
+                self._dirty.add(key)
+                # The stored version is stale even if this one is evicted
+                # before the next save
+                if self._disk_index.pop(key, None) is not None:
+                    self._disk_keys.discard(key)
+                    self._tombstones.add(key)
 
             # Evict if necessary
             self._evict_lru()
@@ -267,6 +437,9 @@ class FileSystemCache:
     ) -> Any | None:
         """Get file content from cache or read from disk.
 
+        The entry for a path is reused while the file's (mtime_ns, size,
+        inode) is unchanged and replaced in place when it changes.
+
         Args:
             file_path: Path to file
             mode: File open mode ('r' for text, 'rb' for binary)
@@ -277,28 +450,42 @@ class FileSystemCache:
             File content or None if file doesn't exist
         """
         file_path = Path(file_path)
+        cache_key = f"file:{file_path}:{mode}"
 
-        # Generate cache key based on file path and modification time
-        if file_path.exists():
-            mtime = file_path.stat().st_mtime
-            cache_key = f"file:{file_path}:{mtime}:{mode}"
-        else:
+        try:
+            validator = file_validator(file_path.stat())
+        except OSError:
+            self.invalidate(cache_key)
             return None
 
-        def read_file():
-            """Read file from disk."""
-            try:
-                if "b" in mode:
-                    with Path(file_path).open(mode) as f:
-                        return f.read()
-                else:
-                    with Path(file_path).open(mode, encoding=encoding) as f:
-                        return f.read()
-            except Exception as e:
-                self._logger.error(f"Failed to read file {file_path}: {e}")
-                return None
+        with self._lock:
+            entry = self._lookup(cache_key)
+            if entry is not None and entry.validator == validator:
+                self._cache.move_to_end(cache_key)
+                entry.touch()
+                self._stats.hits += 1
+                return entry.value
+            self._stats.misses += 1
 
-        return self.get_or_compute(cache_key, read_file, ttl)
+        try:
+            if "b" in mode:
+                with file_path.open(mode) as f:
+                    content = f.read()
+            else:
+                with file_path.open(mode, encoding=encoding) as f:
+                    content = f.read()
+        except Exception as e:
+            self._logger.error(f"Failed to read file {file_path}: {e}")
+            return None
+
+        self.put(
+            cache_key,
+            content,
+            ttl,
+            size_hint=sys.getsizeof(content),
+            validator=validator,
+        )
+        return content
 
     def get_json(
         self, file_path: str | Path, ttl: float | None = None
@@ -332,41 +519,73 @@ class FileSystemCache:
             True if entry was removed, False if not found
         """
         with self._lock:
-            entry = self._cache.pop(key, None)
-            if entry:
-                self._stats.total_size -= entry.size
-                self._stats.entry_count -= 1
-                return True
-            return False
+            removed = self._drop(key) is not None
+            self._dirty.discard(key)
+            if self._disk_index.pop(key, None) is not None:
+                self._disk_keys.discard(key)
+                self._tombstones.add(key)
+                removed = True
+            return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Invalidate all keys starting with prefix.
+
+        Uses the sorted key indexes, so the cost depends on the number of
+        matching keys rather than the cache size.
+
+        Args:
+            prefix: Key prefix (e.g. "query:" or "file:/path/to/dir/")
+
+        Returns:
+            Number of entries invalidated
+        """
+        with self._lock:
+            keys = set(self._keys.with_prefix(prefix))
+            keys.update(self._disk_keys.with_prefix(prefix))
+            return sum(1 for key in keys if self.invalidate(key))
 
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all keys matching pattern.
 
+        Patterns whose only wildcard is a trailing ``*`` are served by
+        invalidate_prefix(); anything else falls back to an fnmatch scan.
+
         Args:
             pattern: Pattern to match (supports * wildcard)
 
         Returns:
             Number of entries invalidated
         """
-        import fnmatch
+        prefix = pattern[:-1] if pattern.endswith("*") else None
+        if prefix is not None and not any(c in prefix for c in "*?["):
+            return self.invalidate_prefix(prefix)
 
         with self._lock:
             matching_keys = [
-                key for key in self._cache if fnmatch.fnmatch(key, pattern)
+                key
+                for key in (*self._cache, *self._disk_index)
+                if fnmatch.fnmatch(key, pattern)
             ]
 
             count = 0
-            for key in matching_keys:
+            for key in set(matching_keys):
                 if self.invalidate(key):
                     count += 1
 
             return count
 
     def clear(self):
-        """Clear all cache entries."""
+        """Clear all cache entries (including the disk tier on next save)."""
         with self._lock:
             self._cache.clear()
+            self._keys.clear()
             self._stats = CacheStats()
+            if self._disk_index or self._disk_records:
+                self._rewrite_disk = True
+            self._disk_index.clear()
+            self._disk_keys.clear()
+            self._dirty.clear()
+            self._tombstones.clear()
             self._logger.info("Cache cleared")
 
     def get_stats(self) -> dict[str, Any]:
@@ -383,41 +602,167 @@ class FileSystemCache:
                 "entry_count": self._stats.entry_count,
                 "total_size_mb": self._stats.total_size / (1024 * 1024),
                 "max_size_mb": self.max_size / (1024 * 1024),
+                "disk_entries": len(self._disk_index),
             }
 
+    # --- Disk tier ---
+
     def _save_cache(self):
-        """Persist cache to disk."""
+        """Append changed entries and tombstones to the disk tier."""
         if not self.persist_path:
             return
 
-        try:
-            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.persist_path.open("wb") as f:
-                pickle.dump(self._cache, f)
-            self._logger.debug(f"Cache persisted to {self.persist_path}")
-        except Exception as e:
-            self._logger.error(f"Failed to persist cache: {e}")
+        with self._lock:
+            try:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                live = len(self._disk_index) + len(self._dirty)
+                if (
+                    self._rewrite_disk
+                    or self._disk_end == 0
+                    or self._disk_records > COMPACT_RATIO * max(live, 1)
+                ):
+                    self._compact()
+                else:
+                    self._append(self._pending_records())
+                self._logger.debug(f"Cache persisted to {self.persist_path}")
+            except Exception as e:
+                self._logger.error(f"Failed to persist cache: {e}")
+
+    def _pending_records(self) -> Iterator[tuple[str, int, bytes]]:
+        for key in sorted(self._tombstones):
+            yield key, _RECORD_TOMBSTONE, b""
+        for key in sorted(self._dirty):
+            entry = self._cache.get(key)
+            payload = _encode_payload(entry) if entry else None
+            if payload is not None:
+                yield key, _RECORD_ENTRY, payload
+
+    def _append(self, records) -> None:
+        with self.persist_path.open("r+b") as f:
+            # Drop a torn tail left by an interrupted writer
+            f.truncate(self._disk_end)
+            f.seek(self._disk_end)
+            self._write_records(f, records)
+            f.flush()
+            os.fsync(f.fileno())
+        self._dirty.clear()
+        self._tombstones.clear()
+
+    def _compact(self) -> None:
+        """Rewrite the log with only live entries (memory wins over disk)."""
+        entries: dict[str, bytes] = {}
+        for key in list(self._disk_index):
+            if key in self._dirty:
+                continue
+            payload = self._read_disk_payload(key)
+            if payload is not None:
+                entries[key] = payload
+        for key in self._dirty:
+            entry = self._cache.get(key)
+            payload = _encode_payload(entry) if entry else None
+            if payload is not None:
+                entries[key] = payload
+
+        tmp_path = self.persist_path.with_suffix(self.persist_path.suffix + ".tmp")
+        self._disk_index.clear()
+        self._disk_keys.clear()
+        self._disk_records = 0
+        with tmp_path.open("wb") as f:
+            f.write(DISK_MAGIC)
+            self._disk_end = len(DISK_MAGIC)
+            self._write_records(
+                f, ((key, _RECORD_ENTRY, p) for key, p in sorted(entries.items()))
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.persist_path)
+        self._dirty.clear()
+        self._tombstones.clear()
+        self._rewrite_disk = False
+
+    def _write_records(self, f, records) -> None:
+        for key, kind, payload in records:
+            key_bytes = key.encode("utf-8")
+            crc = zlib.crc32(key_bytes + payload)
+            f.write(_RECORD_HEADER.pack(len(key_bytes), len(payload), crc, kind))
+            f.write(key_bytes)
+            offset = f.tell()
+            f.write(payload)
+            self._index_record(key, kind, offset, len(payload), crc)
+            self._disk_end = offset + len(payload)
+
+    def _index_record(self, key, kind, offset, length, crc) -> None:
+        self._disk_records += 1
+        if kind == _RECORD_TOMBSTONE:
+            if self._disk_index.pop(key, None) is not None:
+                self._disk_keys.discard(key)
+        else:
+            self._disk_index[key] = (offset, length, crc)
+            self._disk_keys.add(key)
 
     def _load_cache(self):
-        """Load cache from disk."""
+        """Index the disk tier; values are read on first access."""
         if not self.persist_path or not self.persist_path.exists():
             return
 
         try:
             with self.persist_path.open("rb") as f:
-                loaded_cache = pickle.load(f)  # nosec
-
-            # Rebuild cache with validation
-            for key, entry in loaded_cache.items():
-                if not entry.is_expired():
-                    self._cache[key] = entry
-                    self._stats.total_size += entry.size
-                    self._stats.entry_count += 1
-
-            self._logger.info(f"Loaded {len(self._cache)} entries from cache")
+                if f.read(len(DISK_MAGIC)) != DISK_MAGIC:
+                    self._logger.info(
+                        f"Ignoring cache file in an old format: {self.persist_path}"
+                    )
+                    self._rewrite_disk = True
+                    return
+                file_size = os.fstat(f.fileno()).st_size
+                self._disk_end = len(DISK_MAGIC)
+                while True:
+                    header = f.read(_RECORD_HEADER.size)
+                    if len(header) < _RECORD_HEADER.size:
+                        break
+                    key_len, length, crc, kind = _RECORD_HEADER.unpack(header)
+                    key_bytes = f.read(key_len)
+                    offset = f.tell()
+                    if len(key_bytes) < key_len or offset + length > file_size:
+                        break  # torn tail
+                    f.seek(length, os.SEEK_CUR)
+                    self._index_record(
+                        key_bytes.decode("utf-8", errors="replace"),
+                        kind,
+                        offset,
+                        length,
+                        crc,
+                    )
+                    self._disk_end = offset + length
+
+            self._logger.info(f"Indexed {len(self._disk_index)} entries from cache")
         except Exception as e:
             self._logger.error(f"Failed to load cache: {e}")
 
+    def _read_disk_payload(self, key: str) -> bytes | None:
+        offset, length, crc = self._disk_index[key]
+        try:
+            with self.persist_path.open("rb") as f:
+                f.seek(offset)
+                payload = f.read(length)
+        except OSError:
+            return None
+        if len(payload) != length or zlib.crc32(key.encode() + payload) != crc:
+            self._logger.warning(f"Discarding corrupt cache record: {key}")
+            self._disk_index.pop(key, None)
+            self._disk_keys.discard(key)
+            return None
+        return payload
+
+    def _read_disk_entry(self, key: str) -> CacheEntry | None:
+        payload = self._read_disk_payload(key)
+        if payload is None:
+            return None
+        with contextlib.suppress(ValueError, KeyError, TypeError):
+            return _decode_payload(key, payload)
+        self._disk_index.pop(key, None)
+        self._disk_keys.discard(key)
+        return None
+
 
 class AsyncFileSystemCache:
     """Async version of FileSystemCache for async applications.
@@ -511,7 +856,7 @@ def get_file_cache(
         _file_cache = FileSystemCache(
             max_size_mb=max_size_mb,
             default_ttl=default_ttl,
-            persist_path=cache_dir / "fs_cache.pkl",
+            persist_path=cache_dir / "fs_cache.log",
         )
     return _file_cache
 
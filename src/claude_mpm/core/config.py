@@ -921,7 +921,7 @@ class Config:
 
             # Check format field
             if "format" in response_logging:
-                valid_formats = ["json", "syslog", "journald"]
+                valid_formats = ["json", "syslog", "journald", "segmented"]
                 if response_logging["format"] not in valid_formats:
                     errors.append(
                         f"response_logging.format must be one of {valid_formats}, "
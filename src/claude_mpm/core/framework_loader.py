@@ -5,6 +5,8 @@ import os
 from pathlib import Path
 from typing import Any
 
+from claude_mpm.core import tracing
+
 # Import framework components
 from claude_mpm.core.framework import (
     AgentLoader,
@@ -206,6 +208,7 @@ class FrameworkLoader:
 
     # === Content Loading Methods ===
 
+    @tracing.traced("framework.load_content", "framework")
     def _load_framework_content(self) -> dict[str, Any]:
         """Load framework content using modular components."""
         content = {
@@ -315,6 +318,7 @@ class FrameworkLoader:
 
     # === Framework Instructions Generation ===
 
+    @tracing.traced("framework.instructions", "framework")
     def get_framework_instructions(self) -> str:
         """
         Get formatted framework instructions for injection.
@@ -364,6 +368,7 @@ class FrameworkLoader:
         """Format minimal framework instructions."""
         return self.content_formatter.format_minimal_framework(self.framework_content)
 
+    @tracing.traced("framework.agent_capabilities", "framework")
     def _generate_agent_capabilities_section(self) -> str:
         """Generate agent capabilities section with caching."""
         # Try cache first
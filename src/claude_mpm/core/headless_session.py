@@ -22,6 +22,7 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from claude_mpm.core import tracing
 from claude_mpm.core.env_defaults import apply_subprocess_env_defaults
 from claude_mpm.core.logger import get_logger
 
@@ -353,6 +354,8 @@ class HeadlessSession:
             # - claude-mpm initializes once
             # - os.execvpe() replaces process with claude
             # - Claude handles the entire session
+            # exec skips atexit handlers, so write the startup trace now
+            tracing.flush()
             os.execvpe(cmd[0], cmd, env)  # nosec B606
 
             # Only reached on exec failure
@@ -10,15 +10,27 @@ WHY this is needed:
 - PM runs directly in Python, bypassing Claude Code's hook system
 - TodoWrite and other PM operations should trigger the same hooks as agent operations
 - Ensures consistent event streaming to Socket.IO dashboard
+
+DESIGN DECISIONS:
+- Events are dispatched in-process to a long-lived ``ClaudeHookHandler``
+  built from the shared ``HookServiceContainer``. Spawning the hook handler
+  per event cost a Python start-up for every PM operation
+- The background thread drains the queue in batches of up to
+  ``CLAUDE_MPM_HOOK_BATCH_SIZE`` events per wake-up
+- ``CLAUDE_MPM_HOOK_DISPATCH=subprocess`` keeps the previous behaviour of
+  running the handler module per event. It is also used when the handler
+  cannot be imported in this process
 """
 
 import contextlib
 import json
+import logging
 import os
 import queue
 import subprocess  # nosec B404
 import threading
 import uuid
+import warnings
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,6 +42,23 @@ from .hook_performance_config import get_hook_performance_config
 from .unified_paths import get_package_root
 
 
+@contextlib.contextmanager
+def _preserve_logging_config():
+    """Undo the logging and warnings changes made by importing the hook handler.
+
+    The hook handler module silences the root logger when it is imported,
+    which is intended for its own process but not for claude-mpm.
+    """
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    try:
+        with warnings.catch_warnings():
+            yield
+    finally:
+        root.handlers = handlers
+        root.setLevel(level)
+
+
 class HookManager:
     """Manager for manually triggering hook events from PM operations.
 
@@ -59,6 +88,20 @@ class HookManager:
         self.background_thread = None
         self.shutdown_event = threading.Event()
 
+        # In-process dispatch (created on first use in the background thread)
+        self.dispatch_mode = self.performance_config.dispatch_mode
+        self.batch_size = max(1, self.performance_config.batch_size)
+        self._in_process_handler = None
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "queued": 0,
+            "dispatched": 0,
+            "dropped": 0,
+            "errors": 0,
+            "batches": 0,
+            "max_queue_depth": 0,
+        }
+
         # Start background processing if hook handler is available
         if self.hook_handler_path:
             self._start_background_processor()
@@ -86,19 +129,28 @@ class HookManager:
             while not self.shutdown_event.is_set():
                 try:
                     # Get hook data with timeout to allow shutdown checking
-                    hook_data = self.hook_queue.get(timeout=1.0)
-                    if hook_data is None:  # Shutdown signal
-                        break
-
-                    # Process the hook synchronously in background thread
-                    self._execute_hook_sync(hook_data)
-                    self.hook_queue.task_done()
-
+                    batch = [self.hook_queue.get(timeout=1.0)]
                 except queue.Empty:
                     # Timeout - continue to check shutdown event
                     continue
+
+                # Take whatever else is already queued, up to the batch size
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.hook_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = None in batch  # Shutdown signal
+                try:
+                    self._process_batch([item for item in batch if item is not None])
                 except Exception as e:
                     self.logger.error(f"Hook processing error: {e}")
+                finally:
+                    for _ in batch:
+                        self.hook_queue.task_done()
+                if stop:
+                    break
 
         self.background_thread = threading.Thread(
             target=process_hooks, name="hook-processor", daemon=True
@@ -145,8 +197,106 @@ class HookManager:
             # Don't let event publishing break hook processing
             self.logger.debug(f"Failed to publish error event: {e}")
 
+    def _process_batch(self, batch: list[dict[str, Any]]) -> None:
+        """Dispatch a batch of queued hooks in the configured mode."""
+        if not batch:
+            return
+        with self._stats_lock:
+            self.stats["batches"] += 1
+
+        handler = None
+        if self.dispatch_mode == "inprocess":
+            handler = self._get_in_process_handler()
+
+        for hook_data in batch:
+            if handler is not None:
+                self._dispatch_in_process(handler, hook_data)
+            else:
+                self._execute_hook_sync(hook_data)
+            with self._stats_lock:
+                self.stats["dispatched"] += 1
+
+    def _get_in_process_handler(self):
+        """The in-process hook handler, or None to use the subprocess path.
+
+        The handler is built once from the shared hook service container. If
+        it cannot be imported or created, the manager falls back to the
+        subprocess dispatch mode for the rest of its lifetime.
+        """
+        if self._in_process_handler is None:
+            try:
+                with _preserve_logging_config():
+                    from ..hooks.claude_hooks.hook_handler import ClaudeHookHandler
+                    from ..hooks.claude_hooks.services import get_container
+
+                    self._in_process_handler = ClaudeHookHandler(
+                        container=get_container()
+                    )
+            except Exception as e:
+                self.logger.warning(
+                    f"In-process hook dispatch unavailable, using subprocess: {e}"
+                )
+                self.dispatch_mode = "subprocess"
+                return None
+        return self._in_process_handler
+
+    def _build_hook_event(self, hook_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "hook_event_name": hook_data["hook_type"],
+            "session_id": self.session_id,
+            "timestamp": hook_data.get("timestamp", datetime.now(UTC).isoformat()),
+            **hook_data["event_data"],
+        }
+
+    def _should_skip(self, hook_type: str) -> bool:
+        """Whether a hook is skipped because it is known to fail repeatedly."""
+        if not self.error_memory.should_skip_hook(hook_type):
+            return False
+        known_error = self.error_memory.is_known_failing_hook(hook_type)
+        # Log warning but don't spam - only on first skip
+        if known_error and known_error["count"] == 2:  # First time we're skipping
+            self.logger.warning(
+                f"⚠️  Skipping {hook_type} hook - failed {known_error['count']} times previously\n"
+                f"Error: {known_error['match']}\n"
+                f"To retry: rm {self.error_memory.memory_file}"
+            )
+        return True
+
+    def _handle_hook_error(self, hook_type: str, error_info: dict[str, str]) -> None:
+        """Record a detected hook error, log the suggested fix and publish it."""
+        with self._stats_lock:
+            self.stats["errors"] += 1
+
+        # Record the error in memory (for skipping repeated failures)
+        self.error_memory.record_error(error_info, hook_type)
+
+        # Get fix suggestion
+        suggestion = self.error_memory.suggest_fix(error_info)
+
+        # Log error with suggestion
+        self.logger.warning(f"Hook {hook_type} error detected:\n{suggestion}")
+
+        # Publish event to event log for autotodos processing
+        self._publish_error_event(hook_type, error_info, suggestion)
+
+    def _dispatch_in_process(self, handler, hook_data: dict[str, Any]) -> None:
+        """Process a single hook with the in-process handler."""
+        hook_type = hook_data.get("hook_type", "unknown")
+        try:
+            if self._should_skip(hook_type):
+                return
+            handler.process_event(self._build_hook_event(hook_data))
+        except Exception as e:
+            error_info = self.error_memory.detect_error(
+                "", f"Error: {type(e).__name__}: {e}", 1
+            )
+            if error_info:
+                self._handle_hook_error(hook_type, error_info)
+            else:
+                self.logger.debug(f"In-process hook execution error: {e}")
+
     def _execute_hook_sync(self, hook_data: dict[str, Any]):
-        """Execute a single hook synchronously in the background thread with error detection.
+        """Execute a single hook in a hook handler subprocess with error detection.
 
         WHY error detection:
         - Prevents repeated execution of failing hooks
@@ -156,30 +306,13 @@ class HookManager:
         """
         try:
             hook_type = hook_data["hook_type"]
-            event_data = hook_data["event_data"]
 
             # Check if this hook is known to fail repeatedly
-            if self.error_memory.should_skip_hook(hook_type):
-                known_error = self.error_memory.is_known_failing_hook(hook_type)
-                if known_error:
-                    # Log warning but don't spam - only on first skip
-                    if known_error["count"] == 2:  # First time we're skipping
-                        self.logger.warning(
-                            f"⚠️  Skipping {hook_type} hook - failed {known_error['count']} times previously\n"
-                            f"Error: {known_error['match']}\n"
-                            f"To retry: rm {self.error_memory.memory_file}"
-                        )
+            if self._should_skip(hook_type):
                 return
 
             # Create the hook event
-            hook_event = {
-                "hook_event_name": hook_type,
-                "session_id": self.session_id,
-                "timestamp": hook_data.get("timestamp", datetime.now(UTC).isoformat()),
-                **event_data,
-            }
-
-            event_json = json.dumps(hook_event)
+            event_json = json.dumps(self._build_hook_event(hook_data))
             env = os.environ.copy()
             env["CLAUDE_MPM_HOOK_DEBUG"] = "true"
 
@@ -201,17 +334,7 @@ class HookManager:
             )
 
             if error_info:
-                # Record the error in memory (for skipping repeated failures)
-                self.error_memory.record_error(error_info, hook_type)
-
-                # Get fix suggestion
-                suggestion = self.error_memory.suggest_fix(error_info)
-
-                # Log error with suggestion
-                self.logger.warning(f"Hook {hook_type} error detected:\n{suggestion}")
-
-                # Publish event to event log for autotodos processing
-                self._publish_error_event(hook_type, error_info, suggestion)
+                self._handle_hook_error(hook_type, error_info)
             elif result.returncode != 0:
                 # Non-zero return without detected pattern
                 self.logger.debug(f"Hook {hook_type} returned code {result.returncode}")
@@ -237,6 +360,14 @@ class HookManager:
             self.background_thread.join(timeout=2.0)
             self.logger.debug("Background hook processor shutdown")
 
+    def get_stats(self) -> dict[str, Any]:
+        """Dispatch statistics, including events dropped on queue overflow."""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["queue_depth"] = self.hook_queue.qsize()
+        stats["dispatch_mode"] = self.dispatch_mode
+        return stats
+
     def _find_hook_handler(self) -> Path | None:
         """Find the hook handler script."""
         try:
@@ -343,13 +474,26 @@ class HookManager:
 
             # Try to queue without blocking
             self.hook_queue.put_nowait(hook_data)
+            depth = self.hook_queue.qsize()
+            with self._stats_lock:
+                self.stats["queued"] += 1
+                self.stats["max_queue_depth"] = max(
+                    self.stats["max_queue_depth"], depth
+                )
             self.logger.debug(
                 f"Successfully queued {hook_type} hook for background processing"
             )
             return True
 
         except queue.Full:
-            self.logger.warning(f"Hook queue full, dropping {hook_type} event")
+            with self._stats_lock:
+                self.stats["dropped"] += 1
+                dropped = self.stats["dropped"]
+            # Warn on the first overflow and then every 100 drops
+            if dropped == 1 or dropped % 100 == 0:
+                self.logger.warning(
+                    f"Hook queue full, dropping {hook_type} event ({dropped} dropped)"
+                )
             return False
         except Exception as e:
             self.logger.error(f"Error queuing {hook_type} hook: {e}")
@@ -39,7 +39,14 @@ class HookPerformanceConfig:
         self.queue_size = int(os.getenv("CLAUDE_MPM_HOOK_QUEUE_SIZE", "1000"))
         self.background_timeout = float(os.getenv("CLAUDE_MPM_HOOK_BG_TIMEOUT", "2.0"))
 
-        # Batching settings (for future implementation)
+        # Dispatch mode: "inprocess" (default) or "subprocess" (one hook
+        # handler process per event)
+        self.dispatch_mode = os.getenv("CLAUDE_MPM_HOOK_DISPATCH", "inprocess").lower()
+        if self.dispatch_mode not in ("inprocess", "subprocess"):
+            self.dispatch_mode = "inprocess"
+
+        # Batching settings (batch_size bounds the events dispatched per
+        # wake-up of the background processor)
         self.enable_batching = (
             os.getenv("CLAUDE_MPM_HOOK_BATCHING", "false").lower() == "true"
         )
@@ -79,7 +86,7 @@ class HookPerformanceConfig:
         return {"maxsize": self.queue_size, "timeout": self.background_timeout}
 
     def get_batch_config(self) -> dict[str, any]:
-        """Get batching configuration (for future use)."""
+        """Get batching configuration."""
         return {
             "enabled": self.enable_batching,
             "batch_size": self.batch_size,
@@ -97,6 +104,7 @@ class HookPerformanceConfig:
             f"  Delegation Hooks: {self.enable_delegation_hooks}",
             f"  Queue Size: {self.queue_size}",
             f"  Background Timeout: {self.background_timeout}s",
+            f"  Dispatch Mode: {self.dispatch_mode}",
             f"  Batching Enabled: {self.enable_batching}",
         ]
         return "\n".join(config_lines)
@@ -140,7 +148,8 @@ ENVIRONMENT_VARIABLES = {
     "CLAUDE_MPM_HOOKS_DELEGATION": 'Set to "false" to disable delegation hooks',
     "CLAUDE_MPM_HOOK_QUEUE_SIZE": "Maximum number of hooks in background queue (default: 1000)",
     "CLAUDE_MPM_HOOK_BG_TIMEOUT": "Timeout for background hook processing in seconds (default: 2.0)",
+    "CLAUDE_MPM_HOOK_DISPATCH": 'Set to "subprocess" to run the hook handler in a new process per event (default: "inprocess")',
     "CLAUDE_MPM_HOOK_BATCHING": 'Set to "true" to enable hook batching (experimental)',
-    "CLAUDE_MPM_HOOK_BATCH_SIZE": "Number of hooks to batch together (default: 10)",
+    "CLAUDE_MPM_HOOK_BATCH_SIZE": "Maximum hooks dispatched per background wake-up (default: 10)",
     "CLAUDE_MPM_HOOK_BATCH_TIMEOUT_MS": "Batch timeout in milliseconds (default: 100)",
 }
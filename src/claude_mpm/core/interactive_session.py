@@ -17,6 +17,7 @@ import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from claude_mpm.core import tracing
 from claude_mpm.core.enums import ServiceState
 from claude_mpm.core.env_defaults import apply_subprocess_env_defaults
 from claude_mpm.core.logger import get_logger
@@ -609,6 +610,9 @@ class InteractiveSession:
                 message="Claude process started (exec mode)",
             )
 
+        # exec skips atexit handlers, so write the startup trace now
+        tracing.flush()
+
         # This will not return if successful
         os.execvpe(cmd[0], cmd, env)  # nosec B606
         return False  # type: ignore[unreachable]  # reached when os.execvpe is mocked in tests
@@ -70,6 +70,20 @@ class ConfigLoader:
         defaults={"enabled": True, "auto_start": False, "health_check_interval": 60},
     )
 
+    MAIN_CONFIG = ConfigPattern(
+        filenames=[
+            "claude-mpm.yaml",
+            "claude-mpm.yml",
+            ".claude-mpm.yaml",
+            ".claude-mpm.yml",
+            "config.yaml",
+            "config.yml",
+        ],
+        search_paths=["~/.config/claude-mpm", ".", "./config", "/etc/claude-mpm"],
+        env_prefix="CLAUDE_MPM_",
+        defaults={},
+    )
+
     def __init__(self, working_dir: str | Path | None = None):
         """
         Initialize config loader.
@@ -157,20 +171,7 @@ class ConfigLoader:
 
     def load_main_config(self) -> Config:
         """Load main application configuration."""
-        pattern = ConfigPattern(
-            filenames=[
-                "claude-mpm.yaml",
-                "claude-mpm.yml",
-                ".claude-mpm.yaml",
-                ".claude-mpm.yml",
-                "config.yaml",
-                "config.yml",
-            ],
-            search_paths=["~/.config/claude-mpm", ".", "./config", "/etc/claude-mpm"],
-            env_prefix="CLAUDE_MPM_",
-            defaults={},
-        )
-        return self.load_config(pattern, cache_key="main_config")
+        return self.load_config(self.MAIN_CONFIG, cache_key="main_config")
 
     def load_memory_config(self, memory_dir: str | Path | None = None) -> Config:
         """Load memory configuration."""
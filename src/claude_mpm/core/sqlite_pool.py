@@ -0,0 +1,179 @@
+"""Per-thread persistent SQLite connections.
+
+WHY: MessagingDatabase and AgentSyncState used to open a fresh
+sqlite3 connection for every operation and re-run their PRAGMAs each time.
+On hot paths (session heartbeats, unread counts, per-file sync tracking) the
+connect + pragma setup dominated the cost of the actual statement.
+
+Design decisions:
+- One connection per (database, thread), created lazily and reused. SQLite
+  connections must not be shared between threads, and per-thread reuse keeps
+  the statement cache warm
+- PRAGMAs (WAL, synchronous=NORMAL, busy_timeout, ...) are applied once when
+  a connection is opened instead of on every checkout
+- Larger ``cached_statements`` so the compiled statements of a repository
+  class stay prepared across calls
+- ``connection()`` keeps the old "commit on success, rollback on error"
+  contract and is re-entrant: nested checkouts on the same thread join the
+  outer transaction
+- Connections owned by finished threads are closed when the next
+  connection is opened; connections inherited across fork() are discarded
+
+Limitations:
+- WAL requires the database to live on a local filesystem
+- synchronous=NORMAL may lose the last transactions on power loss (never
+  corrupts the database), which is acceptable for caches and messaging state
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable, Generator, Iterable, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from claude_mpm.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+}
+
+DEFAULT_CACHED_STATEMENTS = 256
+
+
+class SQLiteConnectionPool:
+    """Hands out one persistent connection per thread for a database file.
+
+    Example:
+        pool = SQLiteConnectionPool(db_path, pragmas={"foreign_keys": "ON"})
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO ...", params)
+
+        pool.executemany("INSERT INTO ...", rows)
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        pragmas: dict[str, str | int] | None = None,
+        row_factory: Callable[..., Any] | None = sqlite3.Row,
+        cached_statements: int = DEFAULT_CACHED_STATEMENTS,
+    ):
+        """Initialize the pool. No connection is opened until first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pragmas: PRAGMAs applied on top of DEFAULT_PRAGMAS
+            row_factory: Row factory for new connections
+            cached_statements: Size of each connection's statement cache
+        """
+        self.db_path = Path(db_path)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.row_factory = row_factory
+        self.cached_statements = cached_statements
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # thread ident -> (weakref to owning thread, connection)
+        self._connections: dict[int, tuple[weakref.ref, sqlite3.Connection]] = {}
+        self._pid = os.getpid()
+        self.connections_opened = 0
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Check out this thread's connection inside a transaction.
+
+        Commits when the outermost block exits normally and rolls back if it
+        raises. Nested blocks share the outer transaction.
+        """
+        conn = self._get_thread_connection()
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            yield conn
+            if depth == 0:
+                conn.commit()
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run one statement for many parameter rows in a single transaction.
+
+        Returns:
+            Number of rows affected
+        """
+        with self.connection() as conn:
+            cursor = conn.executemany(sql, rows)
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close every connection opened by this pool, in all threads."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for _thread_ref, conn in connections:
+            self._close_quietly(conn)
+        self._local = threading.local()
+
+    def _get_thread_connection(self) -> sqlite3.Connection:
+        if os.getpid() != self._pid:
+            # Connections must never be used across fork(); drop inherited ones
+            # without closing them, since the parent still owns the handles.
+            with self._lock:
+                self._connections.clear()
+            self._local = threading.local()
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=self.cached_statements,
+            # The pool guarantees per-thread use; this only allows close()
+            # to run from whichever thread shuts the pool down.
+            check_same_thread=False,
+        )
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+        current = threading.current_thread()
+        with self._lock:
+            self._prune_dead_threads()
+            self._connections[current.ident] = (weakref.ref(current), conn)
+            self.connections_opened += 1
+
+        logger.debug(f"Opened SQLite connection to {self.db_path} for {current.name}")
+        return conn
+
+    def _prune_dead_threads(self) -> None:
+        """Close connections whose owning thread has exited. Caller holds lock."""
+        for ident, (thread_ref, conn) in list(self._connections.items()):
+            thread = thread_ref()
+            if thread is None or not thread.is_alive():
+                del self._connections[ident]
+                self._close_quietly(conn)
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Error closing SQLite connection: {e}")
@@ -0,0 +1,359 @@
+"""Opt-in span tracing for startup and hook invocations.
+
+WHY: ``hook_performance_config`` and ``LifecyclePerformanceTracker`` cover
+individual subsystems, but nothing showed where the time goes in a whole
+``claude-mpm run`` startup or in a single hook invocation.
+
+DESIGN DECISIONS:
+- Tracing is enabled per process with ``--profile`` or
+  ``CLAUDE_MPM_PROFILE=1``. ``--profile`` also exports the variable, so
+  hook processes started by Claude Code are traced too.
+- When tracing is disabled, ``span()`` returns a shared no-op object after
+  one global check. Instrumented code pays no allocation or clock read.
+- Spans become Chrome trace "complete" events (``"ph": "X"``). Timestamps
+  are wall-clock microseconds, so traces of the CLI and its hook processes
+  line up when loaded together in Perfetto or chrome://tracing. Nesting
+  follows from the timestamps of each thread.
+- Each traced process writes one file,
+  ``~/.claude-mpm/traces/<process>-<time>-<pid>.json``, at exit or before
+  ``exec`` replaces it. Only the newest ``MAX_TRACE_FILES`` are kept.
+- Only the standard library is imported so hook processes can use this
+  module cheaply.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PROFILE_ENV = "CLAUDE_MPM_PROFILE"
+MAX_TRACE_FILES = 200
+
+
+def trace_dir() -> Path:
+    """Trace directory (computed dynamically to respect Path.home mocks)."""
+    return Path.home() / ".claude-mpm" / "traces"
+
+
+def profile_requested() -> bool:
+    """Whether the environment asks for tracing."""
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class _NoopSpan:
+    """Span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        return None
+
+    def end(self) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed region, recorded when it ends."""
+
+    __slots__ = ("_ended", "_tracer", "args", "category", "name", "start_ns", "tid")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, Any]):
+        self._tracer = tracer
+        self._ended = False
+        self.name = name
+        self.category = category
+        self.args = args
+        self.tid = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+
+    def __enter__(self) -> Span:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.end()
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments shown with the span."""
+        self.args.update(args)
+
+    def end(self) -> None:
+        if not self._ended:
+            self._ended = True
+            self._tracer.record(
+                self.name,
+                self.category,
+                self.start_ns,
+                time.perf_counter_ns(),
+                args=self.args,
+                tid=self.tid,
+            )
+
+
+class Tracer:
+    """Collects the spans of one process as Chrome trace events."""
+
+    def __init__(self, process_name: str):
+        """
+        Args:
+            process_name: Label of the traced process (``claude-mpm``, ``hook``)
+        """
+        self.process_name = process_name
+        self.pid = os.getpid()
+        self.started_at = time.time()
+        self._origin_ns = time.perf_counter_ns()
+        self._origin_us = time.time_ns() // 1000
+        self._events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _timestamp_us(self, perf_ns: int) -> float:
+        return self._origin_us + (perf_ns - self._origin_ns) / 1000
+
+    def start_span(self, name: str, category: str, args: dict[str, Any]) -> Span:
+        return Span(self, name, category, args)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        *,
+        args: dict[str, Any] | None = None,
+        tid: int | None = None,
+    ) -> None:
+        """Record a finished span from ``time.perf_counter_ns()`` readings."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round(self._timestamp_us(start_ns), 3),
+            "dur": round((end_ns - start_ns) / 1000, 3),
+            "pid": self.pid,
+            "tid": tid if tid is not None else threading.get_ident(),
+        }
+        if args:
+            event["args"] = {key: _jsonable(value) for key, value in args.items()}
+        with self._lock:
+            self._events.append(event)
+
+    def write(self, directory: Path | None = None) -> Path | None:
+        """Write and clear the recorded spans.
+
+        Returns:
+            Path of the trace file, or None if nothing was recorded or the
+            file could not be written
+        """
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return None
+        directory = directory or trace_dir()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        path = directory / f"{self.process_name}-{stamp}-{self.pid}.json"
+        metadata = {
+            "name": "process_name",
+            "ph": "M",
+            "pid": self.pid,
+            "args": {"name": self.process_name},
+        }
+        trace = {
+            "traceEvents": [metadata, *events],
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "process": self.process_name,
+                "argv": sys.argv[1:],
+                "started_at": self.started_at,
+            },
+        }
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                # Second flush of the same process (e.g. before exec)
+                previous = json.loads(path.read_text(encoding="utf-8"))
+                trace["traceEvents"] = previous["traceEvents"] + events
+            path.write_text(json.dumps(trace), encoding="utf-8")
+        except (OSError, ValueError, KeyError):
+            return None
+        _prune(directory)
+        return path
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _prune(directory: Path) -> None:
+    files = sorted(directory.glob("*.json"), key=_mtime, reverse=True)
+    for stale in files[MAX_TRACE_FILES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+_tracer: Tracer | None = None
+
+
+def enable(process_name: str = "claude-mpm") -> Tracer:
+    """Start tracing this process and the processes it starts.
+
+    Args:
+        process_name: Label used in the trace file name and viewer
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(process_name)
+        atexit.register(flush)
+    os.environ[PROFILE_ENV] = "1"
+    return _tracer
+
+
+def enable_from_env(process_name: str) -> bool:
+    """Enable tracing if ``CLAUDE_MPM_PROFILE`` is set."""
+    if profile_requested():
+        enable(process_name)
+    return is_enabled()
+
+
+def disable() -> None:
+    """Stop tracing, discarding spans that were not flushed."""
+    global _tracer
+    if _tracer is not None:
+        atexit.unregister(flush)
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_tracer() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, category: str = "claude_mpm", **args: Any) -> Span | _NoopSpan:
+    """Time a region: ``with span("registry.discover", "registry"): ...``.
+
+    The returned span can also be ended explicitly with ``end()``.
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_span(name, category, args)
+
+
+def traced(name: str | None = None, category: str = "claude_mpm") -> Callable[[F], F]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.start_span(span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def flush() -> Path | None:
+    """Write recorded spans now (called at exit and before ``exec``)."""
+    if _tracer is None:
+        return None
+    return _tracer.write()
+
+
+def load_traces(
+    limit: int = 10, *, process: str | None = None, directory: Path | None = None
+) -> list[dict]:
+    """The newest *limit* traces, newest first.
+
+    Args:
+        limit: Number of traced runs to load
+        process: Only traces of this process (``claude-mpm`` or ``hook``)
+        directory: Trace directory (default: ~/.claude-mpm/traces)
+    """
+    directory = directory or trace_dir()
+    traces = []
+    for path in sorted(directory.glob("*.json"), key=_mtime, reverse=True):
+        if len(traces) >= limit:
+            break
+        try:
+            trace = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(trace, dict) or not isinstance(
+            trace.get("traceEvents"), list
+        ):
+            continue
+        if process is not None and trace.get("otherData", {}).get("process") != process:
+            continue
+        trace["path"] = str(path)
+        traces.append(trace)
+    return traces
+
+
+def summarize_spans(
+    traces: list[dict], category: str | None = None
+) -> list[dict[str, Any]]:
+    """Aggregate spans by name across traces, slowest (by max) first.
+
+    Returns:
+        Rows with ``name``, ``category``, ``count``, ``total_ms``,
+        ``mean_ms`` and ``max_ms``
+    """
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for trace in traces:
+        for event in trace["traceEvents"]:
+            if event.get("ph") != "X":
+                continue
+            if category is not None and event.get("cat") != category:
+                continue
+            key = (event.get("name", "?"), event.get("cat", ""))
+            row = rows.setdefault(
+                key,
+                {
+                    "name": key[0],
+                    "category": key[1],
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                },
+            )
+            duration_ms = event.get("dur", 0) / 1000
+            row["count"] += 1
+            row["total_ms"] += duration_ms
+            row["max_ms"] = max(row["max_ms"], duration_ms)
+    for row in rows.values():
+        row["mean_ms"] = row["total_ms"] / row["count"]
+    return sorted(rows.values(), key=lambda row: row["max_ms"], reverse=True)
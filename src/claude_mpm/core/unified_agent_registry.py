@@ -35,6 +35,7 @@ from typing import Any
 
 from claude_mpm.core.logging_utils import get_logger
 
+from . import tracing
 from .unified_paths import get_path_manager
 
 logger = get_logger(__name__)
@@ -213,6 +214,7 @@ class UnifiedAgentRegistry:
             f"Discovery paths configured: {[str(p) for p in self.discovery_paths]}"
         )
 
+    @tracing.traced("registry.discover_agents", "registry")
     def discover_agents(self, force_refresh: bool = False) -> dict[str, AgentMetadata]:
         """
         Discover all agents from configured paths with tier precedence.
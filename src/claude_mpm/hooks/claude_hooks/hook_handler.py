@@ -94,6 +94,8 @@ except ImportError:
         SubagentResponseProcessor,
     )
 
+from claude_mpm.core import tracing
+
 # Import CorrelationManager with fallback (used in _route_event cleanup)
 # WHY at top level: Runtime relative imports fail with "no known parent package" error
 try:
@@ -392,35 +394,8 @@ class ClaudeHookHandler:
                     _continue_sent = True
                 return
 
-            # Check for duplicate events (same event within 100ms)
-            if self.duplicate_detector.is_duplicate(event):
-                _log(
-                    f"[{datetime.now(UTC).isoformat()}] Skipping duplicate event: {event.get('hook_event_name', 'unknown')} (PID: {os.getpid()})"
-                )
-                # Still need to output continue for this invocation
-                if not _continue_sent:
-                    self._continue_execution()
-                    _continue_sent = True
-                return
-
-            # Debug: Log that we're processing an event
-            hook_type = event.get("hook_event_name", "unknown")
-            _log(
-                f"\n[{datetime.now(UTC).isoformat()}] Processing hook event: {hook_type} (PID: {os.getpid()})"
-            )
-
-            # Perform periodic cleanup if needed
-            if self.state_manager.increment_events_processed():
-                self.state_manager.cleanup_old_entries()
-                # Also cleanup old correlation files
-                CorrelationManager.cleanup_old()
-                _log(
-                    f"🧹 Performed cleanup after {self.state_manager.events_processed} events"
-                )
-
-            # Route event to appropriate handler
             # Returns modified_input for PreToolUse, or decision dict for Stop hooks
-            handler_result = self._route_event(event)
+            handler_result = self.process_event(event)
 
             # Send response (only if not already sent)
             if not _continue_sent:
@@ -442,6 +417,46 @@ class ClaudeHookHandler:
             # Cancel the alarm
             signal.alarm(0)
 
+    def process_event(self, event: dict) -> dict | None:
+        """Process one parsed hook event without reading stdin or writing stdout.
+
+        WHY separate from handle():
+        - handle() is the per-process entry point used by Claude Code
+        - HookManager dispatches PM-triggered events to a long-lived handler
+          in the claude-mpm process through this method
+
+        Args:
+            event: Hook event dictionary
+
+        Returns:
+            Modified input for PreToolUse, a decision dict for Stop hooks,
+            None otherwise (including skipped duplicates)
+        """
+        # Check for duplicate events (same event within 100ms)
+        if self.duplicate_detector.is_duplicate(event):
+            _log(
+                f"[{datetime.now(UTC).isoformat()}] Skipping duplicate event: {event.get('hook_event_name', 'unknown')} (PID: {os.getpid()})"
+            )
+            return None
+
+        # Debug: Log that we're processing an event
+        hook_type = event.get("hook_event_name", "unknown")
+        _log(
+            f"\n[{datetime.now(UTC).isoformat()}] Processing hook event: {hook_type} (PID: {os.getpid()})"
+        )
+
+        # Perform periodic cleanup if needed
+        if self.state_manager.increment_events_processed():
+            self.state_manager.cleanup_old_entries()
+            # Also cleanup old correlation files
+            CorrelationManager.cleanup_old()
+            _log(
+                f"🧹 Performed cleanup after {self.state_manager.events_processed} events"
+            )
+
+        # Route event to appropriate handler
+        return self._route_event(event)
+
     def _read_hook_event(self) -> dict:
         """
         Read and parse hook event from stdin with timeout.
@@ -549,6 +564,7 @@ class ClaudeHookHandler:
             success = False
             error_message = None
             result = None
+            route_span = tracing.span(f"hook.{hook_type}", "hook")
 
             try:
                 # Handlers can optionally return modified input
@@ -571,6 +587,8 @@ class ClaudeHookHandler:
             finally:
                 # Calculate duration
                 duration_ms = int((time.time() - start_time) * 1000)
+                route_span.set(success=success)
+                route_span.end()
 
                 # Emit hook execution event
                 self._emit_hook_execution_event(
@@ -623,7 +641,8 @@ class ClaudeHookHandler:
 
     def _emit_socketio_event(self, namespace: str, event: str, data: dict):
         """Emit event through connection manager."""
-        self.connection_manager.emit_event(namespace, event, data)
+        with tracing.span(f"emit.{event}", "emit"):
+            self.connection_manager.emit_event(namespace, event, data)
 
     def _get_event_key(self, event: dict) -> str:
         """Generate event key through duplicate detector (backward compatibility)."""
@@ -795,6 +814,8 @@ def main():
     """Entry point with singleton pattern and proper cleanup."""
     global _global_handler
     _continue_printed = False  # Track if we've already printed continue
+    # Trace file is written at exit (sys.exit runs atexit handlers)
+    tracing.enable_from_env("hook")
 
     # Check Claude Code version compatibility first
     is_compatible, version = check_claude_version()
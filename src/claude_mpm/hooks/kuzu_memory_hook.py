@@ -12,24 +12,25 @@ for structured memory storage with semantic search capabilities.
 
 DESIGN DECISIONS:
 - Priority 10 for early execution to enrich prompts before other hooks
-- Uses subprocess to call kuzu-memory directly for maximum compatibility
+- Recall and storage go through KuzuRecallClient: one long-lived worker
+  process, a per-prompt recall cache and batched stores, falling back to
+  the kuzu-memory CLI when the worker is unavailable
 - Graceful degradation if kuzu-memory is not installed
 - Automatic extraction and storage of important information
-- Async learning with 'memory learn --no-wait' for non-blocking memory storage
-- Synchronous recall for immediate memory retrieval
 - kuzu-memory operates in subservient mode (MPM controls hooks, not kuzu)
 - kuzu-memory is an OPTIONAL dependency (install with: pip install claude-mpm[memory])
 """
 
-import json
 import re
-import shutil
-import subprocess  # nosec B404
 from pathlib import Path
 from typing import Any
 
 from claude_mpm.core.logging_utils import get_logger
 from claude_mpm.hooks.base_hook import HookContext, HookResult, SubmitHook
+from claude_mpm.services.memory.kuzu_recall import (
+    KuzuRecallClient,
+    find_kuzu_memory_cmd,
+)
 
 logger = get_logger(__name__)
 
@@ -63,6 +64,7 @@ class KuzuMemoryHook(SubmitHook):
 
         # Use current project directory (kuzu-memory works with project-specific databases)
         self.project_path = Path.cwd()
+        self.recall_client = KuzuRecallClient(self.kuzu_memory_cmd, self.project_path)
 
         # Memory extraction patterns
         self.memory_patterns = [
@@ -82,27 +84,9 @@ class KuzuMemoryHook(SubmitHook):
 
         NOTE: As of v4.8.6, kuzu-memory is a required dependency and should be
         installed via pip. This method checks both pipx and system PATH for
-        backward compatibility.
+        backward compatibility. The lookup runs once per process.
         """
-        # Check pipx installation
-        pipx_path = (
-            Path.home()
-            / ".local"
-            / "pipx"
-            / "venvs"
-            / "kuzu-memory"
-            / "bin"
-            / "kuzu-memory"
-        )
-        if pipx_path.exists():
-            return str(pipx_path)
-
-        # Check system PATH
-        kuzu_cmd = shutil.which("kuzu-memory")
-        if kuzu_cmd:
-            return kuzu_cmd
-
-        return None
+        return find_kuzu_memory_cmd()
 
     def execute(self, context: HookContext) -> HookResult:
         """
@@ -167,40 +151,14 @@ class KuzuMemoryHook(SubmitHook):
         Returns:
             List of relevant memory dictionaries
         """
-        try:
-            # Type narrowing: ensure kuzu_memory_cmd is not None before using
-            if self.kuzu_memory_cmd is None:
-                return []
-
-            # Use kuzu-memory recall command (v1.2.7+ syntax)
-            result = subprocess.run(  # nosec B603
-                [self.kuzu_memory_cmd, "memory", "recall", query, "--format", "json"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                cwd=str(self.project_path),
-                check=False,
-            )
+        if self.kuzu_memory_cmd is None:
+            return []
 
-            if result.returncode == 0 and result.stdout:
-                try:
-                    # Parse JSON with strict=False to handle control characters
-                    data = json.loads(result.stdout, strict=False)
-                    # v1.2.7 returns dict with 'memories' key, not array
-                    if isinstance(data, dict):
-                        memories = data.get("memories", [])
-                    else:
-                        memories = data if isinstance(data, list) else []
-                    return memories
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse kuzu-memory JSON output: {e}")
-                    logger.debug(f"Raw output: {result.stdout[:200]}")
-                    return []  # Graceful fallback
-
-        except (subprocess.TimeoutExpired, Exception) as e:
+        try:
+            return self.recall_client.recall(query)
+        except Exception as e:
             logger.debug(f"Memory retrieval failed: {e}")
-
-        return []
+            return []
 
     def _enrich_prompt(
         self, original_data: dict[str, Any], prompt: str, memories: list[dict[str, Any]]
@@ -272,43 +230,25 @@ Note: Use the memories above to provide more informed and contextual responses.
 
     def store_memory(self, content: str, tags: list[str] | None = None) -> bool:
         """
-        Store a memory using kuzu-memory async learn command.
+        Queue a memory for storage in kuzu-memory.
 
-        This uses the async 'learn' command with --no-wait flag for non-blocking
-        execution, allowing the hook to return immediately without waiting for
-        memory processing to complete.
+        Stores are written in groups by the recall client's background
+        flusher, so the hook returns immediately.
 
         Args:
             content: The memory content to store
-            tags: Optional tags for categorization (currently unused)
+            tags: Optional tags for categorization
 
         Returns:
-            True if the async learn command was launched successfully
+            True if the memory was queued
         """
         if not self.enabled or self.kuzu_memory_cmd is None:
             return False
 
-        try:
-            # Use kuzu-memory learn command with --no-wait for async execution
-            # This is non-blocking and returns immediately
-            cmd = [self.kuzu_memory_cmd, "memory", "learn", content, "--no-wait"]
-
-            # Launch async process (fire-and-forget)
-            # Use Popen instead of run for non-blocking execution
-            subprocess.Popen(  # nosec B603
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                cwd=str(self.project_path),
-                start_new_session=True,  # Detach from parent process
-            )
-
-            logger.debug(f"Launched async learn for memory: {content[:50]}...")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to launch async learn: {e}")
-            return False
+        queued = self.recall_client.store(content, tags)
+        if queued:
+            logger.debug(f"Queued memory for storage: {content[:50]}...")
+        return queued
 
     def extract_and_store_learnings(self, text: str) -> int:
         """
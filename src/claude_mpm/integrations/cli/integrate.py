@@ -11,6 +11,7 @@ Provides CLI commands for managing API integrations:
 - create: Interactive wizard for creating new integrations
 - rebuild-index: Regenerate catalog _index.yaml
 - batch: Run batch scripts against integrations
+- cache: Show or clear cached integration responses
 """
 
 from __future__ import annotations
@@ -31,6 +32,7 @@ from ..core.batch import BatchRunner
 from ..core.index_generator import CatalogIndexGenerator
 from ..core.manifest import IntegrationManifest
 from ..core.mcp_generator import MCPServerGenerator
+from ..core.response_cache import ResponseCache, cache_dir_for
 
 console = Console()
 
@@ -734,3 +736,44 @@ def batch_cmd(integration: str, script: str) -> None:
         console.print("[red]Batch failed with errors:[/red]")
         for e in result.errors:
             console.print(f"  - {e}")
+
+
+@manage_integrations.command("cache")
+@click.argument("name", required=False)
+@click.option("--clear", is_flag=True, help="Drop cached responses and counters")
+def cache_cmd(name: str | None, clear: bool) -> None:
+    """Show response cache statistics, optionally for one integration."""
+    manager = IntegrationManager()
+    cache = ResponseCache.open(cache_dir_for(manager.project_dir))
+
+    if clear:
+        removed = cache.clear(name)
+        console.print(f"[green]Removed {removed} cached responses[/green]")
+        return
+
+    stats = cache.stats(name)
+    if not stats:
+        console.print("[dim]No cached responses[/dim]")
+        return
+
+    table = Table()
+    table.add_column("Integration", style="cyan")
+    table.add_column("Entries", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Revalidated", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Evictions", justify="right")
+    table.add_column("Hit rate", justify="right")
+    for integration, row in sorted(stats.items()):
+        table.add_row(
+            integration,
+            str(row["entries"]),
+            f"{row['bytes'] / 1024:.1f} KB",
+            str(row["hits"]),
+            str(row["revalidated"]),
+            str(row["misses"]),
+            str(row["evictions"]),
+            f"{row['hit_rate']:.0%}",
+        )
+    console.print(table)
@@ -4,6 +4,8 @@ This module provides the foundational components for API integrations:
 - manifest: Integration manifest parsing and validation
 - credentials: Credential management with .env wizard
 - client: REST and GraphQL HTTP client
+- pool: Shared connections and rate limiting for clients
+- response_cache: On-disk cache of idempotent operation responses
 - generator: Agent and skill file generation
 - mcp_generator: MCP server generation
 
@@ -42,17 +44,24 @@ from .credentials import CredentialManager
 from .generator import IntegrationGenerator
 from .manifest import (
     AuthConfig,
+    CacheConfig,
     CredentialDefinition,
     HealthCheck,
     IntegrationManifest,
     MCPConfig,
     Operation,
     OperationParameter,
+    PaginationConfig,
+    RateLimit,
 )
 from .mcp_generator import MCPServerGenerator
+from .pool import ConnectorPool, TokenBucket
+from .response_cache import ResponseCache
 
 __all__ = [
     "AuthConfig",
+    "CacheConfig",
+    "ConnectorPool",
     "CredentialDefinition",
     "CredentialManager",
     "HealthCheck",
@@ -63,4 +72,8 @@ __all__ = [
     "MCPServerGenerator",
     "Operation",
     "OperationParameter",
+    "PaginationConfig",
+    "RateLimit",
+    "ResponseCache",
+    "TokenBucket",
 ]
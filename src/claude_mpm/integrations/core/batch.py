@@ -2,6 +2,10 @@
 
 Provides a framework for running batch operations across multiple integrations
 or performing bulk operations with full client access.
+
+Bulk runs execute one script per integration concurrently (bounded by
+``max_concurrency``) and share a ``ConnectorPool``, so integrations on the
+same API reuse connections and respect one rate limit.
 """
 
 from __future__ import annotations
@@ -18,6 +22,10 @@ if TYPE_CHECKING:
 from .client import IntegrationClient
 from .credentials import CredentialManager
 from .manifest import IntegrationManifest  # noqa: TC001 - used in dataclass field
+from .pool import ConnectorPool
+
+# Integrations processed at once by run_bulk()
+DEFAULT_BULK_CONCURRENCY = 4
 
 
 @dataclass
@@ -82,6 +90,7 @@ class BatchRunner:
         script_path: Path,
         manifest: IntegrationManifest,
         manifest_path: Path,
+        pool: ConnectorPool | None = None,
     ) -> BatchResult:
         """Run a batch script with integration context.
 
@@ -91,6 +100,7 @@ class BatchRunner:
             script_path: Path to the Python batch script.
             manifest: Integration manifest.
             manifest_path: Path to the manifest file.
+            pool: Shared connector pool (used by run_bulk).
 
         Returns:
             BatchResult with execution results.
@@ -142,7 +152,9 @@ class BatchRunner:
             )
 
         # Create context and run
-        async with IntegrationClient(manifest, credentials) as client:
+        async with IntegrationClient(
+            manifest, credentials, pool=pool, project_dir=self.project_dir
+        ) as client:
             ctx = BatchContext(
                 manifest=manifest,
                 client=client,
@@ -198,7 +210,9 @@ class BatchRunner:
         cred_manager = CredentialManager(self.project_dir)
         credentials, _ = cred_manager.get_all_credentials(manifest.auth.credentials)
 
-        async with IntegrationClient(manifest, credentials) as client:
+        async with IntegrationClient(
+            manifest, credentials, project_dir=self.project_dir
+        ) as client:
             ctx = BatchContext(
                 manifest=manifest,
                 client=client,
@@ -223,23 +237,47 @@ class BatchRunner:
         self,
         script_path: Path,
         manifests: list[tuple[IntegrationManifest, Path]],
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> list[BatchResult]:
-        """Run a batch script across multiple integrations.
+        """Run a batch script across multiple integrations concurrently.
 
         Args:
             script_path: Path to the Python batch script.
             manifests: List of (manifest, manifest_path) tuples.
+            max_concurrency: Maximum integrations processed at once.
 
         Returns:
-            List of BatchResult for each integration.
+            List of BatchResult for each integration, in input order.
         """
-        results: list[BatchResult] = []
-
-        for manifest, manifest_path in manifests:
-            result = await self.run_script(script_path, manifest, manifest_path)
-            results.append(result)
-
-        return results
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with ConnectorPool() as pool:
+
+            async def _run_one(
+                manifest: IntegrationManifest, manifest_path: Path
+            ) -> BatchResult:
+                async with semaphore:
+                    try:
+                        return await self.run_script(
+                            script_path, manifest, manifest_path, pool=pool
+                        )
+                    except Exception as e:
+                        return BatchResult(
+                            success=False,
+                            results=[],
+                            errors=[f"Batch execution failed: {e}"],
+                            script_path=script_path,
+                            integration=manifest.name,
+                        )
+
+            return list(
+                await asyncio.gather(
+                    *(_run_one(manifest, path) for manifest, path in manifests)
+                )
+            )
 
 
 # Example batch script template
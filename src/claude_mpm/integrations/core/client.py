@@ -16,14 +16,36 @@ Example:
 
         # Call operation by name
         repos = await client.call_operation("list_repos", username="octocat")
+
+        # Stream every item of a paginated list operation
+        async for repo in client.paginate("list_repos", username="octocat"):
+            print(repo["name"])
+
+Requests are throttled by the manifest's ``rate_limit`` (token bucket) and
+429/503 responses are retried after the server's ``Retry-After``. Pass a
+shared ``ConnectorPool`` to reuse connections and rate limits across
+clients talking to the same API. Idempotent operations can be served from
+a ``ResponseCache`` when the manifest enables ``cache``.
 """
 
+import asyncio
 import base64
+import hashlib
+import re
+from collections.abc import AsyncIterator, Mapping
+from pathlib import Path
 from typing import Any
 
 import aiohttp
 
-from .manifest import IntegrationManifest, Operation
+from .manifest import IntegrationManifest, Operation, PaginationConfig
+from .pool import ConnectorPool, TokenBucket, parse_retry_after
+from .response_cache import ResponseCache, cache_dir_for, cache_key
+
+# Responses retried after waiting (Retry-After or exponential backoff)
+RETRYABLE_STATUSES = frozenset({429, 503})
+
+_LINK_NEXT_RE = re.compile(r'<([^>]+)>\s*;[^,]*rel="?next"?')
 
 
 class IntegrationClientError(Exception):
@@ -64,20 +86,51 @@ class IntegrationClient:
         self,
         manifest: IntegrationManifest,
         credentials: dict[str, str],
+        pool: ConnectorPool | None = None,
+        cache: ResponseCache | None = None,
+        *,
+        project_dir: Path | None = None,
     ) -> None:
         """Initialize the integration client.
 
         Args:
             manifest: Integration manifest defining the API.
             credentials: Dictionary of credential name -> value.
+            pool: Shared connector pool. Without one the client opens its
+                own connections and rate limiter.
+            cache: Response cache for idempotent operations. Defaults to
+                the shared on-disk cache when the manifest enables caching.
+            project_dir: Project root the default cache lives under
+                (default: current directory).
         """
         self.manifest = manifest
         self.credentials = credentials
+        self.pool = pool
+        if cache is None and manifest.cache.enabled:
+            cache = ResponseCache.open(
+                cache_dir_for(project_dir, manifest.cache.directory),
+                max_bytes=int(manifest.cache.max_size_mb * 1024 * 1024),
+            )
+        self.cache = cache
         self._session: aiohttp.ClientSession | None = None
+        self._limiter: TokenBucket | None = None
 
     async def __aenter__(self) -> "IntegrationClient":
         """Enter async context manager."""
-        self._session = aiohttp.ClientSession()
+        rate_limit = self.manifest.rate_limit
+        if self.pool is not None:
+            self._session = aiohttp.ClientSession(
+                connector=self.pool.connector(self.manifest.base_url, rate_limit),
+                connector_owner=False,
+            )
+            self._limiter = self.pool.limiter(self.manifest.base_url, rate_limit)
+        else:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=rate_limit.max_concurrency)
+            )
+            self._limiter = TokenBucket(
+                rate_limit.requests_per_second, rate_limit.burst
+            )
         return self
 
     async def __aexit__(
@@ -184,34 +237,83 @@ class IntegrationClient:
         if headers:
             request_headers.update(headers)
 
-        async with self._session.request(
-            method,
-            url,
-            params=params,
-            json=json,
-            headers=request_headers,
-        ) as response:
-            # Handle error responses
-            if response.status >= 400:
-                try:
-                    error_body = await response.json()
-                except (aiohttp.ContentTypeError, ValueError):
-                    error_body = await response.text()
+        result, _headers, _status = await self._send(
+            method, url, params=params, json=json, headers=request_headers
+        )
+        return result
 
-                raise APIError(
-                    f"API request failed: {response.status}",
-                    status_code=response.status,
-                    response_body=error_body,
-                )
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        check_status: bool = True,
+        **kwargs: Any,
+    ) -> tuple[Any, Mapping[str, str], int]:
+        """Send a throttled request, retrying 429/503 responses.
+
+        Returns:
+            Tuple of (parsed body, response headers, status code).
+
+        Raises:
+            APIError: If the API returns an error response.
+        """
+        if not self._session:
+            raise IntegrationClientError(
+                "Client not initialized. Use 'async with' context manager."
+            )
+        rate_limit = self.manifest.rate_limit
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+
+            async with self._session.request(method, url, **kwargs) as response:
+                if (
+                    response.status in RETRYABLE_STATUSES
+                    and attempt < rate_limit.max_retries
+                ):
+                    delay = parse_retry_after(response.headers.get("Retry-After"))
+                    if delay is None:
+                        delay = 0.5 * 2**attempt
+                    delay = min(delay, rate_limit.max_retry_after)
+                    attempt += 1
+                else:
+                    return await self._read_response(response, check_status)
+
+            # Outside the response block so the connection is released.
+            # Deferring the shared limiter pauses every client of this API.
+            if self._limiter is not None:
+                self._limiter.defer(delay)
+            else:
+                await asyncio.sleep(delay)
+
+    async def _read_response(
+        self, response: aiohttp.ClientResponse, check_status: bool
+    ) -> tuple[Any, Mapping[str, str], int]:
+        # Not modified: the caller holds the cached body
+        if response.status == 304:
+            return None, response.headers, response.status
 
-            # Parse successful response
+        # Handle error responses
+        if check_status and response.status >= 400:
             try:
-                result: dict[str, Any] = await response.json()
-                return result
+                error_body = await response.json()
             except (aiohttp.ContentTypeError, ValueError):
-                # Return text wrapped in dict if not JSON
-                text = await response.text()
-                return {"response": text}
+                error_body = await response.text()
+
+            raise APIError(
+                f"API request failed: {response.status}",
+                status_code=response.status,
+                response_body=error_body,
+            )
+
+        # Parse successful response
+        try:
+            result: Any = await response.json()
+        except (aiohttp.ContentTypeError, ValueError):
+            # Return text wrapped in dict if not JSON
+            result = {"response": await response.text()}
+        return result, response.headers, response.status
 
     async def graphql_request(
         self,
@@ -252,24 +354,22 @@ class IntegrationClient:
         request_headers["Content-Type"] = "application/json"
         request_headers["Accept"] = "application/json"
 
-        async with self._session.post(
-            url,
-            json=body,
-            headers=request_headers,
-        ) as response:
-            result: dict[str, Any] = await response.json()
+        # GraphQL reports errors in the body, often with HTTP 200
+        result, _headers, status = await self._send(
+            "POST", url, check_status=False, json=body, headers=request_headers
+        )
 
-            # Check for GraphQL errors
-            if result.get("errors"):
-                error_messages = [e.get("message", str(e)) for e in result["errors"]]
-                raise APIError(
-                    f"GraphQL errors: {'; '.join(error_messages)}",
-                    status_code=response.status,
-                    response_body=result,
-                )
+        # Check for GraphQL errors
+        if result.get("errors"):
+            error_messages = [e.get("message", str(e)) for e in result["errors"]]
+            raise APIError(
+                f"GraphQL errors: {'; '.join(error_messages)}",
+                status_code=status,
+                response_body=result,
+            )
 
-            data: dict[str, Any] = result.get("data", result)
-            return data
+        data: dict[str, Any] = result.get("data", result)
+        return data
 
     async def call_operation(
         self,
@@ -296,6 +396,15 @@ class IntegrationClient:
         # Build parameters from operation definition
         operation_params = self._build_operation_params(operation, params)
 
+        if self.cache is not None and operation.idempotent:
+            ttl = (
+                operation.cache_ttl
+                if operation.cache_ttl is not None
+                else self.manifest.cache.ttl
+            )
+            if ttl > 0:
+                return await self._call_cached(operation, params, operation_params, ttl)
+
         # Call appropriate method based on operation type
         if operation.type == "rest_get":
             endpoint = self._interpolate_endpoint(operation.endpoint or "", params)
@@ -324,6 +433,181 @@ class IntegrationClient:
 
         raise IntegrationClientError(f"Unknown operation type: {operation.type}")
 
+    async def _call_cached(
+        self,
+        operation: Operation,
+        params: dict[str, Any],
+        operation_params: dict[str, Any],
+        ttl: float,
+    ) -> dict[str, Any]:
+        """Serve an idempotent operation from the response cache.
+
+        Fresh entries are returned directly; stale entries with validators
+        are revalidated with If-None-Match/If-Modified-Since.
+        """
+        assert self.cache is not None
+        name = self.manifest.name
+        endpoint = self._interpolate_endpoint(operation.endpoint or "", params)
+        key = cache_key(
+            name,
+            operation.name,
+            endpoint,
+            operation_params,
+            # Different credentials may see different data
+            hashlib.sha256(
+                repr(sorted(self._get_auth_headers().items())).encode()
+            ).hexdigest(),
+        )
+
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            self.cache.record(name, "hits")
+            return entry.body
+
+        if operation.type == "query":
+            # GraphQL responses carry no validators; TTL only
+            data = await self.graphql_request(
+                operation.query or "", variables=operation_params
+            )
+            self.cache.put(key, name, data, ttl)
+            self.cache.record(name, "misses")
+            return data
+
+        conditional: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                conditional["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional["If-Modified-Since"] = entry.last_modified
+
+        if not self._session:
+            raise IntegrationClientError(
+                "Client not initialized. Use 'async with' context manager."
+            )
+        request_headers = self._get_auth_headers()
+        request_headers["Accept"] = "application/json"
+        request_headers.update(conditional)
+        url = f"{self.manifest.base_url.rstrip('/')}{endpoint}"
+        body, headers, status = await self._send(
+            "GET", url, params=operation_params, headers=request_headers
+        )
+
+        if status == 304:
+            if entry is not None:
+                self.cache.refresh(key, ttl)
+                self.cache.record(name, "revalidated")
+                return entry.body
+            # Nothing to revalidate: fetch the body unconditionally
+            for header in conditional:
+                request_headers.pop(header)
+            body, headers, status = await self._send(
+                "GET", url, params=operation_params, headers=request_headers
+            )
+            if status == 304:
+                raise APIError(
+                    "API returned 304 for an unconditional request",
+                    status_code=status,
+                )
+
+        self.cache.put(
+            key,
+            name,
+            body,
+            ttl,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        self.cache.record(name, "misses")
+        return body
+
+    async def paginate(
+        self,
+        operation_name: str,
+        **params: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream every item of a list operation, fetching pages on demand.
+
+        Uses the operation's ``pagination`` settings; operations without
+        them are treated as a single page.
+
+        Args:
+            operation_name: Name of a rest_get operation.
+            **params: Operation parameters.
+
+        Yields:
+            Items from each page, in order.
+
+        Raises:
+            IntegrationClientError: If the operation is unknown or not rest_get.
+            APIError: If the API returns an error response.
+        """
+        if not self._session:
+            raise IntegrationClientError(
+                "Client not initialized. Use 'async with' context manager."
+            )
+        operation = self.manifest.get_operation(operation_name)
+        if not operation:
+            raise IntegrationClientError(f"Operation not found: {operation_name}")
+        if operation.type != "rest_get":
+            raise IntegrationClientError(
+                f"Pagination requires a rest_get operation: {operation_name}"
+            )
+
+        config = operation.pagination or PaginationConfig(max_pages=1)
+        query = self._build_operation_params(operation, params)
+        endpoint = self._interpolate_endpoint(operation.endpoint or "", params)
+        url: str | None = f"{self.manifest.base_url.rstrip('/')}{endpoint}"
+
+        headers = self._get_auth_headers()
+        headers["Accept"] = "application/json"
+
+        position: Any = config.start if config.style in ("page", "offset") else None
+        pages = 0
+        while url is not None:
+            page_params: dict[str, Any] | None = dict(query)
+            if config.size_param:
+                page_params[config.size_param] = config.page_size
+            if position is not None:
+                page_params[config.page_param] = position
+            if config.style == "link" and pages > 0:
+                # The next link already carries every query parameter
+                page_params = None
+
+            body, response_headers, _status = await self._send(
+                "GET", url, params=page_params, headers=headers
+            )
+            items = (
+                self._get_nested_value(body, config.items_path)
+                if config.items_path
+                else body
+            )
+            if items is None:
+                items = []
+            elif not isinstance(items, list):
+                items = [items]
+            for item in items:
+                yield item
+
+            pages += 1
+            if config.max_pages is not None and pages >= config.max_pages:
+                return
+
+            if config.style == "link":
+                match = _LINK_NEXT_RE.search(response_headers.get("Link", ""))
+                url = match.group(1) if match else None
+            elif config.style == "cursor":
+                position = (
+                    self._get_nested_value(body, config.cursor_path)
+                    if config.cursor_path and isinstance(body, dict)
+                    else None
+                )
+                if not position:
+                    return
+            elif len(items) < config.page_size:
+                return
+            else:
+                position += 1 if config.style == "page" else len(items)
+
     async def health_check(self) -> tuple[bool, str]:
         """Run health check and return status.
 
@@ -14,14 +14,23 @@ Example manifest:
       credentials:
         - name: GITHUB_TOKEN
           prompt: "Enter your GitHub personal access token"
+    rate_limit:
+      requests_per_second: 10
+      burst: 5
+      max_concurrency: 4
+    cache:
+      ttl: 300
     operations:
       - name: list_repos
         description: List repositories for a user
         type: rest_get
         endpoint: /users/{username}/repos
+        pagination:
+          style: link
+          page_size: 100
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
@@ -112,6 +121,52 @@ class OperationParameter:
         )
 
 
+@dataclass
+class PaginationConfig:
+    """Pagination settings for list operations.
+
+    Attributes:
+        style: How the next page is requested: page (page number), offset
+            (item offset), cursor (token from the response body) or link
+            (RFC 5988 ``Link: <...>; rel="next"`` header, as used by GitHub).
+        items_path: Dot path to the item list in the response body. Empty
+            means the body itself is the list.
+        page_param: Query parameter carrying the page number/offset/cursor.
+        size_param: Query parameter carrying the page size.
+        page_size: Items requested per page.
+        start: First page number (page style) or offset (offset style).
+        cursor_path: Dot path to the next cursor (cursor style).
+        max_pages: Stop after this many pages (None = until exhausted).
+    """
+
+    style: Literal["page", "offset", "cursor", "link"] = "page"
+    items_path: str = ""
+    page_param: str = "page"
+    size_param: str | None = "per_page"
+    page_size: int = 100
+    start: int = 1
+    cursor_path: str | None = None
+    max_pages: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PaginationConfig":
+        """Create from dictionary representation."""
+        style = data.get("style", "page")
+        return cls(
+            style=style,
+            items_path=data.get("items_path", ""),
+            page_param=data.get(
+                "page_param",
+                {"offset": "offset", "cursor": "cursor"}.get(style, "page"),
+            ),
+            size_param=data.get("size_param", "per_page"),
+            page_size=data.get("page_size", 100),
+            start=data.get("start", 0 if style == "offset" else 1),
+            cursor_path=data.get("cursor_path"),
+            max_pages=data.get("max_pages"),
+        )
+
+
 @dataclass
 class Operation:
     """API operation definition.
@@ -124,6 +179,9 @@ class Operation:
         query: GraphQL query string (for GraphQL operations).
         script: Batch script content (for script operations).
         parameters: List of operation parameters.
+        pagination: Pagination settings for list operations.
+        cache_ttl: Seconds to cache responses of this operation, overriding
+            the manifest's cache.ttl (0 disables caching for it).
     """
 
     name: str
@@ -141,6 +199,13 @@ class Operation:
     query: str | None = None
     script: str | None = None
     parameters: list[OperationParameter] = field(default_factory=list)
+    pagination: PaginationConfig | None = None
+    cache_ttl: float | None = None
+
+    @property
+    def idempotent(self) -> bool:
+        """Whether repeating the operation has no side effects."""
+        return self.type in ("rest_get", "query")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Operation":
@@ -156,6 +221,12 @@ class Operation:
             query=data.get("query"),
             script=data.get("script"),
             parameters=parameters,
+            pagination=(
+                PaginationConfig.from_dict(data["pagination"])
+                if data.get("pagination")
+                else None
+            ),
+            cache_ttl=data.get("cache_ttl"),
         )
 
 
@@ -183,6 +254,71 @@ class HealthCheck:
         )
 
 
+@dataclass
+class RateLimit:
+    """Client-side request limits for the integration's API.
+
+    Attributes:
+        requests_per_second: Sustained request rate (None = unlimited).
+        burst: Requests allowed back-to-back before throttling kicks in.
+        max_concurrency: Open connections to the API at once.
+        max_retries: Retries for 429/503 responses (honoring Retry-After).
+        max_retry_after: Cap in seconds on a single Retry-After wait.
+    """
+
+    requests_per_second: float | None = None
+    burst: int = 1
+    max_concurrency: int = 10
+    max_retries: int = 3
+    max_retry_after: float = 60.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RateLimit":
+        """Create from dictionary representation."""
+        rps = data.get("requests_per_second")
+        if rps is None and data.get("requests_per_minute"):
+            rps = data["requests_per_minute"] / 60.0
+        return cls(
+            requests_per_second=rps,
+            burst=data.get("burst", 1),
+            max_concurrency=data.get("max_concurrency", 10),
+            max_retries=data.get("max_retries", 3),
+            max_retry_after=data.get("max_retry_after", 60.0),
+        )
+
+
+@dataclass
+class CacheConfig:
+    """Response cache settings (opt-in).
+
+    Only idempotent operations (rest_get, GraphQL query) are cached.
+
+    Attributes:
+        enabled: Whether call_operation consults the cache.
+        ttl: Default seconds a response is served without contacting the
+            API. Stale entries with an ETag/Last-Modified are revalidated
+            with a conditional request.
+        max_size_mb: Disk budget; least recently used entries are evicted.
+        directory: Cache directory, relative to the project root
+            (default: .claude-mpm/cache/integrations).
+    """
+
+    enabled: bool = False
+    ttl: float = 300.0
+    max_size_mb: float = 50.0
+    directory: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CacheConfig":
+        """Create from dictionary representation."""
+        return cls(
+            enabled=data.get("enabled", True),
+            ttl=data.get("ttl", 300.0),
+            max_size_mb=data.get("max_size_mb", 50.0),
+            directory=data.get("directory"),
+        )
+
+
 @dataclass
 class MCPConfig:
     """MCP (Model Context Protocol) configuration.
@@ -218,6 +354,8 @@ class IntegrationManifest:
         operations: List of available operations.
         health: Optional health check configuration.
         mcp: MCP tool generation configuration.
+        rate_limit: Client-side rate and connection limits.
+        cache: Response cache configuration.
         author: Optional author information.
         repository: Optional repository URL.
     """
@@ -231,6 +369,8 @@ class IntegrationManifest:
     operations: list[Operation]
     health: HealthCheck | None = None
     mcp: MCPConfig = field(default_factory=MCPConfig)
+    rate_limit: RateLimit = field(default_factory=RateLimit)
+    cache: CacheConfig = field(default_factory=CacheConfig)
     author: str | None = None
     repository: str | None = None
 
@@ -271,6 +411,14 @@ class IntegrationManifest:
         operations = [Operation.from_dict(op) for op in data.get("operations", [])]
         health = HealthCheck.from_dict(data["health"]) if data.get("health") else None
         mcp = MCPConfig.from_dict(data["mcp"]) if data.get("mcp") else MCPConfig()
+        rate_limit = (
+            RateLimit.from_dict(data["rate_limit"])
+            if data.get("rate_limit")
+            else RateLimit()
+        )
+        cache = (
+            CacheConfig.from_dict(data["cache"]) if data.get("cache") else CacheConfig()
+        )
 
         return cls(
             name=data["name"],
@@ -282,6 +430,8 @@ class IntegrationManifest:
             operations=operations,
             health=health,
             mcp=mcp,
+            rate_limit=rate_limit,
+            cache=cache,
             author=data.get("author"),
             repository=data.get("repository"),
         )
@@ -348,6 +498,16 @@ class IntegrationManifest:
                 f"Health check references unknown operation: {self.health.operation}"
             )
 
+        # Validate rate limits
+        rps = self.rate_limit.requests_per_second
+        if rps is not None and rps <= 0:
+            errors.append("rate_limit.requests_per_second must be positive")
+        if self.rate_limit.max_concurrency < 1:
+            errors.append("rate_limit.max_concurrency must be at least 1")
+
+        if self.cache.ttl < 0:
+            errors.append("cache.ttl must not be negative")
+
         # Validate MCP tools reference valid operations
         if self.mcp.tools:
             for tool in self.mcp.tools:
@@ -381,10 +541,13 @@ class IntegrationManifest:
     def to_dict(self) -> dict[str, Any]:
         """Convert manifest to dictionary representation.
 
+        Optional sections (pagination, per-operation cache TTLs, rate
+        limits, cache) are only included when configured.
+
         Returns:
             Dictionary representation of the manifest.
         """
-        return {
+        data: dict[str, Any] = {
             "name": self.name,
             "version": self.version,
             "description": self.description,
@@ -403,27 +566,7 @@ class IntegrationManifest:
                 ],
                 "header_name": self.auth.header_name,
             },
-            "operations": [
-                {
-                    "name": op.name,
-                    "description": op.description,
-                    "type": op.type,
-                    "endpoint": op.endpoint,
-                    "query": op.query,
-                    "script": op.script,
-                    "parameters": [
-                        {
-                            "name": p.name,
-                            "type": p.type,
-                            "required": p.required,
-                            "default": p.default,
-                            "description": p.description,
-                        }
-                        for p in op.parameters
-                    ],
-                }
-                for op in self.operations
-            ],
+            "operations": [self._operation_to_dict(op) for op in self.operations],
             "health": (
                 {
                     "operation": self.health.operation,
@@ -440,3 +583,34 @@ class IntegrationManifest:
             "author": self.author,
             "repository": self.repository,
         }
+        if self.rate_limit != RateLimit():
+            data["rate_limit"] = asdict(self.rate_limit)
+        if self.cache.enabled:
+            data["cache"] = asdict(self.cache)
+        return data
+
+    @staticmethod
+    def _operation_to_dict(op: Operation) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": op.name,
+            "description": op.description,
+            "type": op.type,
+            "endpoint": op.endpoint,
+            "query": op.query,
+            "script": op.script,
+            "parameters": [
+                {
+                    "name": p.name,
+                    "type": p.type,
+                    "required": p.required,
+                    "default": p.default,
+                    "description": p.description,
+                }
+                for p in op.parameters
+            ],
+        }
+        if op.pagination:
+            data["pagination"] = asdict(op.pagination)
+        if op.cache_ttl is not None:
+            data["cache_ttl"] = op.cache_ttl
+        return data
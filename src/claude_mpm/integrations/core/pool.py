@@ -0,0 +1,146 @@
+"""Shared HTTP connections and rate limiting for integration clients.
+
+Each ``IntegrationClient`` used to open its own ``aiohttp.ClientSession``
+with default connector limits, so bulk runs across several integrations
+re-did TCP/TLS handshakes per client and had no notion of an API's request
+budget.
+
+A ``ConnectorPool`` keeps one ``TCPConnector`` and one ``TokenBucket`` per
+API origin (scheme://host:port). Clients created with the pool share both,
+so concurrent batch scripts hitting the same API reuse connections and
+draw from the same rate limit declared in the manifest.
+
+Example:
+    async with ConnectorPool() as pool:
+        async with IntegrationClient(manifest, credentials, pool=pool) as client:
+            async for repo in client.paginate("list_repos", username="octocat"):
+                ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from .manifest import RateLimit
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests per second, ``burst`` at once.
+
+    ``defer()`` pushes the next permitted request out, which is how a
+    server's ``Retry-After`` applies to every client sharing the bucket.
+    """
+
+    def __init__(self, rate: float | None, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._not_before = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._not_before:
+                    await asyncio.sleep(self._not_before - now)
+                    continue
+                if self.rate is None:
+                    return
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def defer(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` (e.g. from Retry-After)."""
+        self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date) to seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def origin_of(url: str) -> str:
+    """``scheme://host:port`` of a URL, used as the pooling key."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class ConnectorPool:
+    """One connector and rate limiter per API origin, shared by clients.
+
+    Must be used (and closed) inside a single event loop.
+    """
+
+    def __init__(self, dns_cache_ttl: int = 300) -> None:
+        self.dns_cache_ttl = dns_cache_ttl
+        self._connectors: dict[str, aiohttp.TCPConnector] = {}
+        self._limiters: dict[str, TokenBucket] = {}
+
+    def connector(self, base_url: str, rate_limit: RateLimit) -> aiohttp.TCPConnector:
+        """Shared connector for ``base_url``'s origin.
+
+        The first manifest seen for an origin sets its connection limit.
+        """
+        key = origin_of(base_url)
+        connector = self._connectors.get(key)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                limit=rate_limit.max_concurrency,
+                limit_per_host=rate_limit.max_concurrency,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._connectors[key] = connector
+        return connector
+
+    def limiter(self, base_url: str, rate_limit: RateLimit) -> TokenBucket:
+        """Shared token bucket for ``base_url``'s origin."""
+        key = origin_of(base_url)
+        bucket = self._limiters.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate_limit.requests_per_second, rate_limit.burst)
+            self._limiters[key] = bucket
+        return bucket
+
+    async def close(self) -> None:
+        """Close every pooled connector."""
+        connectors = list(self._connectors.values())
+        self._connectors.clear()
+        for connector in connectors:
+            await connector.close()
+
+    async def __aenter__(self) -> ConnectorPool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
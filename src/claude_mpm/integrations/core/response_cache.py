@@ -0,0 +1,295 @@
+"""On-disk response cache for integration operations.
+
+Batch scripts and generated MCP tools often repeat the same read operation
+several times within a session. With ``cache`` enabled in the manifest,
+``IntegrationClient.call_operation`` serves idempotent operations (rest_get
+and GraphQL queries) from this cache:
+
+- Fresh entries (younger than the operation's TTL) are returned without
+  contacting the API.
+- Stale entries that carry an ETag or Last-Modified are revalidated with a
+  conditional request; a 304 response refreshes the entry in place.
+- The cache is a single SQLite file bounded by size; least recently used
+  entries are evicted once it exceeds its budget.
+- Clients and ``claude-mpm integrate cache`` locate the file with
+  ``cache_dir_for`` from the same project root, so the command reports
+  the cache the clients write.
+
+Hit/miss counters are stored alongside the entries, so numbers from MCP
+servers (separate processes) show up in ``claude-mpm integrate cache``.
+
+Example:
+    cache = ResponseCache.open(cache_dir_for())
+    async with IntegrationClient(manifest, credentials, cache=cache) as client:
+        await client.call_operation("get_user", username="octocat")
+    print(cache.stats(manifest.name))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_FILENAME = "responses.db"
+DEFAULT_CACHE_DIR = Path(".claude-mpm") / "cache" / "integrations"
+
+_COUNTERS = ("hits", "misses", "revalidated", "evictions")
+
+
+@dataclass
+class CachedResponse:
+    """A cached operation response."""
+
+    body: Any
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without revalidation."""
+        return time.time() < self.expires_at
+
+    @property
+    def revalidatable(self) -> bool:
+        """Whether a conditional request can confirm the entry."""
+        return bool(self.etag or self.last_modified)
+
+
+def cache_dir_for(
+    project_dir: Path | None = None, directory: str | Path | None = None
+) -> Path:
+    """Cache directory for a project.
+
+    Args:
+        project_dir: Project root (default: current directory).
+        directory: Configured directory (manifest ``cache.directory``);
+            relative paths are resolved against the project root.
+    """
+    root = Path(project_dir) if project_dir else Path.cwd()
+    return root / (Path(directory) if directory else DEFAULT_CACHE_DIR)
+
+
+def cache_key(integration: str, *parts: Any) -> str:
+    """Stable key for an integration request."""
+    payload = json.dumps([integration, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Size-bounded LRU response cache in a SQLite file."""
+
+    _instances: dict[Path, ResponseCache] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, directory: Path, max_bytes: int = 50 * 1024 * 1024) -> None:
+        """Open (and create if needed) the cache.
+
+        Args:
+            directory: Directory holding the cache database.
+            max_bytes: Total size of cached bodies before LRU eviction.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._conn = sqlite3.connect(
+            str(self.directory / CACHE_FILENAME), check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    integration TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_last_access "
+                "ON entries(last_access)"
+            )
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS counters (
+                    integration TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    value INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (integration, name)
+                )
+            """)
+
+    @classmethod
+    def open(
+        cls, directory: Path | None = None, max_bytes: int = 50 * 1024 * 1024
+    ) -> ResponseCache:
+        """Return the process-wide cache for ``directory``.
+
+        Clients created per call (as generated MCP servers do) share one
+        connection instead of reopening the database each time.
+        """
+        path = Path(directory or cache_dir_for()).resolve()
+        with cls._instances_lock:
+            cache = cls._instances.get(path)
+            if cache is None:
+                cache = cls(path, max_bytes)
+                cls._instances[path] = cache
+            return cache
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up an entry (fresh or stale) and mark it recently used."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM entries "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return CachedResponse(json.loads(row[0]), row[1], row[2], row[3])
+
+    def put(
+        self,
+        key: str,
+        integration: str,
+        body: Any,
+        ttl: float,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response, evicting least recently used entries if needed."""
+        payload = json.dumps(body, default=str)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, integration, body, etag, "
+                "last_modified, expires_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    integration,
+                    payload,
+                    etag,
+                    last_modified,
+                    now + ttl,
+                    now,
+                    len(payload),
+                ),
+            )
+            self._evict(integration)
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """Extend an entry after the API confirmed it (HTTP 304)."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET expires_at = ?, last_access = ? WHERE key = ?",
+                (now + ttl, now, key),
+            )
+
+    def clear(self, integration: str | None = None) -> int:
+        """Drop cached entries and counters. Returns entries removed."""
+        where, params = (
+            ("WHERE integration = ?", (integration,)) if integration else ("", ())
+        )
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                f"DELETE FROM entries {where}", params
+            ).rowcount
+            self._conn.execute(f"DELETE FROM counters {where}", params)
+        return removed
+
+    def _evict(self, integration: str) -> None:
+        """Drop LRU entries beyond max_bytes. Caller holds the lock."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            evicted += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._bump(integration, "evictions", evicted)
+
+    # ------------------------------------------------------------------
+    # Counters
+    # ------------------------------------------------------------------
+
+    def record(self, integration: str, counter: str) -> None:
+        """Increment a hit/miss/revalidated counter."""
+        with self._lock, self._conn:
+            self._bump(integration, counter, 1)
+
+    def _bump(self, integration: str, counter: str, amount: int) -> None:
+        self._conn.execute(
+            "INSERT INTO counters (integration, name, value) VALUES (?, ?, ?) "
+            "ON CONFLICT(integration, name) DO UPDATE SET value = value + ?",
+            (integration, counter, amount, amount),
+        )
+
+    def stats(self, integration: str | None = None) -> dict[str, dict[str, Any]]:
+        """Counters, entry counts and sizes per integration."""
+        where, params = (
+            ("WHERE integration = ?", (integration,)) if integration else ("", ())
+        )
+        with self._lock:
+            counters = self._conn.execute(
+                f"SELECT integration, name, value FROM counters {where}", params
+            ).fetchall()
+            sizes = self._conn.execute(
+                f"SELECT integration, COUNT(*), SUM(size) FROM entries {where} "
+                "GROUP BY integration",
+                params,
+            ).fetchall()
+
+        result: dict[str, dict[str, Any]] = {}
+
+        def _row(name: str) -> dict[str, Any]:
+            return result.setdefault(
+                name, {**dict.fromkeys(_COUNTERS, 0), "entries": 0, "bytes": 0}
+            )
+
+        for name, counter, value in counters:
+            _row(name)[counter] = value
+        for name, entries, size in sizes:
+            _row(name).update(entries=entries, bytes=size or 0)
+        for row in result.values():
+            lookups = row["hits"] + row["misses"] + row["revalidated"]
+            row["hit_rate"] = (
+                (row["hits"] + row["revalidated"]) / lookups if lookups else 0.0
+            )
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        with self._instances_lock:
+            for path, cache in list(self._instances.items()):
+                if cache is self:
+                    del self._instances[path]
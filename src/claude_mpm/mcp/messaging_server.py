@@ -25,6 +25,9 @@ from claude_mpm.services.communication.shortcuts_service import ShortcutsService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound for message_check long-polls, to stay below MCP client timeouts
+MAX_CHECK_WAIT_SECONDS = 300.0
+
 
 def _message_to_dict(msg: Any) -> dict[str, Any]:
     """Convert a Message dataclass to a JSON-serialisable dict."""
@@ -184,7 +187,10 @@ class MessagingMCPServer:
                 ),
                 Tool(
                     name="message_check",
-                    description="Check unread message count and high-priority messages",
+                    description=(
+                        "Check unread message count and high-priority messages. "
+                        "Set wait_seconds to long-poll until a message arrives."
+                    ),
                     inputSchema={
                         "type": "object",
                         "properties": {
@@ -192,6 +198,15 @@ class MessagingMCPServer:
                                 "type": "string",
                                 "description": "Filter unread count by agent name",
                             },
+                            "wait_seconds": {
+                                "type": "number",
+                                "description": (
+                                    "If no unread messages, wait up to this many "
+                                    f"seconds (max {MAX_CHECK_WAIT_SECONDS:g}) for one "
+                                    "to arrive (default: 0, return immediately)"
+                                ),
+                                "default": 0,
+                            },
                         },
                         "required": [],
                     },
@@ -384,10 +399,23 @@ class MessagingMCPServer:
         return {"ok": True, "message": _message_to_dict(msg)}
 
     async def _message_check(self, arguments: dict[str, Any]) -> dict[str, Any]:
-        """Check unread count and high-priority messages."""
-        unread_count = await asyncio.to_thread(
-            self.messages.get_unread_count, arguments.get("agent")
+        """Check unread count and high-priority messages.
+
+        With ``wait_seconds`` > 0 this long-polls: it returns as soon as a
+        message arrives (woken by the sender's notification) or on timeout.
+        """
+        wait_seconds = min(
+            max(float(arguments.get("wait_seconds") or 0), 0.0),
+            MAX_CHECK_WAIT_SECONDS,
         )
+        if wait_seconds:
+            unread_count = await asyncio.to_thread(
+                self.messages.wait_for_messages, arguments.get("agent"), wait_seconds
+            )
+        else:
+            unread_count = await asyncio.to_thread(
+                self.messages.get_unread_count, arguments.get("agent")
+            )
         high_priority = await asyncio.to_thread(
             self.messages.get_high_priority_messages
         )
@@ -11,6 +11,7 @@ between related events (e.g., pre_tool and post_tool pairs) while preserving
 chronological order for session replay and analysis.
 """
 
+import gzip
 import json
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
@@ -423,13 +424,16 @@ class AgentSession:
             },
         }
 
-    def save_to_file(self, directory: str | None = None) -> str:
+    def save_to_file(self, directory: str | None = None, compress: bool = False) -> str:
         """Save the session to a JSON file.
 
         WHY: Persistent storage allows for later analysis and debugging.
 
         Args:
             directory: Directory to save to (defaults to .claude-mpm/sessions/)
+            compress: Write compact, gzip-compressed JSON (``.json.gz``).
+                Session event payloads are highly repetitive, so this
+                shrinks files several times over
 
         Returns:
             Path to the saved file
@@ -447,6 +451,12 @@ class AgentSession:
         filename = f"session_{self.session_id[:8]}_{timestamp}.json"
         filepath = directory / filename
 
+        if compress:
+            filepath = filepath.with_name(filename + ".gz")
+            with gzip.open(filepath, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+            return str(filepath)
+
         # Save to file
         with filepath.open("w", encoding="utf-8") as f:
             json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
@@ -527,12 +537,22 @@ class AgentSession:
 
     @classmethod
     def load_from_file(cls, filepath: str) -> "AgentSession":
-        """Load a session from a JSON file.
+        """Load a session from a JSON or gzip-compressed JSON file.
 
         WHY: Enables analysis of historical sessions.
         """
-        with Path(filepath).open(
-            encoding="utf-8",
-        ) as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(read_session_file(filepath))
+
+
+def read_session_file(filepath: str | Path) -> dict[str, Any]:
+    """Read a saved session document (``.json`` or ``.json.gz``).
+
+    Compressed files are decompressed while parsing rather than read into
+    memory first.
+    """
+    path = Path(filepath)
+    if path.suffix == ".gz":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
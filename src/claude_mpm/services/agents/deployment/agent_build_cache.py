@@ -0,0 +1,92 @@
+"""Per-agent build hashes for incremental agent deployment.
+
+WHY: Every deployment rebuilt every agent - re-parsing its template,
+walking up directories for BASE-AGENT.md files and rewriting the output -
+even when nothing had changed. Multi-source deployments force a rebuild of
+each selected agent, so a routine startup paid the full build cost.
+
+DESIGN DECISIONS:
+- Each built agent records the hash of its inputs (template, composed
+  BASE-AGENT.md chain, base agent config, source, package version; see
+  AgentTemplateBuilder.compute_input_hash) and the hash of the file written
+- An agent is skipped when its input hash matches and the deployed file
+  still hashes to what was written, so hand-edited or deleted agents are
+  rebuilt
+- Records live in a hidden JSON file next to the deployed agents
+  (``.mpm-build-hashes.json``); Claude Code only loads ``*.md`` files and
+  deleting the record only costs one full rebuild
+- Thread-safe, since changed agents are built in parallel
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from claude_mpm.core.logger import get_logger
+
+BUILD_HASHES_FILENAME = ".mpm-build-hashes.json"
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class AgentBuildCache:
+    """Input/output hashes of the agents deployed to one directory."""
+
+    def __init__(self, agents_dir: Path):
+        """
+        Load recorded hashes for *agents_dir*.
+
+        Args:
+            agents_dir: Directory agents are deployed to
+        """
+        self.path = Path(agents_dir) / BUILD_HASHES_FILENAME
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._records: dict[str, dict[str, str]] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._records = data.get("agents", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Ignoring unreadable build hashes {self.path}: {e}")
+
+    def is_current(self, agent_name: str, input_hash: str, target_file: Path) -> bool:
+        """Whether *target_file* is the output of a build with these inputs."""
+        with self._lock:
+            record = self._records.get(agent_name)
+        if not record or record.get("input") != input_hash:
+            return False
+        return _file_hash(target_file) == record.get("output")
+
+    def record(self, agent_name: str, input_hash: str, target_file: Path) -> None:
+        """Remember the inputs that produced the freshly written *target_file*."""
+        output_hash = _file_hash(target_file)
+        if output_hash is None:
+            return
+        with self._lock:
+            self._records[agent_name] = {"input": input_hash, "output": output_hash}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist records if anything was built."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload: dict[str, Any] = {"version": 1, "agents": self._records}
+            self._dirty = False
+        try:
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save build hashes to {self.path}: {e}")
@@ -28,6 +28,7 @@ ROLLBACK PROCEDURES:
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -41,6 +42,7 @@ from claude_mpm.services.shared import ConfigServiceBase
 
 # Import git source management for remote agent sync
 from ..git_source_manager import GitSourceManager
+from .agent_build_cache import AgentBuildCache
 from .agent_configuration_manager import AgentConfigurationManager
 from .agent_discovery_service import AgentDiscoveryService
 from .agent_environment_manager import AgentEnvironmentManager
@@ -55,6 +57,8 @@ from .deployment_results_manager import DeploymentResultsManager
 from .multi_source_deployment_service import MultiSourceAgentDeploymentService
 from .single_agent_deployer import SingleAgentDeployer
 
+DEFAULT_BUILD_WORKERS = 8
+
 
 class AgentDeploymentService(ConfigServiceBase, AgentDeploymentInterface):
     """Service for deploying Claude Code native agents.
@@ -143,6 +147,11 @@ class AgentDeploymentService(ConfigServiceBase, AgentDeploymentInterface):
         # Initialize filesystem manager service
         self.filesystem_manager = AgentFileSystemManager()
 
+        # Threads used to build changed agents in parallel
+        self.build_workers = self.get_config_value(
+            "build_workers", default=DEFAULT_BUILD_WORKERS, config_type=int
+        )
+
         # Determine the actual working directory using configuration
         # Priority: param > config > environment > current directory
         self.working_directory = self.get_config_value(
@@ -405,38 +414,24 @@ class AgentDeploymentService(ConfigServiceBase, AgentDeploymentInterface):
                 results["total"] = len(template_files)
                 agent_sources = {}
 
-            # Deploy each agent template
-            for template_file in template_files:
-                template_file_path = (
-                    template_file
-                    if isinstance(template_file, Path)
-                    else Path(template_file)
-                )
-                agent_name = template_file_path.stem
-
-                # Get source info for this agent (agent_sources now uses file stems as keys)
-                source_info = (
-                    agent_sources.get(agent_name, "unknown")
-                    if agent_sources
-                    else "single"
-                )
-
-                # When using multi-source deployment, we've already determined which
-                # agents need updates. Don't re-check versions in single_agent_deployer.
-                # This prevents the issue where multi-source says "deploying 9 agents"
-                # but then all get skipped due to redundant version checks.
-                skip_version_check = use_multi_source and not force_rebuild
-
-                self.single_agent_deployer.deploy_single_agent(
-                    template_file=template_file_path,
-                    agents_dir=agents_dir,
-                    base_agent_data=base_agent_data,
-                    base_agent_version=base_agent_version,
-                    force_rebuild=force_rebuild or skip_version_check,
-                    deployment_mode=deployment_mode,
-                    results=results,
-                    source_info=source_info,
-                )
+            # Deploy each agent template (unchanged agents are skipped,
+            # changed ones built in parallel)
+            self._deploy_templates(
+                template_files,
+                agents_dir,
+                base_agent_data,
+                base_agent_version,
+                results,
+                force_rebuild=force_rebuild,
+                deployment_mode=deployment_mode,
+                agent_sources=agent_sources,
+                # When using multi-source deployment, we've already determined
+                # which agents need updates. Don't re-check versions in
+                # single_agent_deployer. This prevents the issue where
+                # multi-source says "deploying 9 agents" but then all get
+                # skipped due to redundant version checks.
+                skip_version_check=use_multi_source and not force_rebuild,
+            )
 
             # CRITICAL: System instructions deployment disabled to prevent automatic file creation
             # The system should NEVER automatically write INSTRUCTIONS.md, MEMORY.md, WORKFLOW.md
@@ -477,6 +472,94 @@ class AgentDeploymentService(ConfigServiceBase, AgentDeploymentInterface):
 
         return results
 
+    def _deploy_templates(
+        self,
+        template_files: list,
+        agents_dir: Path,
+        base_agent_data: dict,
+        base_agent_version: tuple,
+        results: dict[str, Any],
+        *,
+        force_rebuild: bool,
+        deployment_mode: str,
+        agent_sources: dict[str, str],
+        skip_version_check: bool,
+    ) -> None:
+        """Build and write agent templates, skipping unchanged agents.
+
+        WHY: Rebuilding every agent on every deployment re-parsed each
+        template and its BASE-AGENT.md chain. Agents whose build inputs
+        (see AgentTemplateBuilder.compute_input_hash) match what was last
+        written are skipped; the rest are built on a thread pool since
+        building is mostly file I/O and YAML parsing.
+
+        Each agent reports into its own results dict, merged in template
+        order afterwards so output stays deterministic.
+        """
+        build_start = time.time()
+        self.template_builder.clear_base_template_cache()
+        build_cache = None if force_rebuild else AgentBuildCache(agents_dir)
+
+        def deploy(template_file: Path | str) -> dict[str, Any]:
+            template_file_path = Path(template_file)
+            agent_name = template_file_path.stem
+            partial: dict[str, Any] = {
+                key: [] for key in ("deployed", "updated", "migrated", "skipped")
+            }
+            partial["errors"] = []
+            partial["metrics"] = {"agent_timings": {}}
+            self.single_agent_deployer.deploy_single_agent(
+                template_file=template_file_path,
+                agents_dir=agents_dir,
+                base_agent_data=base_agent_data,
+                base_agent_version=base_agent_version,
+                force_rebuild=force_rebuild or skip_version_check,
+                deployment_mode=deployment_mode,
+                results=partial,
+                # agent_sources uses file stems as keys
+                source_info=(
+                    agent_sources.get(agent_name, "unknown")
+                    if agent_sources
+                    else "single"
+                ),
+                build_cache=build_cache,
+            )
+            return partial
+
+        workers = max(1, min(self.build_workers, len(template_files)))
+        if workers == 1:
+            partials = [deploy(template_file) for template_file in template_files]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="agent-build"
+            ) as executor:
+                partials = list(executor.map(deploy, template_files))
+
+        unchanged = 0
+        for partial in partials:
+            for key in ("deployed", "updated", "migrated", "skipped", "errors"):
+                results[key].extend(partial[key])
+            results["metrics"]["agent_timings"].update(
+                partial["metrics"]["agent_timings"]
+            )
+            unchanged += len(partial["skipped"])
+        if build_cache is not None:
+            build_cache.save()
+
+        build_stats = {
+            "built": sum(
+                len(partial[key])
+                for partial in partials
+                for key in ("deployed", "updated", "migrated")
+            ),
+            "skipped": unchanged,
+            "failed": sum(len(partial["errors"]) for partial in partials),
+            "workers": workers,
+            "duration_ms": (time.time() - build_start) * 1000,
+        }
+        results["metrics"]["build"] = build_stats
+        self.results_manager.record_build_stats(build_stats)
+
     def get_deployment_metrics(self) -> dict[str, Any]:
         """Get current deployment metrics."""
         return self.results_manager.get_deployment_metrics()
@@ -7,8 +7,10 @@ Extracted from AgentDeploymentService as part of the refactoring to improve
 maintainability and testability.
 """
 
+import hashlib
 import json
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +33,68 @@ class AgentTemplateBuilder:
     def __init__(self):
         """Initialize the template builder."""
         self.logger = get_logger(__name__)
+        # BASE-AGENT.md discovery and content, shared by every agent built in
+        # a deployment run (most agents live in the same few directories)
+        self._base_chain_cache: dict[Path, list[Path]] = {}
+        self._base_content_cache: dict[Path, str] = {}
+        self._base_cache_lock = threading.Lock()
+
+    def clear_base_template_cache(self) -> None:
+        """Forget memoized BASE-AGENT.md lookups.
+
+        Called at the start of each deployment run so edits made between
+        runs are picked up.
+        """
+        with self._base_cache_lock:
+            self._base_chain_cache.clear()
+            self._base_content_cache.clear()
+
+    def _read_base_template(self, base_template_path: Path) -> str:
+        """Read a BASE-AGENT.md file once per run."""
+        with self._base_cache_lock:
+            cached = self._base_content_cache.get(base_template_path)
+        if cached is None:
+            cached = base_template_path.read_text(encoding="utf-8")
+            with self._base_cache_lock:
+                self._base_content_cache[base_template_path] = cached
+        return cached
+
+    def compute_input_hash(
+        self,
+        template_path: Path,
+        base_agent_data: dict,
+        source_info: str = "unknown",
+    ) -> str:
+        """Hash everything build_agent_markdown() output depends on.
+
+        Covers the template bytes, the composed BASE-AGENT.md chain, the
+        base agent configuration, the source label and the package version
+        (so builder changes in a new release invalidate earlier builds).
+
+        Args:
+            template_path: Path to the agent template
+            base_agent_data: Base agent configuration data
+            source_info: Source of the agent (system/project/user)
+
+        Returns:
+            Hex digest identifying this agent's build inputs
+        """
+        from claude_mpm import __version__
+
+        digest = hashlib.sha256()
+        digest.update(__version__.encode())
+        digest.update(source_info.encode())
+        digest.update(
+            json.dumps(base_agent_data or {}, sort_keys=True, default=str).encode()
+        )
+        digest.update(template_path.read_bytes())
+        for base_template_path in self._discover_base_agent_templates(template_path):
+            digest.update(str(base_template_path).encode())
+            try:
+                digest.update(self._read_base_template(base_template_path).encode())
+            except OSError:
+                digest.update(b"<unreadable>")
+        return digest.hexdigest()
 
     def normalize_tools_input(self, tools):
         """Normalize various tool input formats to a consistent list.
@@ -114,6 +178,11 @@ class AgentTemplateBuilder:
                 repo/BASE-AGENT.md
             ]
         """
+        with self._base_cache_lock:
+            cached = self._base_chain_cache.get(agent_file.parent)
+        if cached is not None:
+            return list(cached)
+
         base_templates = []
         current_dir = agent_file.parent
 
@@ -155,6 +224,8 @@ class AgentTemplateBuilder:
                 f"Discovered {len(base_templates)} BASE-AGENT.md file(s) for {agent_file.name}"
             )
 
+        with self._base_cache_lock:
+            self._base_chain_cache[agent_file.parent] = list(base_templates)
         return base_templates
 
     def _parse_markdown_template(self, template_path: Path) -> dict:
@@ -629,7 +700,7 @@ class AgentTemplateBuilder:
         # Append each BASE template (order: closest to farthest)
         for base_template_path in base_templates:
             try:
-                base_content = base_template_path.read_text(encoding="utf-8")
+                base_content = self._read_base_template(base_template_path)
                 if base_content.strip():
                     content_parts.append(base_content)
                     self.logger.debug(
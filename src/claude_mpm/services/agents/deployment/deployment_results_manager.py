@@ -1,6 +1,7 @@
 """Deployment results manager for tracking deployment outcomes."""
 
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -21,6 +22,8 @@ class DeploymentResultsManager:
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
+        # Agents are built on a thread pool and record metrics concurrently
+        self._metrics_lock = threading.Lock()
 
         # Initialize deployment metrics tracking
         self._deployment_metrics = {
@@ -31,6 +34,10 @@ class DeploymentResultsManager:
             "version_migration_count": 0,
             "agent_type_counts": {},
             "deployment_errors": {},
+            "agents_built": 0,
+            "agents_skipped": 0,
+            "build_time_ms": 0.0,
+            "last_build": None,
         }
 
     def initialize_deployment_results(
@@ -104,9 +111,10 @@ class DeploymentResultsManager:
         results["metrics"]["agent_timings"][agent_name] = agent_deployment_time
 
         # METRICS: Update agent type deployment counts
-        self._deployment_metrics["agent_type_counts"][agent_name] = (
-            self._deployment_metrics["agent_type_counts"].get(agent_name, 0) + 1
-        )
+        with self._metrics_lock:
+            self._deployment_metrics["agent_type_counts"][agent_name] = (
+                self._deployment_metrics["agent_type_counts"].get(agent_name, 0) + 1
+            )
 
         deployment_info = {
             "name": agent_name,
@@ -123,8 +131,9 @@ class DeploymentResultsManager:
             )
 
             # METRICS: Track migration statistics
-            self._deployment_metrics["migrations_performed"] += 1
-            self._deployment_metrics["version_migration_count"] += 1
+            with self._metrics_lock:
+                self._deployment_metrics["migrations_performed"] += 1
+                self._deployment_metrics["version_migration_count"] += 1
 
         elif is_update:
             results["updated"].append(deployment_info)
@@ -168,6 +177,20 @@ class DeploymentResultsManager:
                     self._deployment_metrics["deployment_errors"].get(error_type, 0) + 1
                 )
 
+    def record_build_stats(self, build_stats: dict[str, Any]) -> None:
+        """Accumulate built/skipped counts and timing of a build pass.
+
+        Args:
+            build_stats: Counts and duration_ms of one deployment's builds
+        """
+        with self._metrics_lock:
+            self._deployment_metrics["agents_built"] += build_stats.get("built", 0)
+            self._deployment_metrics["agents_skipped"] += build_stats.get("skipped", 0)
+            self._deployment_metrics["build_time_ms"] += build_stats.get(
+                "duration_ms", 0.0
+            )
+            self._deployment_metrics["last_build"] = dict(build_stats)
+
     def get_deployment_metrics(self) -> dict[str, Any]:
         """Get current deployment metrics."""
         return self._deployment_metrics.copy()
@@ -182,4 +205,8 @@ class DeploymentResultsManager:
             "version_migration_count": 0,
             "agent_type_counts": {},
             "deployment_errors": {},
+            "agents_built": 0,
+            "agents_skipped": 0,
+            "build_time_ms": 0.0,
+            "last_build": None,
         }
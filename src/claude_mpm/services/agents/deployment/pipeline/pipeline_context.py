@@ -52,6 +52,7 @@ class PipelineContext:
     # Metrics and timing
     deployment_start_time: float | None = None
     step_timings: dict[str, float] = field(default_factory=dict)
+    build_stats: dict[str, Any] | None = None  # Built/skipped agent counts
 
     # Error handling
     errors: list[str] = field(default_factory=list)
@@ -143,6 +144,9 @@ class PipelineContext:
         if self.step_timings:
             self.results["step_timings"] = self.step_timings.copy()
 
+        if self.build_stats is not None:
+            self.results["build"] = dict(self.build_stats)
+
         # Ensure all required fields are present
         for field in [
             "deployed",
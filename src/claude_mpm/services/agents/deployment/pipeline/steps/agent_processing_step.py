@@ -1,9 +1,11 @@
 """Agent processing step for deployment pipeline."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from claude_mpm.core.enums import OperationResult
+from claude_mpm.services.agents.deployment.agent_build_cache import AgentBuildCache
 from claude_mpm.services.agents.deployment.processors import (
     AgentDeploymentContext,
     AgentDeploymentResult,
@@ -12,16 +14,25 @@ from claude_mpm.services.agents.deployment.processors import (
 
 from .base_step import BaseDeploymentStep, StepResult
 
+# Threads used to build changed agents in parallel
+DEFAULT_BUILD_WORKERS = 8
+
 
 class AgentProcessingStep(BaseDeploymentStep):
     """Step to process and deploy individual agents."""
 
-    def __init__(self, template_builder, version_manager):
+    def __init__(
+        self,
+        template_builder,
+        version_manager,
+        max_workers: int = DEFAULT_BUILD_WORKERS,
+    ):
         super().__init__(
             name="Agent Processing",
             description="Process and deploy individual agent templates",
         )
         self.processor = AgentProcessor(template_builder, version_manager)
+        self.max_workers = max_workers
 
     def execute(self, context) -> StepResult:
         """Execute agent processing step.
@@ -47,27 +58,21 @@ class AgentProcessingStep(BaseDeploymentStep):
             processed_count = 0
             failed_count = 0
 
-            # Process each template file
+            # Unchanged agents are skipped by input hash; BASE-AGENT.md
+            # lookups are shared by all agents of this run
+            self.processor.template_builder.clear_base_template_cache()
+            build_cache = (
+                None
+                if context.force_rebuild or context.actual_target_dir is None
+                else AgentBuildCache(context.actual_target_dir)
+            )
+
+            # Prepare and validate each agent, then build them in parallel
+            agent_contexts = []
             for template_file in context.template_files:
                 try:
-                    # Determine source for this agent
-                    agent_name = template_file.stem
-                    # Use source from context if available (multi-source deployment), otherwise determine it
-                    if context.agent_sources and agent_name in context.agent_sources:
-                        source_info = context.agent_sources[agent_name]
-                    else:
-                        source_info = self._determine_agent_source(template_file)
-
-                    # Create agent deployment context
-                    agent_context = AgentDeploymentContext.from_template_file(
-                        template_file=template_file,
-                        agents_dir=context.actual_target_dir,
-                        base_agent_data=context.base_agent_data or {},
-                        base_agent_version=context.base_agent_version or (1, 0, 0),
-                        force_rebuild=context.force_rebuild,
-                        deployment_mode=context.deployment_mode,
-                        source_info=source_info,
-                    )
+                    agent_context = self._create_agent_context(context, template_file)
+                    agent_context.build_cache = build_cache
 
                     # Validate agent if requested
                     if context.should_repair_existing_agents:
@@ -81,16 +86,7 @@ class AgentProcessingStep(BaseDeploymentStep):
                             failed_count += 1
                             continue
 
-                    # Process the agent
-                    result = self.processor.process_agent(agent_context)
-
-                    # Update context results based on outcome
-                    self._update_context_with_result(context, result)
-
-                    if result.is_successful():
-                        processed_count += 1
-                    else:
-                        failed_count += 1
+                    agent_contexts.append(agent_context)
 
                 except Exception as e:
                     error_msg = f"Failed to process agent {template_file.stem}: {e!s}"
@@ -98,6 +94,39 @@ class AgentProcessingStep(BaseDeploymentStep):
                     context.add_error(error_msg)
                     failed_count += 1
 
+            build_start = time.time()
+            workers = max(1, min(self.max_workers, len(agent_contexts)))
+            if workers == 1:
+                results = [self._process_agent(c) for c in agent_contexts]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="agent-build"
+                ) as executor:
+                    results = list(executor.map(self._process_agent, agent_contexts))
+
+            # Update context results in template order
+            built = skipped = 0
+            for result in results:
+                self._update_context_with_result(context, result)
+                if result.is_successful():
+                    processed_count += 1
+                    if result.was_skipped:
+                        skipped += 1
+                    else:
+                        built += 1
+                else:
+                    failed_count += 1
+            if build_cache is not None:
+                build_cache.save()
+
+            context.build_stats = {
+                "built": built,
+                "skipped": skipped,
+                "failed": failed_count,
+                "workers": workers,
+                "duration_ms": (time.time() - build_start) * 1000,
+            }
+
             # Calculate execution time
             execution_time = time.time() - start_time
             context.step_timings[self.name] = execution_time
@@ -134,6 +163,61 @@ class AgentProcessingStep(BaseDeploymentStep):
                 execution_time=execution_time,
             )
 
+    def _process_agent(
+        self, agent_context: AgentDeploymentContext
+    ) -> AgentDeploymentResult:
+        """Build one agent, recording any exception as that agent's failure.
+
+        WHY: Results are collected from ``executor.map``, which re-raises the
+        first worker exception and drops every other result of the step.
+
+        Args:
+            agent_context: Agent deployment context
+
+        Returns:
+            Agent deployment result
+        """
+        try:
+            return self.processor.process_agent(agent_context)
+        except Exception as e:
+            error_msg = f"Failed to process agent {agent_context.agent_name}: {e!s}"
+            self.logger.error(error_msg, exc_info=True)
+            return AgentDeploymentResult.failed(
+                agent_context.agent_name,
+                agent_context.template_file,
+                agent_context.target_file,
+                error_msg,
+            )
+
+    def _create_agent_context(
+        self, context, template_file: Path
+    ) -> AgentDeploymentContext:
+        """Create the deployment context for one template.
+
+        Args:
+            context: Pipeline context
+            template_file: Agent template file
+
+        Returns:
+            Agent deployment context
+        """
+        agent_name = template_file.stem
+        # Use source from context if available (multi-source deployment), otherwise determine it
+        if context.agent_sources and agent_name in context.agent_sources:
+            source_info = context.agent_sources[agent_name]
+        else:
+            source_info = self._determine_agent_source(template_file)
+
+        return AgentDeploymentContext.from_template_file(
+            template_file=template_file,
+            agents_dir=context.actual_target_dir,
+            base_agent_data=context.base_agent_data or {},
+            base_agent_version=context.base_agent_version or (1, 0, 0),
+            force_rebuild=context.force_rebuild,
+            deployment_mode=context.deployment_mode,
+            source_info=source_info,
+        )
+
     def _update_context_with_result(
         self, context, result: AgentDeploymentResult
     ) -> None:
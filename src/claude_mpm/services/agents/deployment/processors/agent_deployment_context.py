@@ -34,6 +34,9 @@ class AgentDeploymentContext:
     validate_before_deployment: bool = True
     collect_metrics: bool = True
 
+    # Recorded build hashes (AgentBuildCache); None always rebuilds
+    build_cache: Any = None
+
     def __post_init__(self):
         """Post-initialization validation."""
         if self.agents_dir is None and self.target_file:
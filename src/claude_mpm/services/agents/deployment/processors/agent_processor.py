@@ -41,6 +41,25 @@ class AgentProcessor:
         try:
             self.logger.debug(f"Processing agent: {context.agent_name}")
 
+            # Skip agents whose build inputs are unchanged since last written
+            input_hash = None
+            if context.build_cache is not None and not context.force_rebuild:
+                input_hash = self.template_builder.compute_input_hash(
+                    context.template_file,
+                    context.base_agent_data or {},
+                    context.source_info,
+                )
+                if context.build_cache.is_current(
+                    context.agent_name, input_hash, context.target_file
+                ):
+                    self.logger.debug(f"Skipped unchanged agent: {context.agent_name}")
+                    return AgentDeploymentResult.skipped(
+                        context.agent_name,
+                        context.template_file,
+                        context.target_file,
+                        reason="Agent inputs unchanged",
+                    )
+
             # Check if agent needs update
             needs_update, is_migration, reason = self._check_update_status(context)
 
@@ -59,10 +78,15 @@ class AgentProcessor:
                 )
 
             # Build the agent
+            is_update = context.is_update()
             agent_content = self._build_agent_content(context)
 
             # Deploy the agent
             self._deploy_agent_content(context, agent_content)
+            if input_hash is not None:
+                context.build_cache.record(
+                    context.agent_name, input_hash, context.target_file
+                )
 
             # Calculate deployment time
             deployment_time_ms = (time.time() - start_time) * 1000
@@ -77,7 +101,7 @@ class AgentProcessor:
                     deployment_time_ms,
                     reason,
                 )
-            if context.is_update():
+            if is_update:
                 self.logger.debug(f"Updated agent: {context.agent_name}")
                 return AgentDeploymentResult.updated(
                     context.agent_name,
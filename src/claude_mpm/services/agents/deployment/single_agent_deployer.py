@@ -11,6 +11,8 @@ from claude_mpm.services.agents.deployment_utils import (
     normalize_deployment_filename,
 )
 
+from .agent_build_cache import AgentBuildCache
+
 
 class SingleAgentDeployer:
     """Service for deploying individual agents.
@@ -49,12 +51,17 @@ class SingleAgentDeployer:
         deployment_mode: str,
         results: dict[str, Any],
         source_info: str = "unknown",
+        *,
+        build_cache: AgentBuildCache | None = None,
     ) -> None:
         """Deploy a single agent template.
 
         WHY: Extracting single agent deployment logic reduces complexity
         and makes the main deployment loop more readable.
 
+        With a build cache, an agent whose build inputs are unchanged since
+        it was last written is skipped without version checks or rebuilding.
+
         Args:
             template_file: Agent template file
             agents_dir: Target agents directory
@@ -64,6 +71,7 @@ class SingleAgentDeployer:
             deployment_mode: Deployment mode (update/project)
             results: Results dictionary to update
             source_info: Source of the agent (system/project/user)
+            build_cache: Recorded build hashes; pass None to always rebuild
         """
         try:
             # METRICS: Track individual agent deployment time
@@ -73,6 +81,16 @@ class SingleAgentDeployer:
             normalized_filename = normalize_deployment_filename(f"{agent_name}.md")
             target_file = agents_dir / normalized_filename
 
+            input_hash = None
+            if build_cache is not None:
+                input_hash = self.template_builder.compute_input_hash(
+                    template_file, base_agent_data, source_info
+                )
+                if build_cache.is_current(agent_name, input_hash, target_file):
+                    results["skipped"].append(agent_name)
+                    self.logger.debug(f"Skipped unchanged agent: {agent_name}")
+                    return
+
             # Check if agent needs update
             needs_update, is_migration, reason = self._check_update_status(
                 target_file,
@@ -100,6 +118,8 @@ class SingleAgentDeployer:
             # Write the agent file
             is_update = target_file.exists()
             target_file.write_text(agent_content)
+            if build_cache is not None and input_hash is not None:
+                build_cache.record(agent_name, input_hash, target_file)
 
             # Clean up underscore variant if it exists
             underscore_variant = get_underscore_variant_filename(normalized_filename)
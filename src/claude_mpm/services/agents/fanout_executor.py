@@ -0,0 +1,394 @@
+"""Concurrent fan-out executor for agent runtimes.
+
+Runs many independent agent prompts (e.g. the same research agent across
+50 modules) concurrently on top of :class:`SDKAgentRunner` -- or any other
+:class:`AgentRuntime` -- while keeping the load on the API bounded.
+
+Features:
+    * Global concurrency cap (``max_concurrency``).
+    * Per-model request rate limits (token bucket, requests per minute).
+    * Retry with exponential backoff and jitter for transient failures.
+    * Cooperative cancellation of queued and in-flight tasks.
+    * Streaming aggregation: every task gets its own :class:`SDKEventBridge`
+      whose events are forwarded to the executor's listeners, and results
+      can be consumed as they complete via :meth:`FanOutExecutor.stream`.
+
+Usage:
+    runner = SDKAgentRunner.from_agent_template("research.json")
+    executor = FanOutExecutor(
+        runner,
+        max_concurrency=8,
+        rate_limits={"claude-sonnet-4-20250514": 60},
+    )
+    executor.on_event(my_listener)
+
+    tasks = [
+        FanOutTask(task_id=module, prompt=f"Summarize {module}")
+        for module in modules
+    ]
+    results = await executor.run(tasks)
+
+    # Or consume results as they finish
+    async for item in executor.stream(tasks):
+        print(item.task_id, item.ok)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from claude_mpm.services.agents.agent_runtime import resolve_model_to_sdk
+from claude_mpm.services.agents.sdk_event_bridge import SDKEventBridge
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from claude_mpm.services.agents.agent_runtime import (
+        AgentConfig,
+        AgentResult,
+        AgentRuntime,
+    )
+    from claude_mpm.services.agents.sdk_event_bridge import EventListener
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_KEY = "default"
+
+# ---------------------------------------------------------------------------
+# Data classes
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FanOutTask:
+    """A single prompt to execute as part of a fan-out batch."""
+
+    task_id: str
+    prompt: str
+    config: AgentConfig | None = None
+
+
+@dataclass
+class FanOutResult:
+    """Outcome of one :class:`FanOutTask`."""
+
+    task_id: str
+    result: AgentResult | None = None
+    error: str | None = None
+    attempts: int = 0
+    duration_ms: float = 0.0
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True when the task produced a non-error result."""
+        return self.result is not None and not self.result.is_error
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff policy for failed agent runs.
+
+    Only exceptions raised by the runtime are retried; a completed run
+    whose result has ``is_error`` set is returned as-is.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    jitter: float = 0.1
+    retry_on: tuple[type[BaseException], ...] = (Exception,)
+
+    def delay_for(self, attempt: int) -> float:
+        """Seconds to wait before retry number *attempt* (1-based)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay += random.uniform(0, delay * self.jitter)  # nosec B311
+        return delay
+
+
+@dataclass
+class FanOutStats:
+    """Counters describing a fan-out run."""
+
+    submitted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    retries: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    per_model: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed tasks per second over the run."""
+        elapsed = self.elapsed_seconds
+        done = self.succeeded + self.failed
+        return done / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "retries": self.retries,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "throughput_per_second": round(self.throughput, 2),
+            "per_model": dict(self.per_model),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class ModelRateLimiter:
+    """Token-bucket rate limiter keyed by model identifier.
+
+    Each model gets a bucket refilled at ``requests_per_minute / 60`` tokens
+    per second with a burst capacity of ``burst`` requests (default 1, i.e.
+    requests are evenly spaced). Models without a configured limit are not
+    throttled.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, float] | None = None,
+        burst: dict[str, float] | None = None,
+    ) -> None:
+        self._rates = {
+            resolve_model_to_sdk(model): rpm / 60.0
+            for model, rpm in (limits or {}).items()
+        }
+        bursts = {
+            resolve_model_to_sdk(model): size for model, size in (burst or {}).items()
+        }
+        self._capacity = {
+            model: max(1.0, bursts.get(model, 1.0)) for model in self._rates
+        }
+        self._tokens = dict(self._capacity)
+        self._updated = dict.fromkeys(self._rates, time.monotonic())
+        self._lock = asyncio.Lock()
+
+    def has_limit(self, model: str) -> bool:
+        return model in self._rates
+
+    async def acquire(self, model: str) -> None:
+        """Wait until a request for *model* may be sent."""
+        if model not in self._rates:
+            return
+
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                rate = self._rates[model]
+                elapsed = now - self._updated[model]
+                self._tokens[model] = min(
+                    self._capacity[model], self._tokens[model] + elapsed * rate
+                )
+                self._updated[model] = now
+                if self._tokens[model] >= 1.0:
+                    self._tokens[model] -= 1.0
+                    return
+                wait = (1.0 - self._tokens[model]) / rate
+            await asyncio.sleep(wait)
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class FanOutExecutor:
+    """Run many agent prompts concurrently with bounded resource usage.
+
+    A single runtime instance is shared by all tasks; ``SDKAgentRunner``
+    builds fresh options per call so concurrent use is safe. Runtimes that
+    provide ``run_streaming`` have their text and tool events forwarded
+    through a per-task :class:`SDKEventBridge`; others fall back to ``run``.
+
+    ``bridges`` holds the bridge of each task's final attempt in the latest
+    run, so a retry never replays events of the attempt that failed and
+    a long-lived executor does not accumulate bridges across runs.
+    """
+
+    def __init__(
+        self,
+        runtime: AgentRuntime,
+        max_concurrency: int = 8,
+        rate_limits: dict[str, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.runtime = runtime
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = ModelRateLimiter(rate_limits)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.stats = FanOutStats()
+        self.bridges: dict[str, SDKEventBridge] = {}
+        self._listeners: list[EventListener] = []
+        self._cancel_event = asyncio.Event()
+        self._inflight: set[asyncio.Task[Any]] = set()
+
+    # -- listeners -------------------------------------------------------------
+
+    def on_event(self, listener: EventListener) -> None:
+        """Register a listener receiving AgentEvents from every task."""
+        self._listeners.append(listener)
+
+    # -- public API --------------------------------------------------------------
+
+    async def run(self, tasks: Iterable[FanOutTask]) -> list[FanOutResult]:
+        """Execute all tasks and return results in submission order."""
+        task_list = list(tasks)
+        by_id: dict[str, FanOutResult] = {}
+        async for item in self.stream(task_list):
+            by_id[item.task_id] = item
+        return [
+            by_id.get(task.task_id) or FanOutResult(task.task_id, cancelled=True)
+            for task in task_list
+        ]
+
+    async def stream(self, tasks: Iterable[FanOutTask]) -> AsyncIterator[FanOutResult]:
+        """Execute tasks and yield each result as soon as it completes."""
+        task_list = list(tasks)
+        seen: set[str] = set()
+        for task in task_list:
+            if task.task_id in seen:
+                raise ValueError(f"Duplicate task_id: {task.task_id!r}")
+            seen.add(task.task_id)
+
+        self._cancel_event.clear()
+        self.bridges = {}
+        self.stats = FanOutStats(submitted=len(task_list), started_at=time.monotonic())
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _guarded(task: FanOutTask) -> FanOutResult:
+            try:
+                async with semaphore:
+                    if self._cancel_event.is_set():
+                        return FanOutResult(task_id=task.task_id, cancelled=True)
+                    return await self._execute(task)
+            except asyncio.CancelledError:
+                if not self._cancel_event.is_set():
+                    raise
+                return FanOutResult(task_id=task.task_id, cancelled=True)
+
+        pending = {asyncio.create_task(_guarded(task)): task for task in task_list}
+        self._inflight = set(pending)
+        try:
+            for next_done in asyncio.as_completed(pending):
+                item = await next_done
+                self._record(item)
+                yield item
+        finally:
+            # Consumer stopped early or was cancelled: don't leak workers
+            for running in pending:
+                if not running.done():
+                    running.cancel()
+            self._inflight = set()
+            self.stats.finished_at = time.monotonic()
+
+    def cancel(self) -> None:
+        """Cancel queued tasks and interrupt in-flight ones."""
+        self._cancel_event.set()
+        for running in list(self._inflight):
+            running.cancel()
+
+    # -- internals ---------------------------------------------------------------
+
+    def _model_key(self, task: FanOutTask) -> str:
+        model = (task.config.model if task.config else None) or getattr(
+            self.runtime, "model", None
+        )
+        return resolve_model_to_sdk(model) if model else DEFAULT_MODEL_KEY
+
+    def _make_bridge(self, task: FanOutTask) -> SDKEventBridge:
+        bridge = SDKEventBridge(agent_id=task.task_id)
+        for listener in self._listeners:
+            bridge.on_event(listener)
+        self.bridges[task.task_id] = bridge
+        return bridge
+
+    async def _execute(self, task: FanOutTask) -> FanOutResult:
+        """Run one task with rate limiting and retries."""
+        model = self._model_key(task)
+        started = time.perf_counter()
+        attempt = 0
+        last_error: str | None = None
+
+        while attempt < self.retry_policy.max_attempts:
+            attempt += 1
+            await self.rate_limiter.acquire(model)
+            self.stats.per_model[model] = self.stats.per_model.get(model, 0) + 1
+            bridge = self._make_bridge(task)
+            try:
+                result = await self._invoke(task, bridge)
+            except self.retry_policy.retry_on as e:
+                last_error = f"{type(e).__name__}: {e}"
+                if attempt >= self.retry_policy.max_attempts:
+                    break
+                delay = self.retry_policy.delay_for(attempt)
+                logger.warning(
+                    "Fan-out task %s failed (attempt %d/%d): %s; retrying in %.2fs",
+                    task.task_id,
+                    attempt,
+                    self.retry_policy.max_attempts,
+                    last_error,
+                    delay,
+                )
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+                continue
+
+            bridge.handle_result(result)
+            return FanOutResult(
+                task_id=task.task_id,
+                result=result,
+                attempts=attempt,
+                duration_ms=(time.perf_counter() - started) * 1000,
+            )
+
+        logger.error("Fan-out task %s gave up: %s", task.task_id, last_error)
+        return FanOutResult(
+            task_id=task.task_id,
+            error=last_error,
+            attempts=attempt,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    async def _invoke(self, task: FanOutTask, bridge: SDKEventBridge) -> AgentResult:
+        run_streaming = getattr(self.runtime, "run_streaming", None)
+        if run_streaming is not None:
+            return await run_streaming(
+                task.prompt,
+                on_text=bridge.handle_text,
+                on_tool_call=bridge.handle_tool_call,
+                config=task.config,
+            )
+        return await self.runtime.run(task.prompt, task.config)
+
+    def _record(self, item: FanOutResult) -> None:
+        if item.cancelled:
+            self.stats.cancelled += 1
+        elif item.ok:
+            self.stats.succeeded += 1
+        else:
+            self.stats.failed += 1
@@ -12,6 +12,7 @@ from claude_mpm.services.agents.deployment.remote_agent_discovery_service import
 from claude_mpm.services.agents.sources.git_source_sync_service import (
     GitSourceSyncService,
 )
+from claude_mpm.services.change_journal import record_source_sync
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +142,9 @@ class GitSourceManager:
             discovery_service = RemoteAgentDiscoveryService(repo.cache_path)
             discovered_agents = discovery_service.discover_remote_agents()
 
+            # Let startup reconcile deployed agents only if the content changed
+            record_source_sync("agents", repo.identifier, repo.cache_path)
+
             # Build result
             result = {
                 "synced": True,
@@ -41,6 +41,7 @@ from claude_mpm.core.enums import OperationResult
 from claude_mpm.core.logging_utils import get_logger
 from claude_mpm.core.unified_agent_registry import UnifiedAgentRegistry as AgentRegistry
 from claude_mpm.core.unified_paths import get_path_manager
+from claude_mpm.services.change_journal import ChangeJournal
 from claude_mpm.services.memory.cache.shared_prompt_cache import SharedPromptCache
 
 logger = get_logger(__name__)
@@ -280,6 +281,8 @@ class AgentModificationTracker(BaseService):
         # Set up file system monitoring
         if self.enable_monitoring:
             await self._setup_file_monitoring()
+            # Agent changes make the next startup reconcile deployed agents
+            self.register_modification_callback(ChangeJournal().record_modification)
 
         # Start background tasks
         self._persistence_task = asyncio.create_task(self._persistence_loop())
@@ -62,6 +62,77 @@ async def execute_agent_prompt(
     }
 
 
+async def execute_agent_prompts(
+    prompts: dict[str, str],
+    *,
+    system_prompt: str | None = None,
+    model: str | None = None,
+    allowed_tools: list[str] | None = None,
+    cwd: str | None = None,
+    max_turns: int | None = None,
+    mcp_servers: dict[str, Any] | None = None,
+    max_concurrency: int = 8,
+    requests_per_minute: float | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Execute many prompts concurrently with the same agent configuration.
+
+    Args:
+        prompts: Mapping of task id -> prompt.
+        requests_per_minute: Optional rate limit for *model*.
+
+    Returns a dict keyed by task id whose values have the same shape as
+    :func:`execute_agent_prompt`, plus ``error`` and ``attempts``.
+    """
+    from claude_mpm.services.agents.agent_runtime import AgentConfig
+    from claude_mpm.services.agents.fanout_executor import FanOutExecutor, FanOutTask
+    from claude_mpm.services.agents.runtime_config import get_runtime, get_runtime_type
+
+    config = AgentConfig(
+        system_prompt=system_prompt,
+        model=model,
+        allowed_tools=allowed_tools,
+        cwd=cwd,
+        max_turns=max_turns,
+        mcp_servers=mcp_servers,
+    )
+
+    runtime = get_runtime(config)
+    runtime_type = get_runtime_type()
+    rate_limits = (
+        {model: requests_per_minute} if model and requests_per_minute else None
+    )
+    executor = FanOutExecutor(
+        runtime, max_concurrency=max_concurrency, rate_limits=rate_limits
+    )
+    logger.info(
+        "Fanning out %d agent prompts via %s runtime", len(prompts), runtime_type
+    )
+
+    results = await executor.run(
+        [
+            FanOutTask(task_id=task_id, prompt=prompt, config=config)
+            for task_id, prompt in prompts.items()
+        ]
+    )
+
+    output: dict[str, dict[str, Any]] = {}
+    for item in results:
+        result = item.result
+        output[item.task_id] = {
+            "text": result.text if result else "",
+            "session_id": result.session_id if result else None,
+            "cost_usd": result.cost_usd if result else None,
+            "num_turns": result.num_turns if result else None,
+            "duration_ms": result.duration_ms if result else None,
+            "is_error": result.is_error if result else True,
+            "tool_calls": result.tool_calls if result else [],
+            "runtime": runtime_type,
+            "error": item.error,
+            "attempts": item.attempts,
+        }
+    return output
+
+
 def print_runtime_status() -> None:
     """Print current runtime selection and SDK availability."""
     from claude_mpm.services.agents.runtime_config import get_runtime_type
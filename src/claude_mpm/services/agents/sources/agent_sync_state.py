@@ -7,8 +7,9 @@ This service manages sync state for agent files from Git sources, providing:
 - Change detection for efficient incremental updates
 
 Database Location: ~/.config/claude-mpm/agent_sync.db
-Thread Safety: Uses connection-per-operation pattern (safe for single-threaded use)
-Performance: Optimized with indexes; expected <10ms per operation
+Thread Safety: One persistent connection per thread (SQLiteConnectionPool)
+Performance: WAL + synchronous=NORMAL, cached statements, bulk track_files();
+    expected well under 1ms per single-row operation
 """
 
 import logging
@@ -18,6 +19,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from claude_mpm.core.sqlite_pool import SQLiteConnectionPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,18 +42,20 @@ class AgentSyncState:
     - Query file change status
     - Provide migration utilities
 
-    Design Decision: Connection-per-operation pattern
+    Design Decision: Persistent per-thread connections
 
-    Rationale: Simplifies connection management and prevents connection leaks.
-    SQLite allows concurrent reads but serializes writes, so connection pooling
-    provides minimal benefit for our read-heavy workload.
+    Rationale: A sync touches every agent file, and opening a connection plus
+    re-applying PRAGMAs per operation dominated the cost of those small
+    statements. Each thread now reuses one connection with a warm statement
+    cache; _get_connection() still commits or rolls back per block.
 
     Trade-offs:
-    - Simplicity: No pool management overhead
-    - Safety: Automatic cleanup via context manager
-    - Performance: Negligible overhead (<1ms per connection)
-
-    Extension Points: Can add connection pooling if multi-threaded access needed.
+    - Performance: No connect/PRAGMA cost per operation; bulk writes via
+      track_files() use a single executemany transaction
+    - Safety: Connections are never shared between threads; close() releases
+      them explicitly, otherwise they are closed when their thread exits
+    - Durability: synchronous=NORMAL may drop the last commits on power loss,
+      which only causes files to be re-synced
     """
 
     # Schema version for migrations
@@ -70,6 +75,8 @@ class AgentSyncState:
             config_dir.mkdir(parents=True, exist_ok=True)
             self.db_path = config_dir / "agent_sync.db"
 
+        self._pool = SQLiteConnectionPool(self.db_path, pragmas={"foreign_keys": "ON"})
+
         # Initialize database
         self._initialize_database()
 
@@ -78,24 +85,19 @@ class AgentSyncState:
         """Context manager for database connections.
 
         Yields:
-            sqlite3.Connection with foreign keys enabled and row factory
+            This thread's sqlite3.Connection (foreign keys enabled, row factory)
 
         Error Handling:
         - Exception during transaction: Rolls back automatically
         - Connection errors: Propagates to caller
-        - Cleanup: Always closes connection
+        - Cleanup: Connection stays open for reuse; see close()
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable FK constraints
-        try:
+        with self._pool.connection() as conn:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        self._pool.close()
 
     def _initialize_database(self):
         """Initialize database schema if not exists.
@@ -314,6 +316,16 @@ class AgentSyncState:
     # FILE TRACKING
     # ==============================================================================
 
+    _TRACK_FILE_SQL = """
+        INSERT INTO agent_files (source_id, file_path, content_sha, local_path, synced_at, file_size)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source_id, file_path) DO UPDATE SET
+            content_sha = excluded.content_sha,
+            local_path = excluded.local_path,
+            synced_at = excluded.synced_at,
+            file_size = excluded.file_size
+    """
+
     def track_file(
         self,
         source_id: str,
@@ -342,15 +354,7 @@ class AgentSyncState:
         """
         with self._get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO agent_files (source_id, file_path, content_sha, local_path, synced_at, file_size)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ON CONFLICT(source_id, file_path) DO UPDATE SET
-                    content_sha = excluded.content_sha,
-                    local_path = excluded.local_path,
-                    synced_at = excluded.synced_at,
-                    file_size = excluded.file_size
-                """,
+                self._TRACK_FILE_SQL,
                 (
                     source_id,
                     file_path,
@@ -362,6 +366,44 @@ class AgentSyncState:
             )
         logger.debug(f"Tracked file: {source_id}/{file_path} -> {content_sha[:8]}...")
 
+    def track_files(self, source_id: str, files: list[dict[str, Any]]) -> int:
+        """Track many agent files in a single transaction.
+
+        Args:
+            source_id: Source identifier
+            files: Dicts with ``file_path`` and ``content_sha`` keys and
+                optional ``local_path`` and ``file_size``
+
+        Returns:
+            Number of files tracked
+
+        Example:
+            sync_state.track_files(
+                "github-remote",
+                [
+                    {"file_path": "research.md", "content_sha": "abc..."},
+                    {"file_path": "engineer.md", "content_sha": "def...", "file_size": 4096},
+                ],
+            )
+        """
+        if not files:
+            return 0
+        synced_at = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                source_id,
+                entry["file_path"],
+                entry["content_sha"],
+                entry.get("local_path"),
+                synced_at,
+                entry.get("file_size"),
+            )
+            for entry in files
+        ]
+        self._pool.executemany(self._TRACK_FILE_SQL, rows)
+        logger.debug(f"Tracked {len(rows)} files for source {source_id}")
+        return len(rows)
+
     def get_file_hash(self, source_id: str, file_path: str) -> str | None:
         """Get stored content hash for file.
 
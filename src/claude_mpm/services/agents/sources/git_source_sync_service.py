@@ -460,6 +460,8 @@ class GitSourceSyncService:
 
         # Get list of agents to sync
         agent_list = self._get_agent_list()
+        # Content hashes are written in one batch after the loop
+        tracked_files: list[dict[str, Any]] = []
 
         # Create progress bar if enabled
         progress_bar = None
@@ -486,14 +488,15 @@ class GitSourceSyncService:
                     cache_file = self.cache_dir / agent_filename
                     content_sha = get_file_hash(cache_file, algorithm="sha256")
                     if content_sha:
-                        self.sync_state.track_file(
-                            source_id=self.source_id,
-                            file_path=agent_filename,
-                            content_sha=content_sha,
-                            local_path=str(cache_file),
-                            file_size=len(content.encode("utf-8"))
-                            if content is not None
-                            else 0,
+                        tracked_files.append(
+                            {
+                                "file_path": agent_filename,
+                                "content_sha": content_sha,
+                                "local_path": str(cache_file),
+                                "file_size": len(content.encode("utf-8"))
+                                if content is not None
+                                else 0,
+                            }
                         )
 
                     results["synced"].append(agent_filename)
@@ -518,12 +521,13 @@ class GitSourceSyncService:
                                 # Re-calculate and track hash
                                 new_sha = get_file_hash(cache_file, algorithm="sha256")
                                 if new_sha:
-                                    self.sync_state.track_file(
-                                        source_id=self.source_id,
-                                        file_path=agent_filename,
-                                        content_sha=new_sha,
-                                        local_path=str(cache_file),
-                                        file_size=len(content.encode("utf-8")),
+                                    tracked_files.append(
+                                        {
+                                            "file_path": agent_filename,
+                                            "content_sha": new_sha,
+                                            "local_path": str(cache_file),
+                                            "file_size": len(content.encode("utf-8")),
+                                        }
                                     )
                                 results["synced"].append(agent_filename)
                                 results["total_downloaded"] += 1
@@ -545,12 +549,13 @@ class GitSourceSyncService:
                             # Track hash
                             current_sha = get_file_hash(cache_file, algorithm="sha256")
                             if current_sha:
-                                self.sync_state.track_file(
-                                    source_id=self.source_id,
-                                    file_path=agent_filename,
-                                    content_sha=current_sha,
-                                    local_path=str(cache_file),
-                                    file_size=len(content.encode("utf-8")),
+                                tracked_files.append(
+                                    {
+                                        "file_path": agent_filename,
+                                        "content_sha": current_sha,
+                                        "local_path": str(cache_file),
+                                        "file_size": len(content.encode("utf-8")),
+                                    }
                                 )
                             results["synced"].append(agent_filename)
                             results["total_downloaded"] += 1
@@ -570,6 +575,9 @@ class GitSourceSyncService:
                 logger.error(f"Unexpected error for {agent_filename}: {e}")
                 results["failed"].append(agent_filename)
 
+        # Track all downloaded files with their content hashes in SQLite
+        self.sync_state.track_files(self.source_id, tracked_files)
+
         # Record sync result in history
         duration_ms = int((time.time() - start_time) * 1000)
         status = (
@@ -11,6 +11,8 @@ Key Features:
 - Async I/O with fire-and-forget pattern
 - Queue-based background writing
 - Optional OS-native logging format
+- Optional segmented format: batches appended to per-session JSONL segments
+  with a sidecar index (see services/response_log.py)
 - Zero blocking on main thread
 - Configuration via .claude-mpm/configuration.yaml
 """
@@ -24,12 +26,17 @@ import time
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from enum import Enum
-from queue import Full, Queue
+from queue import Empty, Full, Queue
 from threading import Lock, Thread
 from typing import Any
 
 from claude_mpm.core.constants import PerformanceConfig, SystemLimits, TimeoutConfig
 from claude_mpm.core.logging_utils import get_logger
+from claude_mpm.services.response_log import (
+    DEFAULT_MAX_SEGMENT_AGE,
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentedResponseLog,
+)
 
 # Import centralized session manager
 from claude_mpm.services.session_manager import get_session_manager
@@ -39,6 +46,9 @@ from ..core.config import Config
 
 logger = get_logger(__name__)
 
+# Entries the worker writes per group commit
+DEFAULT_BATCH_SIZE = 256
+
 
 class LogFormat(Enum):
     """Supported log formats for response storage."""
@@ -46,6 +56,7 @@ class LogFormat(Enum):
     JSON = "json"
     SYSLOG = "syslog"
     JOURNALD = "journald"
+    SEGMENTED = "segmented"
 
 
 @dataclass
@@ -126,6 +137,8 @@ class AsyncSessionLogger:
                 self.log_format = LogFormat.SYSLOG
             elif format_str == "journald":
                 self.log_format = LogFormat.JOURNALD
+            elif format_str == "segmented":
+                self.log_format = LogFormat.SEGMENTED
             else:
                 self.log_format = LogFormat.JSON
 
@@ -160,6 +173,9 @@ class AsyncSessionLogger:
                 if enable_compression is not None
                 else response_config.get("enable_compression", False)
             )
+            self.batch_size = max(
+                1, int(response_config.get("batch_size", DEFAULT_BATCH_SIZE))
+            )
 
             # Create base directory
             self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -173,6 +189,7 @@ class AsyncSessionLogger:
             self._worker_thread: Thread | None = None
             self._shutdown = False
             self._lock = Lock()
+            self._unwritten = 0  # Queued entries not yet written
 
             # Statistics
             self.stats = {
@@ -180,6 +197,8 @@ class AsyncSessionLogger:
                 "queued": 0,
                 "dropped": 0,
                 "errors": 0,
+                "batches": 0,
+                "files_created": 0,
                 "avg_write_time_ms": 0.0,
             }
 
@@ -234,6 +253,20 @@ class AsyncSessionLogger:
                 logger.warning("systemd not available, falling back to JSON")
                 self.log_format = LogFormat.JSON
 
+        elif self.log_format == LogFormat.SEGMENTED:
+            response_config = self.config.get("response_logging", {})
+            self.segment_log = SegmentedResponseLog(
+                self.base_dir,
+                max_segment_bytes=response_config.get(
+                    "segment_max_bytes", DEFAULT_MAX_SEGMENT_BYTES
+                ),
+                max_segment_age=response_config.get(
+                    "segment_max_age", DEFAULT_MAX_SEGMENT_AGE
+                ),
+                compress=self.enable_compression,
+                fsync=response_config.get("fsync", False),
+            )
+
     def _start_worker(self):
         """Start the background worker thread for async writes."""
         with self._lock:
@@ -246,41 +279,62 @@ class AsyncSessionLogger:
                 logger.debug("Started async logger worker thread")
 
     def _process_queue(self):
-        """Background worker to process the log queue."""
+        """Background worker to process the log queue.
+
+        Each pass takes every queued entry (up to ``batch_size``) and writes
+        them together, so a burst costs one group commit instead of one
+        write per entry. Entries still queued at shutdown are written
+        before the worker exits.
+        """
         write_times = []
 
-        while not self._shutdown:
+        while not self._shutdown or not self._queue.empty():
             try:
                 # Get entry with timeout to allow shutdown checks
-                entry = self._queue.get(timeout=TimeoutConfig.QUEUE_GET_TIMEOUT)
+                batch = [self._queue.get(timeout=TimeoutConfig.QUEUE_GET_TIMEOUT)]
+            except Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            # Time the write operation
+            start_time = time.perf_counter()
+            written = self._write_batch(batch)
+            write_time = (
+                time.perf_counter() - start_time
+            ) * PerformanceConfig.SECONDS_TO_MS
+
+            # Update statistics (average write time per entry)
+            write_times.append(write_time / len(batch))
+            if len(write_times) > 100:
+                write_times = write_times[-100:]  # Keep last 100
 
-                # Time the write operation
-                start_time = time.perf_counter()
-                self._write_entry(entry)
-                write_time = (
-                    time.perf_counter() - start_time
-                ) * PerformanceConfig.SECONDS_TO_MS
+            with self._lock:
+                self.stats["logged"] += written
+                self.stats["batches"] += 1
+                self.stats["avg_write_time_ms"] = sum(write_times) / len(write_times)
+                self._unwritten -= len(batch)
 
-                # Update statistics
-                write_times.append(write_time)
-                if len(write_times) > 100:
-                    write_times = write_times[-100:]  # Keep last 100
+    def _write_batch(self, batch: list[LogEntry]) -> int:
+        """Write queued entries, as one group commit in the segmented format.
 
-                with self._lock:
-                    self.stats["logged"] += 1
-                    self.stats["avg_write_time_ms"] = sum(write_times) / len(
-                        write_times
-                    )
+        Returns:
+            Number of entries written
+        """
+        if self.log_format != LogFormat.SEGMENTED:
+            return sum(self._write_entry(entry) for entry in batch)
+        try:
+            return self._write_segmented_entries(batch)
+        except Exception as e:
+            logger.error(f"Failed to write log batch: {e}", exc_info=True)
+            with self._lock:
+                self.stats["errors"] += len(batch)
+            return 0
 
-            except Exception as e:
-                # Check if it's a timeout (queue.Empty) or real error
-                if "Empty" not in str(type(e).__name__):
-                    logger.error(f"Error in async worker: {e}", exc_info=True)
-                    with self._lock:
-                        self.stats["errors"] += 1
-                # Otherwise it's just a timeout, continue to check shutdown
-
-    def _write_entry(self, entry: LogEntry):
+    def _write_entry(self, entry: LogEntry) -> bool:
         """Write a log entry to disk or system log."""
         try:
             if self.log_format == LogFormat.JSON:
@@ -289,10 +343,33 @@ class AsyncSessionLogger:
                 self._write_syslog_entry(entry)
             elif self.log_format == LogFormat.JOURNALD:
                 self._write_journald_entry(entry)
+            elif self.log_format == LogFormat.SEGMENTED:
+                self._write_segmented_entries([entry])
+            return True
         except Exception as e:
             logger.error(f"Failed to write log entry: {e}", exc_info=True)
             with self._lock:
                 self.stats["errors"] += 1
+            return False
+
+    @staticmethod
+    def _entry_record(entry: LogEntry) -> dict[str, Any]:
+        """Serializable form of an entry (without the internal microseconds)."""
+        data = asdict(entry)
+        data.pop("microseconds", None)
+        return data
+
+    def _write_segmented_entries(self, entries: list[LogEntry]) -> int:
+        """Append entries to the session segments in one group commit."""
+        created = self.segment_log.stats["segments_created"]
+        written = self.segment_log.append_batch(
+            self._entry_record(entry) for entry in entries
+        )
+        with self._lock:
+            self.stats["files_created"] += (
+                self.segment_log.stats["segments_created"] - created
+            )
+        return written
 
     def _generate_filename(self, entry: LogEntry) -> str:
         """
@@ -325,9 +402,7 @@ class AsyncSessionLogger:
         file_path = self.base_dir / filename
 
         # Prepare data (exclude microseconds field which is internal only)
-        data = asdict(entry)
-        # Remove internal-only field
-        data.pop("microseconds", None)
+        data = self._entry_record(entry)
 
         # Write file
         if self.enable_compression:
@@ -338,6 +413,8 @@ class AsyncSessionLogger:
         else:
             with file_path.open("w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+        with self._lock:
+            self.stats["files_created"] += 1
 
         logger.debug(f"Wrote log entry to {file_path}")
 
@@ -437,6 +514,8 @@ class AsyncSessionLogger:
         # Queue for async processing or write directly
         if self.enable_async:
             try:
+                with self._lock:
+                    self._unwritten += 1
                 self._queue.put_nowait(entry)
                 with self._lock:
                     self.stats["queued"] += 1
@@ -445,6 +524,7 @@ class AsyncSessionLogger:
                 # Queue is full, drop the entry (fire-and-forget)
                 logger.warning("Log queue full, dropping entry")
                 with self._lock:
+                    self._unwritten -= 1
                     self.stats["dropped"] += 1
                 return False
         else:
@@ -456,6 +536,9 @@ class AsyncSessionLogger:
         """
         Flush pending log entries with timeout.
 
+        Waits until queued entries are written, including a batch the worker
+        has already taken off the queue.
+
         Args:
             timeout: Maximum time to wait for flush
 
@@ -466,10 +549,10 @@ class AsyncSessionLogger:
             return True
 
         start_time = time.time()
-        while not self._queue.empty():
+        while self._unwritten > 0:
             if time.time() - start_time > timeout:
                 logger.warning(
-                    f"Flush timeout with {self._queue.qsize()} entries remaining"
+                    f"Flush timeout with {self._unwritten} entries remaining"
                 )
                 return False
             time.sleep(0.01)
@@ -593,6 +676,8 @@ def get_async_logger(
                     log_format = LogFormat.SYSLOG
                 elif format_str == "journald":
                     log_format = LogFormat.JOURNALD
+                elif format_str == "segmented":
+                    log_format = LogFormat.SEGMENTED
                 else:
                     log_format = LogFormat.JSON
 
@@ -0,0 +1,361 @@
+"""Change journal for startup agent/skill reconciliation.
+
+WHY: Startup decided whether to redo agent and skill deployment with
+24-hour TTL stamps in sync-state.json. Within the TTL, a deleted deployed
+agent, an edited configuration.yaml or a new local template went unnoticed
+until the stamp expired. Once it expired, every agent and skill was
+reconciled again even though nothing had changed.
+
+DESIGN DECISIONS:
+- The journal (~/.claude-mpm/cache/change-journal.json) records what each
+  project's deployment was last reconciled against, separately for
+  ``agents`` and ``skills``:
+  - the source revisions at that time;
+  - stamps and hashes of the configuration inputs, including profiles
+    and the main config files that select the active profile;
+  - the installed claude-mpm version;
+  - stamps and SHA-256 hashes of the deployed files.
+- Sync services record a revision per source after every sync. The
+  revision is a digest of the cached files' paths, sizes and mtimes, and
+  files are only rewritten when their ETag changes.
+- AgentModificationTracker's watchdog observer records file events for
+  agent directories the journal does not stamp itself, such as user-level
+  templates. Each event carries the project it belongs to, or none for
+  user-level files, which apply to every project.
+- ``pending_changes()`` compares the current state with the last
+  reconciliation. Stamps are compared first and files are hashed only when
+  a stamp differs. A touched file with unchanged content gets its new
+  stamp written back, so a clean check costs a few ``stat()`` calls and
+  no reads.
+- The TTL now only rate-limits network polling of remote sources.
+  Reconciliation runs when, and only when, the journal reports changes.
+- Every read-modify-write of the journal holds an advisory file lock, so
+  concurrent sessions and the watcher do not drop each other's updates.
+- The journal is disposable: a project without an entry is reconciled at
+  its next sync and recorded from then on.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .. import __version__
+from ..core.config_file_lock import ConfigFileLockError, config_file_lock
+from ..core.logger import get_logger
+from ..core.shared.config_loader import ConfigLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+JOURNAL_VERSION = 1
+# Watcher events kept for projects that have not started up since
+MAX_EVENTS = 500
+
+
+def journal_path() -> Path:
+    """Journal location (computed dynamically to respect Path.home mocks)."""
+    return Path.home() / ".claude-mpm" / "cache" / "change-journal.json"
+
+
+def _stamp(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _sha256(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def source_revision(cache_path: Path) -> str:
+    """Digest identifying the synced content of one source cache.
+
+    Dotfiles (ETag caches, catalogs, sync metadata) are ignored so that
+    bookkeeping written during a sync does not count as a content change.
+    """
+    digest = hashlib.sha256()
+    root = Path(cache_path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for filename in sorted(filenames):
+            if filename.startswith("."):
+                continue
+            path = Path(dirpath) / filename
+            stamp = _stamp(path)
+            digest.update(f"{path.relative_to(root)}\0{stamp}\n".encode())
+    return digest.hexdigest()
+
+
+def _main_config_files(project_path: Path) -> list[Path]:
+    """Candidates ConfigLoader.load_main_config searches (e.g. active_profile)."""
+    paths = []
+    for search_path in ConfigLoader.MAIN_CONFIG.search_paths:
+        if search_path.startswith("~/"):
+            base = Path.home() / search_path[2:]
+        else:
+            base = project_path / search_path
+        paths.extend(base / name for name in ConfigLoader.MAIN_CONFIG.filenames)
+    return paths
+
+
+def _config_inputs(kind: str, project_path: Path) -> list[Path]:
+    """Files whose content determines what gets deployed for *kind*."""
+    config_dir = Path.home() / ".claude-mpm" / "config"
+    project_config = project_path / ".claude-mpm" / "configuration.yaml"
+    # Profiles filter both agents and skills
+    shared = [
+        project_config,
+        *_main_config_files(project_path),
+        *sorted((project_path / ".claude-mpm" / "profiles").glob("*.yaml")),
+    ]
+    if kind == "agents":
+        templates = project_path / ".claude-mpm" / "agents"
+        return [
+            config_dir / "agent_sources.yaml",
+            *shared,
+            *sorted(templates.glob("*.md")),
+        ]
+    # Skills deployed from agents depend on which agents are deployed
+    return [
+        config_dir / "skill_sources.yaml",
+        *shared,
+        *sorted((project_path / ".claude" / "agents").glob("*.md")),
+    ]
+
+
+def _deployed_files(kind: str, project_path: Path) -> dict[str, Path]:
+    """Deployed files of *kind* by name."""
+    if kind == "agents":
+        deploy_dir = project_path / ".claude" / "agents"
+        return {path.name: path for path in deploy_dir.glob("*.md")}
+    deploy_dir = project_path / ".claude" / "skills"
+    return {path.parent.name: path for path in deploy_dir.glob("*/SKILL.md")}
+
+
+def _file_states(paths: dict[str, Path]) -> dict[str, list | None]:
+    states: dict[str, list | None] = {}
+    for key, path in paths.items():
+        stamp = _stamp(path)
+        states[key] = None if stamp is None else [*stamp, _sha256(path)]
+    return states
+
+
+def _changed_files(
+    recorded: dict[str, list | None], paths: dict[str, Path]
+) -> tuple[list[str], bool]:
+    """Keys whose file differs from its recorded state.
+
+    A file whose stamp changed but whose content did not gets its new stamp
+    written into *recorded*, so it is not hashed again on the next check.
+
+    Returns:
+        Changed keys and whether any recorded stamp was refreshed
+    """
+    changed = sorted(set(recorded) ^ set(paths))
+    refreshed = False
+    for key in sorted(set(recorded) & set(paths)):
+        state = recorded[key]
+        stamp = _stamp(paths[key])
+        if state is None or stamp is None:
+            if state != stamp:
+                changed.append(key)
+        elif stamp != state[:2]:
+            if _sha256(paths[key]) == state[2]:
+                recorded[key] = [*stamp, state[2]]
+                refreshed = True
+            else:
+                changed.append(key)
+    return changed, refreshed
+
+
+class ChangeJournal:
+    """Records source revisions, file events and reconciled deployment state."""
+
+    def __init__(self, path: Path | None = None):
+        """
+        Args:
+            path: Journal file (default: ~/.claude-mpm/cache/change-journal.json)
+        """
+        self.path = path or journal_path()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and data.get("version") == JOURNAL_VERSION:
+                return data
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable change journal {self.path}: {e}")
+        return {"version": JOURNAL_VERSION, "sources": {}, "projects": {}, "events": []}
+
+    def _save(self, data: dict[str, Any]) -> None:
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.debug(f"Could not save change journal {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _update(self, apply: Callable[[dict[str, Any]], bool]) -> None:
+        """Load, modify and save the journal while holding its file lock.
+
+        Args:
+            apply: Mutates the loaded journal; returns whether to save it
+        """
+        try:
+            with config_file_lock(self.path):
+                data = self._load()
+                if apply(data):
+                    self._save(data)
+        except ConfigFileLockError as e:
+            logger.debug(f"Could not update change journal {self.path}: {e}")
+
+    def record_source(self, kind: str, source_id: str, revision: str) -> None:
+        """Record the revision a sync left in a source's cache."""
+
+        def apply(data: dict[str, Any]) -> bool:
+            sources = data["sources"].setdefault(kind, {})
+            if sources.get(source_id) == revision:
+                return False
+            sources[source_id] = revision
+            return True
+
+        self._update(apply)
+
+    def record_event(
+        self, kind: str, path: str, change: str, project: Path | None = None
+    ) -> None:
+        """Record a file system change reported by a watcher.
+
+        Args:
+            kind: ``agents`` or ``skills``
+            path: Changed file
+            change: Type of change (create, modify, delete, ...)
+            project: Project the file belongs to; None for user-level files
+                that affect every project
+        """
+        event = {
+            "kind": kind,
+            "path": path,
+            "change": change,
+            "project": None if project is None else str(project),
+            "time": time.time(),
+        }
+
+        def apply(data: dict[str, Any]) -> bool:
+            data["events"].append(event)
+            del data["events"][:-MAX_EVENTS]
+            return True
+
+        self._update(apply)
+
+    def record_modification(self, modification: Any) -> None:
+        """AgentModificationTracker callback feeding agent file events.
+
+        The tracker watches project directories relative to its working
+        directory and the user agents directory, so only project-tier
+        changes are scoped to the current project.
+        """
+        self.record_event(
+            "agents",
+            modification.file_path,
+            modification.modification_type.value,
+            project=Path.cwd() if modification.tier.value == "project" else None,
+        )
+
+    def is_tracked(self, kind: str, project_path: Path) -> bool:
+        """Whether *kind* of the project was ever recorded as reconciled."""
+        return kind in self._load()["projects"].get(str(project_path), {})
+
+    def pending_changes(self, kind: str, project_path: Path) -> list[str]:
+        """Describe what changed for *kind* since the project was reconciled.
+
+        Returns:
+            Human-readable reasons; empty if no reconciliation is needed
+        """
+        data = self._load()
+        entry = data["projects"].get(str(project_path), {}).get(kind)
+        if entry is None:
+            return ["not reconciled yet"]
+
+        reasons = []
+        if entry.get("version") != __version__:
+            reasons.append(f"claude-mpm version changed to {__version__}")
+        sources = data["sources"].get(kind, {})
+        reasons.extend(
+            f"source {source_id} changed"
+            for source_id in sorted(set(sources) | set(entry["sources"]))
+            if sources.get(source_id) != entry["sources"].get(source_id)
+        )
+        inputs = {str(path): path for path in _config_inputs(kind, project_path)}
+        changed_inputs, inputs_refreshed = _changed_files(entry["inputs"], inputs)
+        reasons.extend(f"{Path(key).name} changed" for key in changed_inputs)
+        changed_deployed, deployed_refreshed = _changed_files(
+            entry["deployed"], _deployed_files(kind, project_path)
+        )
+        reasons.extend(f"deployed {name} changed" for name in changed_deployed)
+        if inputs_refreshed or deployed_refreshed:
+            # Touched but unchanged files: keep the next check free of reads
+            self._update(
+                lambda fresh: _refresh_stamps(fresh, kind, project_path, entry)
+            )
+        reasons.extend(
+            f"{event['path']} {event['change']}"
+            for event in data["events"]
+            if event["kind"] == kind
+            and event.get("project") in (None, str(project_path))
+            and event["time"] > entry["reconciled_at"]
+        )
+        return reasons
+
+    def mark_reconciled(self, kind: str, project_path: Path) -> None:
+        """Record the current sources, inputs and deployed files as reconciled."""
+        inputs = {str(path): path for path in _config_inputs(kind, project_path)}
+        entry = {
+            "reconciled_at": time.time(),
+            "version": __version__,
+            "inputs": _file_states(inputs),
+            "deployed": _file_states(_deployed_files(kind, project_path)),
+        }
+
+        def apply(data: dict[str, Any]) -> bool:
+            entry["sources"] = dict(data["sources"].get(kind, {}))
+            data["projects"].setdefault(str(project_path), {})[kind] = entry
+            return True
+
+        self._update(apply)
+
+
+def _refresh_stamps(
+    data: dict[str, Any], kind: str, project_path: Path, checked: dict[str, Any]
+) -> bool:
+    """Copy refreshed stamps into *data* unless the project was reconciled since."""
+    entry = data["projects"].get(str(project_path), {}).get(kind)
+    if entry is None or entry["reconciled_at"] != checked["reconciled_at"]:
+        return False
+    entry["inputs"] = checked["inputs"]
+    entry["deployed"] = checked["deployed"]
+    return True
+
+
+def record_source_sync(kind: str, source_id: str, cache_path: Path) -> None:
+    """Record a source's revision after a sync; never fails the sync."""
+    try:
+        ChangeJournal().record_source(kind, source_id, source_revision(cache_path))
+    except Exception as e:
+        logger.debug(f"Could not record {kind} source {source_id} in journal: {e}")
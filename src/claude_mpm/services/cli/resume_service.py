@@ -5,7 +5,8 @@ WHY: This service provides resume capabilities by reading stop event logs from
 
 DESIGN DECISIONS:
 - Two-tier strategy: prefer resume logs, fallback to response logs
-- Read JSON stop events from response logs
+- Read JSON stop events from response logs, both the segmented log
+  (through its index) and the legacy one-file-per-response layout
 - Parse PM responses for context (tasks, files, next steps)
 - Group by session_id for session-based resume
 - Calculate time elapsed and display comprehensive context
@@ -23,6 +24,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from claude_mpm.core.logger import get_logger
+from claude_mpm.services.response_log import ResponseLogReader
 
 logger = get_logger(__name__)
 
@@ -91,6 +93,9 @@ class ResumeService:
             logger.debug("No responses directory found")
             return []
 
+        summaries = self._list_segmented_sessions()
+        segmented_ids = {summary.session_id for summary in summaries}
+
         # Group response files by session_id
         sessions_map: dict[str, list[Path]] = {}
 
@@ -109,8 +114,9 @@ class ResumeService:
                 continue
 
         # Create summaries
-        summaries = []
         for session_id, files in sessions_map.items():
+            if session_id in segmented_ids:
+                continue
             try:
                 # Use the most recent file for this session
                 files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
@@ -145,6 +151,36 @@ class ResumeService:
         summaries.sort(key=lambda s: s.timestamp, reverse=True)
         return summaries
 
+    def _list_segmented_sessions(self) -> list[SessionSummary]:
+        """Session summaries from the segmented response log's index."""
+        reader = ResponseLogReader(self.responses_dir)
+        if not reader.exists():
+            return []
+
+        summaries = []
+        for session in reader.sessions():
+            try:
+                data = reader.latest(session["session_id"]) or {}
+                metadata = data.get("metadata", {})
+                timestamp_str = data.get("timestamp") or metadata.get("timestamp")
+                summaries.append(
+                    SessionSummary(
+                        session_id=session["session_id"],
+                        timestamp=self._parse_timestamp(timestamp_str),
+                        agent_count=session["entries"],
+                        stop_reason=metadata.get("stop_reason", "unknown"),
+                        token_usage=metadata.get("usage", {}).get("total_tokens", 0),
+                        last_agent=data.get("agent", session["last_agent"]),
+                        working_directory=metadata.get("working_directory", ""),
+                        git_branch=metadata.get("git_branch", "unknown"),
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to create summary for session {session['session_id']}: {e}"
+                )
+        return summaries
+
     def get_session_context(self, session_id: str) -> SessionContext | None:
         """Get full context for a specific session.
 
@@ -211,6 +247,18 @@ class ResumeService:
         if not self.responses_dir.exists():
             return None
 
+        reader = ResponseLogReader(self.responses_dir)
+        if reader.exists():
+            index = reader.index(session_id=session_id)
+            latest_data = reader.latest(session_id)
+            if latest_data is not None:
+                segments = sorted({entry.segment for entry in index})
+                return self._build_context(
+                    session_id,
+                    latest_data,
+                    [str(self.responses_dir / segment) for segment in segments],
+                )
+
         # Find all response files for this session
         response_files = []
         for response_file in self.responses_dir.glob("*.json"):
@@ -251,7 +299,28 @@ class ResumeService:
 
             with latest_file.open("r") as f:
                 latest_data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to build context from files: {e}")
+            return None
+
+        return self._build_context(
+            session_id, latest_data, [str(f) for f in response_files]
+        )
+
+    def _build_context(
+        self, session_id: str, latest_data: dict, response_files: list[str]
+    ) -> SessionContext | None:
+        """Build SessionContext from a session's most recent response.
+
+        Args:
+            session_id: Session ID
+            latest_data: Most recent logged response of the session
+            response_files: Files (or segments) holding the session's responses
 
+        Returns:
+            SessionContext or None if parsing fails
+        """
+        try:
             metadata = latest_data.get("metadata", {})
             timestamp_str = latest_data.get("timestamp") or metadata.get("timestamp")
             timestamp = self._parse_timestamp(timestamp_str)
@@ -281,7 +350,7 @@ class ResumeService:
                 next_steps=pm_data.get("next_steps", []),
                 context_management=pm_data.get("context_management"),
                 delegation_compliance=pm_data.get("delegation_compliance"),
-                response_files=[str(f) for f in response_files],
+                response_files=response_files,
             )
 
         except Exception as e:
@@ -158,6 +158,16 @@ def process_message(message_data: dict) -> bool:
         message_data["status"] = "unread"
         shared_db.insert_message(message_data)
 
+        # Wake sessions long-polling on the recipient project
+        from .message_notifier import MessageNotifier
+
+        MessageNotifier(shared_db_path.parent / "notify").publish(
+            to_project,
+            message_data["id"],
+            message_data.get("to_agent", "pm"),
+            message_data.get("priority", "normal"),
+        )
+
         # Also notify the target project if it has an active session
         # This is where real-time notification would happen
         send_notification.schedule(
@@ -0,0 +1,245 @@
+"""
+Local push notifications for cross-project messaging.
+
+WHY: Sessions used to notice new messages by re-querying the shared SQLite
+store on a schedule, which adds delivery latency and constant background I/O
+when many sessions run at once. This module lets a sender wake exactly the
+sessions waiting on the destination project.
+
+DESIGN:
+- Each waiting consumer binds a Unix datagram socket named after a hash of
+  its project path: <notify_dir>/<project-key>-<token>.sock
+- Publishers send a tiny JSON datagram to every socket of the target project
+  after the message is committed to SQLite. The database stays the source of
+  truth; a notification only says "look now"
+- Agent filtering happens on the receiving side, so one subscription can
+  watch a single agent or the whole project
+- Sockets whose owner died (ECONNREFUSED/ENOENT) are unlinked by publishers
+- Publishing never blocks and never raises into the send path
+- Platforms without AF_UNIX get a subscription that simply sleeps, so
+  callers fall back to their periodic re-check
+"""
+
+import contextlib
+import hashlib
+import json
+import socket
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from ...core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# sockaddr_un.sun_path is 104 bytes on macOS/BSD and 108 on Linux
+MAX_SOCKET_PATH = 100
+MAX_DATAGRAM = 4096
+
+
+@dataclass
+class MessageNotification:
+    """A "new message" signal delivered to a subscriber."""
+
+    message_id: str
+    to_project: str
+    to_agent: str
+    priority: str
+    sent_at: float
+
+    @property
+    def latency(self) -> float:
+        """Seconds between publish and now."""
+        return time.time() - self.sent_at
+
+
+def _project_key(project: str) -> str:
+    return hashlib.sha256(project.encode()).hexdigest()[:16]
+
+
+class MessageSubscription:
+    """Receives notifications for one project (optionally one agent)."""
+
+    def __init__(
+        self, sock: socket.socket | None, path: Path | None, agent: str | None
+    ):
+        self._sock = sock
+        self.path = path
+        self.agent = agent
+
+    @property
+    def active(self) -> bool:
+        """True if push notifications are available on this platform."""
+        return self._sock is not None
+
+    def wait(self, timeout: float) -> list[MessageNotification]:
+        """Block until a matching notification arrives or *timeout* elapses.
+
+        Returns all matching notifications received (possibly empty on
+        timeout). Notifications already queued are returned immediately.
+        """
+        if self._sock is None:
+            time.sleep(max(0.0, timeout))
+            return []
+
+        deadline = time.monotonic() + max(0.0, timeout)
+        matched: list[MessageNotification] = []
+        while not matched:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._sock.settimeout(remaining)
+            try:
+                data = self._sock.recv(MAX_DATAGRAM)
+            except (TimeoutError, BlockingIOError):
+                break
+            except OSError as e:
+                logger.debug(f"Notification socket error: {e}")
+                break
+            matched.extend(self._filter([data]))
+
+        # Drain whatever else is already queued without blocking
+        self._sock.setblocking(False)
+        pending = []
+        while True:
+            try:
+                pending.append(self._sock.recv(MAX_DATAGRAM))
+            except OSError:
+                break
+        matched.extend(self._filter(pending))
+        return matched
+
+    def close(self) -> None:
+        """Stop receiving notifications and remove the socket file."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+
+    def __enter__(self) -> "MessageSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _filter(self, datagrams: list[bytes]) -> list[MessageNotification]:
+        notifications = []
+        for data in datagrams:
+            try:
+                notification = MessageNotification(**json.loads(data))
+            except (ValueError, TypeError) as e:
+                logger.debug(f"Ignoring malformed notification: {e}")
+                continue
+            if self.agent is None or notification.to_agent == self.agent:
+                notifications.append(notification)
+        return notifications
+
+
+class MessageNotifier:
+    """Publishes and subscribes to new-message notifications."""
+
+    def __init__(self, notify_dir: Path):
+        """
+        Initialize notifier.
+
+        Args:
+            notify_dir: Directory holding subscriber sockets. Senders and
+                receivers must agree on it; MessageService uses the
+                directory next to the shared messaging database.
+        """
+        self.notify_dir = self._usable_dir(Path(notify_dir))
+
+    @staticmethod
+    def supported() -> bool:
+        """Whether Unix datagram sockets are available."""
+        return hasattr(socket, "AF_UNIX")
+
+    def subscribe(self, project: str, agent: str | None = None) -> MessageSubscription:
+        """
+        Start receiving notifications for messages sent to *project*.
+
+        Args:
+            project: Canonical project path (as stored in to_project)
+            agent: Only wake for messages to this agent (None = any agent)
+
+        Returns:
+            Subscription; use as a context manager or call close()
+        """
+        if not self.supported():
+            return MessageSubscription(None, None, agent)
+
+        self.notify_dir.mkdir(parents=True, exist_ok=True)
+        path = self.notify_dir / f"{_project_key(project)}-{uuid.uuid4().hex[:8]}.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(str(path))
+        except OSError as e:
+            sock.close()
+            logger.debug(
+                f"Push notifications unavailable ({e}); falling back to polling"
+            )
+            return MessageSubscription(None, None, agent)
+        return MessageSubscription(sock, path, agent)
+
+    def publish(
+        self,
+        to_project: str,
+        message_id: str,
+        to_agent: str = "pm",
+        priority: str = "normal",
+    ) -> int:
+        """
+        Wake every session subscribed to *to_project*.
+
+        Returns:
+            Number of subscribers notified
+        """
+        if not self.supported() or not self.notify_dir.is_dir():
+            return 0
+
+        payload = json.dumps(
+            {
+                "message_id": message_id,
+                "to_project": to_project,
+                "to_agent": to_agent,
+                "priority": priority,
+                "sent_at": time.time(),
+            }
+        ).encode()
+
+        delivered = 0
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            for path in self.notify_dir.glob(f"{_project_key(to_project)}-*.sock"):
+                try:
+                    sock.sendto(payload, str(path))
+                    delivered += 1
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Subscriber exited without cleaning up
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+                except BlockingIOError:
+                    # Receiver's queue is full; it has pending wakeups already
+                    delivered += 1
+                except OSError as e:
+                    logger.debug(f"Failed to notify {path.name}: {e}")
+        finally:
+            sock.close()
+
+        if delivered:
+            logger.debug(f"Notified {delivered} subscriber(s) of message {message_id}")
+        return delivered
+
+    @staticmethod
+    def _usable_dir(notify_dir: Path) -> Path:
+        """Fall back to a short temp dir when socket paths would be too long."""
+        # <16 hex>-<8 hex>.sock
+        if len(str(notify_dir)) + 31 <= MAX_SOCKET_PATH:
+            return notify_dir
+        digest = hashlib.sha256(str(notify_dir).encode()).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / f"claude-mpm-notify-{digest}"
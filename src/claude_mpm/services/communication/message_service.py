@@ -9,9 +9,11 @@ DESIGN:
 - Separate databases for inbox (received) and outbox (sent)
 - Global session registry for peer discovery
 - Status tracking (unread, read, archived)
+- Push notifications (MessageNotifier) wake waiting sessions on delivery
 """
 
 import os
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -20,6 +22,7 @@ from pathlib import Path
 import yaml
 
 from ...core.logging_utils import get_logger
+from .message_notifier import MessageNotifier
 from .messaging_db import MessagingDatabase
 
 logger = get_logger(__name__)
@@ -155,6 +158,9 @@ class MessageService:
             messaging_db_path or Path.home() / ".claude-mpm" / "messaging.db"
         )
         self.messaging_db = MessagingDatabase(self.messaging_db_path)
+        # Notification sockets live next to the shared database so every
+        # session using the same database also shares the channel
+        self.notifier = MessageNotifier(self.messaging_db_path.parent / "notify")
 
         # Global session registry (use override or default)
         self.global_registry_path = (
@@ -349,6 +355,12 @@ class MessageService:
         # Insert to shared database
         self.messaging_db.insert_message(message_dict)
 
+        # Wake sessions waiting on the recipient project
+        try:
+            self.notifier.publish(to_project_normalized, message_id, to_agent, priority)
+        except Exception as e:
+            logger.warning(f"Failed to publish message notification: {e}")
+
         # Enqueue notification for recipient (non-blocking, optional)
         if not is_self_message:
             try:
@@ -473,6 +485,39 @@ class MessageService:
             str(self.project_root), to_agent=agent
         )
 
+    def wait_for_messages(
+        self,
+        agent: str | None = None,
+        timeout: float = 30.0,
+        poll_interval: float = 5.0,
+    ) -> int:
+        """
+        Long-poll for unread messages.
+
+        Returns immediately if messages are already waiting; otherwise
+        sleeps until a sender's notification arrives or *timeout* elapses.
+        The inbox is also re-checked every *poll_interval* seconds as a
+        safety net for senders that don't publish notifications.
+
+        Args:
+            agent: Filter by target agent
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between fallback inbox checks
+
+        Returns:
+            Number of unread messages (0 on timeout)
+        """
+        deadline = time.monotonic() + timeout
+        # Subscribe before the first check so a message sent in between
+        # still wakes us
+        with self.notifier.subscribe(str(self.project_root), agent) as subscription:
+            while True:
+                unread = self.get_unread_count(agent)
+                remaining = deadline - time.monotonic()
+                if unread or remaining <= 0:
+                    return unread
+                subscription.wait(min(remaining, poll_interval))
+
     def reply_to_message(
         self,
         original_message_id: str,
@@ -6,9 +6,12 @@ replacing the file-based approach with proper database management.
 
 DESIGN:
 - SQLite with WAL mode for concurrent access
+- Persistent per-thread connections via SQLiteConnectionPool, so heartbeats
+  and unread counts don't pay connect + PRAGMA setup on every call
 - Two tables: sessions (peer discovery) and messages (communication)
 - Supports both local project databases and global registry
-- Efficient querying with indexes on common fields
+- Efficient querying with indexes on common fields, plus covering indexes
+  for the per-project / per-agent inbox queries
 """
 
 import json
@@ -19,6 +22,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 
 from ...core.logging_utils import get_logger
+from ...core.sqlite_pool import SQLiteConnectionPool
 
 logger = get_logger(__name__)
 
@@ -35,23 +39,23 @@ class MessagingDatabase:
         """
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # WAL + synchronous=NORMAL are applied once per connection by the pool
+        self._pool = SQLiteConnectionPool(self.db_path)
         self._initialize_database()
 
     @contextmanager
     def get_connection(self):
-        """Get a database connection with proper handling."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            # Enable WAL mode for concurrent access
-            conn.execute("PRAGMA journal_mode=WAL")
+        """Get this thread's database connection inside a transaction.
+
+        Commits on success and rolls back on error; the connection itself
+        stays open for reuse by later calls on the same thread.
+        """
+        with self._pool.connection() as conn:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+
+    def close(self) -> None:
+        """Close all pooled connections to the database."""
+        self._pool.close()
 
     def _initialize_database(self) -> None:
         """Create tables and indexes if they don't exist."""
@@ -111,8 +115,56 @@ class MessagingDatabase:
                 "CREATE INDEX IF NOT EXISTS idx_sessions_last_active ON sessions(last_active)"
             )
 
+            # Composite indexes for the inbox queries: equality columns first,
+            # created_at last so ORDER BY created_at and COUNT(*) are answered
+            # from the index without a sort or table lookup
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_project_status_created "
+                "ON messages(to_project, status, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_project_agent_status_created "
+                "ON messages(to_project, to_agent, status, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_messages_agent_status_created "
+                "ON messages(to_agent, status, created_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_status_last_active "
+                "ON sessions(status, last_active)"
+            )
+
     # Message operations
 
+    _INSERT_MESSAGE_SQL = """
+        INSERT INTO messages (
+            id, from_project, from_agent, to_project, to_agent,
+            message_type, priority, subject, body, status,
+            created_at, replied_to, metadata, attachments
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _message_params(message: dict) -> tuple:
+        """Build INSERT parameters for a message dict (JSON fields serialized)."""
+        return (
+            message["id"],
+            message["from_project"],
+            message.get("from_agent", "pm"),
+            message["to_project"],
+            message.get("to_agent", "pm"),
+            message.get("type", "notification"),
+            message.get("priority", "normal"),
+            message["subject"],
+            message["body"],
+            message.get("status", "unread"),
+            message.get("created_at", datetime.now(UTC).isoformat()),
+            message.get("reply_to"),
+            json.dumps(message.get("metadata", {})),
+            json.dumps(message.get("attachments", [])),
+        )
+
     def insert_message(self, message: dict) -> str:
         """
         Insert a new message into the database.
@@ -124,39 +176,30 @@ class MessagingDatabase:
             Message ID
         """
         with self.get_connection() as conn:
-            # Serialize JSON fields
-            metadata_json = json.dumps(message.get("metadata", {}))
-            attachments_json = json.dumps(message.get("attachments", []))
-
-            conn.execute(
-                """
-                INSERT INTO messages (
-                    id, from_project, from_agent, to_project, to_agent,
-                    message_type, priority, subject, body, status,
-                    created_at, replied_to, metadata, attachments
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    message["id"],
-                    message["from_project"],
-                    message.get("from_agent", "pm"),
-                    message["to_project"],
-                    message.get("to_agent", "pm"),
-                    message.get("type", "notification"),
-                    message.get("priority", "normal"),
-                    message["subject"],
-                    message["body"],
-                    message.get("status", "unread"),
-                    message.get("created_at", datetime.now(UTC).isoformat()),
-                    message.get("reply_to"),
-                    metadata_json,
-                    attachments_json,
-                ),
-            )
+            conn.execute(self._INSERT_MESSAGE_SQL, self._message_params(message))
 
         logger.debug(f"Inserted message {message['id']}")
         return message["id"]
 
+    def insert_messages(self, messages: list[dict]) -> int:
+        """
+        Insert many messages in a single transaction.
+
+        Args:
+            messages: Message dictionaries with the same fields as insert_message
+
+        Returns:
+            Number of messages inserted
+        """
+        if not messages:
+            return 0
+        inserted = self._pool.executemany(
+            self._INSERT_MESSAGE_SQL,
+            [self._message_params(message) for message in messages],
+        )
+        logger.debug(f"Inserted {inserted} messages")
+        return inserted
+
     def get_message(self, message_id: str) -> dict | None:
         """
         Get a message by ID.
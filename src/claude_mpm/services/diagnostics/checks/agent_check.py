@@ -14,6 +14,8 @@ from .base_check import BaseDiagnosticCheck
 class AgentCheck(BaseDiagnosticCheck):
     """Check agent deployment and configuration."""
 
+    depends_on = ("FilesystemCheck", "ConfigurationCheck")
+
     @property
     def name(self) -> str:
         return "agent_check"
@@ -30,6 +30,8 @@ class AgentSourcesCheck(BaseDiagnosticCheck):
     and accessible. This check ensures the agent deployment pipeline is healthy.
     """
 
+    depends_on = ("ConfigurationCheck",)
+
     @property
     def name(self) -> str:
         return "agent_sources_check"
@@ -6,6 +6,7 @@ they can be easily added, tested, and executed by the diagnostic runner.
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 
 from ..models import DiagnosticResult
 
@@ -15,8 +16,20 @@ class BaseDiagnosticCheck(ABC):
 
     WHY: Ensures all checks follow the same pattern and can be
     executed uniformly by the diagnostic runner.
+
+    Scheduling metadata (class attributes, override in subclasses):
+    - depends_on: Class names of checks that must finish before this one
+      starts. Unknown or skipped dependencies are ignored.
+    - cache_ttl: Seconds a result may be reused from the on-disk result
+      cache. 0 disables caching for the check.
+    - timeout: Seconds the parallel scheduler waits before reporting the
+      check as timed out and continuing with partial results.
     """
 
+    depends_on: tuple[str, ...] = ()
+    cache_ttl: float = 0.0
+    timeout: float = 10.0
+
     def __init__(self, verbose: bool = False):
         """Initialize the check.
 
@@ -58,3 +71,15 @@ class BaseDiagnosticCheck(ABC):
             True if the check should run, False to skip
         """
         return True
+
+    def cache_inputs(self) -> list[Path]:
+        """Files and directories whose state determines this check's result.
+
+        WHY: Cached results are keyed by the mtime and size of these paths,
+        so editing a config file or installing a tool invalidates the cached
+        result immediately instead of waiting for the TTL to expire.
+
+        Returns:
+            Paths to fingerprint (missing paths are allowed)
+        """
+        return []
@@ -17,6 +17,9 @@ from .base_check import BaseDiagnosticCheck
 class ClaudeCodeCheck(BaseDiagnosticCheck):
     """Check Claude Code CLI installation and integration."""
 
+    cache_ttl = 300.0
+    timeout = 15.0
+
     @property
     def name(self) -> str:
         return "claude_code_check"
@@ -25,6 +28,14 @@ class ClaudeCodeCheck(BaseDiagnosticCheck):
     def category(self) -> str:
         return "Claude Code"
 
+    def cache_inputs(self) -> list[Path]:
+        """Claude CLI location, MCP config and output style file."""
+        return [
+            Path.home() / ".claude.json",
+            Path.home() / ".local" / "bin",
+            Path.home() / ".claude" / "responses" / "OUTPUT_STYLE.md",
+        ]
+
     def run(self) -> DiagnosticResult:
         """Run Claude Code CLI diagnostics."""
         try:
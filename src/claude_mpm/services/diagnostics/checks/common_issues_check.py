@@ -16,6 +16,8 @@ from .base_check import BaseDiagnosticCheck
 class CommonIssuesCheck(BaseDiagnosticCheck):
     """Check for common known issues."""
 
+    depends_on = ("FilesystemCheck", "ConfigurationCheck")
+
     @property
     def name(self) -> str:
         return "common_issues_check"
@@ -18,6 +18,9 @@ from .base_check import BaseDiagnosticCheck
 class InstallationCheck(BaseDiagnosticCheck):
     """Check claude-mpm installation and dependencies."""
 
+    cache_ttl = 300.0
+    timeout = 20.0
+
     @property
     def name(self) -> str:
         return "installation_check"
@@ -26,6 +29,15 @@ class InstallationCheck(BaseDiagnosticCheck):
     def category(self) -> str:
         return "Installation"
 
+    def cache_inputs(self) -> list[Path]:
+        """Interpreter site-packages and the pipx venvs directory."""
+        import sysconfig
+
+        return [
+            Path(sysconfig.get_paths()["purelib"]),
+            Path.home() / ".local" / "pipx" / "venvs",
+        ]
+
     def run(self) -> DiagnosticResult:
         """Run installation diagnostics."""
         try:
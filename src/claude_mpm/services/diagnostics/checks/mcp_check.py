@@ -18,6 +18,8 @@ from .base_check import BaseDiagnosticCheck
 class MCPCheck(BaseDiagnosticCheck):
     """Check MCP server installation and configuration."""
 
+    timeout = 15.0
+
     @property
     def name(self) -> str:
         return "mcp_check"
@@ -22,6 +22,9 @@ from .base_check import BaseDiagnosticCheck
 class MCPServicesCheck(BaseDiagnosticCheck):
     """Check MCP external services installation and health."""
 
+    cache_ttl = 120.0
+    timeout = 60.0
+
     def __init__(self, verbose: bool = False):
         """Initialize the MCP services check."""
         super().__init__(verbose)
@@ -94,6 +97,15 @@ class MCPServicesCheck(BaseDiagnosticCheck):
     def category(self) -> str:
         return "MCP Services"
 
+    def cache_inputs(self) -> list[Path]:
+        """MCP configuration plus the locations services get installed into."""
+        return [
+            Path.home() / ".claude.json",
+            Path.cwd() / ".mcp.json",
+            Path.home() / ".local" / "bin",
+            Path.home() / ".local" / "pipx" / "venvs",
+        ]
+
     def run(self) -> DiagnosticResult:
         """Run MCP services diagnostics."""
         try:
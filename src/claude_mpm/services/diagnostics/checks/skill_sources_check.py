@@ -30,6 +30,8 @@ class SkillSourcesCheck(BaseDiagnosticCheck):
     and accessible. This check ensures the skill deployment pipeline is healthy.
     """
 
+    depends_on = ("ConfigurationCheck",)
+
     @property
     def name(self) -> str:
         return "skill_sources_check"
@@ -25,6 +25,8 @@ from .base_check import BaseDiagnosticCheck
 class StartupLogCheck(BaseDiagnosticCheck):
     """Analyze startup logs for errors and issues."""
 
+    depends_on = ("FilesystemCheck",)
+
     # Common error patterns and their fixes
     ERROR_PATTERNS: ClassVar[dict[str, dict[str, Any]]] = {
         r"Agent deployment.*failed": (
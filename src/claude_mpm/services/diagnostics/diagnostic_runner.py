@@ -6,7 +6,7 @@ and aggregate results for reporting.
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 
 from claude_mpm.core.enums import ValidationSeverity
 from claude_mpm.core.logging_utils import get_logger
@@ -28,6 +28,8 @@ from .checks import (
     StartupLogCheck,
 )
 from .models import DiagnosticResult, DiagnosticSummary
+from .result_cache import DiagnosticResultCache
+from .scheduler import CheckScheduler
 
 logger = get_logger(__name__)
 
@@ -39,15 +41,28 @@ class DiagnosticRunner:
     proper error handling, parallel execution, and result aggregation.
     """
 
-    def __init__(self, verbose: bool = False, fix: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        fix: bool = False,
+        use_cache: bool = False,
+        check_timeout: float | None = None,
+    ):
         """Initialize diagnostic runner.
 
         Args:
             verbose: Include detailed information in results
             fix: Attempt to fix issues automatically (future feature)
+            use_cache: Reuse recent results of cacheable checks
+            check_timeout: Override per-check timeouts in parallel mode (seconds)
         """
         self.verbose = verbose
         self.fix = fix
+        self.check_timeout = check_timeout
+        self.cache = DiagnosticResultCache() if use_cache else None
+        if self.cache and fix:
+            # Fixes change what the checks would report
+            self.cache.clear()
         self.logger = logger  # Add logger initialization
         # Define check order (dependencies first)
         self.check_classes: list[type[BaseDiagnosticCheck]] = [
@@ -72,6 +87,7 @@ class DiagnosticRunner:
         Returns:
             DiagnosticSummary with all results
         """
+        started = time.perf_counter()
         summary = DiagnosticSummary()
 
         # Run checks in order
@@ -85,7 +101,7 @@ class DiagnosticRunner:
                     continue
 
                 self.logger.debug(f"Running {check.name}")
-                result = check.run()
+                result = self._run_check(check)
                 summary.add_result(result)
 
                 # If fix mode is enabled and there's a fix available
@@ -102,6 +118,7 @@ class DiagnosticRunner:
                 )
                 summary.add_result(error_result)
 
+        self._finish(summary, started)
         return summary
 
     def run_diagnostics_parallel(self) -> DiagnosticSummary:
@@ -109,94 +126,28 @@ class DiagnosticRunner:
 
         WHY: Some checks may involve I/O or network operations, running them
         in parallel can significantly speed up the overall diagnostic process.
+        Each check starts as soon as the checks it declares in ``depends_on``
+        have finished, and checks exceeding their timeout are reported as
+        warnings so the remaining results are still returned.
 
         Returns:
             DiagnosticSummary with all results
         """
+        started = time.perf_counter()
         summary = DiagnosticSummary()
 
-        # Group checks by dependency level
-        # Level 1: No dependencies
-        level1 = [
-            InstallationCheck,
-            FilesystemCheck,
-            ConfigurationCheck,
-            InstructionsCheck,
-        ]
-        # Level 2: May depend on level 1
-        level2 = [
-            ClaudeCodeCheck,
-            AgentCheck,
-            AgentSourcesCheck,
-            SkillSourcesCheck,
-            MCPCheck,
-            MCPServicesCheck,
-            MonitorCheck,
-            StartupLogCheck,
-        ]
-        # Level 3: Depends on others
-        level3 = [CommonIssuesCheck]
-
-        for level in [level1, level2, level3]:
-            level_results = self._run_level_parallel(level)
-            for result in level_results:
-                summary.add_result(result)
+        scheduler = CheckScheduler(
+            self.check_classes,
+            verbose=self.verbose,
+            cache=self.cache,
+            timeout=self.check_timeout,
+        )
+        for result in scheduler.run():
+            summary.add_result(result)
 
+        self._finish(summary, started)
         return summary
 
-    def _run_level_parallel(
-        self, check_classes: list[type[BaseDiagnosticCheck]]
-    ) -> list[DiagnosticResult]:
-        """Run a group of checks in parallel.
-
-        Args:
-            check_classes: List of check classes to run
-
-        Returns:
-            List of DiagnosticResults
-        """
-        results = []
-
-        with ThreadPoolExecutor(max_workers=len(check_classes)) as executor:
-            future_to_check = {}
-
-            for check_class in check_classes:
-                try:
-                    check = check_class(verbose=self.verbose)
-                    if check.should_run():
-                        future = executor.submit(check.run)
-                        future_to_check[future] = check_class.__name__
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to create check {check_class.__name__}: {e}"
-                    )
-                    results.append(
-                        DiagnosticResult(
-                            category=check_class.__name__.replace("Check", ""),
-                            status=ValidationSeverity.ERROR,
-                            message=f"Check initialization failed: {e!s}",
-                            details={"error": str(e)},
-                        )
-                    )
-
-            for future in as_completed(future_to_check):
-                check_name = future_to_check[future]
-                try:
-                    result = future.result(timeout=10)
-                    results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Check {check_name} failed: {e}")
-                    results.append(
-                        DiagnosticResult(
-                            category=check_name.replace("Check", ""),
-                            status=ValidationSeverity.ERROR,
-                            message=f"Check execution failed: {e!s}",
-                            details={"error": str(e)},
-                        )
-                    )
-
-        return results
-
     def run_specific_checks(self, check_names: list[str]) -> DiagnosticSummary:
         """Run only specific diagnostic checks.
 
@@ -206,6 +157,7 @@ class DiagnosticRunner:
         Returns:
             DiagnosticSummary with results from specified checks
         """
+        started = time.perf_counter()
         summary = DiagnosticSummary()
 
         # Map check names to classes
@@ -241,7 +193,7 @@ class DiagnosticRunner:
             try:
                 check = check_class(verbose=self.verbose)
                 if check.should_run():
-                    result = check.run()
+                    result = self._run_check(check)
                     summary.add_result(result)
             except Exception as e:
                 self.logger.error(f"Check {name} failed: {e}")
@@ -253,8 +205,30 @@ class DiagnosticRunner:
                 )
                 summary.add_result(error_result)
 
+        self._finish(summary, started)
         return summary
 
+    def _run_check(self, check: BaseDiagnosticCheck) -> DiagnosticResult:
+        """Run a single check, consulting the result cache and timing it."""
+        if self.cache:
+            cached = self.cache.get(check)
+            if cached is not None:
+                return cached
+
+        check_started = time.perf_counter()
+        result = check.run()
+        result.duration_ms = (time.perf_counter() - check_started) * 1000
+
+        if self.cache:
+            self.cache.put(check, result)
+        return result
+
+    def _finish(self, summary: DiagnosticSummary, started: float):
+        """Record total run time and persist any newly cached results."""
+        summary.duration_ms = (time.perf_counter() - started) * 1000
+        if self.cache:
+            self.cache.flush()
+
     def _attempt_fix(self, result: DiagnosticResult):
         """Attempt to fix an issue automatically.
 
@@ -121,6 +121,10 @@ class DoctorReporter:
         else:
             line += self._color("Skipped", color)
 
+        timing = self._format_timing(result)
+        if timing:
+            line += " " + self._color(f"({timing})", "gray")
+
         print(line)
 
         # Message
@@ -193,6 +197,13 @@ class DoctorReporter:
         status_line += " | ".join(parts)
         print(status_line)
 
+        if summary.duration_ms is not None:
+            cached_count = sum(1 for r in summary.results if r.cached)
+            timing_line = f"Completed in {self._format_duration(summary.duration_ms)}"
+            if cached_count:
+                timing_line += f" ({cached_count} cached)"
+            print(self._color(timing_line, "gray"))
+
         # Overall health
         overall = summary.overall_status
         if overall == OperationResult.SUCCESS:
@@ -358,6 +369,9 @@ class DoctorReporter:
         # Recommendations Section
         self._print_recommendations_markdown(summary)
 
+        # Per-check timings
+        self._print_timings_markdown(summary)
+
         # Fixes Section
         fixes = [
             (r.category, r.fix_command, r.fix_description)
@@ -408,6 +422,21 @@ class DoctorReporter:
         reset_code = self.COLORS["reset"]
         return f"{color_code}{text}{reset_code}"
 
+    def _format_timing(self, result: DiagnosticResult) -> str:
+        """Get the timing annotation for a result ("" if not timed)."""
+        if result.cached:
+            return "cached"
+        if result.duration_ms is None:
+            return ""
+        return self._format_duration(result.duration_ms)
+
+    @staticmethod
+    def _format_duration(duration_ms: float) -> str:
+        """Format milliseconds as a short human-readable duration."""
+        if duration_ms < 1000:
+            return f"{duration_ms:.0f}ms"
+        return f"{duration_ms / 1000:.2f}s"
+
     def _get_status_color(self, status) -> str:
         """Get color for a status."""
         color_map = {
@@ -608,3 +637,24 @@ class DoctorReporter:
             for i, rec in enumerate(recommendations, 1):
                 print(f"{i}. {rec}")
             print()
+
+    def _print_timings_markdown(self, summary: DiagnosticSummary):
+        """Print per-check timings in markdown, slowest first."""
+        timed = [r for r in summary.results if r.duration_ms is not None or r.cached]
+        if not timed:
+            return
+
+        print("## ⏱️ Check Timings\n")
+        print("| Check | Duration | Source |")
+        print("|-------|----------|--------|")
+        for result in sorted(timed, key=lambda r: r.duration_ms or 0, reverse=True):
+            duration = (
+                self._format_duration(result.duration_ms)
+                if result.duration_ms is not None
+                else "N/A"
+            )
+            source = "cache" if result.cached else "run"
+            print(f"| {result.category} | {duration} | {source} |")
+        if summary.duration_ms is not None:
+            print(f"\n**Total:** {self._format_duration(summary.duration_ms)}")
+        print()
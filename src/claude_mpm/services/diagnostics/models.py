@@ -56,6 +56,10 @@ class DiagnosticResult:
     severity: str = "medium"  # critical, high, medium, low, info
     doc_link: str = ""  # Link to relevant documentation
 
+    # Execution metadata populated by the runner
+    duration_ms: float | None = None  # Wall-clock time spent running the check
+    cached: bool = False  # True when served from the result cache
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -74,8 +78,33 @@ class DiagnosticResult:
             result["severity"] = self.severity
         if self.doc_link:
             result["doc_link"] = self.doc_link
+        if self.duration_ms is not None:
+            result["duration_ms"] = round(self.duration_ms, 1)
+        if self.cached:
+            result["cached"] = True
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DiagnosticResult":
+        """Rebuild a result from its to_dict() form.
+
+        WHY: The result cache stores results as JSON, so they need to be
+        restored with their original status enum.
+        """
+        return cls(
+            category=data["category"],
+            status=_status_from_value(data["status"]),
+            message=data.get("message", ""),
+            details=data.get("details") or {},
+            fix_command=data.get("fix_command"),
+            fix_description=data.get("fix_description"),
+            sub_results=[cls.from_dict(r) for r in data.get("sub_results", [])],
+            explanation=data.get("explanation", ""),
+            severity=data.get("severity", "medium"),
+            doc_link=data.get("doc_link", ""),
+            duration_ms=data.get("duration_ms"),
+        )
+
     @property
     def has_issues(self) -> bool:
         """Check if this result indicates any issues."""
@@ -93,6 +122,18 @@ class DiagnosticResult:
         return severity_map.get(self.status, 0)
 
 
+def _status_from_value(value: str) -> OperationResult | ValidationSeverity:
+    """Map a serialized status back to its enum.
+
+    ValidationSeverity wins for values shared by both enums ("error") since
+    that is what checks and the runner report.
+    """
+    try:
+        return ValidationSeverity(value)
+    except ValueError:
+        return OperationResult(value)
+
+
 @dataclass
 class DiagnosticSummary:
     """Summary of all diagnostic results.
@@ -107,6 +148,7 @@ class DiagnosticSummary:
     error_count: int = 0
     skipped_count: int = 0
     results: list[DiagnosticResult] = field(default_factory=list)
+    duration_ms: float | None = None  # Total wall-clock time for the run
 
     def add_result(self, result: DiagnosticResult):
         """Add a result to the summary."""
@@ -146,6 +188,10 @@ class DiagnosticSummary:
                 "errors": self.error_count,
                 "skipped": self.skipped_count,
                 "overall_status": self.overall_status.value,
+                "duration_ms": (
+                    round(self.duration_ms, 1) if self.duration_ms is not None else None
+                ),
+                "cached": sum(1 for r in self.results if r.cached),
             },
             "results": [r.to_dict() for r in self.results],
         }
@@ -0,0 +1,174 @@
+"""
+On-disk cache for diagnostic check results.
+
+WHY: Several checks (MCP services, Claude Code, installation) spawn
+subprocesses with multi-second timeouts. Their results rarely change between
+two `claude-mpm doctor` invocations a few seconds apart, so a short-lived
+cache makes repeated runs near-instant.
+
+DESIGN DECISIONS:
+- Opt-in per check via BaseDiagnosticCheck.cache_ttl (0 = never cached)
+- Only results without warnings or errors are stored, so a transient or
+  just-fixed issue is re-checked on the next run instead of replayed
+- Entries are keyed by a fingerprint of the check's cache_inputs() mtimes
+  and sizes plus the interpreter, cwd and PATH, so relevant changes
+  invalidate immediately rather than after the TTL
+- Single small JSON file, written atomically once per run via flush()
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from claude_mpm.core.logging_utils import get_logger
+
+from .checks.base_check import BaseDiagnosticCheck
+from .models import DiagnosticResult
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "doctor_results.json"
+CACHE_VERSION = 1
+
+
+def _default_cache_dir() -> Path:
+    from claude_mpm.core.unified_paths import get_path_manager
+
+    return get_path_manager().get_cache_dir("user")
+
+
+def _has_issues(result: DiagnosticResult) -> bool:
+    return result.has_issues or any(_has_issues(r) for r in result.sub_results)
+
+
+class DiagnosticResultCache:
+    """Short-lived, fingerprint-validated cache of DiagnosticResults."""
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache file (defaults to the
+                user cache dir, ~/.claude-mpm/cache)
+        """
+        self.cache_file = (cache_dir or _default_cache_dir()) / CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, check: BaseDiagnosticCheck) -> DiagnosticResult | None:
+        """Return a cached result for the check if still valid."""
+        if check.cache_ttl <= 0:
+            return None
+
+        key = self._key(check)
+        with self._lock:
+            entry = self._load().get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        age = time.time() - entry.get("stored_at", 0)
+        if age > check.cache_ttl or entry.get("fingerprint") != self._fingerprint(
+            check
+        ):
+            self.misses += 1
+            return None
+
+        try:
+            result = DiagnosticResult.from_dict(entry["result"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry for {key}: {e}")
+            self.misses += 1
+            return None
+
+        result.cached = True
+        self.hits += 1
+        return result
+
+    def put(self, check: BaseDiagnosticCheck, result: DiagnosticResult) -> None:
+        """Store a clean result for the check.
+
+        No-op if the check is not cacheable or the result has issues.
+        """
+        if check.cache_ttl <= 0 or _has_issues(result):
+            return
+
+        entry = {
+            "stored_at": time.time(),
+            "fingerprint": self._fingerprint(check),
+            "result": result.to_dict(),
+        }
+        with self._lock:
+            self._load()[self._key(check)] = entry
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Persist pending entries to disk."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            payload = {"version": CACHE_VERSION, "entries": self._entries}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(payload, default=str))
+                tmp_file.replace(self.cache_file)
+                self._dirty = False
+            except OSError as e:
+                logger.debug(f"Could not write diagnostic cache: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries = {}
+            self._dirty = False
+            try:
+                self.cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not remove diagnostic cache: {e}")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load entries from disk on first use. Caller must hold the lock."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                data = json.loads(self.cache_file.read_text())
+                if data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("entries", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug(f"Ignoring unreadable diagnostic cache: {e}")
+        return self._entries
+
+    @staticmethod
+    def _key(check: BaseDiagnosticCheck) -> str:
+        verbosity = "verbose" if check.verbose else "normal"
+        return f"{type(check).__name__}:{verbosity}"
+
+    @staticmethod
+    def _fingerprint(check: BaseDiagnosticCheck) -> str:
+        """Hash the environment and the state of the check's input paths."""
+        digest = hashlib.sha256()
+        digest.update(sys.executable.encode())
+        digest.update(str(Path.cwd()).encode())
+        digest.update(os.environ.get("PATH", "").encode())
+
+        for path in check.cache_inputs():
+            try:
+                stat = path.stat()
+                state = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+            except OSError:
+                state = f"{path}:missing"
+            digest.update(state.encode())
+
+        return digest.hexdigest()
@@ -0,0 +1,223 @@
+"""
+Dependency-graph scheduler for diagnostic checks.
+
+WHY: Grouping checks into fixed levels forces every check to wait for the
+slowest check of the previous level. Scheduling from declared dependencies
+starts each check as soon as the checks it depends on have finished, and a
+per-check deadline keeps one hanging check from stalling the whole report.
+
+DESIGN DECISIONS:
+- Dependencies are declared on the check class (depends_on) by class name;
+  dependencies outside the scheduled set are ignored
+- A timed-out check is reported as a warning and its dependents are
+  released. Checks run in daemon threads rather than a ThreadPoolExecutor,
+  whose workers are joined at interpreter exit, so an abandoned hung
+  check cannot keep the process alive
+- Results are returned in the order the check classes were given so
+  reports stay stable regardless of completion order
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from claude_mpm.core.enums import ValidationSeverity
+from claude_mpm.core.logging_utils import get_logger
+
+from .checks.base_check import BaseDiagnosticCheck
+from .models import DiagnosticResult
+from .result_cache import DiagnosticResultCache
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class CheckScheduler:
+    """Run diagnostic checks concurrently in dependency order."""
+
+    def __init__(
+        self,
+        check_classes: list[type[BaseDiagnosticCheck]],
+        verbose: bool = False,
+        cache: DiagnosticResultCache | None = None,
+        timeout: float | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            check_classes: Checks to run, in reporting order
+            verbose: Passed through to each check
+            cache: Optional result cache consulted before running a check
+            timeout: Override for every check's own timeout (seconds)
+            max_workers: Maximum number of checks running at once
+        """
+        self.check_classes = check_classes
+        self.verbose = verbose
+        self.cache = cache
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    def run(self) -> list[DiagnosticResult]:
+        """Run all checks and return their results.
+
+        Returns:
+            One result per check that ran (skipped checks are omitted)
+        """
+        results: dict[str, DiagnosticResult] = {}
+        checks: dict[str, BaseDiagnosticCheck] = {}
+
+        for check_class in self.check_classes:
+            check_name = check_class.__name__
+            try:
+                check = check_class(verbose=self.verbose)
+                if check.should_run():
+                    checks[check_name] = check
+                else:
+                    logger.debug(f"Skipping {check.name}")
+            except Exception as e:
+                logger.error(f"Failed to create check {check_name}: {e}")
+                results[check_name] = _error_result(
+                    check_name, f"Check initialization failed: {e!s}", e
+                )
+
+        waiting_on = {
+            name: {dep for dep in check.depends_on if dep in checks and dep != name}
+            for name, check in checks.items()
+        }
+        pending = list(checks)
+        running: dict[Future, tuple[str, float]] = {}
+        max_workers = max(1, self.max_workers)
+
+        while pending or running:
+            ready = [name for name in pending if not waiting_on[name]]
+            if not ready and not running:
+                # Dependency cycle: release the first blocked check
+                blocked = pending[0]
+                logger.warning(
+                    f"Dependency cycle involving {blocked}: "
+                    f"{sorted(waiting_on[blocked])}"
+                )
+                ready = [blocked]
+
+            for name in ready:
+                check = checks[name]
+                cached = self.cache.get(check) if self.cache else None
+                if cached is not None:
+                    pending.remove(name)
+                    results[name] = cached
+                    self._complete(name, waiting_on)
+                elif len(running) < max_workers:
+                    pending.remove(name)
+                    running[_start_check(check, name)] = (name, time.monotonic())
+
+            if not running:
+                continue
+
+            done, _ = wait(
+                running,
+                timeout=self._next_deadline(running, checks),
+                return_when=FIRST_COMPLETED,
+            )
+
+            for future in done:
+                name, _started = running.pop(future)
+                results[name] = self._collect(future, name, checks[name])
+                self._complete(name, waiting_on)
+
+            now = time.monotonic()
+            for future, (name, started) in list(running.items()):
+                timeout = self._timeout_for(checks[name])
+                if now - started >= timeout:
+                    # The daemon thread is abandoned; its result is ignored
+                    running.pop(future)
+                    logger.warning(f"Check {name} timed out after {timeout}s")
+                    results[name] = _timeout_result(
+                        checks[name], timeout, (now - started) * 1000
+                    )
+                    self._complete(name, waiting_on)
+
+        return [
+            results[cls.__name__]
+            for cls in self.check_classes
+            if cls.__name__ in results
+        ]
+
+    def _collect(
+        self, future: Future, name: str, check: BaseDiagnosticCheck
+    ) -> DiagnosticResult:
+        """Turn a finished future into a result, caching successes."""
+        try:
+            result, duration_ms = future.result()
+        except Exception as e:
+            logger.error(f"Check {name} failed: {e}")
+            return _error_result(name, f"Check execution failed: {e!s}", e)
+
+        result.duration_ms = duration_ms
+        if self.cache:
+            self.cache.put(check, result)
+        return result
+
+    def _timeout_for(self, check: BaseDiagnosticCheck) -> float:
+        return self.timeout if self.timeout is not None else check.timeout
+
+    def _next_deadline(
+        self,
+        running: dict[Future, tuple[str, float]],
+        checks: dict[str, BaseDiagnosticCheck],
+    ) -> float:
+        """Seconds until the earliest running check hits its timeout."""
+        now = time.monotonic()
+        return max(
+            0.0,
+            min(
+                started + self._timeout_for(checks[name]) - now
+                for name, started in running.values()
+            ),
+        )
+
+    @staticmethod
+    def _complete(name: str, waiting_on: dict[str, set[str]]) -> None:
+        """Release checks that were waiting on the given check."""
+        for deps in waiting_on.values():
+            deps.discard(name)
+
+
+def _start_check(check: BaseDiagnosticCheck, name: str) -> Future:
+    """Run a check in a daemon thread; the future gets (result, duration_ms)."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        started = time.perf_counter()
+        try:
+            result = check.run()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result((result, (time.perf_counter() - started) * 1000))
+
+    threading.Thread(target=run, name=f"doctor-check-{name}", daemon=True).start()
+    return future
+
+
+def _error_result(check_name: str, message: str, error: Exception) -> DiagnosticResult:
+    return DiagnosticResult(
+        category=check_name.replace("Check", ""),
+        status=ValidationSeverity.ERROR,
+        message=message,
+        details={"error": str(error)},
+    )
+
+
+def _timeout_result(
+    check: BaseDiagnosticCheck, timeout: float, duration_ms: float
+) -> DiagnosticResult:
+    return DiagnosticResult(
+        category=check.category,
+        status=ValidationSeverity.WARNING,
+        message=f"Check timed out after {timeout:g}s; results are incomplete",
+        details={"timed_out": True, "timeout_seconds": timeout},
+        duration_ms=duration_ms,
+    )
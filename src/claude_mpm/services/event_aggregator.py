@@ -12,7 +12,6 @@ aggregator to run alongside the dashboard without any conflicts.
 """
 
 import asyncio
-import json
 import signal
 import sys
 import threading
@@ -33,6 +32,8 @@ import contextlib
 
 from ..core.logger import get_logger
 from ..models.agent_session import AgentSession
+from .session_analytics import ANALYTICS_FILENAME, SessionAnalyticsStore
+from .session_catalog import SessionCatalog
 
 
 class EventAggregator:
@@ -88,6 +89,13 @@ class EventAggregator:
             self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
 
+        # Session bodies are gzip-compressed; summaries live in the catalog
+        self.compress_sessions = self.config.get(
+            "event_aggregator.compress_sessions", True
+        )
+        self.catalog = SessionCatalog(self.save_dir)
+        self.analytics = SessionAnalyticsStore(self.save_dir / ANALYTICS_FILENAME)
+
         # Socket.IO client
         self.sio_client = None
         self.connected = False
@@ -385,7 +393,7 @@ class EventAggregator:
 
         # Save to file
         try:
-            filepath = session.save_to_file(self.save_dir)
+            filepath = self._save_session(session)
             self.logger.info(f"Saved session {session_id[:8]}... to {filepath}")
             self.logger.info(f"  - Events: {session.metrics.total_events}")
             self.logger.info(f"  - Delegations: {session.metrics.total_delegations}")
@@ -432,6 +440,21 @@ class EventAggregator:
             except Exception as e:
                 self.logger.error(f"Error in cleanup task: {e}")
 
+    def _save_session(self, session: AgentSession) -> str:
+        """Write a session file and record it in the catalog."""
+        filepath = session.save_to_file(self.save_dir, compress=self.compress_sessions)
+        try:
+            self.catalog.record(filepath, session.to_dict())
+        except Exception as e:
+            # The next list_sessions() sync picks the file up instead
+            self.logger.warning(f"Failed to catalog session {filepath}: {e}")
+        try:
+            self.analytics.ingest(session)
+        except Exception as e:
+            # backfill_analytics() retries sessions missing from the store
+            self.logger.warning(f"Failed to index session analytics: {e}")
+        return filepath
+
     def _save_all_sessions(self):
         """Save all active sessions to disk.
 
@@ -441,7 +464,7 @@ class EventAggregator:
             try:
                 session = self.active_sessions[session_id]
                 session.finalize()
-                filepath = session.save_to_file(self.save_dir)
+                filepath = self._save_session(session)
                 self.logger.info(
                     f"Saved active session {session_id[:8]}... to {filepath}"
                 )
@@ -469,48 +492,32 @@ class EventAggregator:
     def list_sessions(self, limit: int = 10) -> list[dict[str, Any]]:
         """List captured sessions.
 
+        WHY: Summaries come from the session catalog, so listing no longer
+        parses every saved session document.
+
         Args:
             limit: Maximum number of sessions to return
 
         Returns:
             List of session summaries
         """
-        sessions = []
-
-        # Get saved session files
-        session_files = sorted(
-            self.save_dir.glob("session_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )[:limit]
-
-        for filepath in session_files:
-            try:
-                # Load just the metadata, not the full session
-                with filepath.open() as f:
-                    data = json.load(f)
-
-                sessions.append(
-                    {
-                        "file": filepath.name,
-                        "session_id": data.get("session_id", "unknown")[:8] + "...",
-                        "start_time": data.get("start_time", "unknown"),
-                        "end_time": data.get("end_time", "unknown"),
-                        "events": data.get("metrics", {}).get("total_events", 0),
-                        "delegations": data.get("metrics", {}).get(
-                            "total_delegations", 0
-                        ),
-                        "initial_prompt": (
-                            (data.get("initial_prompt", "")[:50] + "...")
-                            if data.get("initial_prompt")
-                            else "N/A"
-                        ),
-                    }
-                )
-            except Exception as e:
-                self.logger.error(f"Error reading session file {filepath}: {e}")
-
-        return sessions
+        self.catalog.sync()
+        return [
+            {
+                "file": row["file"],
+                "session_id": row["session_id"][:8] + "...",
+                "start_time": row["start_time"] or "unknown",
+                "end_time": row["end_time"] or "unknown",
+                "events": row["events"],
+                "delegations": row["delegations"],
+                "initial_prompt": (
+                    (row["initial_prompt"][:50] + "...")
+                    if row["initial_prompt"]
+                    else "N/A"
+                ),
+            }
+            for row in self.catalog.list(limit)
+        ]
 
     def load_session(self, session_id_prefix: str) -> AgentSession | None:
         """Load a session by ID prefix.
@@ -521,16 +528,46 @@ class EventAggregator:
         Returns:
             AgentSession if found, None otherwise
         """
-        # Search for matching session file
-        for filepath in self.save_dir.glob("session_*.json"):
-            if session_id_prefix in filepath.name:
-                try:
-                    return AgentSession.load_from_file(str(filepath))
-                except Exception as e:
-                    self.logger.error(f"Error loading session from {filepath}: {e}")
+        filepath = self.catalog.find(session_id_prefix)
+        if filepath is None and self.catalog.sync():
+            filepath = self.catalog.find(session_id_prefix)
+        if filepath is None:
+            return None
 
+        try:
+            return AgentSession.load_from_file(str(filepath))
+        except Exception as e:
+            self.logger.error(f"Error loading session from {filepath}: {e}")
         return None
 
+    def backfill_analytics(self) -> int:
+        """Add saved sessions missing from the analytics store.
+
+        Returns:
+            Number of sessions ingested
+        """
+        self.catalog.sync()
+        known = self.analytics.session_ids()
+        missing = [
+            path
+            for session_id, path in self.catalog.files_by_session().items()
+            if session_id not in known
+        ]
+        return self.analytics.backfill(missing) if missing else 0
+
+    def query_sessions(self, **query: Any) -> list[dict[str, Any]]:
+        """Run a cross-session analytics query.
+
+        See SessionAnalyticsStore.query() for the arguments.
+        """
+        self.backfill_analytics()
+        return self.analytics.query(**query)
+
+    def migrate_sessions(self) -> dict[str, int]:
+        """Compress legacy plain-JSON session files and catalog them."""
+        self.catalog.sync()
+        return self.catalog.migrate()
+
 
 # Global aggregator instance
 _aggregator: EventAggregator | None = None
@@ -6,11 +6,19 @@ WHY pyee over alternatives:
 - Simple EventEmitter pattern familiar to developers
 - Thread-safe for multi-threaded environments
 - Efficient event dispatch with minimal overhead
+
+WHY a topic trie for filters and wildcards:
+- Filters and wildcard subscriptions are compiled into one TopicTrie each,
+  so publish cost does not grow with the number of patterns
+- Handlers are classified as sync or async once, at registration
+- History is a fixed-size ring buffer instead of a re-sliced list
 """
 
 import asyncio
+import inspect
 import logging
 import threading
+from collections import deque
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any, Optional
@@ -19,10 +27,21 @@ from pyee.asyncio import AsyncIOEventEmitter
 
 # Configure logger
 from claude_mpm.core.logging_utils import get_logger
+from claude_mpm.services.event_bus.topic_trie import TopicTrie
 
 logger = get_logger(__name__)
 
 
+class _Subscriber:
+    """A registered handler and whether it must be scheduled as a coroutine."""
+
+    __slots__ = ("handler", "is_async")
+
+    def __init__(self, handler: Callable):
+        self.handler = handler
+        self.is_async = inspect.iscoroutinefunction(handler)
+
+
 class EventBus:
     """Singleton Event Bus for decoupled event handling.
 
@@ -54,6 +73,7 @@ class EventBus:
         self._emitter = AsyncIOEventEmitter()
         self._enabled = True
         self._event_filters: set[str] = set()
+        self._filter_trie = TopicTrie()
         self._stats = {
             "events_published": 0,
             "events_filtered": 0,
@@ -62,9 +82,13 @@ class EventBus:
         }
         self._debug = False
 
-        # Event history for debugging (limited size)
-        self._event_history: list[dict[str, Any]] = []
-        self._max_history_size = 100
+        # Event history for debugging (ring buffer, see _max_history_size)
+        self._event_history: deque[dict[str, Any]] = deque(maxlen=100)
+
+        # Wildcard subscriptions ("hook.*"): pattern -> subscribers, plus the
+        # trie used to resolve them on publish
+        self._wildcard_handlers: dict[str, list[_Subscriber]] = {}
+        self._wildcard_trie = TopicTrie()
 
         # Track async handler tasks to prevent garbage collection
         self._handler_tasks: set[asyncio.Task] = set()
@@ -74,6 +98,14 @@ class EventBus:
 
         logger.info("EventBus initialized")
 
+    @property
+    def _max_history_size(self) -> int:
+        return self._event_history.maxlen
+
+    @_max_history_size.setter
+    def _max_history_size(self, size: int) -> None:
+        self._event_history = deque(self._event_history, maxlen=size)
+
     @classmethod
     def get_instance(cls) -> "EventBus":
         """Get the singleton EventBus instance.
@@ -115,6 +147,7 @@ class EventBus:
             pattern: Event name pattern to allow
         """
         self._event_filters.add(pattern)
+        self._filter_trie.add(pattern, pattern)
         logger.debug(f"Added event filter: {pattern}")
 
     def remove_filter(self, pattern: str) -> None:
@@ -124,11 +157,13 @@ class EventBus:
             pattern: Event name pattern to remove
         """
         self._event_filters.discard(pattern)
+        self._filter_trie.remove(pattern)
         logger.debug(f"Removed event filter: {pattern}")
 
     def clear_filters(self) -> None:
         """Clear all event filters (allow all events)."""
         self._event_filters.clear()
+        self._filter_trie.clear()
         logger.debug("Cleared all event filters")
 
     def _should_process_event(self, event_type: str) -> bool:
@@ -144,18 +179,7 @@ class EventBus:
         if not self._event_filters:
             return True
 
-        # Check if event matches any filter
-        for filter_pattern in self._event_filters:
-            if filter_pattern.endswith("*"):
-                # Wildcard pattern
-                prefix = filter_pattern[:-1]
-                if event_type.startswith(prefix):
-                    return True
-            elif event_type == filter_pattern:
-                # Exact match
-                return True
-
-        return False
+        return bool(self._filter_trie.match(event_type))
 
     def publish(self, event_type: str, data: Any) -> bool:
         """Publish an event synchronously (for use from sync contexts like hooks).
@@ -189,37 +213,10 @@ class EventBus:
             # Emit event to regular handlers (pyee handles thread safety)
             self._emitter.emit(event_type, data)
 
-            # Also emit to wildcard handlers
-            if hasattr(self, "_wildcard_handlers"):
-                for prefix, handlers in self._wildcard_handlers.items():
-                    if event_type.startswith(prefix):
-                        for handler in handlers:
-                            try:
-                                # Call with event_type and data for wildcard handlers
-                                if asyncio.iscoroutinefunction(handler):
-                                    # Schedule async handlers with tracking
-                                    try:
-                                        loop = asyncio.get_event_loop()
-                                        if loop.is_running():
-                                            task = asyncio.create_task(
-                                                handler(event_type, data)
-                                            )
-                                            self._handler_tasks.add(task)
-                                            task.add_done_callback(
-                                                self._handler_tasks.discard
-                                            )
-                                        else:
-                                            loop.run_until_complete(
-                                                handler(event_type, data)
-                                            )
-                                    except RuntimeError:
-                                        # No event loop, skip async handler
-                                        pass
-                                else:
-                                    handler(event_type, data)
-                            except Exception as e:
-                                if self._debug:
-                                    logger.debug(f"Wildcard handler error: {e}")
+            # Also emit to wildcard handlers (called with event_type and data)
+            if self._wildcard_trie:
+                for subscriber in self._wildcard_trie.match(event_type):
+                    self._invoke(subscriber, event_type, event_type, data)
 
             # Update stats
             self._stats["events_published"] += 1
@@ -235,6 +232,28 @@ class EventBus:
             logger.error(f"Failed to publish event {event_type}: {e}")
             return False
 
+    def _invoke(self, subscriber: _Subscriber, event_type: str, *args: Any) -> None:
+        """Call a handler, scheduling coroutine handlers on the running loop.
+
+        Without a running loop, coroutine handlers run to completion on a
+        temporary loop. Handler errors never propagate to the publisher.
+        """
+        try:
+            if not subscriber.is_async:
+                subscriber.handler(*args)
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(subscriber.handler(*args))
+                return
+            task = loop.create_task(subscriber.handler(*args))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+        except Exception as e:
+            if self._debug:
+                logger.debug(f"Handler error for {event_type}: {e}")
+
     async def publish_async(self, event_type: str, data: Any) -> bool:
         """Publish an event from an async context.
 
@@ -258,25 +277,17 @@ class EventBus:
             event_type: The event type to listen for (supports wildcards)
             handler: The handler function
         """
+        subscriber = _Subscriber(handler)
         if event_type.endswith("*"):
             # Store wildcard handlers separately
-            if not hasattr(self, "_wildcard_handlers"):
-                self._wildcard_handlers = {}
-
-            prefix = event_type[:-1]
-            if prefix not in self._wildcard_handlers:
-                self._wildcard_handlers[prefix] = []
-            self._wildcard_handlers[prefix].append(handler)
+            self._wildcard_handlers.setdefault(event_type, []).append(subscriber)
+            self._wildcard_trie.add(event_type, subscriber)
 
             logger.debug(f"Registered wildcard handler for: {event_type}")
         else:
             # Wrap handler to catch exceptions and prevent them from stopping other handlers
             def safe_handler(data):
-                try:
-                    handler(data)
-                except Exception as e:
-                    if self._debug:
-                        logger.debug(f"Handler error for {event_type}: {e}")
+                self._invoke(subscriber, event_type, data)
 
             # Store mapping for later removal
             wrapper_key = (event_type, handler)
@@ -305,7 +316,16 @@ class EventBus:
         """
         # Check if we have a wrapped version of this handler
         wrapper_key = (event_type, handler)
-        if wrapper_key in self._handler_wrappers:
+        if event_type in self._wildcard_handlers:
+            subscribers = self._wildcard_handlers[event_type]
+            for subscriber in subscribers:
+                if subscriber.handler == handler:
+                    subscribers.remove(subscriber)
+                    self._wildcard_trie.remove(event_type, subscriber)
+                    break
+            if not subscribers:
+                del self._wildcard_handlers[event_type]
+        elif wrapper_key in self._handler_wrappers:
             # Remove the wrapped handler from pyee
             wrapped_handler = self._handler_wrappers[wrapper_key]
             self._emitter.remove_listener(event_type, wrapped_handler)
@@ -322,7 +342,11 @@ class EventBus:
         Args:
             event_type: Optional event type. If None, removes all listeners.
         """
-        if event_type:
+        if event_type and event_type in self._wildcard_handlers:
+            del self._wildcard_handlers[event_type]
+            self._wildcard_trie.remove(event_type)
+            logger.debug(f"Removed all handlers for: {event_type}")
+        elif event_type:
             self._emitter.remove_all_listeners(event_type)
             # Clean up wrappers for this event type
             wrappers_to_remove = [
@@ -335,6 +359,8 @@ class EventBus:
             self._emitter.remove_all_listeners()
             # Clean up all wrappers
             self._handler_wrappers.clear()
+            self._wildcard_handlers.clear()
+            self._wildcard_trie.clear()
             logger.debug("Removed all event handlers")
 
     def _record_event(self, event_type: str, data: Any) -> None:
@@ -350,12 +376,9 @@ class EventBus:
             "data": data,
         }
 
+        # deque(maxlen=...) drops the oldest record once full
         self._event_history.append(event_record)
 
-        # Trim history if too large
-        if len(self._event_history) > self._max_history_size:
-            self._event_history = self._event_history[-self._max_history_size :]
-
     def get_stats(self) -> dict[str, Any]:
         """Get event bus statistics.
 
@@ -379,7 +402,7 @@ class EventBus:
         Returns:
             list: Recent events
         """
-        return self._event_history[-limit:]
+        return list(self._event_history)[-limit:]
 
     def clear_history(self) -> None:
         """Clear the event history."""
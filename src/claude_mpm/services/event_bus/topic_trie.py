@@ -0,0 +1,134 @@
+"""Segment trie for EventBus topic patterns.
+
+WHY: EventBus filters and wildcard subscriptions were checked by scanning
+every pattern with startswith() on each publish, so publish cost grew with
+the number of subscriptions. The trie resolves all patterns matching a
+topic in time proportional to the topic's length, and publish results are
+memoized per topic until the subscriptions change.
+
+Pattern syntax (unchanged from the original EventBus semantics):
+- ``hook.pre_tool`` matches that topic exactly
+- ``hook.*`` matches every topic starting with ``hook.``
+- ``hook.pre_*`` matches ``hook.pre_tool``, ``hook.pre_tool.extra``, ...
+- ``*`` matches every topic
+Only a trailing ``*`` is a wildcard; anywhere else it is a literal.
+"""
+
+from collections.abc import Hashable
+from typing import Any
+
+# Memoized lookups kept before the cache is reset; bounds memory when
+# topics are unbounded (e.g. ids embedded in event names).
+MAX_CACHED_TOPICS = 4096
+
+
+class _Node:
+    __slots__ = ("children", "exact", "prefixes")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # Patterns ending exactly at this node
+        self.exact: dict[Hashable, tuple[int, Any]] = {}
+        # Trailing-wildcard patterns: partial next segment -> entries
+        self.prefixes: dict[str, dict[Hashable, tuple[int, Any]]] = {}
+
+
+class TopicTrie:
+    """Maps topic patterns to values and resolves all matches for a topic.
+
+    Values are keyed so the same value can be registered under several
+    patterns and removed individually; ``match`` returns values in
+    registration order.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._patterns: dict[str, set[Hashable]] = {}
+        self._sequence = 0
+        self._cache: dict[str, tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._patterns.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._patterns)
+
+    @property
+    def patterns(self) -> list[str]:
+        return list(self._patterns)
+
+    def add(self, pattern: str, value: Any, key: Hashable | None = None) -> None:
+        """Register ``value`` under ``pattern`` (replacing the same key)."""
+        key = value if key is None else key
+        self._sequence += 1
+        self._slot(pattern, create=True)[key] = (self._sequence, value)
+        self._patterns.setdefault(pattern, set()).add(key)
+        self._cache.clear()
+
+    def remove(self, pattern: str, key: Hashable | None = None) -> bool:
+        """Remove one key from ``pattern``, or the whole pattern if key is None."""
+        slot = self._slot(pattern, create=False)
+        keys = self._patterns.get(pattern)
+        if slot is None or not keys:
+            return False
+        removed = list(keys) if key is None else [key] if key in keys else []
+        for k in removed:
+            slot.pop(k, None)
+            keys.discard(k)
+        if not keys:
+            del self._patterns[pattern]
+        self._cache.clear()
+        return bool(removed)
+
+    def clear(self) -> None:
+        self._root = _Node()
+        self._patterns.clear()
+        self._cache.clear()
+
+    def match(self, topic: str) -> tuple[Any, ...]:
+        """Return the values of every pattern matching ``topic``."""
+        cached = self._cache.get(topic)
+        if cached is not None:
+            return cached
+
+        found: list[tuple[int, Any]] = []
+        node = self._root
+        for segment in topic.split("."):
+            # Trailing wildcards at this depth match on a prefix of the segment
+            if node.prefixes:
+                for end in range(len(segment) + 1):
+                    entries = node.prefixes.get(segment[:end])
+                    if entries:
+                        found.extend(entries.values())
+            node = node.children.get(segment)
+            if node is None:
+                break
+        else:
+            found.extend(node.exact.values())
+
+        found.sort(key=lambda entry: entry[0])
+        result = tuple(value for _, value in found)
+        if len(self._cache) >= MAX_CACHED_TOPICS:
+            self._cache.clear()
+        self._cache[topic] = result
+        return result
+
+    def _slot(self, pattern: str, create: bool) -> dict | None:
+        wildcard = pattern.endswith("*")
+        segments = (pattern[:-1] if wildcard else pattern).split(".")
+        leaf = segments.pop() if wildcard else None
+
+        node = self._root
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[segment] = _Node()
+            node = child
+
+        if leaf is None:
+            return node.exact
+        if create:
+            return node.prefixes.setdefault(leaf, {})
+        return node.prefixes.get(leaf)
@@ -17,6 +17,7 @@ from .legacy import (
 from .network import NetworkHealthService
 from .process import ProcessHealthService
 from .resources import ResourceMonitorService
+from .sampler import MetricsSampler, get_metrics_sampler
 from .service import ServiceHealthService
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "HealthMetric",
     # Base components
     "HealthStatus",
+    "MetricsSampler",
     "MonitoringAggregatorService",
     "NetworkConnectivityChecker",
     "NetworkHealthService",
@@ -36,4 +38,5 @@ __all__ = [
     "ResourceMonitorService",
     "ServiceHealthChecker",
     "ServiceHealthService",
+    "get_metrics_sampler",
 ]
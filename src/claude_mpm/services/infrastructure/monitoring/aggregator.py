@@ -12,6 +12,7 @@ from typing import Any
 
 from ....core.enums import HealthStatus
 from .base import BaseMonitoringService, HealthChecker, HealthCheckResult, HealthMetric
+from .sampler import get_metrics_sampler
 
 
 class MonitoringAggregatorService(BaseMonitoringService):
@@ -22,6 +23,7 @@ class MonitoringAggregatorService(BaseMonitoringService):
     - Health history tracking
     - Status aggregation and reporting
     - Continuous monitoring with configurable intervals
+    - Concurrent service checks backed by a background metrics sampler
     - Integration with recovery systems via callbacks
     """
 
@@ -39,6 +41,11 @@ class MonitoringAggregatorService(BaseMonitoringService):
         self.history_size = self.config.get("history_size", 100)
         self.aggregation_window = self.config.get("aggregation_window", 300)
 
+        # Background resource sampling read by resource/process services
+        self.sampler = get_metrics_sampler()
+        if "sample_interval" in self.config:
+            self.sampler.interval = self.config["sample_interval"]
+
         # Registered monitoring services
         self.services: list[BaseMonitoringService] = []
         self.checkers: list[HealthChecker] = []  # For backward compatibility
@@ -108,55 +115,16 @@ class MonitoringAggregatorService(BaseMonitoringService):
         all_metrics = []
         errors = []
 
-        # Check all monitoring services
-        for service in self.services:
-            try:
-                service_start = time.time()
-                metrics = await service.check_health()
-                service_duration = (time.time() - service_start) * 1000
-
-                all_metrics.extend(metrics)
-                self.logger.debug(
-                    f"Service {service.get_name()} completed in {service_duration:.2f}ms"
-                )
-            except Exception as e:
-                error_msg = f"Service {service.get_name()} failed: {e}"
-                errors.append(error_msg)
-                self.logger.error(error_msg)
-
-                all_metrics.append(
-                    HealthMetric(
-                        name=f"{service.get_name()}_error",
-                        value=str(e),
-                        status=HealthStatus.UNKNOWN,
-                        message=error_msg,
-                    )
-                )
-
-        # Check legacy health checkers
-        for checker in self.checkers:
-            try:
-                checker_start = time.time()
-                metrics = await checker.check_health()
-                checker_duration = (time.time() - checker_start) * 1000
-
-                all_metrics.extend(metrics)
-                self.logger.debug(
-                    f"Checker {checker.get_name()} completed in {checker_duration:.2f}ms"
-                )
-            except Exception as e:
-                error_msg = f"Checker {checker.get_name()} failed: {e}"
-                errors.append(error_msg)
-                self.logger.error(error_msg)
-
-                all_metrics.append(
-                    HealthMetric(
-                        name=f"{checker.get_name()}_error",
-                        value=str(e),
-                        status=HealthStatus.UNKNOWN,
-                        message=error_msg,
-                    )
-                )
+        # Services and legacy checkers run concurrently; results keep
+        # registration order
+        outcomes = await asyncio.gather(
+            *(self._run_check("Service", service) for service in self.services),
+            *(self._run_check("Checker", checker) for checker in self.checkers),
+        )
+        for metrics, error in outcomes:
+            all_metrics.extend(metrics)
+            if error:
+                errors.append(error)
 
         # Determine overall status
         overall_status = self._determine_overall_status(all_metrics)
@@ -189,6 +157,31 @@ class MonitoringAggregatorService(BaseMonitoringService):
 
         return result
 
+    async def _run_check(
+        self, kind: str, source: BaseMonitoringService | HealthChecker
+    ) -> tuple[list[HealthMetric], str | None]:
+        """Run one service or checker, turning failures into an error metric."""
+        try:
+            check_start = time.time()
+            metrics = await source.check_health()
+            check_duration = (time.time() - check_start) * 1000
+
+            self.logger.debug(
+                f"{kind} {source.get_name()} completed in {check_duration:.2f}ms"
+            )
+            return metrics, None
+        except Exception as e:
+            error_msg = f"{kind} {source.get_name()} failed: {e}"
+            self.logger.error(error_msg)
+            return [
+                HealthMetric(
+                    name=f"{source.get_name()}_error",
+                    value=str(e),
+                    status=HealthStatus.UNKNOWN,
+                    message=error_msg,
+                )
+            ], error_msg
+
     def _determine_overall_status(self, metrics: list[HealthMetric]) -> HealthStatus:
         """Determine overall health status from individual metrics.
 
@@ -266,6 +259,7 @@ class MonitoringAggregatorService(BaseMonitoringService):
             return
 
         self.monitoring = True
+        self.sampler.start()
         self.monitor_task = asyncio.create_task(self._monitoring_loop())
         self.logger.info(
             f"Started health monitoring with {self.check_interval}s interval"
@@ -282,6 +276,7 @@ class MonitoringAggregatorService(BaseMonitoringService):
             with contextlib.suppress(asyncio.CancelledError):
                 await self.monitor_task
             self.monitor_task = None
+        self.sampler.stop()
 
         self.logger.info("Stopped health monitoring")
 
@@ -1,12 +1,14 @@
 """Process health monitoring service.
 
 Monitors individual process health including CPU, memory, file descriptors, and threads.
+Resource readings are recorded by the shared MetricsSampler.
 """
 
-from claude_mpm.core.constants import ResourceLimits, TimeoutConfig
+from claude_mpm.core.constants import ResourceLimits
 from claude_mpm.core.enums import HealthStatus
 
 from .base import BaseMonitoringService, HealthMetric
+from .sampler import MetricsSampler, get_metrics_sampler
 
 try:
     import psutil
@@ -34,6 +36,7 @@ class ProcessHealthService(BaseMonitoringService):
         cpu_threshold: float = 80.0,
         memory_threshold_mb: int = 500,
         fd_threshold: int = 1000,
+        sampler: MetricsSampler | None = None,
     ):
         """Initialize process health service.
 
@@ -42,6 +45,7 @@ class ProcessHealthService(BaseMonitoringService):
             cpu_threshold: CPU usage threshold as percentage
             memory_threshold_mb: Memory usage threshold in MB
             fd_threshold: File descriptor count threshold
+            sampler: Sampler to record into (defaults to the shared one)
         """
         super().__init__(f"ProcessHealth_{pid}")
         self.pid = pid
@@ -49,6 +53,9 @@ class ProcessHealthService(BaseMonitoringService):
         self.memory_threshold_mb = memory_threshold_mb
         self.fd_threshold = fd_threshold
         self.process = None
+        self.sampler = sampler or get_metrics_sampler()
+        self.source = f"process_{pid}"
+        self._sample_errors: dict[str, str] = {}
 
         if PSUTIL_AVAILABLE:
             try:
@@ -56,6 +63,41 @@ class ProcessHealthService(BaseMonitoringService):
             except psutil.NoSuchProcess:
                 self.logger.warning(f"Process {pid} not found for monitoring")
 
+        if self.process is not None:
+            # Prime the CPU counters; later samples measure since the last call
+            try:
+                self.process.cpu_percent(interval=None)
+            except Exception as e:
+                self.logger.debug(f"Failed to prime CPU counters: {e}")
+            self.sampler.add_source(self.source, self._sample_process)
+
+    def _sample_process(self) -> dict[str, float]:
+        """Sampler source: non-blocking CPU, memory, fd and thread readings."""
+        readings = {
+            "cpu_percent": lambda: self.process.cpu_percent(interval=None),
+            "memory_rss": lambda: self.process.memory_info().rss,
+            "memory_vms": lambda: self.process.memory_info().vms,
+            "num_threads": self.process.num_threads,
+        }
+        if hasattr(self.process, "num_fds"):
+            readings["num_fds"] = self.process.num_fds
+
+        values = {}
+        for key, read in readings.items():
+            try:
+                values[key] = read()
+                self._sample_errors.pop(key, None)
+            except Exception as e:
+                self._sample_errors[key] = str(e)
+        return values
+
+    def _sampled(self, key: str) -> float:
+        """Latest sampled value for ``key``; raises with the sampling error."""
+        summary = self.sampler.summary(f"{self.source}.{key}")
+        if summary is None:
+            raise RuntimeError(self._sample_errors.get(key, "no samples"))
+        return summary.latest
+
     async def check_health(self) -> list[HealthMetric]:
         """Check process health metrics."""
         metrics = []
@@ -85,6 +127,7 @@ class ProcessHealthService(BaseMonitoringService):
         try:
             # Check if process still exists
             if not self.process.is_running():
+                self.sampler.remove_source(self.source)
                 metrics.append(
                     HealthMetric(
                         name="process_exists",
@@ -95,6 +138,9 @@ class ProcessHealthService(BaseMonitoringService):
                 )
                 return metrics
 
+            # Non-blocking: reads the sampler unless its data is stale
+            self.sampler.ensure_fresh(self.source)
+
             # Process status
             metrics.extend(self._check_process_status())
 
@@ -172,9 +218,7 @@ class ProcessHealthService(BaseMonitoringService):
         """Check CPU usage."""
         metrics = []
         try:
-            cpu_percent = self.process.cpu_percent(
-                interval=TimeoutConfig.CPU_SAMPLE_INTERVAL
-            )
+            cpu_percent = self._sampled("cpu_percent")
             cpu_status = HealthStatus.HEALTHY
             if cpu_percent > self.cpu_threshold:
                 cpu_status = (
@@ -207,8 +251,7 @@ class ProcessHealthService(BaseMonitoringService):
         """Check memory usage."""
         metrics = []
         try:
-            memory_info = self.process.memory_info()
-            memory_mb = memory_info.rss / ResourceLimits.BYTES_TO_MB
+            memory_mb = self._sampled("memory_rss") / ResourceLimits.BYTES_TO_MB
             memory_status = HealthStatus.HEALTHY
             if memory_mb > self.memory_threshold_mb:
                 memory_status = (
@@ -230,7 +273,9 @@ class ProcessHealthService(BaseMonitoringService):
             metrics.append(
                 HealthMetric(
                     name="memory_vms_mb",
-                    value=round(memory_info.vms / ResourceLimits.BYTES_TO_MB, 2),
+                    value=round(
+                        self._sampled("memory_vms") / ResourceLimits.BYTES_TO_MB, 2
+                    ),
                     status=HealthStatus.HEALTHY,
                     unit="MB",
                 )
@@ -251,7 +296,7 @@ class ProcessHealthService(BaseMonitoringService):
         metrics = []
         if hasattr(self.process, "num_fds"):
             try:
-                fd_count = self.process.num_fds()
+                fd_count = int(self._sampled("num_fds"))
                 fd_status = HealthStatus.HEALTHY
                 if fd_count > self.fd_threshold:
                     fd_status = (
@@ -283,7 +328,7 @@ class ProcessHealthService(BaseMonitoringService):
         """Check thread count."""
         metrics = []
         try:
-            thread_count = self.process.num_threads()
+            thread_count = int(self._sampled("num_threads"))
             metrics.append(
                 HealthMetric(
                     name="thread_count",
@@ -1,10 +1,14 @@
 """Resource monitoring service for system resources (CPU, memory, disk).
 
 Monitors system-wide resource usage including CPU, memory, and disk utilization.
+CPU, memory and network counters are read from the shared MetricsSampler.
 """
 
+import time
+
 from ....core.enums import HealthStatus
 from .base import BaseMonitoringService, HealthMetric
+from .sampler import MetricsSampler, get_metrics_sampler
 
 try:
     import psutil
@@ -23,13 +27,17 @@ class ResourceMonitorService(BaseMonitoringService):
     - System memory usage
     - Disk space utilization
     - System load average
+    - Network throughput
     """
 
+    SOURCE = "system"
+
     def __init__(
         self,
         cpu_threshold: float = 80.0,
         memory_threshold: float = 85.0,
         disk_threshold: float = 90.0,
+        sampler: MetricsSampler | None = None,
     ):
         """Initialize resource monitor service.
 
@@ -37,11 +45,58 @@ class ResourceMonitorService(BaseMonitoringService):
             cpu_threshold: CPU usage warning threshold (%)
             memory_threshold: Memory usage warning threshold (%)
             disk_threshold: Disk usage warning threshold (%)
+            sampler: Sampler to record into (defaults to the shared one)
         """
         super().__init__("ResourceMonitor")
         self.cpu_threshold = cpu_threshold
         self.memory_threshold = memory_threshold
         self.disk_threshold = disk_threshold
+        self.sampler = sampler or get_metrics_sampler()
+        self._sample_errors: dict[str, str] = {}
+        self._last_net: tuple[float, int, int] | None = None
+
+        if PSUTIL_AVAILABLE:
+            # Prime the CPU counters; later samples measure since the last call
+            psutil.cpu_percent(interval=None)
+            self.sampler.add_source(self.SOURCE, self._sample_system)
+
+    def _sample_system(self) -> dict[str, float]:
+        """Sampler source: non-blocking CPU, memory and network readings."""
+        values = {}
+        try:
+            values["cpu_percent"] = psutil.cpu_percent(interval=None)
+            self._sample_errors.pop("cpu", None)
+        except Exception as e:
+            self._sample_errors["cpu"] = str(e)
+
+        try:
+            memory = psutil.virtual_memory()
+            values["memory_percent"] = memory.percent
+            values["memory_available"] = memory.available
+            values["memory_total"] = memory.total
+            self._sample_errors.pop("memory", None)
+        except Exception as e:
+            self._sample_errors["memory"] = str(e)
+
+        try:
+            net = psutil.net_io_counters()
+            now = time.monotonic()
+            if self._last_net is not None and now > self._last_net[0]:
+                elapsed = now - self._last_net[0]
+                values["net_sent_per_sec"] = (
+                    net.bytes_sent - self._last_net[1]
+                ) / elapsed
+                values["net_recv_per_sec"] = (
+                    net.bytes_recv - self._last_net[2]
+                ) / elapsed
+            self._last_net = (now, net.bytes_sent, net.bytes_recv)
+        except Exception as e:
+            self.logger.debug(f"Network counters not available: {e}")
+
+        return values
+
+    def _latest(self, key: str):
+        return self.sampler.summary(f"{self.SOURCE}.{key}")
 
     async def check_health(self) -> list[HealthMetric]:
         """Check system resource health."""
@@ -58,9 +113,15 @@ class ResourceMonitorService(BaseMonitoringService):
             )
             return metrics
 
+        # Non-blocking: reads the sampler unless its data is stale
+        self.sampler.ensure_fresh(self.SOURCE)
+
         # CPU usage
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu = self._latest("cpu_percent")
+            if cpu is None:
+                raise RuntimeError(self._sample_errors.get("cpu", "no CPU samples"))
+            cpu_percent = cpu.latest
             cpu_status = self._get_threshold_status(cpu_percent, self.cpu_threshold)
 
             metrics.append(
@@ -73,6 +134,17 @@ class ResourceMonitorService(BaseMonitoringService):
                 )
             )
 
+            metrics.append(
+                HealthMetric(
+                    name="system_cpu_usage_avg",
+                    value=round(cpu.ewma, 2),
+                    status=self._get_threshold_status(cpu.ewma, self.cpu_threshold),
+                    threshold=self.cpu_threshold,
+                    unit="%",
+                    message=f"EWMA over {cpu.samples} samples, p95 {cpu.p95:.1f}%",
+                )
+            )
+
             # CPU count for context
             metrics.append(
                 HealthMetric(
@@ -94,15 +166,19 @@ class ResourceMonitorService(BaseMonitoringService):
 
         # Memory usage
         try:
-            memory = psutil.virtual_memory()
+            memory = self._latest("memory_percent")
+            if memory is None:
+                raise RuntimeError(
+                    self._sample_errors.get("memory", "no memory samples")
+                )
             memory_status = self._get_threshold_status(
-                memory.percent, self.memory_threshold
+                memory.latest, self.memory_threshold
             )
 
             metrics.append(
                 HealthMetric(
                     name="system_memory_usage",
-                    value=round(memory.percent, 2),
+                    value=round(memory.latest, 2),
                     status=memory_status,
                     threshold=self.memory_threshold,
                     unit="%",
@@ -113,7 +189,7 @@ class ResourceMonitorService(BaseMonitoringService):
             metrics.append(
                 HealthMetric(
                     name="memory_available_gb",
-                    value=round(memory.available / (1024**3), 2),
+                    value=round(self._latest("memory_available").latest / (1024**3), 2),
                     status=HealthStatus.HEALTHY,
                     unit="GB",
                 )
@@ -122,7 +198,7 @@ class ResourceMonitorService(BaseMonitoringService):
             metrics.append(
                 HealthMetric(
                     name="memory_total_gb",
-                    value=round(memory.total / (1024**3), 2),
+                    value=round(self._latest("memory_total").latest / (1024**3), 2),
                     status=HealthStatus.HEALTHY,
                     unit="GB",
                 )
@@ -138,6 +214,22 @@ class ResourceMonitorService(BaseMonitoringService):
                 )
             )
 
+        # Network throughput (needs two samples)
+        for key, name in (
+            ("net_sent_per_sec", "network_sent_kb_per_sec"),
+            ("net_recv_per_sec", "network_recv_kb_per_sec"),
+        ):
+            rate = self._latest(key)
+            if rate is not None:
+                metrics.append(
+                    HealthMetric(
+                        name=name,
+                        value=round(rate.latest / 1024, 2),
+                        status=HealthStatus.HEALTHY,
+                        unit="KB/s",
+                    )
+                )
+
         # Disk usage
         try:
             disk = psutil.disk_usage("/")
@@ -232,9 +324,13 @@ class ResourceMonitorService(BaseMonitoringService):
             return None
 
         try:
+            self.sampler.ensure_fresh(self.SOURCE)
+            cpu = self._latest("cpu_percent")
+            memory = self._latest("memory_percent")
             return {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
-                "memory_percent": psutil.virtual_memory().percent,
+                "cpu_percent": cpu.latest,
+                "cpu_percent_avg": cpu.ewma,
+                "memory_percent": memory.latest,
                 "disk_percent": psutil.disk_usage("/").percent,
             }
         except Exception as e:
@@ -0,0 +1,229 @@
+"""Background metrics sampler shared by the monitoring services.
+
+WHY: Resource and process health checks called ``cpu_percent(interval=0.1)``
+inside ``async def check_health``, so every check blocked the event loop
+for at least 100 ms, and an aggregator with several services paid that once
+per service.
+
+DESIGN DECISIONS:
+- A single daemon thread calls every registered source at a fixed rate.
+  CPU is measured as the delta between consecutive samples with
+  ``cpu_percent(interval=None)``, so sampling never sleeps.
+- Each metric keeps its samples in a fixed-size ring buffer. The sampler
+  thread updates the EWMA and percentiles after every sample, so a health
+  check only looks up a precomputed summary.
+- Sources are plain callables returning ``{key: value}``. The services
+  define them, so tests that patch a service module's ``psutil`` still
+  control what gets sampled.
+- If the sampler is not running or a source's data is stale, a check can
+  take one synchronous, non-blocking sample with ``sample_now(source)``.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL = 1.0
+DEFAULT_CAPACITY = 120
+DEFAULT_EWMA_ALPHA = 0.3
+
+SampleSource = Callable[[], dict[str, float]]
+
+
+@dataclass(frozen=True)
+class SeriesSummary:
+    """Precomputed statistics for one metric's ring buffer."""
+
+    latest: float
+    timestamp: float
+    ewma: float
+    p50: float
+    p95: float
+    minimum: float
+    maximum: float
+    samples: int
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, round(fraction * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class _Series:
+    __slots__ = ("ewma", "samples", "summary")
+
+    def __init__(self, capacity: int):
+        self.samples: deque[tuple[float, float]] = deque(maxlen=capacity)
+        self.ewma: float | None = None
+        self.summary: SeriesSummary | None = None
+
+    def add(self, timestamp: float, value: float, alpha: float) -> None:
+        self.samples.append((timestamp, value))
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += alpha * (value - self.ewma)
+        ordered = sorted(v for _, v in self.samples)
+        self.summary = SeriesSummary(
+            latest=value,
+            timestamp=timestamp,
+            ewma=self.ewma,
+            p50=_percentile(ordered, 0.5),
+            p95=_percentile(ordered, 0.95),
+            minimum=ordered[0],
+            maximum=ordered[-1],
+            samples=len(ordered),
+        )
+
+
+class MetricsSampler:
+    """Samples registered sources into per-metric ring buffers.
+
+    Metrics are named ``"<source>.<key>"``.
+
+    Args:
+        interval: Seconds between sampling passes
+        capacity: Samples kept per metric
+        ewma_alpha: Weight of the newest sample in the moving average
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        capacity: int = DEFAULT_CAPACITY,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+    ):
+        self.interval = interval
+        self.capacity = capacity
+        self.ewma_alpha = ewma_alpha
+        self._sources: dict[str, SampleSource] = {}
+        self._series: dict[str, _Series] = {}
+        self._sampled_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_source(self, name: str, source: SampleSource) -> None:
+        """Register (or replace) a source sampled on every pass."""
+        with self._lock:
+            self._sources[name] = source
+
+    def remove_source(self, name: str) -> None:
+        """Stop sampling a source and drop its buffers."""
+        prefix = f"{name}."
+        with self._lock:
+            self._sources.pop(name, None)
+            self._sampled_at.pop(name, None)
+            for metric in [m for m in self._series if m.startswith(prefix)]:
+                del self._series[metric]
+
+    def sample_now(self, name: str | None = None) -> None:
+        """Sample one source (or all of them) synchronously."""
+        with self._lock:
+            if name is None:
+                sources = list(self._sources.items())
+            elif name in self._sources:
+                sources = [(name, self._sources[name])]
+            else:
+                sources = []
+
+        for source_name, source in sources:
+            try:
+                values = source()
+            except Exception as e:
+                logger.debug(f"Metrics source {source_name} failed: {e}")
+                continue
+            self._record(source_name, values, time.time())
+
+    def _record(self, source: str, values: dict[str, float], timestamp: float):
+        with self._lock:
+            if source not in self._sources:
+                return  # removed while sampling
+            for key, value in values.items():
+                metric = f"{source}.{key}"
+                series = self._series.get(metric)
+                if series is None:
+                    series = self._series[metric] = _Series(self.capacity)
+                series.add(timestamp, float(value), self.ewma_alpha)
+            self._sampled_at[source] = timestamp
+
+    def summary(self, metric: str) -> SeriesSummary | None:
+        """Latest precomputed statistics for a metric, or None if unsampled."""
+        series = self._series.get(metric)
+        return series.summary if series is not None else None
+
+    def window(
+        self, metric: str, seconds: float | None = None
+    ) -> list[tuple[float, float]]:
+        """(timestamp, value) samples for a metric, optionally the last N seconds."""
+        with self._lock:
+            series = self._series.get(metric)
+            samples = list(series.samples) if series is not None else []
+        if seconds is not None:
+            cutoff = time.time() - seconds
+            samples = [s for s in samples if s[0] >= cutoff]
+        return samples
+
+    def is_fresh(self, source: str) -> bool:
+        """True if the running sampler covered ``source`` within two intervals."""
+        sampled_at = self._sampled_at.get(source)
+        return (
+            self.running
+            and sampled_at is not None
+            and time.time() - sampled_at <= 2 * self.interval
+        )
+
+    def ensure_fresh(self, source: str) -> None:
+        """Sample ``source`` inline unless the background thread has it covered."""
+        if not self.is_fresh(source):
+            self.sample_now(source)
+
+    def start(self) -> None:
+        """Start the sampling thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            self.sample_now()
+            next_at += self.interval
+            delay = next_at - time.monotonic()
+            if delay < 0:  # fell behind; don't burst to catch up
+                next_at, delay = time.monotonic(), 0
+            self._stop.wait(delay)
+
+
+_sampler: MetricsSampler | None = None
+_sampler_lock = threading.Lock()
+
+
+def get_metrics_sampler() -> MetricsSampler:
+    """Process-wide sampler shared by the monitoring services."""
+    global _sampler
+    if _sampler is None:
+        with _sampler_lock:
+            if _sampler is None:
+                _sampler = MetricsSampler()
+    return _sampler
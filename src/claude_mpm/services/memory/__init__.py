@@ -4,15 +4,18 @@ This module provides memory management services including:
 - Memory building and optimization
 - Memory routing to appropriate agents
 - Caching services for performance
+- Persistent kuzu-memory recall client
 """
 
 from .builder import MemoryBuilder
 from .indexed_memory import IndexedMemoryService
+from .kuzu_recall import KuzuRecallClient
 from .optimizer import MemoryOptimizer
 from .router import MemoryRouter
 
 __all__ = [
     "IndexedMemoryService",
+    "KuzuRecallClient",
     "MemoryBuilder",
     "MemoryOptimizer",
     "MemoryRouter",
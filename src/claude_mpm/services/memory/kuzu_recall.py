@@ -0,0 +1,430 @@
+"""Persistent kuzu-memory recall client with a prompt-level cache.
+
+WHY: KuzuMemoryHook forked ``kuzu-memory memory recall`` for every user
+prompt and another ``memory learn`` process for every extracted learning.
+Each fork pays interpreter start-up plus opening the graph database, which
+dominates prompt latency even when the same prompt is asked twice.
+
+DESIGN DECISIONS:
+- One worker process (kuzu_worker.py) keeps the database open and answers
+  line-delimited JSON-RPC requests on stdio. It is started lazily and used
+  once it reports ready; until then, and whenever it is unavailable, calls
+  fall back to the original CLI invocations.
+- Recall results are cached by a hash of the normalized prompt. Each entry
+  records a stamp of the database directory (mtime/size of its files) and
+  a write generation, so changes by other processes or by our own flushed
+  stores invalidate it.
+- Stores are queued and written in groups by a flusher thread, either every
+  ``flush_interval`` seconds or once ``max_batch`` items are pending.
+- The kuzu-memory executable is located once per process.
+"""
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess  # nosec B404
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from claude_mpm.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("kuzu_worker.py")
+# Seconds before a failed worker is started again, and how often to try
+WORKER_RETRY_DELAY = 30.0
+MAX_WORKER_STARTS = 3
+
+
+@cache
+def find_kuzu_memory_cmd() -> str | None:
+    """Locate the kuzu-memory executable (pipx install first, then PATH)."""
+    pipx_path = (
+        Path.home()
+        / ".local"
+        / "pipx"
+        / "venvs"
+        / "kuzu-memory"
+        / "bin"
+        / "kuzu-memory"
+    )
+    if pipx_path.exists():
+        return str(pipx_path)
+    return shutil.which("kuzu-memory")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case- and whitespace-insensitive form of a prompt, used as cache key."""
+    return re.sub(r"\s+", " ", prompt).strip().lower()
+
+
+def _parse_recall_output(stdout: str) -> list[dict[str, Any]]:
+    # Parse JSON with strict=False to handle control characters
+    data = json.loads(stdout, strict=False)
+    # v1.2.7 returns dict with 'memories' key, not array
+    if isinstance(data, dict):
+        return data.get("memories", [])
+    return data if isinstance(data, list) else []
+
+
+class KuzuRecallClient:
+    """Recall and store memories through a long-lived kuzu-memory worker.
+
+    Args:
+        kuzu_memory_cmd: kuzu-memory executable used for the CLI fallback
+        project_path: Project whose memory database is used
+        worker_cmd: Command starting the worker (defaults to kuzu_worker.py
+            under the interpreter that has kuzu-memory installed)
+        db_path: Database directory watched for cache invalidation
+        cache_size: Maximum number of cached prompts
+        flush_interval: Seconds between group writes of queued stores
+        max_batch: Pending stores that trigger an immediate flush
+        timeout: Seconds to wait for a recall or store to complete
+    """
+
+    def __init__(
+        self,
+        kuzu_memory_cmd: str | None,
+        project_path: Path,
+        *,
+        worker_cmd: list[str] | None = None,
+        db_path: Path | None = None,
+        cache_size: int = 256,
+        flush_interval: float = 2.0,
+        max_batch: int = 32,
+        timeout: float = 5.0,
+    ):
+        self.kuzu_memory_cmd = kuzu_memory_cmd
+        self.project_path = Path(project_path)
+        self.worker_cmd = worker_cmd or self._default_worker_cmd()
+        self.db_path = db_path or self.project_path / "kuzu-memories"
+        self.cache_size = cache_size
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.stats = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "worker_calls": 0,
+            "cli_calls": 0,
+            "stored": 0,
+            "flushes": 0,
+        }
+
+        self._cache: OrderedDict[str, tuple[Any, int, list]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._worker: subprocess.Popen | None = None
+        self._worker_ready = threading.Event()
+        self._worker_starts = 0
+        self._worker_retry_at = 0.0
+        self._write_lock = threading.Lock()
+        self._pending_requests: dict[int, Future] = {}
+        self._next_id = 0
+
+        self._pending_stores: list[dict[str, Any]] = []
+        self._store_cond = threading.Condition()
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+        self._atexit_registered = False
+
+    def _default_worker_cmd(self) -> list[str]:
+        # A pipx install has its own interpreter next to the executable
+        python = sys.executable
+        if self.kuzu_memory_cmd:
+            sibling = Path(self.kuzu_memory_cmd).with_name("python")
+            if sibling.exists():
+                python = str(sibling)
+        return [python, str(WORKER_SCRIPT), str(self.project_path)]
+
+    # --- Recall ---
+
+    def recall(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Return memories relevant to ``query`` (cached per prompt)."""
+        normalized = f"{limit}:{normalize_prompt(query)}"
+        key = hashlib.sha256(normalized.encode()).hexdigest()
+        stamp = self._db_stamp()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] == stamp and cached[1] == self._generation:
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return cached[2]
+            self.stats["cache_misses"] += 1
+            generation = self._generation
+
+        memories = self._worker_recall(query, limit)
+        if memories is None:
+            memories = self._cli_recall(query)
+            if memories is None:
+                return []
+
+        with self._lock:
+            self._cache[key] = (stamp, generation, memories)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return memories
+
+    def _db_stamp(self) -> tuple | None:
+        """Cheap fingerprint of the database directory's files."""
+        try:
+            entries = [self.db_path.stat()]
+            with os.scandir(self.db_path) as it:
+                entries.extend(e.stat() for e in it if e.is_file())
+        except OSError:
+            return None
+        return tuple(sorted((s.st_mtime_ns, s.st_size, s.st_ino) for s in entries))
+
+    def _worker_recall(self, query: str, limit: int) -> list[dict[str, Any]] | None:
+        result = self._call("recall", {"query": query, "limit": limit})
+        if result is None:
+            return None
+        return result.get("memories", [])
+
+    def _cli_recall(self, query: str) -> list[dict[str, Any]] | None:
+        if self.kuzu_memory_cmd is None:
+            return None
+        self.stats["cli_calls"] += 1
+        try:
+            # Use kuzu-memory recall command (v1.2.7+ syntax)
+            result = subprocess.run(  # nosec B603
+                [self.kuzu_memory_cmd, "memory", "recall", query, "--format", "json"],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                cwd=str(self.project_path),
+                check=False,
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"Memory retrieval failed: {e}")
+            return None
+
+        if result.returncode != 0 or not result.stdout:
+            return None
+        try:
+            return _parse_recall_output(result.stdout)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse kuzu-memory JSON output: {e}")
+            logger.debug(f"Raw output: {result.stdout[:200]}")
+            return []  # Graceful fallback
+
+    # --- Store ---
+
+    def store(self, content: str, tags: list[str] | None = None) -> bool:
+        """Queue a memory for the next group write."""
+        if self.kuzu_memory_cmd is None or self._closed:
+            return False
+        with self._store_cond:
+            self._pending_stores.append({"content": content, "tags": tags or []})
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="kuzu-memory-flusher", daemon=True
+                )
+                self._flusher.start()
+                self._register_atexit()
+            if len(self._pending_stores) >= self.max_batch:
+                self._store_cond.notify()
+        return True
+
+    def flush(self) -> int:
+        """Write queued stores now; returns the number written."""
+        with self._store_cond:
+            items, self._pending_stores = self._pending_stores, []
+        if not items:
+            return 0
+
+        result = self._call("learn", {"items": items})
+        if result is None:
+            for item in items:
+                self._cli_learn(item["content"])
+
+        with self._lock:
+            self._generation += 1
+        self.stats["stored"] += len(items)
+        self.stats["flushes"] += 1
+        logger.debug(f"Stored {len(items)} memories in one group write")
+        return len(items)
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._store_cond:
+                if not self._closed and len(self._pending_stores) < self.max_batch:
+                    self._store_cond.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush kuzu-memory stores: {e}")
+            if closed:
+                return
+
+    def _cli_learn(self, content: str) -> None:
+        self.stats["cli_calls"] += 1
+        try:
+            # Fire-and-forget async learn, detached from this process
+            subprocess.Popen(  # nosec B603
+                [self.kuzu_memory_cmd, "memory", "learn", content, "--no-wait"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.project_path),
+                start_new_session=True,
+            )
+        except OSError as e:
+            logger.error(f"Failed to launch async learn: {e}")
+
+    # --- Worker ---
+
+    def _call(self, method: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Send a request to the worker; None if it is unavailable or fails."""
+        if not self._ensure_worker():
+            return None
+
+        future: Future = Future()
+        with self._write_lock:
+            worker = self._worker
+            if worker is None or worker.stdin is None:
+                return None
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending_requests[request_id] = future
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params,
+            }
+            try:
+                worker.stdin.write(json.dumps(request) + "\n")
+                worker.stdin.flush()
+            except (OSError, ValueError) as e:
+                self._pending_requests.pop(request_id, None)
+                self._worker_failed(worker, f"write failed: {e}")
+                return None
+
+        try:
+            response = future.result(self.timeout)
+        except FutureTimeout:
+            self._pending_requests.pop(request_id, None)
+            self._worker_failed(worker, f"{method} timed out")
+            return None
+        except Exception:
+            return None
+
+        if "error" in response:
+            logger.warning(f"kuzu-memory worker {method} failed: {response['error']}")
+            return None
+        self.stats["worker_calls"] += 1
+        return response.get("result") or {}
+
+    def _ensure_worker(self) -> bool:
+        """Start the worker if needed; True once it has reported ready."""
+        if self._worker is not None:
+            return self._worker_ready.is_set()
+        if (
+            self._closed
+            or self._worker_starts >= MAX_WORKER_STARTS
+            or time.monotonic() < self._worker_retry_at
+        ):
+            return False
+
+        with self._write_lock:
+            if self._worker is not None:
+                return self._worker_ready.is_set()
+            self._worker_starts += 1
+            self._worker_ready.clear()
+            try:
+                worker = subprocess.Popen(  # nosec B603
+                    self.worker_cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                    cwd=str(self.project_path),
+                )
+            except OSError as e:
+                logger.debug(f"kuzu-memory worker could not start: {e}")
+                self._worker_retry_at = time.monotonic() + WORKER_RETRY_DELAY
+                return False
+            self._worker = worker
+            threading.Thread(
+                target=self._read_responses,
+                args=(worker,),
+                name="kuzu-memory-worker-reader",
+                daemon=True,
+            ).start()
+            self._register_atexit()
+
+        # Don't hold up this prompt for start-up; the CLI answers it
+        return False
+
+    def _read_responses(self, worker: subprocess.Popen) -> None:
+        for line in worker.stdout:
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if message.get("method") == "ready":
+                self._worker_ready.set()
+                logger.debug("kuzu-memory worker ready")
+                continue
+            future = self._pending_requests.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        self._worker_failed(worker, "worker exited")
+
+    def _worker_failed(self, worker: subprocess.Popen, reason: str) -> None:
+        with self._write_lock:
+            if self._worker is not worker:
+                return
+            self._worker = None
+            self._worker_ready.clear()
+            self._worker_retry_at = time.monotonic() + WORKER_RETRY_DELAY
+            pending, self._pending_requests = self._pending_requests, {}
+        if not self._closed:
+            logger.debug(f"kuzu-memory worker unavailable ({reason}); using CLI")
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        with contextlib.suppress(OSError):
+            worker.kill()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            worker.wait(timeout=1)
+
+    def _register_atexit(self) -> None:
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Flush queued stores and stop the flusher and worker."""
+        with self._store_cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._store_cond.notify()
+        if self._flusher is not None:
+            self._flusher.join(self.timeout * 2)
+        else:
+            self.flush()
+
+        worker = self._worker
+        if worker is not None:
+            with contextlib.suppress(OSError, ValueError):
+                worker.stdin.close()
+            try:
+                worker.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._worker_failed(worker, "shutdown")
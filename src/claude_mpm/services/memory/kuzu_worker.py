@@ -0,0 +1,95 @@
+"""Long-lived kuzu-memory worker speaking line-delimited JSON-RPC on stdio.
+
+Started by KuzuRecallClient so that one process keeps the kuzu database
+open for the whole session instead of forking the CLI for every prompt.
+
+Protocol (one JSON object per line, after a ``{"method": "ready"}``
+notification once the database is open):
+    -> {"jsonrpc": "2.0", "id": 1, "method": "recall",
+        "params": {"query": "...", "limit": 10}}
+    <- {"jsonrpc": "2.0", "id": 1, "result": {"memories": [...]}}
+    -> {"jsonrpc": "2.0", "id": 2, "method": "learn",
+        "params": {"items": [{"content": "...", "tags": [...]}]}}
+    <- {"jsonrpc": "2.0", "id": 2, "result": {"stored": 1}}
+
+The module deliberately imports nothing from claude_mpm so it can also run
+under the interpreter of a pipx-installed kuzu-memory.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+METHODS = frozenset({"recall", "learn"})
+
+
+def _memory_to_dict(memory: Any) -> dict[str, Any]:
+    if isinstance(memory, dict):
+        return memory
+    return {
+        "content": getattr(memory, "content", str(memory)),
+        "tags": list(getattr(memory, "tags", None) or []),
+        "relevance": getattr(memory, "relevance", None)
+        or getattr(memory, "confidence", 0.0),
+    }
+
+
+class KuzuWorker:
+    """Dispatches JSON-RPC requests to a kuzu_memory.KuzuMemory handle."""
+
+    def __init__(self, project_path: Path):
+        from kuzu_memory import KuzuMemory
+
+        db_path = project_path / "kuzu-memories" / "memories.db"
+        self.memory = KuzuMemory(db_path=db_path)
+
+    def recall(self, query: str, limit: int = 10) -> dict[str, Any]:
+        context = self.memory.attach_memories(query, max_memories=limit)
+        return {"memories": [_memory_to_dict(m) for m in context.memories]}
+
+    def learn(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        stored = 0
+        for item in items:
+            self.memory.generate_memories(item["content"], source="claude-mpm")
+            stored += 1
+        return {"stored": stored}
+
+
+def serve(handler: Any, stdin=None, stdout=None) -> None:
+    """Answer requests until stdin closes."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stdout.write(json.dumps({"jsonrpc": "2.0", "method": "ready"}) + "\n")
+    stdout.flush()
+    for line in stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request["method"] not in METHODS:
+                raise ValueError(f"Unknown method: {request['method']}")
+            method = getattr(handler, request["method"])
+            response = {"result": method(**request.get("params", {}))}
+        except Exception as e:
+            response = {"error": {"code": -32000, "message": str(e)}}
+        response.update(jsonrpc="2.0", id=request_id)
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+def main() -> int:
+    project_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
+    try:
+        handler = KuzuWorker(project_path)
+    except Exception as e:
+        print(f"kuzu-memory worker unavailable: {e}", file=sys.stderr)
+        return 1
+    serve(handler)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
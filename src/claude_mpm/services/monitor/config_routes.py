@@ -6,6 +6,7 @@ All endpoints are GET-only. No mutation operations.
 """
 
 import asyncio
+import hashlib
 import json as json_module
 import logging
 import re
@@ -17,6 +18,11 @@ from aiohttp import web
 
 from claude_mpm.core.deployment_context import DeploymentContext
 from claude_mpm.services.config_api.validation import validate_safe_name
+from claude_mpm.services.monitor.config_views import (
+    CONFIG_VIEWS_KEY,
+    ConfigViews,
+    ViewSnapshot,
+)
 from claude_mpm.services.monitor.pagination import (
     extract_pagination_params,
     paginate,
@@ -31,6 +37,14 @@ _git_source_manager = None
 _skills_deployer_service = None
 _skill_to_agent_mapper = None
 _config_validation_service = None
+_unwatched_views: ConfigViews | None = None
+
+# Materialized views (see config_views.py); names double as the entity_type
+# of the "view_changed" config events pushed to the dashboard.
+VIEW_AGENTS_AVAILABLE = "agents_available"
+VIEW_SKILLS_AVAILABLE = "skills_available"
+VIEW_SKILLS_DEPLOYED = "skills_deployed"
+VIEW_SKILL_LINKS = "skill_links"
 
 
 def _get_agent_manager(scope: str = "project") -> Any:
@@ -130,12 +144,97 @@ def register_config_routes(app: web.Application, server_instance=None):
     # Phase 4A: Configuration validation
     app.router.add_get("/api/config/validate", handle_validate)
 
+    app[CONFIG_VIEWS_KEY] = _create_config_views()
+
     logger.info("Registered 11 config API routes under /api/config/")
 
 
+def _create_config_views() -> ConfigViews:
+    """Register the materialized list views and the directories they read."""
+    views = ConfigViews()
+    views.register(
+        VIEW_AGENTS_AVAILABLE,
+        _build_available_agents,
+        roots=lambda _param: [
+            _get_git_source_manager().cache_root,
+            DeploymentContext.from_project().agents_dir,
+        ],
+        items=lambda agents: {
+            a.get("agent_id") or a.get("name", ""): a for a in agents
+        },
+    )
+    views.register(
+        VIEW_SKILLS_AVAILABLE,
+        _build_available_skills,
+        roots=lambda _collection: [
+            _get_skills_deployer().CLAUDE_SKILLS_DIR,
+            Path.cwd() / ".claude" / "skills",
+            Path.cwd() / ".claude" / "agents",
+        ],
+        items=lambda skills: {s.get("name", ""): s for s in skills},
+        on_invalidate=lambda: _get_skill_to_agent_mapper().invalidate(),
+    )
+    views.register(
+        VIEW_SKILLS_DEPLOYED,
+        _build_deployed_skills,
+        roots=lambda scope: [
+            DeploymentContext.from_request_scope(scope or "project").skills_dir,
+            *(path.parent for path in _local_manifest_paths()),
+        ],
+        items=lambda data: {s.get("name", ""): s for s in data.get("skills", [])},
+    )
+    views.register(
+        VIEW_SKILL_LINKS,
+        _build_skill_links,
+        roots=lambda _param: [
+            Path.cwd() / ".claude" / "agents",
+            Path.cwd() / ".claude" / "skills",
+        ],
+        items=lambda data: data["links"].get("by_agent", {}),
+        on_invalidate=lambda: _get_skill_to_agent_mapper().invalidate(),
+    )
+    return views
+
+
+def _get_config_views(request: web.Request) -> ConfigViews:
+    """Views registered on the request's app.
+
+    Handlers invoked without a registered app share one unwatched registry,
+    which rebuilds on every request.
+    """
+    global _unwatched_views
+    app = request.app
+    if isinstance(app, web.Application) and CONFIG_VIEWS_KEY in app:
+        return app[CONFIG_VIEWS_KEY]
+    if _unwatched_views is None:
+        _unwatched_views = _create_config_views()
+    return _unwatched_views
+
+
 # --- Shared Helpers ---
 
 
+def _view_etag(request: web.Request, snapshot: ViewSnapshot) -> str:
+    """ETag for one response: the view content plus the query that shaped it."""
+    digest = hashlib.sha1(
+        f"{snapshot.etag}?{request.query_string}".encode(), usedforsecurity=False
+    ).hexdigest()[:16]
+    return f'"{digest}"'
+
+
+def _not_modified(request: web.Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag."""
+    header = request.headers.get("If-None-Match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+def _not_modified_response(etag: str, cache_control: str) -> web.Response:
+    return web.Response(
+        status=304, headers={"ETag": etag, "Cache-Control": cache_control}
+    )
+
+
 def _parse_manifest_skills(available_skills) -> dict:
     """Parse manifest skills from either flat list or nested dict structure.
 
@@ -167,6 +266,14 @@ def _parse_manifest_skills(available_skills) -> dict:
     return lookup
 
 
+def _local_manifest_paths() -> list[Path]:
+    """Locally cached skill manifests, in lookup order."""
+    return [
+        Path.home() / ".claude" / "skills" / "claude-mpm" / "manifest.json",
+        Path.home() / ".claude-mpm" / "cache" / "skills" / "system" / "manifest.json",
+    ]
+
+
 def _build_manifest_lookup(skills_svc) -> dict:
     """Build a name-to-manifest-entry lookup dict from available skills.
 
@@ -177,11 +284,7 @@ def _build_manifest_lookup(skills_svc) -> dict:
     manifest_lookup: dict = {}
 
     # --- Primary: read local cached manifest from disk (no network) ---
-    local_manifest_paths = [
-        Path.home() / ".claude" / "skills" / "claude-mpm" / "manifest.json",
-        Path.home() / ".claude-mpm" / "cache" / "skills" / "system" / "manifest.json",
-    ]
-    for manifest_path in local_manifest_paths:
+    for manifest_path in _local_manifest_paths():
         try:
             if manifest_path.exists():
                 raw = json_module.loads(manifest_path.read_text(encoding="utf-8"))
@@ -415,6 +518,40 @@ async def handle_agents_deployed(request: web.Request) -> web.Response:
         )
 
 
+def _build_available_agents(_param: str | None = None) -> list[dict]:
+    """List available (cached) agents with the is_deployed flag.
+
+    WHY: list_cached_agents is blocking; ConfigViews runs this in a thread and
+    keeps the result until the agent cache or project agents directory changes.
+    WHAT: Fetches cached agents, promotes metadata fields and adds
+    is_deployed=True for agents already in the project. Search filtering is
+    applied per request by the handler so one view serves every query.
+    TEST: Mock git_mgr.list_cached_agents() with two agents; mock deployed_names
+    with one; assert the result has is_deployed=True for the deployed one only.
+    """
+    git_mgr = _get_git_source_manager()
+    agents = git_mgr.list_cached_agents()
+
+    # Promote metadata fields to root level for frontend compatibility.
+    # The discovery service nests name/description under metadata,
+    # but the frontend AvailableAgent interface expects them at root.
+    for agent in agents:
+        metadata = agent.get("metadata", {})
+        agent.setdefault("name", metadata.get("name", agent.get("agent_id", "")))
+        agent.setdefault("description", metadata.get("description", ""))
+
+    # Enrich with is_deployed flag by checking project agents
+    # Use lightweight list_agent_names() to avoid parsing all agent files
+    agent_mgr = _get_agent_manager("project")
+    deployed_names = agent_mgr.list_agent_names(location="project")
+
+    for agent in agents:
+        agent_key = agent.get("agent_id") or agent.get("name", "")
+        agent["is_deployed"] = agent_key in deployed_names
+
+    return agents
+
+
 async def handle_agents_available(request: web.Request) -> web.Response:
     """GET /api/config/agents/available - List available agents from cache.
 
@@ -425,51 +562,23 @@ async def handle_agents_available(request: web.Request) -> web.Response:
         search = request.query.get("search", None)
         pagination_params = extract_pagination_params(request)
 
-        def _list_available():
-            """List available (cached) agents with search filtering and is_deployed flag.
-
-            WHY: list_cached_agents is blocking; running in a thread avoids stalling the
-            event loop during what can be a moderately slow cache read.
-            WHAT: Fetches cached agents, promotes metadata fields, applies optional search
-            filter, and adds is_deployed=True for agents already in the project.
-            TEST: Mock git_mgr.list_cached_agents() with two agents; mock deployed_names
-            with one; assert the result has is_deployed=True for the deployed one only.
-            """
-            git_mgr = _get_git_source_manager()
-            agents = git_mgr.list_cached_agents()
-
-            # Promote metadata fields to root level for frontend compatibility.
-            # The discovery service nests name/description under metadata,
-            # but the frontend AvailableAgent interface expects them at root.
-            for agent in agents:
-                metadata = agent.get("metadata", {})
-                agent.setdefault(
-                    "name", metadata.get("name", agent.get("agent_id", ""))
-                )
-                agent.setdefault("description", metadata.get("description", ""))
-
-            # Client-side search filter on name/description
-            if search:
-                search_lower = search.lower()
-                agents = [
-                    a
-                    for a in agents
-                    if search_lower in a.get("name", "").lower()
-                    or search_lower in a.get("description", "").lower()
-                ]
-
-            # Enrich with is_deployed flag by checking project agents
-            # Use lightweight list_agent_names() to avoid parsing all agent files
-            agent_mgr = _get_agent_manager("project")
-            deployed_names = agent_mgr.list_agent_names(location="project")
-
-            for agent in agents:
-                agent_key = agent.get("agent_id") or agent.get("name", "")
-                agent["is_deployed"] = agent_key in deployed_names
-
-            return agents
+        snapshot = await _get_config_views(request).get(VIEW_AGENTS_AVAILABLE)
+        etag = _view_etag(request, snapshot)
+        # Cache hint: available agents change only on sync
+        cache_control = "private, max-age=60"
+        if _not_modified(request, etag):
+            return _not_modified_response(etag, cache_control)
 
-        agents = await asyncio.to_thread(_list_available)
+        agents = snapshot.data
+        # Client-side search filter on name/description
+        if search:
+            search_lower = search.lower()
+            agents = [
+                a
+                for a in agents
+                if search_lower in a.get("name", "").lower()
+                or search_lower in a.get("description", "").lower()
+            ]
 
         # Apply pagination
         result = paginate(
@@ -485,8 +594,8 @@ async def handle_agents_available(request: web.Request) -> web.Response:
             response_data["filters_applied"] = {"search": search}
 
         response = web.json_response(response_data)
-        # Cache hint: available agents change only on sync
-        response.headers["Cache-Control"] = "private, max-age=60"
+        response.headers["Cache-Control"] = cache_control
+        response.headers["ETag"] = etag
         return response
     except Exception as e:
         logger.error(f"Error listing available agents: {e}")
@@ -496,84 +605,96 @@ async def handle_agents_available(request: web.Request) -> web.Response:
         )
 
 
-async def handle_skills_deployed(request: web.Request) -> web.Response:
-    """GET /api/config/skills/deployed - List deployed skills."""
-    scope_str, ctx, err = _validate_get_scope(request)
-    if err:
-        return err
+def _build_deployed_skills(scope_str: str | None = None) -> dict:
+    """List deployed skills enriched with deployment-index metadata.
 
-    try:
+    WHY: check_deployed_skills is synchronous; ConfigViews runs this in a
+    thread and keeps the result until the scope's skills directory or a
+    local skill manifest changes.
+    WHAT: Calls SkillsDeployerService.check_deployed_skills then tries to load
+    the deployment index to add metadata (deployed_at, is_user_requested, etc.).
+    TEST: Mock SkillsDeployerService and load_deployment_index; assert the
+    returned list contains the expected metadata fields.
+    """
+    ctx = DeploymentContext.from_request_scope(scope_str or "project")
+    skills_svc = _get_skills_deployer()
+    skills_dir = ctx.skills_dir
+    deployed = skills_svc.check_deployed_skills(skills_dir=skills_dir)
 
-        def _list_deployed_skills():
-            """List deployed skills enriched with deployment-index metadata in a thread.
+    # Enrich with deployment index metadata if available
+    try:
+        from claude_mpm.services.skills.selective_skill_deployer import (
+            load_deployment_index,
+        )
 
-            WHY: check_deployed_skills is synchronous; running in a thread keeps the
-            event loop responsive while scanning the skills directory.
-            WHAT: Calls SkillsDeployerService.check_deployed_skills then tries to load
-            the deployment index to add metadata (deployed_at, is_user_requested, etc.).
-            TEST: Mock SkillsDeployerService and load_deployment_index; assert the
-            returned list contains the expected metadata fields.
-            """
-            skills_svc = _get_skills_deployer()
-            skills_dir = ctx.skills_dir
-            deployed = skills_svc.check_deployed_skills(skills_dir=skills_dir)
+        skills_dir = ctx.skills_dir
+        index = load_deployment_index(skills_dir)
 
-            # Enrich with deployment index metadata if available
-            try:
-                from claude_mpm.services.skills.selective_skill_deployer import (
-                    load_deployment_index,
-                )
+        deployed_meta = index.get("deployed_skills", {})
+        user_requested = set(index.get("user_requested_skills", []))
 
-                skills_dir = ctx.skills_dir
-                index = load_deployment_index(skills_dir)
+        skills_list = []
+        for skill in deployed.get("skills", []):
+            skill_name = skill.get("name", "")
+            meta = deployed_meta.get(skill_name, {})
+            skills_list.append(
+                {
+                    "name": skill_name,
+                    "path": skill.get("path", ""),
+                    "description": meta.get("description", ""),
+                    "category": meta.get("category", "unknown"),
+                    "collection": meta.get("collection", ""),
+                    "is_user_requested": skill_name in user_requested,
+                    "deploy_mode": (
+                        "user_defined"
+                        if skill_name in user_requested
+                        else "agent_referenced"
+                    ),
+                    "deploy_date": meta.get("deployed_at", ""),
+                    # Default manifest fields (overwritten by _enrich_skill_from_manifest when found)
+                    "version": "",
+                    "toolchain": None,
+                    "framework": None,
+                    "tags": [],
+                    "full_tokens": 0,
+                    "entry_point_tokens": 0,
+                }
+            )
 
-                deployed_meta = index.get("deployed_skills", {})
-                user_requested = set(index.get("user_requested_skills", []))
+        # Phase 2 Step 3: Cross-reference with manifest for enrichment
+        manifest_lookup = _build_manifest_lookup(skills_svc)
+        for skill_item in skills_list:
+            _enrich_skill_from_manifest(skill_item, manifest_lookup)
 
-                skills_list = []
-                for skill in deployed.get("skills", []):
-                    skill_name = skill.get("name", "")
-                    meta = deployed_meta.get(skill_name, {})
-                    skills_list.append(
-                        {
-                            "name": skill_name,
-                            "path": skill.get("path", ""),
-                            "description": meta.get("description", ""),
-                            "category": meta.get("category", "unknown"),
-                            "collection": meta.get("collection", ""),
-                            "is_user_requested": skill_name in user_requested,
-                            "deploy_mode": (
-                                "user_defined"
-                                if skill_name in user_requested
-                                else "agent_referenced"
-                            ),
-                            "deploy_date": meta.get("deployed_at", ""),
-                            # Default manifest fields (overwritten by _enrich_skill_from_manifest when found)
-                            "version": "",
-                            "toolchain": None,
-                            "framework": None,
-                            "tags": [],
-                            "full_tokens": 0,
-                            "entry_point_tokens": 0,
-                        }
-                    )
+        return {
+            "skills": skills_list,
+            "total": len(skills_list),
+            "claude_skills_dir": str(deployed.get("claude_skills_dir", "")),
+        }
+    except ImportError:
+        # Fallback: return basic deployed skills without metadata
+        return deployed
 
-                # Phase 2 Step 3: Cross-reference with manifest for enrichment
-                manifest_lookup = _build_manifest_lookup(skills_svc)
-                for skill_item in skills_list:
-                    _enrich_skill_from_manifest(skill_item, manifest_lookup)
 
-                return {
-                    "skills": skills_list,
-                    "total": len(skills_list),
-                    "claude_skills_dir": str(deployed.get("claude_skills_dir", "")),
-                }
-            except ImportError:
-                # Fallback: return basic deployed skills without metadata
-                return deployed
+async def handle_skills_deployed(request: web.Request) -> web.Response:
+    """GET /api/config/skills/deployed - List deployed skills."""
+    scope_str, _ctx, err = _validate_get_scope(request)
+    if err:
+        return err
 
-        data = await asyncio.to_thread(_list_deployed_skills)
-        return web.json_response({"success": True, "scope": scope_str, **data})
+    try:
+        snapshot = await _get_config_views(request).get(VIEW_SKILLS_DEPLOYED, scope_str)
+        etag = _view_etag(request, snapshot)
+        cache_control = "private, no-cache"
+        if _not_modified(request, etag):
+            return _not_modified_response(etag, cache_control)
+
+        response = web.json_response(
+            {"success": True, "scope": scope_str, **snapshot.data}
+        )
+        response.headers["Cache-Control"] = cache_control
+        response.headers["ETag"] = etag
+        return response
     except Exception as e:
         logger.error(f"Error listing deployed skills: {e}")
         return web.json_response(
@@ -582,6 +703,88 @@ async def handle_skills_deployed(request: web.Request) -> web.Response:
         )
 
 
+def _build_available_skills(collection: str | None = None) -> list[dict]:
+    """List available skills with the is_deployed flag and agent counts.
+
+    WHY: list_available_skills and check_deployed_skills are both synchronous;
+    ConfigViews runs this in a thread, once per collection, and keeps the
+    result until the skill collections or project skills/agents change.
+    WHAT: Fetches available skills from the deployer, checks which are already
+    deployed (using path-normalisation), and adds is_deployed to each skill.
+    TEST: Mock list_available_skills() with two skills; mark one as deployed;
+    assert is_deployed=True for the deployed one and False for the other.
+    """
+    skills_svc = _get_skills_deployer()
+    result = skills_svc.list_available_skills(collection=collection)
+
+    # Mark which are deployed (use project-level directory)
+    project_skills_dir = Path.cwd() / ".claude" / "skills"
+    deployed = skills_svc.check_deployed_skills(skills_dir=project_skills_dir)
+    deployed_names = {s.get("name", "") for s in deployed.get("skills", [])}
+
+    def _is_skill_deployed(short_name: str) -> bool:
+        """Check if a skill is deployed, accounting for path-normalization.
+
+        Deployed directory names are path-normalized (e.g.,
+        'universal-main-mcp-builder') while available skill names are
+        short manifest names (e.g., 'mcp-builder'). This function
+        checks for exact match first, then suffix-based matching.
+        """
+        if not short_name:
+            return False
+        # Exact match (handles already-normalized names)
+        if short_name in deployed_names:
+            return True
+        # Suffix match: check if any deployed name ends with
+        # '-{short_name}' to handle path-normalization
+        suffix = f"-{short_name}"
+        return any(dn.endswith(suffix) for dn in deployed_names)
+
+    # Flatten into a flat list for the UI
+    flat_skills = []
+    skills = result.get("skills", [])
+    if isinstance(skills, list):
+        for skill in skills:
+            if isinstance(skill, dict):
+                skill["is_deployed"] = _is_skill_deployed(skill.get("name", ""))
+                flat_skills.append(skill)
+    elif isinstance(skills, dict):
+        for category, category_skills in skills.items():
+            if isinstance(category_skills, list):
+                for skill in category_skills:
+                    if isinstance(skill, dict):
+                        skill["category"] = category
+                        skill["is_deployed"] = _is_skill_deployed(skill.get("name", ""))
+                        flat_skills.append(skill)
+
+    # Phase 2 Step 6: Enrich with agent count from skill-links
+    try:
+        mapper = _get_skill_to_agent_mapper()
+        links = mapper.get_all_links()
+        by_skill = links.get("by_skill", {})
+
+        for skill in flat_skills:
+            skill_name = skill.get("name", "")
+            skill_data = by_skill.get(skill_name, {})
+            if not skill_data:
+                # Try suffix matching for normalized names
+                for s_name, s_data in by_skill.items():
+                    if s_name.endswith(f"-{skill_name}") or skill_name.endswith(
+                        f"-{s_name}"
+                    ):
+                        skill_data = s_data
+                        break
+            agents = (
+                skill_data.get("agents", []) if isinstance(skill_data, dict) else []
+            )
+            skill["agent_count"] = len(agents)
+    except Exception as e:
+        logger.warning(f"Could not load skill-links for agent counts: {e}")
+        # Don't fail - just skip enrichment
+
+    return flat_skills
+
+
 async def handle_skills_available(request: web.Request) -> web.Response:
     """GET /api/config/skills/available - List available skills from sources.
 
@@ -592,95 +795,17 @@ async def handle_skills_available(request: web.Request) -> web.Response:
         collection = request.query.get("collection", None)
         pagination_params = extract_pagination_params(request)
 
-        def _list_available_skills():
-            """List available skills with is_deployed flag in a thread pool.
-
-            WHY: list_available_skills and check_deployed_skills are both synchronous;
-            running in a thread keeps the event loop free for other requests.
-            WHAT: Fetches available skills from the deployer, checks which are already
-            deployed (using path-normalisation), and adds is_deployed to each skill.
-            TEST: Mock list_available_skills() with two skills; mark one as deployed;
-            assert is_deployed=True for the deployed one and False for the other.
-            """
-            skills_svc = _get_skills_deployer()
-            result = skills_svc.list_available_skills(collection=collection)
-
-            # Mark which are deployed (use project-level directory)
-            project_skills_dir = Path.cwd() / ".claude" / "skills"
-            deployed = skills_svc.check_deployed_skills(skills_dir=project_skills_dir)
-            deployed_names = {s.get("name", "") for s in deployed.get("skills", [])}
-
-            def _is_skill_deployed(short_name: str) -> bool:
-                """Check if a skill is deployed, accounting for path-normalization.
-
-                Deployed directory names are path-normalized (e.g.,
-                'universal-main-mcp-builder') while available skill names are
-                short manifest names (e.g., 'mcp-builder'). This function
-                checks for exact match first, then suffix-based matching.
-                """
-                if not short_name:
-                    return False
-                # Exact match (handles already-normalized names)
-                if short_name in deployed_names:
-                    return True
-                # Suffix match: check if any deployed name ends with
-                # '-{short_name}' to handle path-normalization
-                suffix = f"-{short_name}"
-                return any(dn.endswith(suffix) for dn in deployed_names)
-
-            # Flatten into a flat list for the UI
-            flat_skills = []
-            skills = result.get("skills", [])
-            if isinstance(skills, list):
-                for skill in skills:
-                    if isinstance(skill, dict):
-                        skill["is_deployed"] = _is_skill_deployed(skill.get("name", ""))
-                        flat_skills.append(skill)
-            elif isinstance(skills, dict):
-                for category, category_skills in skills.items():
-                    if isinstance(category_skills, list):
-                        for skill in category_skills:
-                            if isinstance(skill, dict):
-                                skill["category"] = category
-                                skill["is_deployed"] = _is_skill_deployed(
-                                    skill.get("name", "")
-                                )
-                                flat_skills.append(skill)
-
-            # Phase 2 Step 6: Enrich with agent count from skill-links
-            try:
-                mapper = _get_skill_to_agent_mapper()
-                links = mapper.get_all_links()
-                by_skill = links.get("by_skill", {})
-
-                for skill in flat_skills:
-                    skill_name = skill.get("name", "")
-                    skill_data = by_skill.get(skill_name, {})
-                    if not skill_data:
-                        # Try suffix matching for normalized names
-                        for s_name, s_data in by_skill.items():
-                            if s_name.endswith(f"-{skill_name}") or skill_name.endswith(
-                                f"-{s_name}"
-                            ):
-                                skill_data = s_data
-                                break
-                    agents = (
-                        skill_data.get("agents", [])
-                        if isinstance(skill_data, dict)
-                        else []
-                    )
-                    skill["agent_count"] = len(agents)
-            except Exception as e:
-                logger.warning(f"Could not load skill-links for agent counts: {e}")
-                # Don't fail - just skip enrichment
-
-            return flat_skills
-
-        skills = await asyncio.to_thread(_list_available_skills)
+        snapshot = await _get_config_views(request).get(
+            VIEW_SKILLS_AVAILABLE, collection
+        )
+        etag = _view_etag(request, snapshot)
+        cache_control = "private, max-age=120"
+        if _not_modified(request, etag):
+            return _not_modified_response(etag, cache_control)
 
         # Apply pagination
         result = paginate(
-            skills,
+            snapshot.data,
             limit=pagination_params["limit"],
             cursor=pagination_params["cursor"],
             sort_key=lambda s: s.get("name", "").lower(),
@@ -692,7 +817,8 @@ async def handle_skills_available(request: web.Request) -> web.Response:
             response_data["filters_applied"] = {"collection": collection}
 
         response = web.json_response(response_data)
-        response.headers["Cache-Control"] = "private, max-age=120"
+        response.headers["Cache-Control"] = cache_control
+        response.headers["ETag"] = etag
         return response
     except Exception as e:
         logger.error(f"Error listing available skills: {e}")
@@ -1070,6 +1196,19 @@ async def handle_skill_detail(request: web.Request) -> web.Response:
 # --- Phase 4A: Skill-to-Agent Linking ---
 
 
+def _build_skill_links(_param: str | None = None) -> dict:
+    """Fetch all skill-to-agent links and stats.
+
+    WHY: get_all_links and get_stats may involve file reads; ConfigViews runs
+    this in a thread and keeps the result until project agents or skills change.
+    WHAT: Calls SkillToAgentMapper.get_all_links() and get_stats(); returns them
+    as {"links": ..., "stats": ...} for the handler to paginate and serialise.
+    TEST: Mock mapper; assert _build_skill_links() returns the mock links and stats.
+    """
+    mapper = _get_skill_to_agent_mapper()
+    return {"links": mapper.get_all_links(), "stats": mapper.get_stats()}
+
+
 async def handle_skill_links(request: web.Request) -> web.Response:
     """GET /api/config/skill-links/ - Full bidirectional skill-agent mapping.
 
@@ -1084,21 +1223,12 @@ async def handle_skill_links(request: web.Request) -> web.Response:
     try:
         pagination_params = extract_pagination_params(request)
 
-        def _get_links():
-            """Fetch all skill-to-agent links and stats in a thread pool.
-
-            WHY: get_all_links and get_stats may involve file reads; running in a thread
-            avoids blocking the event loop.
-            WHAT: Calls SkillToAgentMapper.get_all_links() and get_stats(); returns the
-            (links, stats) tuple for the caller to paginate and serialise.
-            TEST: Mock mapper; assert _get_links() returns the mock links and stats.
-            """
-            mapper = _get_skill_to_agent_mapper()
-            links = mapper.get_all_links()
-            stats = mapper.get_stats()
-            return links, stats
-
-        links, stats = await asyncio.to_thread(_get_links)
+        snapshot = await _get_config_views(request).get(VIEW_SKILL_LINKS)
+        etag = _view_etag(request, snapshot)
+        cache_control = "private, max-age=30"
+        if _not_modified(request, etag):
+            return _not_modified_response(etag, cache_control)
+        links, stats = snapshot.data["links"], snapshot.data["stats"]
 
         # Paginate by_agent entries
         by_agent = links.get("by_agent", {})
@@ -1131,7 +1261,8 @@ async def handle_skill_links(request: web.Request) -> web.Response:
             }
 
         response = web.json_response(response_data)
-        response.headers["Cache-Control"] = "private, max-age=30"
+        response.headers["Cache-Control"] = cache_control
+        response.headers["ETag"] = etag
         return response
     except Exception as e:
         logger.error(f"Error fetching skill links: {e}")
@@ -0,0 +1,320 @@
+"""Materialized views for the monitor config API.
+
+WHY: The dashboard polls the config list endpoints (available agents,
+available and deployed skills, skill links). Each poll used to rebuild the
+full list from disk in a worker thread: listing the agent cache, reading
+skill manifests and mapping skills to agents. The lists only change when
+files under a handful of directories change, so they are kept in memory
+and rebuilt only when a filesystem watcher sees one of those directories
+change.
+
+DESIGN DECISIONS:
+- One ConfigViews registry per aiohttp app (stored under CONFIG_VIEWS_KEY),
+  so applications created in tests never share cached state.
+- A view is identified by its name plus one parameter (scope, collection);
+  each parameter value is materialized separately.
+- Results are cached only while the watcher runs. Without an observer
+  nothing could invalidate a cached view, so every request rebuilds it as
+  before; ETags are still computed so If-None-Match keeps working.
+- Each view declares the directories it reads. Existing directories are
+  watched recursively; a missing one is watched through its nearest
+  existing ancestor so its creation invalidates the view.
+- Watchdog events are debounced per registry, then handed to the event
+  loop, which drops the affected views, rebuilds the variants that were
+  materialized and reports an added/removed/changed delta through the
+  ``on_change`` callback (the server forwards it as a ``config_event``).
+- Builds started before an invalidation are never cached (a generation
+  counter per view), so a slow build cannot resurrect stale data.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE_DELAY = 0.5
+IGNORED_SUFFIXES = (".tmp", ".swp", "~")
+
+ChangeCallback = Callable[[str, str | None, "ViewSnapshot", dict], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class ViewSnapshot:
+    """A materialized result and the content hash used as its ETag."""
+
+    data: Any
+    etag: str
+
+
+@dataclass
+class _ViewSpec:
+    builder: Callable[[str | None], Any]
+    roots: Callable[[str | None], list[Path]]
+    items: Callable[[Any], dict[str, Any]]
+    on_invalidate: Callable[[], None] | None = None
+
+
+@dataclass
+class _Watch:
+    handler: "_RootEventHandler"
+    watch: Any
+    recursive: bool
+
+
+def compute_etag(data: Any) -> str:
+    """Return a short, stable content hash for JSON-serialisable data."""
+    payload = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.sha1(payload, usedforsecurity=False).hexdigest()[:16]
+
+
+def diff_items(old: dict[str, Any], new: dict[str, Any]) -> dict[str, list[str]]:
+    """Compare two keyed item maps and list the added, removed and changed keys."""
+    return {
+        "added": sorted(key for key in new if key not in old),
+        "removed": sorted(key for key in old if key not in new),
+        "changed": sorted(key for key in new if key in old and new[key] != old[key]),
+    }
+
+
+def _nearest_existing(path: Path) -> Path:
+    for candidate in (path, *path.parents):
+        if candidate.is_dir():
+            return candidate
+    return Path(path.anchor or "/")
+
+
+class _RootEventHandler(FileSystemEventHandler):
+    """Forwards relevant events for one watched root to the registry."""
+
+    def __init__(self, views: "ConfigViews", root: Path):
+        super().__init__()
+        self.views = views
+        self.root = root
+
+    def _is_relevant(self, raw_path) -> bool:
+        if not raw_path:
+            return False
+        path = Path(raw_path.decode() if isinstance(raw_path, bytes) else raw_path)
+        if path.name.endswith(IGNORED_SUFFIXES):
+            return False
+        if path == self.root or path in self.root.parents:
+            return True
+        try:
+            relative = path.relative_to(self.root)
+        except ValueError:
+            return False
+        return ".git" not in relative.parts
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed", "closed_no_write"):
+            return
+        if event.is_directory and event.event_type == "modified":
+            return
+        if self._is_relevant(event.src_path) or self._is_relevant(
+            getattr(event, "dest_path", "")
+        ):
+            self.views._root_changed(self.root)
+
+
+class ConfigViews:
+    """Registry of materialized config views for one aiohttp application."""
+
+    def __init__(self, debounce_delay: float = DEFAULT_DEBOUNCE_DELAY):
+        self.debounce_delay = debounce_delay
+        self.stats = {"hits": 0, "builds": 0, "invalidations": 0, "deltas": 0}
+        self._specs: dict[str, _ViewSpec] = {}
+        self._cache: dict[tuple[str, str | None], ViewSnapshot] = {}
+        self._generation: dict[str, int] = {}
+        self._dependents: dict[Path, set[str]] = {}
+        self._watches: dict[Path, _Watch] = {}
+        self._observer = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._on_change: ChangeCallback | None = None
+        self._pending: set[str] = set()
+        self._timer: threading.Timer | None = None
+        self._timer_lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def register(
+        self,
+        name: str,
+        builder: Callable[[str | None], Any],
+        *,
+        roots: Callable[[str | None], list[Path]],
+        items: Callable[[Any], dict[str, Any]],
+        on_invalidate: Callable[[], None] | None = None,
+    ) -> None:
+        """Register a view.
+
+        Args:
+            name: View name, also used as the entity_type of delta events
+            builder: Blocking function building the view for one parameter
+            roots: Directories the builder reads for that parameter
+            items: Maps built data to ``{key: item}`` for delta computation
+            on_invalidate: Called before rebuilding, e.g. to drop a
+                service's own cache
+        """
+        self._specs[name] = _ViewSpec(builder, roots, items, on_invalidate)
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    async def get(self, name: str, param: str | None = None) -> ViewSnapshot:
+        """Return the materialized view, building it in a thread if needed."""
+        key = (name, param)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        spec = self._specs[name]
+        generation = self._generation.get(name, 0)
+        data = await asyncio.to_thread(spec.builder, param)
+        self.stats["builds"] += 1
+        snapshot = ViewSnapshot(data, compute_etag(data))
+
+        if (
+            self.watching
+            and generation == self._generation.get(name, 0)
+            and self._watch_roots(name, spec.roots(param))
+        ):
+            self._cache[key] = snapshot
+        return snapshot
+
+    def start(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_change: ChangeCallback | None = None,
+    ) -> None:
+        """Start watching; views built from now on are kept in memory."""
+        if self._observer is not None:
+            return
+        self._loop = loop
+        self._on_change = on_change
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.start()
+        logger.info("Config view watcher started")
+
+    def stop(self) -> None:
+        """Stop watching and drop every materialized view."""
+        with self._timer_lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            self._pending.clear()
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        self._watches.clear()
+        self._dependents.clear()
+        self._cache.clear()
+        logger.info("Config view watcher stopped")
+
+    def invalidate(self, *names: str) -> None:
+        """Drop the given views (all when none are given) and rebuild them.
+
+        Must be called on the event loop thread.
+        """
+        for name in names or tuple(self._specs):
+            spec = self._specs.get(name)
+            if spec is None:
+                continue
+            self._generation[name] = self._generation.get(name, 0) + 1
+            self.stats["invalidations"] += 1
+            stale = {
+                key[1]: self._cache.pop(key)
+                for key in [k for k in self._cache if k[0] == name]
+            }
+            if spec.on_invalidate:
+                try:
+                    spec.on_invalidate()
+                except Exception as e:
+                    logger.debug(f"Invalidation hook for {name} failed: {e}")
+            if stale and self.watching:
+                task = asyncio.ensure_future(self._refresh(name, stale))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, name: str, stale: dict[str | None, ViewSnapshot]):
+        spec = self._specs[name]
+        for param, old in stale.items():
+            try:
+                new = await self.get(name, param)
+                if new.etag == old.etag:
+                    continue
+                delta = diff_items(spec.items(old.data), spec.items(new.data))
+                self.stats["deltas"] += 1
+                if self._on_change:
+                    await self._on_change(name, param, new, delta)
+            except Exception as e:
+                logger.warning(f"Could not refresh config view {name}: {e}")
+
+    def _watch_roots(self, name: str, roots: list[Path]) -> bool:
+        """Ensure every root is watched; False if the observer rejects one."""
+        for raw_root in roots:
+            root = Path(raw_root).expanduser()
+            exists = root.is_dir()
+            current = self._watches.get(root)
+            if current is None or (exists and not current.recursive):
+                try:
+                    if current is not None:
+                        self._observer.remove_handler_for_watch(
+                            current.handler, current.watch
+                        )
+                    handler = _RootEventHandler(self, root)
+                    anchor = root if exists else _nearest_existing(root)
+                    watch = self._observer.schedule(
+                        handler, str(anchor), recursive=exists
+                    )
+                except Exception as e:
+                    logger.debug(f"Cannot watch {root} for config views: {e}")
+                    self._watches.pop(root, None)
+                    return False
+                self._watches[root] = _Watch(handler, watch, exists)
+            self._dependents.setdefault(root, set()).add(name)
+        return True
+
+    def _root_changed(self, root: Path) -> None:
+        """Called from the observer thread; debounces bursts of events."""
+        with self._timer_lock:
+            self._pending |= self._dependents.get(root, set())
+            if not self._pending:
+                return
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_delay, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._timer_lock:
+            names, self._pending = self._pending, set()
+            self._timer = None
+        loop = self._loop
+        if names and loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.invalidate, *sorted(names))
+
+
+CONFIG_VIEWS_KEY = web.AppKey("config_views", ConfigViews)
+
+
+def get_config_views(app: web.Application) -> ConfigViews:
+    """Return the view registry attached to an app by register_config_routes."""
+    return app[CONFIG_VIEWS_KEY]
@@ -1430,6 +1430,7 @@ class UnifiedMonitorServer:
             )
 
             register_config_routes(self.app, server_instance=self)
+            self._start_config_views()
 
             # Register source management routes (Phase 2: mutations)
             from claude_mpm.services.monitor.routes.config_sources import (
@@ -1467,6 +1468,32 @@ class UnifiedMonitorServer:
             self.logger.error(f"Error setting up HTTP routes: {e}")
             raise
 
+    def _start_config_views(self):
+        """Keep the config list views materialized and push their changes.
+
+        Filesystem watchers invalidate the views; each rebuilt view that
+        changed is announced as a ``view_changed`` config_event carrying the
+        new ETag and the added/removed/changed keys.
+        """
+        from claude_mpm.services.monitor.config_views import get_config_views
+
+        async def _on_view_change(name, param, snapshot, delta):
+            if self.config_event_handler is None:
+                return
+            await self.config_event_handler.emit_config_event(
+                operation="view_changed",
+                entity_type=name,
+                entity_id=param,
+                status="completed",
+                data={"etag": snapshot.etag, **delta},
+            )
+
+        try:
+            get_config_views(self.app).start(self.loop, on_change=_on_view_change)
+        except Exception as e:
+            # Views still work unwatched; they rebuild on every request
+            self.logger.warning(f"Config view watcher unavailable: {e}")
+
     def stop(self):
         """Stop the unified monitor server."""
         try:
@@ -1713,6 +1740,18 @@ class UnifiedMonitorServer:
             # Stop accepting new connections
             self.running = False
 
+            # Stop config view watchers
+            if self.app is not None:
+                try:
+                    from claude_mpm.services.monitor.config_views import (
+                        CONFIG_VIEWS_KEY,
+                    )
+
+                    if CONFIG_VIEWS_KEY in self.app:
+                        self.app[CONFIG_VIEWS_KEY].stop()
+                except Exception as e:
+                    self.logger.debug(f"Error stopping config view watcher: {e}")
+
             # Stop config file watcher
             if self.config_file_watcher is not None:
                 try:
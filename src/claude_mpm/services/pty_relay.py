@@ -0,0 +1,302 @@
+"""Readiness-driven relay between a PTY master and the controlling terminal.
+
+WHY: Subprocess launch mode used to poll the child and call select() with a
+zero timeout in a loop, keeping one core busy for the whole interactive
+session. Every 4 KiB read was also decoded and broadcast to the dashboard
+before the next keystroke could be echoed.
+
+DESIGN DECISIONS:
+- PtyRelay blocks in a selectors (epoll on Linux) wait on the PTY master,
+  stdin and a child-exit source. It uses no timeout, so an idle session
+  costs no CPU.
+- Child exit comes from a pidfd (Linux 5.3+). Otherwise a SIGCHLD handler
+  writes to a self-pipe. Off the main thread, where signal handlers cannot
+  be installed, the relay falls back to a 0.5 s wait timeout and
+  process.poll(). The relay never reaps the child; the caller's
+  process.wait() does.
+- The read size adapts to the output rate. It doubles while reads fill the
+  buffer (bulk output such as a long diff) and shrinks back for interactive
+  traffic.
+- Terminal output is written straight to stdout. Broadcast copies go to an
+  OutputCoalescer thread, which merges them into frames bounded by size and
+  time, so echo latency never waits on the WebSocket.
+"""
+
+import codecs
+import contextlib
+import errno
+import logging
+import os
+import selectors
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+MIN_READ_SIZE = 16 * 1024
+MAX_READ_SIZE = 1024 * 1024
+DEFAULT_FRAME_BYTES = 64 * 1024
+DEFAULT_FRAME_DELAY = 0.05
+EXIT_POLL_INTERVAL = 0.5
+
+_MASTER = "master"
+_STDIN = "stdin"
+_CHILD = "child"
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class OutputCoalescer:
+    """Merges output chunks into bounded text frames on a background thread.
+
+    A frame is emitted when ``max_bytes`` are buffered, or ``max_delay``
+    seconds after the first unsent byte arrived, whichever comes first.
+    Bytes are decoded incrementally, so multi-byte UTF-8 characters split
+    across reads are not mangled.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[str], None],
+        max_bytes: int = DEFAULT_FRAME_BYTES,
+        max_delay: float = DEFAULT_FRAME_DELAY,
+    ):
+        self.sink = sink
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.stats = {"chunks": 0, "frames": 0, "bytes": 0}
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._first_at = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="pty-output-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    def feed(self, data: bytes) -> None:
+        """Queue a chunk for broadcast; never blocks on the sink."""
+        with self._cond:
+            if self._closed:
+                return
+            if not self._chunks:
+                self._first_at = time.monotonic()
+            self._chunks.append(data)
+            self._size += len(data)
+            self.stats["chunks"] += 1
+            if len(self._chunks) == 1 or self._size >= self.max_bytes:
+                self._cond.notify()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush buffered output and stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _take(self) -> bytes | None:
+        with self._cond:
+            while not self._chunks and not self._closed:
+                self._cond.wait()
+            while not self._closed and self._size < self.max_bytes:
+                remaining = self._first_at + self.max_delay - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if not self._chunks:
+                return None
+            data = b"".join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
+            return data
+
+    def _run(self) -> None:
+        while True:
+            data = self._take()
+            if data is None:
+                tail = self._decoder.decode(b"", final=True)
+                if tail:
+                    self._emit(tail)
+                return
+            text = self._decoder.decode(data)
+            if text:
+                self.stats["bytes"] += len(data)
+                self._emit(text)
+
+    def _emit(self, text: str) -> None:
+        self.stats["frames"] += 1
+        try:
+            self.sink(text)
+        except Exception as e:
+            logger.debug(f"Failed to broadcast output: {e}")
+
+
+class PtyRelay:
+    """Relays bytes between a PTY master and stdin/stdout until the child exits.
+
+    Args:
+        master_fd: PTY master connected to the child
+        process: The child process (used for exit notification only)
+        stdin_fd: Terminal input to forward to the child, or None
+        stdout_fd: Where child output is written
+        on_output: Optional callback receiving a copy of every output chunk
+    """
+
+    def __init__(
+        self,
+        master_fd: int,
+        process: subprocess.Popen,
+        stdin_fd: int | None,
+        stdout_fd: int,
+        on_output: Callable[[bytes], None] | None = None,
+    ):
+        self.master_fd = master_fd
+        self.process = process
+        self.stdin_fd = stdin_fd
+        self.stdout_fd = stdout_fd
+        self.on_output = on_output
+        self.read_size = MIN_READ_SIZE
+        self.stats = {"reads": 0, "bytes_out": 0, "bytes_in": 0, "wakeups": 0}
+        self.exit_source = "poll"
+        self._cleanups: list[Callable[[], None]] = []
+
+    def run(self) -> dict:
+        """Relay until the child exits or the PTY closes; returns stats."""
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(self.master_fd, selectors.EVENT_READ, _MASTER)
+            if self.stdin_fd is not None:
+                selector.register(self.stdin_fd, selectors.EVENT_READ, _STDIN)
+            timeout = self._register_exit_source(selector)
+            self._loop(selector, timeout)
+        finally:
+            selector.close()
+            for cleanup in reversed(self._cleanups):
+                with contextlib.suppress(Exception):
+                    cleanup()
+            self._cleanups.clear()
+        return dict(self.stats, read_size=self.read_size, exit_source=self.exit_source)
+
+    def _loop(self, selector: selectors.BaseSelector, timeout: float | None) -> None:
+        while True:
+            events = selector.select(timeout)
+            self.stats["wakeups"] += 1
+            for key, _ in events:
+                if key.data == _MASTER:
+                    if not self._pump_output():
+                        return
+                elif key.data == _STDIN:
+                    if not self._pump_input():
+                        selector.unregister(self.stdin_fd)
+                else:
+                    self._drain_output()
+                    return
+            if not events and self.process.poll() is not None:
+                self._drain_output()
+                return
+
+    def _register_exit_source(self, selector: selectors.BaseSelector) -> float | None:
+        """Watch for child exit; returns the select timeout to use."""
+        pidfd_open = getattr(os, "pidfd_open", None)
+        if pidfd_open is not None:
+            try:
+                pidfd = pidfd_open(self.process.pid)
+            except OSError:
+                pass
+            else:
+                self._cleanups.append(lambda: os.close(pidfd))
+                selector.register(pidfd, selectors.EVENT_READ, _CHILD)
+                self.exit_source = "pidfd"
+                return None
+
+        if threading.current_thread() is threading.main_thread():
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(write_fd, False)
+            self._cleanups.extend(
+                [lambda: os.close(read_fd), lambda: os.close(write_fd)]
+            )
+
+            def on_sigchld(signum, frame):
+                with contextlib.suppress(OSError):
+                    os.write(write_fd, b"\0")
+
+            previous = signal.signal(signal.SIGCHLD, on_sigchld)
+            self._cleanups.append(lambda: signal.signal(signal.SIGCHLD, previous))
+            selector.register(read_fd, selectors.EVENT_READ, _CHILD)
+            self.exit_source = "sigchld"
+            # The child may have exited before the handler was installed
+            if self.process.poll() is not None:
+                os.write(write_fd, b"\0")
+            return None
+
+        self.exit_source = "poll"
+        return EXIT_POLL_INTERVAL
+
+    def _pump_output(self) -> bool:
+        """Forward one read from the PTY; False on EOF/closed PTY."""
+        try:
+            data = os.read(self.master_fd, self.read_size)
+        except OSError:
+            # Linux raises EIO once the child side of the PTY is closed
+            return False
+        if not data:
+            return False
+        self._forward(data)
+        return True
+
+    def _drain_output(self) -> None:
+        """Forward output the child wrote before exiting."""
+        os.set_blocking(self.master_fd, False)
+        try:
+            while True:
+                try:
+                    data = os.read(self.master_fd, self.read_size)
+                except OSError as e:
+                    if e.errno not in (errno.EAGAIN, errno.EIO):
+                        logger.debug(f"PTY drain stopped: {e}")
+                    return
+                if not data:
+                    return
+                self._forward(data)
+        finally:
+            with contextlib.suppress(OSError):
+                os.set_blocking(self.master_fd, True)
+
+    def _forward(self, data: bytes) -> None:
+        self.stats["reads"] += 1
+        self.stats["bytes_out"] += len(data)
+        _write_all(self.stdout_fd, data)
+        if self.on_output is not None:
+            self.on_output(data)
+        self._adapt_read_size(len(data))
+
+    def _adapt_read_size(self, received: int) -> None:
+        if received >= self.read_size:
+            self.read_size = min(self.read_size * 2, MAX_READ_SIZE)
+        elif received < self.read_size // 4:
+            self.read_size = max(self.read_size // 2, MIN_READ_SIZE)
+
+    def _pump_input(self) -> bool:
+        """Forward terminal input to the child; False once stdin is closed."""
+        try:
+            data = os.read(self.stdin_fd, MIN_READ_SIZE)
+        except OSError:
+            return False
+        if not data:
+            return False
+        self.stats["bytes_in"] += len(data)
+        try:
+            _write_all(self.master_fd, data)
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,460 @@
+"""Segmented, append-only response log.
+
+WHY: The JSON response format writes one pretty-printed file per response
+into a flat directory. A busy day leaves tens of thousands of small files,
+every response pays an open/create/close, and listing a session means
+parsing every file in the directory.
+
+DESIGN DECISIONS:
+- Responses are appended as JSON lines to per-session segments,
+  ``<base_dir>/segments/<session_id>/<start>-<n>.jsonl``. A segment is
+  rotated when it exceeds ``max_segment_bytes`` or is older than
+  ``max_segment_age`` seconds.
+- ``append_batch`` is a group commit: the records of one session are
+  written with a single write (and optional fsync) per batch, and the
+  index lines of the whole batch with one more.
+- With compression, each batch is appended as one gzip member ("frame").
+  Concatenated members are a valid gzip stream, so a segment stays readable
+  with ``gzip.open`` and an index entry can seek straight to its frame.
+- A sidecar index (``<base_dir>/index.jsonl``) holds one small line per
+  response: session, agent, time, segment, frame offset and position in
+  the frame. Lookups by session, agent or time read only the index and the
+  frames they need. The index is derived data: ``rebuild_index`` recreates
+  it from the segments.
+- ``migrate_legacy_responses`` moves the old per-file layout into segments.
+"""
+
+import calendar
+import gzip
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from ..core.logger import get_logger
+
+logger = get_logger("services.response_log")
+
+SEGMENTS_DIRNAME = "segments"
+INDEX_FILENAME = "index.jsonl"
+DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_SEGMENT_AGE = 24 * 60 * 60.0
+
+
+def _timestamp_seconds(value: Any) -> float:
+    """Epoch seconds of an ISO timestamp, datetime or number (0.0 if unknown)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return 0.0
+
+
+def _safe_name(value: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in value) or "unknown"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Location of one response in the segments."""
+
+    session_id: str
+    agent: str
+    time: float  # Epoch seconds of the response timestamp
+    segment: str  # Path relative to the log's base directory
+    offset: int  # Byte offset of the frame holding the response
+    position: int  # Line number of the response within the frame
+
+    def to_line(self) -> str:
+        return json.dumps(
+            {
+                "session_id": self.session_id,
+                "agent": self.agent,
+                "time": self.time,
+                "segment": self.segment,
+                "offset": self.offset,
+                "position": self.position,
+            },
+            separators=(",", ":"),
+        )
+
+
+@dataclass
+class _Segment:
+    path: Path
+    size: int
+    started: float
+
+
+class SegmentedResponseLog:
+    """Writer appending batches of responses to per-session segments."""
+
+    def __init__(
+        self,
+        base_dir: Path | str,
+        *,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_age: float = DEFAULT_MAX_SEGMENT_AGE,
+        compress: bool = False,
+        fsync: bool = False,
+    ):
+        """
+        Args:
+            base_dir: Response directory (segments and index live below it)
+            max_segment_bytes: Size after which a new segment is started
+            max_segment_age: Seconds after which a new segment is started
+            compress: Append each batch as a gzip member
+            fsync: fsync segments and index after each batch
+        """
+        self.base_dir = Path(base_dir)
+        self.segments_dir = self.base_dir / SEGMENTS_DIRNAME
+        self.index_path = self.base_dir / INDEX_FILENAME
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.compress = compress
+        self.fsync = fsync
+        self.suffix = ".jsonl.gz" if compress else ".jsonl"
+        self._current: dict[str, _Segment] = {}
+        self._lock = Lock()
+        self.stats = {"batches": 0, "records": 0, "segments_created": 0}
+
+    def append(self, record: dict[str, Any]) -> None:
+        self.append_batch([record])
+
+    def append_batch(self, records: Iterable[dict[str, Any]]) -> int:
+        """Group-commit *records* (dicts with ``session_id``, ``agent``, ``timestamp``).
+
+        Returns:
+            Number of records written
+        """
+        records = list(records)
+        if not records:
+            return 0
+
+        by_session: dict[str, list[dict[str, Any]]] = {}
+        for record in records:
+            session_id = str(record.get("session_id") or "unknown")
+            by_session.setdefault(session_id, []).append(record)
+
+        index_lines = []
+        with self._lock:
+            for session_id, session_records in by_session.items():
+                index_lines.extend(self._write_frame(session_id, session_records))
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            with self.index_path.open("a", encoding="utf-8") as index:
+                index.write("".join(f"{line}\n" for line in index_lines))
+                self._commit(index)
+            self.stats["batches"] += 1
+            self.stats["records"] += len(records)
+        return len(records)
+
+    def _write_frame(self, session_id: str, records: list[dict[str, Any]]) -> list[str]:
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        ).encode("utf-8")
+        if self.compress:
+            payload = gzip.compress(payload)
+
+        segment = self._segment_for(session_id)
+        offset = segment.size
+        with segment.path.open("ab") as f:
+            f.write(payload)
+            self._commit(f)
+        segment.size += len(payload)
+
+        relative = segment.path.relative_to(self.base_dir).as_posix()
+        return [
+            IndexEntry(
+                session_id=session_id,
+                agent=str(record.get("agent") or "unknown"),
+                time=_timestamp_seconds(record.get("timestamp")),
+                segment=relative,
+                offset=offset,
+                position=position,
+            ).to_line()
+            for position, record in enumerate(records)
+        ]
+
+    def _commit(self, f) -> None:
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def _segment_for(self, session_id: str) -> _Segment:
+        segment = self._current.get(session_id)
+        if segment is None:
+            segment = self._resume_segment(session_id)
+        now = time.time()
+        if (
+            segment is None
+            or segment.size >= self.max_segment_bytes
+            or now - segment.started >= self.max_segment_age
+        ):
+            segment = self._new_segment(session_id, now)
+        self._current[session_id] = segment
+        return segment
+
+    def _session_dir(self, session_id: str) -> Path:
+        return self.segments_dir / _safe_name(session_id)
+
+    def _resume_segment(self, session_id: str) -> _Segment | None:
+        """The newest existing segment of a session (after a restart)."""
+        session_dir = self._session_dir(session_id)
+        if not session_dir.is_dir():
+            return None
+        candidates = sorted(session_dir.glob(f"*{self.suffix}"))
+        if not candidates:
+            return None
+        path = candidates[-1]
+        try:
+            started = calendar.timegm(time.strptime(path.name[:15], "%Y%m%dT%H%M%S"))
+        except ValueError:
+            started = path.stat().st_mtime
+        return _Segment(path, path.stat().st_size, started)
+
+    def _new_segment(self, session_id: str, now: float) -> _Segment:
+        session_dir = self._session_dir(session_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+        number = len(list(session_dir.glob(f"{stamp}-*")))
+        path = session_dir / f"{stamp}-{number:04d}{self.suffix}"
+        self.stats["segments_created"] += 1
+        return _Segment(path, 0, now)
+
+    def close(self) -> None:
+        with self._lock:
+            self._current.clear()
+
+
+class ResponseLogReader:
+    """Lookups over a segmented response log."""
+
+    def __init__(self, base_dir: Path | str):
+        """
+        Args:
+            base_dir: Response directory the log was written to
+        """
+        self.base_dir = Path(base_dir)
+        self.index_path = self.base_dir / INDEX_FILENAME
+
+    def exists(self) -> bool:
+        return self.index_path.exists() or (self.base_dir / SEGMENTS_DIRNAME).is_dir()
+
+    def index(
+        self,
+        session_id: str | None = None,
+        agent: str | None = None,
+        since: Any = None,
+        until: Any = None,
+    ) -> list[IndexEntry]:
+        """Index entries matching all given filters, in write order.
+
+        Args:
+            session_id: Only this session
+            agent: Only this agent
+            since: Only responses at or after this time (ISO string, datetime
+                or epoch seconds)
+            until: Only responses at or before this time
+        """
+        if not self.index_path.exists():
+            if not (self.base_dir / SEGMENTS_DIRNAME).is_dir():
+                return []
+            self.rebuild_index()
+        start = None if since is None else _timestamp_seconds(since)
+        end = None if until is None else _timestamp_seconds(until)
+
+        matches = []
+        with self.index_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = IndexEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue  # Torn line from an interrupted write
+                if session_id is not None and entry.session_id != session_id:
+                    continue
+                if agent is not None and entry.agent != agent:
+                    continue
+                if start is not None and entry.time < start:
+                    continue
+                if end is not None and entry.time > end:
+                    continue
+                matches.append(entry)
+        return matches
+
+    def entries(
+        self,
+        session_id: str | None = None,
+        agent: str | None = None,
+        since: Any = None,
+        until: Any = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Responses matching the filters (see ``index``), in write order."""
+        matches = self.index(session_id, agent, since, until)
+        for (segment, offset), group in groupby(
+            matches, key=lambda e: (e.segment, e.offset)
+        ):
+            wanted = {entry.position for entry in group}
+            for position, record in enumerate(self._read_frame(segment, offset)):
+                if position in wanted:
+                    yield record
+                    wanted.discard(position)
+                    if not wanted:
+                        break
+
+    def sessions(self) -> list[dict[str, Any]]:
+        """Per-session summaries from the index, most recent first."""
+        summaries: dict[str, dict[str, Any]] = {}
+        for entry in self.index():
+            summary = summaries.setdefault(
+                entry.session_id,
+                {
+                    "session_id": entry.session_id,
+                    "entries": 0,
+                    "first_time": entry.time,
+                    "last_time": entry.time,
+                    "last_agent": entry.agent,
+                    "agents": set(),
+                },
+            )
+            summary["entries"] += 1
+            summary["agents"].add(entry.agent)
+            summary["first_time"] = min(summary["first_time"], entry.time)
+            if entry.time >= summary["last_time"]:
+                summary["last_time"] = entry.time
+                summary["last_agent"] = entry.agent
+        for summary in summaries.values():
+            summary["agents"] = sorted(summary["agents"])
+        return sorted(summaries.values(), key=lambda s: s["last_time"], reverse=True)
+
+    def latest(self, session_id: str) -> dict[str, Any] | None:
+        """The most recent response of a session."""
+        matches = self.index(session_id=session_id)
+        if not matches:
+            return None
+        newest = max(matches, key=lambda e: e.time)
+        for position, record in enumerate(
+            self._read_frame(newest.segment, newest.offset)
+        ):
+            if position == newest.position:
+                return record
+        return None
+
+    def _read_frame(self, segment: str, offset: int) -> Iterator[dict[str, Any]]:
+        """Records from *offset* of a segment (to the end of the file)."""
+        path = self.base_dir / segment
+        try:
+            with path.open("rb") as raw:
+                raw.seek(offset)
+                stream = gzip.GzipFile(fileobj=raw) if path.suffix == ".gz" else raw
+                for line in stream:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except (OSError, EOFError) as e:
+            logger.warning(f"Failed to read response segment {path}: {e}")
+
+    def rebuild_index(self) -> int:
+        """Recreate the index from the segments.
+
+        Each segment is indexed as a single frame starting at offset 0, which
+        remains correct for concatenated gzip members.
+
+        Returns:
+            Number of indexed responses
+        """
+        lines = []
+        for path in sorted((self.base_dir / SEGMENTS_DIRNAME).glob("*/*.jsonl*")):
+            relative = path.relative_to(self.base_dir).as_posix()
+            for position, record in enumerate(self._read_frame(relative, 0)):
+                lines.append(
+                    IndexEntry(
+                        session_id=str(record.get("session_id") or "unknown"),
+                        agent=str(record.get("agent") or "unknown"),
+                        time=_timestamp_seconds(record.get("timestamp")),
+                        segment=relative,
+                        offset=0,
+                        position=position,
+                    ).to_line()
+                )
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+        tmp_path.replace(self.index_path)
+        return len(lines)
+
+
+def _load_legacy_file(path: Path) -> dict[str, Any]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def migrate_legacy_responses(
+    base_dir: Path | str,
+    *,
+    compress: bool = False,
+    remove: bool = True,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> dict[str, int]:
+    """Move per-response ``*.json``/``*.json.gz`` files into segments.
+
+    Files are appended in timestamp order so each session's segments read
+    chronologically. Unreadable files are left in place.
+
+    Args:
+        base_dir: Response directory with the legacy files
+        compress: Write compressed segments
+        remove: Delete each legacy file once it is in a segment
+        batch_size: Records per group commit
+        dry_run: Only count the files that would be migrated
+
+    Returns:
+        Counts of ``migrated``, ``failed`` and ``segments_created``
+    """
+    base_dir = Path(base_dir)
+    stats = {"migrated": 0, "failed": 0, "segments_created": 0}
+    if not base_dir.is_dir():
+        return stats
+
+    loaded: list[tuple[Path, dict[str, Any]]] = []
+    for path in [*base_dir.glob("*.json"), *base_dir.glob("*.json.gz")]:
+        try:
+            data = _load_legacy_file(path)
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Skipping unreadable response file {path}: {e}")
+            stats["failed"] += 1
+            continue
+        if not isinstance(data, dict):
+            stats["failed"] += 1
+            continue
+        loaded.append((path, data))
+
+    if dry_run:
+        stats["migrated"] = len(loaded)
+        return stats
+
+    loaded.sort(key=lambda item: _timestamp_seconds(item[1].get("timestamp")))
+    log = SegmentedResponseLog(base_dir, compress=compress)
+    for start in range(0, len(loaded), batch_size):
+        batch = loaded[start : start + batch_size]
+        log.append_batch(data for _, data in batch)
+        if remove:
+            for path, _ in batch:
+                path.unlink(missing_ok=True)
+        stats["migrated"] += len(batch)
+    stats["segments_created"] = log.stats["segments_created"]
+    log.close()
+    return stats
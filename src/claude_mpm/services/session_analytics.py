@@ -0,0 +1,468 @@
+"""Cross-session analytics over captured agent sessions.
+
+WHY: Each AgentSession is saved as its own document, and ``aggregate
+view/export`` only look at one session at a time. Questions such as "p95
+tool duration by agent over the last 30 days" or "delegations per project"
+needed every session file to be loaded and walked in Python.
+
+DESIGN DECISIONS:
+- Sessions are flattened into narrow SQLite tables (sessions, events,
+  tool_operations, delegations) stored next to the session files
+  (<save_dir>/analytics.db). Payloads are not copied; only the columns
+  worth grouping or aggregating on are kept
+- EventAggregator ingests each session when it is saved; ``backfill()``
+  adds sessions saved before the store existed. Ingest is idempotent
+  (a session's rows are replaced), so re-saving a session is safe
+- Every row carries its day (UTC, YYYY-MM-DD) for grouping and an indexed
+  epoch timestamp, so time-windowed queries only touch the relevant rows
+- Queries are compiled to a single SQL statement: grouping, sums, averages
+  and percentiles all run inside SQLite. Percentiles use the nearest-rank
+  method via window functions (no percentile() in stock SQLite)
+- Tool operations are rebuilt from PreToolUse/PostToolUse event pairs
+  (matched by correlation ID), so tools used outside a delegation count too
+- Group-by, filter and metric columns are validated against a whitelist
+  per table; nothing from the command line is interpolated unchecked
+
+pyarrow/Parquet would need the optional data-processing extra; SQLite is
+always available and handles millions of narrow rows comfortably.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from ..core.logger import get_logger
+from ..core.sqlite_pool import SQLiteConnectionPool
+from ..models.agent_session import AgentSession
+
+logger = get_logger("services.session_analytics")
+
+ANALYTICS_FILENAME = "analytics.db"
+
+# Query table name -> (SQL table, groupable columns, numeric columns)
+TABLES: dict[str, tuple[str, tuple[str, ...], tuple[str, ...]]] = {
+    "sessions": (
+        "sessions",
+        ("day", "project", "session_id"),
+        ("duration_ms", "total_events", "delegations", "tool_calls"),
+    ),
+    "events": (
+        "events",
+        ("day", "project", "session_id", "agent", "event_type", "category"),
+        (),
+    ),
+    "tools": (
+        "tool_operations",
+        ("day", "project", "session_id", "agent", "tool", "success"),
+        ("duration_ms",),
+    ),
+    "delegations": (
+        "delegations",
+        ("day", "project", "session_id", "agent", "success"),
+        ("duration_ms", "tool_calls", "files_changed"),
+    ),
+}
+
+_METRIC_RE = re.compile(r"^(count|sum|avg|min|max|p(\d{1,3}(?:\.\d+)?))(?::(\w+))?$")
+
+
+def parse_timestamp(value: str | None) -> float | None:
+    """Parse an event timestamp to epoch seconds (None if unparseable).
+
+    Accepts the formats AgentSession produces, including ``...+00:00Z``.
+    """
+    if not value:
+        return None
+    text = value.strip()
+    if text.endswith("Z"):
+        text = text[:-1]
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def _day(epoch: float | None) -> str | None:
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, UTC).strftime("%Y-%m-%d")
+
+
+def _duration_ms(start: float | None, end: float | None) -> int | None:
+    if start is None or end is None:
+        return None
+    return round((end - start) * 1000)
+
+
+@dataclass(frozen=True)
+class Metric:
+    """One aggregate column of a query, e.g. ``p95:duration_ms``."""
+
+    function: str
+    column: str | None = None
+    percentile: float | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "Metric":
+        match = _METRIC_RE.match(spec.strip())
+        if not match:
+            raise ValueError(
+                f"Invalid metric {spec!r}; use count, sum:<col>, avg:<col>, "
+                "min:<col>, max:<col> or p<N>:<col>"
+            )
+        function, pct, column = match.groups()
+        if function != "count" and column is None:
+            raise ValueError(
+                f"Metric {spec!r} needs a column, e.g. {function}:duration_ms"
+            )
+        if pct is not None:
+            percentile = float(pct)
+            if not 0 < percentile <= 100:
+                raise ValueError(f"Percentile out of range in {spec!r}")
+            return cls("percentile", column, percentile)
+        return cls(function, column)
+
+    @property
+    def label(self) -> str:
+        if self.function == "percentile":
+            return f"p{self.percentile:g}_{self.column}"
+        if self.column is None:
+            return self.function
+        return f"{self.function}_{self.column}"
+
+
+class SessionAnalyticsStore:
+    """Flattened, queryable copy of captured sessions."""
+
+    def __init__(self, db_path: Path | str):
+        """
+        Open (and create if needed) the analytics store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
+        self._initialize()
+
+    def _initialize(self) -> None:
+        with self._pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    project TEXT,
+                    ts REAL,
+                    day TEXT,
+                    duration_ms INTEGER,
+                    total_events INTEGER,
+                    delegations INTEGER,
+                    tool_calls INTEGER,
+                    ingested_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS events (
+                    session_id TEXT NOT NULL,
+                    project TEXT,
+                    ts REAL,
+                    day TEXT,
+                    agent TEXT,
+                    event_type TEXT,
+                    category TEXT
+                );
+                CREATE TABLE IF NOT EXISTS tool_operations (
+                    session_id TEXT NOT NULL,
+                    project TEXT,
+                    ts REAL,
+                    day TEXT,
+                    agent TEXT,
+                    tool TEXT,
+                    duration_ms INTEGER,
+                    success INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS delegations (
+                    session_id TEXT NOT NULL,
+                    project TEXT,
+                    ts REAL,
+                    day TEXT,
+                    agent TEXT,
+                    duration_ms INTEGER,
+                    success INTEGER,
+                    tool_calls INTEGER,
+                    files_changed INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_sessions_ts ON sessions(ts);
+                CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id);
+                CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+                CREATE INDEX IF NOT EXISTS idx_tools_session
+                    ON tool_operations(session_id);
+                CREATE INDEX IF NOT EXISTS idx_tools_ts ON tool_operations(ts);
+                CREATE INDEX IF NOT EXISTS idx_delegations_session
+                    ON delegations(session_id);
+                CREATE INDEX IF NOT EXISTS idx_delegations_ts ON delegations(ts);
+            """)
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def ingest(self, session: AgentSession) -> int:
+        """
+        Store (or replace) one session's rows.
+
+        Returns:
+            Number of event rows written
+        """
+        sid = session.session_id
+        project = session.project_root or session.working_directory or None
+
+        events = []
+        pre_tools: dict[str, tuple[float | None, str, str]] = {}
+        tool_rows = []
+        for event in session.events:
+            ts = parse_timestamp(event.timestamp)
+            agent = event.agent_context or "pm"
+            events.append(
+                (
+                    sid,
+                    project,
+                    ts,
+                    _day(ts),
+                    agent,
+                    event.event_type,
+                    event.category.value,
+                )
+            )
+            if event.event_type == "PreToolUse":
+                tool = event.data.get("tool_name", "unknown")
+                if event.correlation_id:
+                    pre_tools[event.correlation_id] = (ts, agent, tool)
+                else:
+                    tool_rows.append(
+                        (sid, project, ts, _day(ts), agent, tool, None, None)
+                    )
+            elif event.event_type == "PostToolUse" and event.correlation_id:
+                started = pre_tools.pop(event.correlation_id, None)
+                if started is None:
+                    continue
+                start_ts, agent, tool = started
+                tool_rows.append(
+                    (
+                        sid,
+                        project,
+                        start_ts,
+                        _day(start_ts),
+                        agent,
+                        tool,
+                        _duration_ms(start_ts, ts),
+                        int(bool(event.data.get("success", True))),
+                    )
+                )
+        # Tool calls that never completed
+        for start_ts, agent, tool in pre_tools.values():
+            tool_rows.append(
+                (sid, project, start_ts, _day(start_ts), agent, tool, None, None)
+            )
+
+        delegation_rows = []
+        for delegation in session.delegations:
+            start_ts = parse_timestamp(delegation.start_time)
+            duration = delegation.duration_ms
+            if duration is None:
+                duration = _duration_ms(start_ts, parse_timestamp(delegation.end_time))
+            delegation_rows.append(
+                (
+                    sid,
+                    project,
+                    start_ts,
+                    _day(start_ts),
+                    delegation.agent_type,
+                    duration,
+                    int(delegation.success),
+                    len(delegation.tool_operations),
+                    len(delegation.file_changes),
+                )
+            )
+
+        start_ts = parse_timestamp(session.start_time)
+        duration = session.metrics.session_duration_ms
+        if duration is None:
+            duration = _duration_ms(start_ts, parse_timestamp(session.end_time))
+
+        with self._pool.connection() as conn:
+            for table in ("events", "tool_operations", "delegations"):
+                conn.execute(f"DELETE FROM {table} WHERE session_id = ?", (sid,))
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, project, ts, day, "
+                "duration_ms, total_events, delegations, tool_calls, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    sid,
+                    project,
+                    start_ts,
+                    _day(start_ts),
+                    duration,
+                    len(session.events),
+                    len(session.delegations),
+                    len(tool_rows),
+                    time.time(),
+                ),
+            )
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", events)
+            conn.executemany(
+                "INSERT INTO tool_operations VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                tool_rows,
+            )
+            conn.executemany(
+                "INSERT INTO delegations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                delegation_rows,
+            )
+        return len(events)
+
+    def backfill(self, session_files: list[Path]) -> int:
+        """
+        Ingest saved session files (e.g. those saved before the store existed).
+
+        Returns:
+            Number of sessions ingested
+        """
+        ingested = 0
+        for path in session_files:
+            try:
+                self.ingest(AgentSession.load_from_file(str(path)))
+            except Exception as e:
+                logger.error(f"Error ingesting session file {path}: {e}")
+                continue
+            ingested += 1
+        return ingested
+
+    def session_ids(self) -> set[str]:
+        with self._pool.connection() as conn:
+            return {row[0] for row in conn.execute("SELECT session_id FROM sessions")}
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        table: str = "tools",
+        metrics: list[str] | None = None,
+        *,
+        group_by: list[str] | None = None,
+        since_days: float | None = None,
+        filters: dict[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate one table.
+
+        Args:
+            table: sessions, events, tools or delegations
+            metrics: Metric specs, e.g. ["count", "p95:duration_ms"]
+            group_by: Columns to group on, e.g. ["agent"]
+            since_days: Only rows from the last N days
+            filters: Exact-match column filters, e.g. {"tool": "Read"}
+            limit: Maximum number of result rows
+
+        Returns:
+            One dict per group, keyed by group columns and metric labels
+
+        Raises:
+            ValueError: Unknown table, column or metric
+        """
+        sql, params, labels = self._compile(
+            table, metrics or ["count"], group_by or [], since_days, filters or {}
+        )
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(zip(labels, row, strict=True)) for row in rows]
+
+    def _compile(
+        self,
+        table: str,
+        metric_specs: list[str],
+        group_by: list[str],
+        since_days: float | None,
+        filters: dict[str, str],
+    ) -> tuple[str, list[Any], list[str]]:
+        if table not in TABLES:
+            raise ValueError(
+                f"Unknown table {table!r}; choose from {', '.join(TABLES)}"
+            )
+        sql_table, groupable, numeric = TABLES[table]
+        for column in [*group_by, *filters]:
+            if column not in groupable:
+                raise ValueError(
+                    f"Cannot group or filter {table} by {column!r}; "
+                    f"choose from {', '.join(groupable)}"
+                )
+
+        metrics = [Metric.parse(spec) for spec in metric_specs]
+        for metric in metrics:
+            if metric.column is not None and metric.column not in numeric:
+                raise ValueError(
+                    f"Cannot aggregate {table} column {metric.column!r}; "
+                    f"choose from {', '.join(numeric) or 'count only'}"
+                )
+
+        where: list[str] = []
+        params: list[Any] = []
+        if since_days is not None:
+            where.append("ts >= ?")
+            params.append(time.time() - since_days * 86400)
+        for column, value in filters.items():
+            where.append(f"{column} = ?")
+            params.append(value)
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+
+        groups = ", ".join(group_by)
+        partition = f"PARTITION BY {groups}" if groups else ""
+        ranked_columns = sorted(
+            {m.column for m in metrics if m.function == "percentile"}
+        )
+
+        select = list(group_by)
+        for metric in metrics:
+            if metric.function == "count":
+                select.append("COUNT(*)")
+            elif metric.function == "percentile":
+                # Nearest rank: ceil(p/100 * n) among non-null values
+                col = metric.column
+                rank = f"(_n_{col} * {metric.percentile / 100!r})"
+                ceil = f"MAX(1, CAST({rank} AS INTEGER) + ({rank} > CAST({rank} AS INTEGER)))"
+                select.append(f"MAX(CASE WHEN _rn_{col} = {ceil} THEN {col} END)")
+            elif metric.function == "avg":
+                select.append(f"ROUND(AVG({metric.column}), 3)")
+            else:
+                select.append(f"{metric.function.upper()}({metric.column})")
+
+        source = sql_table
+        if ranked_columns:
+            windows = []
+            for col in ranked_columns:
+                null_split = (
+                    f"PARTITION BY {groups + ', ' if groups else ''}({col} IS NULL)"
+                )
+                windows.append(
+                    f"ROW_NUMBER() OVER ({null_split} ORDER BY {col}) AS _rn_{col}"
+                )
+                windows.append(f"COUNT({col}) OVER ({partition}) AS _n_{col}")
+            source = f"(SELECT *, {', '.join(windows)} FROM {sql_table}{where_sql})"
+            where_sql = ""
+
+        sql = f"SELECT {', '.join(select)} FROM {source}{where_sql}"
+        if groups:
+            sql += f" GROUP BY {groups} ORDER BY {groups}"
+        return sql, params, [*group_by, *(m.label for m in metrics)]
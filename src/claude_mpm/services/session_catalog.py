@@ -0,0 +1,246 @@
+"""Catalog of saved EventAggregator sessions.
+
+WHY: Listing sessions used to glob the activity directory, stat every file
+and fully parse each JSON document just to show a handful of summary
+fields, and loading a session by ID scanned filenames one by one. With
+months of captured sessions, ``aggregate sessions`` spent most of its time
+re-reading large documents whose summaries never change.
+
+DESIGN DECISIONS:
+- A small SQLite table (<save_dir>/catalog.db) holds one summary row per
+  session file: ID, time range, event/delegation counts, prompt preview,
+  size and whether the body is compressed. Listing and lookup are index
+  queries; session bodies are only read when a session is actually loaded
+- Rows are written when the aggregator saves a session. ``sync()`` picks
+  up files the catalog does not know about (older installs, files copied
+  in by hand) by comparing directory entries, so already-cataloged bodies
+  are never parsed again, and drops rows whose file was deleted
+- Session bodies are stored as compact gzip JSON (``.json.gz``); plain
+  ``.json`` files stay readable and ``migrate()`` converts them in place
+- The catalog is a cache: deleting catalog.db only costs one re-scan
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..core.logger import get_logger
+from ..core.sqlite_pool import SQLiteConnectionPool
+from ..models.agent_session import read_session_file
+
+logger = get_logger("services.session_catalog")
+
+CATALOG_FILENAME = "catalog.db"
+
+_SUMMARY_COLUMNS = (
+    "file, session_id, start_time, end_time, events, delegations, "
+    "initial_prompt, saved_at, size_bytes, compressed"
+)
+
+
+def _summarize(path: Path, data: dict[str, Any]) -> tuple:
+    stat = path.stat()
+    metrics = data.get("metrics") or {}
+    return (
+        path.name,
+        data.get("session_id") or "unknown",
+        data.get("start_time"),
+        data.get("end_time"),
+        metrics.get("total_events", 0),
+        metrics.get("total_delegations", 0),
+        (data.get("initial_prompt") or "")[:200],
+        stat.st_mtime,
+        stat.st_size,
+        int(path.suffix == ".gz"),
+    )
+
+
+class SessionCatalog:
+    """Indexed summaries of the session files in one directory."""
+
+    def __init__(self, save_dir: Path | str):
+        """
+        Open (and create if needed) the catalog for *save_dir*.
+
+        Args:
+            save_dir: Directory the aggregator saves session files to
+        """
+        self.save_dir = Path(save_dir)
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.save_dir / CATALOG_FILENAME)
+        self._initialize()
+
+    def _initialize(self) -> None:
+        with self._pool.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    file TEXT PRIMARY KEY,
+                    session_id TEXT NOT NULL,
+                    start_time TEXT,
+                    end_time TEXT,
+                    events INTEGER DEFAULT 0,
+                    delegations INTEGER DEFAULT 0,
+                    initial_prompt TEXT,
+                    saved_at REAL NOT NULL,
+                    size_bytes INTEGER DEFAULT 0,
+                    compressed INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_saved_at "
+                "ON sessions(saved_at DESC)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_session_id "
+                "ON sessions(session_id)"
+            )
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def record(self, path: Path | str, data: dict[str, Any] | None = None) -> None:
+        """
+        Add or replace the catalog row for a session file.
+
+        Args:
+            path: Saved session file (inside save_dir)
+            data: Session dict if already in memory; read from *path* otherwise
+        """
+        path = Path(path)
+        if data is None:
+            data = read_session_file(path)
+        with self._pool.connection() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO sessions ({_SUMMARY_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _summarize(path, data),
+            )
+
+    def sync(self) -> int:
+        """
+        Reconcile the catalog with the files on disk.
+
+        Only files without a catalog row are parsed.
+
+        Returns:
+            Number of rows added or removed
+        """
+        on_disk = {
+            entry.name
+            for entry in os.scandir(self.save_dir)
+            if entry.is_file() and self._is_session_file(entry.name)
+        }
+        with self._pool.connection() as conn:
+            known = {row[0] for row in conn.execute("SELECT file FROM sessions")}
+            missing = known - on_disk
+            conn.executemany(
+                "DELETE FROM sessions WHERE file = ?", [(name,) for name in missing]
+            )
+
+        added = 0
+        for name in sorted(on_disk - known):
+            try:
+                self.record(self.save_dir / name)
+                added += 1
+            except Exception as e:
+                logger.error(f"Error cataloging session file {name}: {e}")
+        return added + len(missing)
+
+    def migrate(self) -> dict[str, int]:
+        """
+        Compress plain ``.json`` session files to ``.json.gz``.
+
+        Each file's modification time is preserved so listing order does
+        not change; the original is removed once the compressed copy is
+        cataloged.
+
+        Returns:
+            Counts of migrated and failed files and bytes before/after
+        """
+        stats = {"migrated": 0, "failed": 0, "bytes_before": 0, "bytes_after": 0}
+        for source in sorted(self.save_dir.glob("session_*.json")):
+            target = source.with_name(source.name + ".gz")
+            try:
+                data = read_session_file(source)
+                stat = source.stat()
+                with gzip.open(target, "wt", encoding="utf-8") as dst:
+                    json.dump(data, dst, ensure_ascii=False, separators=(",", ":"))
+                os.utime(target, (stat.st_atime, stat.st_mtime))
+                self.record(target, data)
+                self._forget(source.name)
+                source.unlink()
+            except Exception as e:
+                logger.error(f"Failed to migrate {source.name}: {e}")
+                target.unlink(missing_ok=True)
+                stats["failed"] += 1
+                continue
+            stats["migrated"] += 1
+            stats["bytes_before"] += stat.st_size
+            stats["bytes_after"] += target.stat().st_size
+        return stats
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def _forget(self, name: str) -> None:
+        with self._pool.connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE file = ?", (name,))
+
+    @staticmethod
+    def _is_session_file(name: str) -> bool:
+        return name.startswith("session_") and name.endswith((".json", ".json.gz"))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Most recently saved sessions first."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM sessions "
+                "ORDER BY saved_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def find(self, session_id_prefix: str) -> Path | None:
+        """
+        Locate the file of the most recent session matching a prefix.
+
+        The prefix is matched against session IDs first, then (as the old
+        filename scan did) against file names.
+        """
+        pattern = self._escape_like(session_id_prefix)
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT file FROM sessions WHERE session_id LIKE ? ESCAPE '\\' "
+                "ORDER BY saved_at DESC LIMIT 1",
+                (f"{pattern}%",),
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    "SELECT file FROM sessions WHERE file LIKE ? ESCAPE '\\' "
+                    "ORDER BY saved_at DESC LIMIT 1",
+                    (f"%{pattern}%",),
+                ).fetchone()
+        return self.save_dir / row[0] if row else None
+
+    def files_by_session(self) -> dict[str, Path]:
+        """Most recent file of every cataloged session, keyed by session ID."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT session_id, file FROM sessions ORDER BY saved_at"
+            ).fetchall()
+        return {row[0]: self.save_dir / row[1] for row in rows}
+
+    def count(self) -> int:
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
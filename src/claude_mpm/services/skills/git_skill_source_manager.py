@@ -28,11 +28,26 @@ from claude_mpm.core.logging_config import get_logger
 from claude_mpm.services.agents.sources.git_source_sync_service import (
     GitSourceSyncService,
 )
+from claude_mpm.services.change_journal import record_source_sync
+from claude_mpm.services.skills.skill_catalog import (
+    CATALOG_FILENAME,
+    MergedSkillIndex,
+    SkillCatalog,
+)
 from claude_mpm.services.skills.skill_discovery_service import SkillDiscoveryService
 
 logger = get_logger(__name__)
 
 
+def _ignore_cache_metadata(directory: str, names: list[str]) -> set[str]:
+    """copytree filter dropping sync bookkeeping from deployed skills.
+
+    A skill whose SKILL.md sits at a source-cache root would otherwise carry
+    the source's catalog, ETag caches and other dotfiles into .claude/skills.
+    """
+    return {name for name in names if name.startswith(".") or name == CATALOG_FILENAME}
+
+
 def _get_github_token(source: SkillSource | None = None) -> str | None:
     """Get GitHub token with source-specific override support.
 
@@ -121,6 +136,8 @@ class GitSkillSourceManager:
         self.sync_service = sync_service  # Use injected if provided
         self.logger = get_logger(__name__)
         self._etag_cache_lock = Lock()  # Thread-safe ETag cache operations
+        # Priority-resolved view across sources (see skill_catalog.py)
+        self._skill_index = MergedSkillIndex(self.cache_dir)
 
         self.logger.info(
             f"GitSkillSourceManager initialized with cache: {self.cache_dir}"
@@ -257,7 +274,7 @@ class GitSkillSourceManager:
                 source, cache_path, force, progress_callback
             )
 
-            # Discover skills in cache
+            # Discover skills in cache (refreshes the source's skill catalog)
             self.logger.debug(f"Scanning cache path for skills: {cache_path}")
             discovery_service = SkillDiscoveryService(cache_path)
             discovered_skills = discovery_service.discover_skills()
@@ -273,6 +290,9 @@ class GitSkillSourceManager:
                     f"Successfully parsed {len(discovered_skills)} skills from {cache_path}"
                 )
 
+            # Let startup reconcile deployed skills only if the content changed
+            record_source_sync("skills", source_id, cache_path)
+
             # Build result
             result = {
                 "synced": True,
@@ -333,6 +353,11 @@ class GitSkillSourceManager:
             self.logger.warning("No enabled sources found")
             return []
 
+        # Serve the merged index while no source catalog has changed
+        fingerprint = self._skill_index_fingerprint(sources)
+        if self._skill_index.load(fingerprint):
+            return self._skill_index.skills()
+
         # Collect skills from all sources
         skills_by_source = {}
 
@@ -343,8 +368,12 @@ class GitSkillSourceManager:
                     self.logger.debug(f"Cache not found for source: {source.id}")
                     continue
 
-                discovery_service = SkillDiscoveryService(cache_path)
-                source_skills = discovery_service.discover_skills()
+                # Catalogs are refreshed on sync; only scan sources without one
+                catalog = SkillCatalog(cache_path)
+                if catalog.exists:
+                    source_skills = catalog.skills()
+                else:
+                    source_skills = SkillDiscoveryService(cache_path).discover_skills()
 
                 # Tag skills with source metadata
                 for skill in source_skills:
@@ -360,12 +389,41 @@ class GitSkillSourceManager:
         # Apply priority resolution
         resolved_skills = self._apply_priority_resolution(skills_by_source)
 
+        # Scanning may have just written catalogs; key the index on them
+        self._skill_index.store(self._skill_index_fingerprint(sources), resolved_skills)
+
         self.logger.info(
             f"Discovered {len(resolved_skills)} skills from {len(skills_by_source)} sources"
         )
 
         return resolved_skills
 
+    def get_skill(self, name: str) -> dict[str, Any] | None:
+        """Look up one resolved skill by name, skill ID or deployment name.
+
+        Uses the merged skill index, so after the first listing this is a
+        dictionary lookup rather than a scan of every source.
+
+        Args:
+            name: Skill name, skill_id or deployment_name
+
+        Returns:
+            Resolved skill dict (as in get_all_skills()) or None
+        """
+        sources = self.config.get_enabled_sources()
+        if not self._skill_index.load(self._skill_index_fingerprint(sources)):
+            self.get_all_skills()
+        return self._skill_index.get(name)
+
+    def _skill_index_fingerprint(self, sources: list[SkillSource]) -> list:
+        """Fingerprint of the enabled sources and their catalogs."""
+        return MergedSkillIndex.fingerprint(
+            [
+                (source.id, source.priority, self._get_source_cache_path(source))
+                for source in sources
+            ]
+        )
+
     def get_skills_by_source(self, source_id: str) -> list[dict[str, Any]]:
         """Get skills from a specific source.
 
@@ -1043,7 +1101,9 @@ class GitSkillSourceManager:
                         shutil.rmtree(target_skill_dir)
 
                 # Copy entire skill directory from cache
-                shutil.copytree(source_dir, target_skill_dir)
+                shutil.copytree(
+                    source_dir, target_skill_dir, ignore=_ignore_cache_metadata
+                )
 
                 # Track result
                 if was_existing:
@@ -1448,7 +1508,7 @@ class GitSkillSourceManager:
                     shutil.rmtree(target_skill_dir)
 
             # Copy entire skill directory with all resources
-            shutil.copytree(source_dir, target_skill_dir)
+            shutil.copytree(source_dir, target_skill_dir, ignore=_ignore_cache_metadata)
 
             self.logger.debug(
                 f"Deployed {deployment_name} from {source_dir} to {target_skill_dir}"
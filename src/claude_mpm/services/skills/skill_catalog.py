@@ -0,0 +1,246 @@
+"""Persistent skill catalogs for skill source caches.
+
+Every ``GitSkillSourceManager.get_all_skills()`` call (skills CLI,
+configurator, startup summary, doctor) used to run
+``SkillDiscoveryService.discover_skills()`` for each source, re-reading and
+YAML-parsing every SKILL.md and walking bundled resource directories, even
+though source caches only change when they are synced.
+
+Design Decision: Two levels of JSON catalogs next to the caches
+
+- ``SkillCatalog`` (``<source cache>/.skill-catalog.json``) maps each skill
+  file's path relative to the cache to its mtime, size, resource-directory
+  stamps and parsed skill dict. ``discover_skills()`` still lists the
+  directory, but only parses files whose stat changed, so a sync refreshes
+  the catalog incrementally.
+- ``MergedSkillIndex`` (``<cache root>/.skill-index.json``) stores the
+  priority-resolved skill list across sources, keyed by a fingerprint of
+  the enabled sources (id, priority) and their catalog files. While the
+  fingerprint matches, listing skills is a single JSON read and lookups by
+  name or skill ID are dictionary hits.
+
+Trade-offs:
+- Skill bodies are duplicated into the catalogs (a few hundred KB for large
+  sources) in exchange for not reparsing them
+- Files edited inside a cache by hand are picked up by the next
+  ``discover_skills()``/sync, not by reading the merged index
+- Both files are disposable; deleting them only costs one full scan
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from claude_mpm.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CATALOG_FILENAME = ".skill-catalog.json"
+INDEX_FILENAME = ".skill-index.json"
+CATALOG_VERSION = 1
+
+RESOURCE_DIRS = ("scripts", "references", "assets")
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable catalog {path}: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return None
+    return data
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning(f"Could not write skill catalog {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def file_stamp(path: Path) -> list[int] | None:
+    """``[mtime_ns, size]`` of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def resource_stamp(skill_file: Path) -> list[int]:
+    """Modification times of a skill's bundled resource directories.
+
+    Adding or removing resources changes the directory mtime, which is
+    enough to know the resource list must be rescanned.
+    """
+    stamps = []
+    for name in RESOURCE_DIRS:
+        try:
+            stamps.append(
+                (skill_file.parent / name / skill_file.stem).stat().st_mtime_ns
+            )
+        except OSError:
+            stamps.append(0)
+    return stamps
+
+
+class SkillCatalog:
+    """Parsed skill metadata of one skills directory, keyed by file."""
+
+    def __init__(self, skills_dir: Path):
+        """Load the catalog of *skills_dir* (empty if missing or outdated).
+
+        Args:
+            skills_dir: Directory scanned by SkillDiscoveryService
+        """
+        self.skills_dir = Path(skills_dir)
+        self.path = self.skills_dir / CATALOG_FILENAME
+        data = _read_json(self.path) or {}
+        self._entries: dict[str, dict[str, Any]] = data.get("files", {})
+        # Files of the current scan, in scan order
+        self._seen: dict[str, None] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def lookup(self, relative_path: str, skill_file: Path) -> tuple[bool, Any]:
+        """Return ``(True, skill)`` if the cached parse of *skill_file* is current.
+
+        ``skill`` is a fresh copy of the parsed dict, or None for files
+        that previously failed to parse.
+        """
+        self._seen[relative_path] = None
+        entry = self._entries.get(relative_path)
+        if (
+            entry is not None
+            and entry.get("stamp") == file_stamp(skill_file)
+            and entry.get("resources") == resource_stamp(skill_file)
+        ):
+            self.hits += 1
+            return True, copy.deepcopy(entry.get("skill"))
+        self.misses += 1
+        return False, None
+
+    def store(
+        self, relative_path: str, skill_file: Path, skill: dict[str, Any] | None
+    ) -> None:
+        """Record the parse result of *skill_file* (None if it is not a skill)."""
+        self._seen[relative_path] = None
+        self._entries[relative_path] = {
+            "stamp": file_stamp(skill_file),
+            "resources": resource_stamp(skill_file),
+            "skill": copy.deepcopy(skill),
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Drop entries for files not seen in this scan and persist changes.
+
+        Entries are kept in scan order so ``skills()`` resolves deployment
+        name collisions the same way ``discover_skills()`` does.
+        """
+        removed = set(self._entries) - set(self._seen)
+        reordered = list(self._entries) != [p for p in self._seen if p in self._entries]
+        self._entries = {
+            path: self._entries[path] for path in self._seen if path in self._entries
+        }
+        if removed or reordered or self._dirty or not self.exists:
+            _write_json(self.path, {"version": CATALOG_VERSION, "files": self._entries})
+            self._dirty = False
+
+    def skills(self) -> list[dict[str, Any]]:
+        """Parsed skills in scan order, as discover_skills() returns them."""
+        skills = []
+        deployment_names: set[str] = set()
+        for entry in self._entries.values():
+            skill = entry.get("skill")
+            if not skill or skill.get("deployment_name") in deployment_names:
+                continue
+            deployment_names.add(skill.get("deployment_name"))
+            skills.append(copy.deepcopy(skill))
+        return skills
+
+
+class MergedSkillIndex:
+    """Priority-resolved skills across sources with O(1) lookups."""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Args:
+            cache_dir: Root of the skill source caches
+        """
+        self.path = Path(cache_dir) / INDEX_FILENAME
+        self._fingerprint: list | None = None
+        self._skills: list[dict[str, Any]] = []
+        self._by_id: dict[str, int] = {}
+        self._by_name: dict[str, int] = {}
+
+    @staticmethod
+    def fingerprint(sources: list[tuple[str, int, Path]]) -> list:
+        """Identify the inputs of a merge: each source and its catalog stamp.
+
+        Args:
+            sources: ``(source_id, priority, cache_path)`` of enabled sources
+        """
+        return [
+            [source_id, priority, file_stamp(cache_path / CATALOG_FILENAME)]
+            for source_id, priority, cache_path in sources
+        ]
+
+    def load(self, fingerprint: list) -> bool:
+        """Use the stored index if it was built from *fingerprint*."""
+        if self._fingerprint == fingerprint:
+            return True
+        data = _read_json(self.path)
+        if data is None or data.get("fingerprint") != fingerprint:
+            return False
+        self._set(fingerprint, data.get("skills", []))
+        return True
+
+    def store(self, fingerprint: list, skills: list[dict[str, Any]]) -> None:
+        """Replace the index with freshly resolved *skills*."""
+        self._set(fingerprint, copy.deepcopy(skills))
+        if all(stamp is not None for _, _, stamp in fingerprint):
+            _write_json(
+                self.path,
+                {
+                    "version": CATALOG_VERSION,
+                    "fingerprint": fingerprint,
+                    "skills": self._skills,
+                },
+            )
+
+    def _set(self, fingerprint: list, skills: list[dict[str, Any]]) -> None:
+        self._fingerprint = fingerprint
+        self._skills = skills
+        self._by_id = {}
+        self._by_name = {}
+        for position, skill in enumerate(skills):
+            self._by_id.setdefault(skill.get("skill_id", ""), position)
+            self._by_name.setdefault(skill.get("name", ""), position)
+            self._by_name.setdefault(skill.get("deployment_name", ""), position)
+
+    def skills(self) -> list[dict[str, Any]]:
+        return copy.deepcopy(self._skills)
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Find a skill by name, skill ID or deployment name."""
+        position = self._by_name.get(name, self._by_id.get(name))
+        if position is None:
+            return None
+        return copy.deepcopy(self._skills[position])
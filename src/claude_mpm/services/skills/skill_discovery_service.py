@@ -42,6 +42,7 @@ from typing import Any
 import yaml
 
 from claude_mpm.core.logging_config import get_logger
+from claude_mpm.services.skills.skill_catalog import SkillCatalog
 
 logger = get_logger(__name__)
 
@@ -101,13 +102,16 @@ class SkillDiscoveryService:
         ...     print(f"{skill['name']}: {skill['description']}")
     """
 
-    def __init__(self, skills_dir: Path):
+    def __init__(self, skills_dir: Path, use_catalog: bool = True):
         """Initialize skill discovery service.
 
         Args:
             skills_dir: Directory containing skill files
+            use_catalog: Reuse parse results of unchanged files from the
+                directory's skill catalog (see skill_catalog.py)
         """
         self.skills_dir = skills_dir
+        self.use_catalog = use_catalog
         self.logger = get_logger(__name__)
 
     def discover_skills(self) -> list[dict[str, Any]]:
@@ -129,6 +133,8 @@ class SkillDiscoveryService:
             debugging-systematic-debugging/SKILL.md
 
         Skips files that can't be parsed or are missing required fields.
+        Files whose mtime, size and resource directories are unchanged since
+        the last scan are served from the skill catalog instead of reparsed.
 
         Returns:
             List of skill dictionaries:
@@ -199,6 +205,7 @@ class SkillDiscoveryService:
 
         # Track deployment names to detect collisions
         deployment_names = {}
+        catalog = SkillCatalog(self.skills_dir) if self.use_catalog else None
 
         for skill_file in all_skill_files:
             try:
@@ -215,14 +222,22 @@ class SkillDiscoveryService:
                     )
                     continue
 
-                skill_dict = self._parse_skill_file(skill_file)
-                if skill_dict:
-                    # Add deployment metadata
-                    skill_dict["deployment_name"] = deployment_name
-                    skill_dict["relative_path"] = str(
-                        skill_file.relative_to(self.skills_dir)
-                    )
+                relative_path = str(skill_file.relative_to(self.skills_dir))
+                cached, skill_dict = (
+                    catalog.lookup(relative_path, skill_file)
+                    if catalog
+                    else (False, None)
+                )
+                if not cached:
+                    skill_dict = self._parse_skill_file(skill_file)
+                    if skill_dict:
+                        # Add deployment metadata
+                        skill_dict["deployment_name"] = deployment_name
+                        skill_dict["relative_path"] = relative_path
+                    if catalog:
+                        catalog.store(relative_path, skill_file, skill_dict)
 
+                if skill_dict:
                     skills.append(skill_dict)
                     deployment_names[deployment_name] = skill_file
                     self.logger.debug(
@@ -235,6 +250,13 @@ class SkillDiscoveryService:
             except Exception as e:
                 self.logger.warning(f"Failed to parse skill {skill_file}: {e}")
 
+        if catalog:
+            catalog.save()
+            self.logger.debug(
+                f"Skill catalog {self.skills_dir.name}: {catalog.hits} unchanged, "
+                f"{catalog.misses} parsed"
+            )
+
         # Summary logging
         parsed_count = len(skills)
         failed_count = len(all_skill_files) - parsed_count
@@ -280,6 +280,16 @@ class ConnectionEventHandler(BaseEventHandler):
             context for what's happening in the session.
             """
             self.clients.add(sid)
+
+            # Register for live events before any await, so a failed or slow
+            # welcome cannot leave the client unregistered and nothing
+            # published meanwhile is missed. History covers up to this point.
+            history_sequence = None
+            fanout = getattr(self.server, "fanout", None)
+            if fanout is not None:
+                history_sequence = fanout.event_log.last_sequence
+                fanout.add_client(sid, history_sequence)
+
             client_addr = environ.get("REMOTE_ADDR", "unknown")
             user_agent = environ.get("HTTP_USER_AGENT", "unknown")
             self.logger.info(f"🔗 NEW CLIENT CONNECTED: {sid} from {client_addr}")
@@ -343,7 +353,9 @@ class ConnectionEventHandler(BaseEventHandler):
                 )
 
                 # Automatically send the last 50 events to new clients
-                await self._send_event_history(sid, limit=50)
+                await self._send_event_history(
+                    sid, limit=50, max_sequence=history_sequence
+                )
 
                 self.logger.debug(
                     f"✅ Sent welcome messages and event history to client {sid}"
@@ -366,6 +378,10 @@ class ConnectionEventHandler(BaseEventHandler):
             else:
                 self.logger.warning(f"⚠️  Attempted to disconnect unknown client: {sid}")
 
+            fanout = getattr(self.server, "fanout", None)
+            if fanout is not None:
+                fanout.remove_client(sid)
+
             # Clean up health tracking
             if sid in self.last_ping_times:
                 del self.last_ping_times[sid]
@@ -429,9 +445,16 @@ class ConnectionEventHandler(BaseEventHandler):
             """Handle subscription request.
 
             WHY: Allows clients to subscribe to specific event channels
-            for filtered event streaming.
+            for filtered event streaming. Channels are Socket.IO event names
+            (``tool_event``) or event types (``hook``); ``session_id``
+            limits events to one Claude session. The filter is applied
+            server-side by the client's fan-out cursor.
             """
             channels = data.get("channels", ["*"]) if data else ["*"]
+            session_id = data.get("session_id") if data else None
+            fanout = getattr(self.server, "fanout", None)
+            if fanout is not None:
+                fanout.subscribe(sid, channels, session_id)
             await self.emit_to_client(
                 sid,
                 "subscribed",
@@ -440,7 +463,7 @@ class ConnectionEventHandler(BaseEventHandler):
                     "subtype": "subscribed",
                     "timestamp": datetime.now(UTC).isoformat() + "Z",
                     "source": "server",
-                    "data": {"channels": channels},
+                    "data": {"channels": channels, "session_id": session_id},
                 },
             )
 
@@ -588,7 +611,11 @@ class ConnectionEventHandler(BaseEventHandler):
         return normalized
 
     async def _send_event_history(
-        self, sid: str, event_types: list[str] | None = None, limit: int = 50
+        self,
+        sid: str,
+        event_types: list[str] | None = None,
+        limit: int = 50,
+        max_sequence: int | None = None,
     ):
         """Send event history to a specific client.
 
@@ -600,6 +627,8 @@ class ConnectionEventHandler(BaseEventHandler):
             sid: Socket.IO session ID of the client
             event_types: Optional list of event types to filter by
             limit: Maximum number of events to send (default: 50)
+            max_sequence: Skip logged events newer than this sequence (the
+                client already receives them live)
         """
         try:
             if not self.event_history:
@@ -612,6 +641,8 @@ class ConnectionEventHandler(BaseEventHandler):
             # Get the most recent events, filtered by type if specified
             history = []
             for event in reversed(self.event_history):
+                if max_sequence is not None and event.get("sequence", 0) > max_sequence:
+                    continue
                 if not event_types or event.get("type") in event_types:
                     history.append(event)
                     if len(history) >= limit:
@@ -7,6 +7,9 @@ clients for various Claude MPM activities.
 
 DESIGN DECISION: Separated broadcasting logic from core server management
 to create focused, testable modules with single responsibilities.
+Broadcasting is fire-and-forget: events are published to the shared event
+log and delivered to each client by ``EventFanout``, so producer threads
+never wait for clients.
 """
 
 import asyncio
@@ -17,6 +20,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ..event_normalizer import EventNormalizer
+from .fanout import EventFanout
 
 
 @dataclass
@@ -171,6 +175,8 @@ class SocketIOEventBroadcaster:
         logger,
         server=None,  # Add server reference for event history access
         connection_manager=None,  # Add connection manager for robust delivery
+        *,
+        fanout: EventFanout | None = None,
     ):
         """Initialise the broadcaster with shared server state and optional collaborators.
 
@@ -180,6 +186,8 @@ class SocketIOEventBroadcaster:
         WHAT: Stores all injected dependencies; sets loop to None (assigned later by
         server); creates a RetryQueue(1000) for resilient delivery; creates an
         EventNormalizer for consistent event schema; sets retry_interval to 2.0 s.
+        Without a fanout, events are appended to event_buffer and emitted to
+        all clients at once.
         TEST: Construct with mock sio and empty sets; assert retry_queue is not None,
         normalizer is not None, and loop is None.
         """
@@ -192,6 +200,7 @@ class SocketIOEventBroadcaster:
         self.loop = None  # Will be set by main server
         self.server = server  # Reference to main server for event history
         self.connection_manager = connection_manager  # For connection tracking
+        self.fanout = fanout  # Per-client delivery from the shared event log
 
         # Initialize retry queue for resilient delivery
         self.retry_queue = RetryQueue(max_size=1000)
@@ -405,11 +414,11 @@ class SocketIOEventBroadcaster:
     def broadcast_event(
         self, event_type: str, data: dict[str, Any], skip_sid: str | None = None
     ):
-        """Broadcast an event to all connected clients with retry support.
+        """Broadcast an event to all connected clients.
 
-        WHY: Enhanced with retry queue to ensure reliable delivery
-        even during transient network issues. Now uses EventNormalizer
-        to ensure consistent event schema and ConnectionManager for tracking.
+        WHY: Uses EventNormalizer to ensure consistent event schema. Safe to
+        call from any thread; returns as soon as the event is published and
+        never waits for clients to receive it.
         """
         if not self.sio:
             return
@@ -431,102 +440,42 @@ class SocketIOEventBroadcaster:
             if sid:
                 event["session_id"] = sid
 
-        # Buffer the event for reliability AND add to event history for new clients
-        with self.buffer_lock:
-            self.event_buffer.append(event)
-            self.stats["events_buffered"] += 1
-
-            # Also add to event history if available (for client replay)
-            # Access through server reference to maintain single history source
-            if hasattr(self, "server") and hasattr(self.server, "event_history"):
-                self.server.event_history.append(event)
-                self.logger.debug(
-                    f"Added {event['type']}/{event['subtype']} to history (total: {len(self.server.event_history)})"
-                )
-
-        # If we have a connection manager, buffer event for all connected clients
-        if self.connection_manager and self.loop:
-            # Buffer for each connected client asynchronously
-            async def buffer_for_clients():
-                """Buffer the normalised event for every currently connected client.
-
-                WHY: Persistent buffering per client allows late-joining or reconnecting
-                clients to replay missed events without re-broadcasting to all clients.
-                WHAT: Iterates a snapshot of connected_clients and awaits
-                connection_manager.buffer_event for each SID.
-                TEST: Attach two mock SIDs; trigger buffer_for_clients; assert
-                buffer_event was called once per SID with the correct event dict.
-                """
-                for sid in list(self.connected_clients):
-                    await self.connection_manager.buffer_event(sid, event)
+        self.publish(event, skip_sid=skip_sid)
+        self.logger.debug(f"Published event: {event_type}")
 
-            try:
-                asyncio.run_coroutine_threadsafe(buffer_for_clients(), self.loop)
-            except Exception as e:
-                self.logger.warning(f"Failed to buffer event for clients: {e}")
+    def publish(
+        self,
+        event: dict[str, Any],
+        socket_event: str | None = None,
+        skip_sid: str | None = None,
+    ) -> None:
+        """Publish an already normalized event to all subscribed clients.
 
-        # Broadcast to all connected clients
-        broadcast_success = False
-        try:
-            # Use run_coroutine_threadsafe to safely call from any thread
-            if hasattr(self, "loop") and self.loop and not self.loop.is_closed():
-                # Categorize event for proper client-side routing
-                socket_event_type = self._categorize_event(event.get("subtype", ""))
-
-                # Create broadcast coroutine
-                if skip_sid:
-                    coro = self.sio.emit(socket_event_type, event, skip_sid=skip_sid)
-                else:
-                    coro = self.sio.emit(socket_event_type, event)
+        Args:
+            event: Normalized event dict
+            socket_event: Socket.IO event name (default: categorized by subtype)
+            skip_sid: Client that should not receive the event
+        """
+        socket_event = socket_event or self._categorize_event(event.get("subtype", ""))
+        self.stats["events_buffered"] = self.stats.get("events_buffered", 0) + 1
 
-                future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        if self.fanout is not None:
+            self.fanout.publish(event, socket_event, skip_sid)
+            return
 
-                # Wait briefly to see if broadcast succeeds
-                try:
-                    future.result(timeout=0.5)  # 500ms timeout
-                    broadcast_success = True
-                    self.stats["events_sent"] += 1
-
-                    # Update activity for all connected clients
-                    if self.connection_manager:
-
-                        async def update_activities():
-                            for sid in list(self.connected_clients):
-                                await self.connection_manager.update_activity(
-                                    sid, "event"
-                                )
-
-                        try:
-                            asyncio.run_coroutine_threadsafe(
-                                update_activities(), self.loop
-                            )
-                        except Exception:
-                            pass  # nosec B110 - non-critical activity update
-
-                    self.logger.debug(f"Broadcasted event: {event_type}")
-                except Exception:
-                    pass  # nosec B110 - will be added to retry queue below
-            else:
-                self.logger.warning(
-                    f"Cannot broadcast {event_type}: server loop not available"
+        # Without per-client fan-out: record and emit to everyone
+        with self.buffer_lock:
+            self.event_buffer.append(event)
+        if self.loop and not self.loop.is_closed():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.sio.emit(socket_event, event, skip_sid=skip_sid), self.loop
                 )
-
-        except Exception as e:
-            self.logger.error(f"Failed to broadcast event {event_type}: {e}")
-
-        # Add to retry queue if broadcast failed
-        if not broadcast_success and self.loop:
-            retryable_event = RetryableEvent(
-                event_type=event_type, data=data, skip_sid=skip_sid
-            )
-
-            # Queue for retry
-            asyncio.run_coroutine_threadsafe(
-                self.retry_queue.add(retryable_event), self.loop
-            )
-
+            except Exception as e:
+                self.logger.error(f"Failed to broadcast event {socket_event}: {e}")
+        else:
             self.logger.warning(
-                f"⚠️ Queued {event_type} for retry (queue size: {len(self.retry_queue.queue)})"
+                f"Cannot broadcast {socket_event}: server loop not available"
             )
 
     def session_started(self, session_id: str, launch_method: str, working_dir: str):
@@ -2,17 +2,18 @@
 Enhanced Connection Manager for SocketIO Server.
 
 WHY: This module provides robust connection management with state tracking,
-health monitoring, event buffering for disconnected clients, and automatic
+health monitoring, event replay for reconnecting clients, and automatic
 recovery from connection failures.
 
 DESIGN DECISION: Centralized connection management ensures consistent handling
 of client states, proper event delivery, and automatic recovery mechanisms.
+Replayed events come from the server's shared ``EventLog``, addressed by
+sequence number, instead of a copy of every event per client.
 """
 
 import asyncio
 import contextlib
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -20,6 +21,7 @@ from typing import Any
 from uuid import uuid4
 
 from ....core.logging_config import get_logger
+from .event_log import EventLog
 
 
 class ConnectionState(Enum):
@@ -62,9 +64,6 @@ class ClientConnection:
     last_ping: float | None = None
     last_pong: float | None = None
     last_event: float | None = None
-    event_buffer: deque[dict[str, Any]] = field(
-        default_factory=lambda: deque(maxlen=1000)
-    )
     event_sequence: int = 0
     last_acked_sequence: int = 0
     pending_acks: dict[int, dict[str, Any]] = field(default_factory=dict)
@@ -142,7 +141,7 @@ class ConnectionManager:
 
     Features:
     - Persistent client IDs across reconnections
-    - Event buffering for disconnected clients
+    - Replay from the shared event log for reconnecting clients
     - Sequence numbers for event ordering
     - Health monitoring with automatic stale detection
     - Connection quality metrics
@@ -150,14 +149,18 @@ class ConnectionManager:
     """
 
     def __init__(
-        self, max_buffer_size: int | None = None, event_ttl: int | None = None
+        self,
+        max_buffer_size: int | None = None,
+        event_ttl: int | None = None,
+        event_log: EventLog | None = None,
     ):
         """
         Initialize connection manager with centralized configuration.
 
         Args:
-            max_buffer_size: Maximum events to buffer per client (uses config if None)
-            event_ttl: Time-to-live for buffered events in seconds (uses config if None)
+            max_buffer_size: Maximum events kept for replay (uses config if None)
+            event_ttl: Time-to-live for replayed events in seconds (uses config if None)
+            event_log: Shared event log replay reads from (a private log if None)
         """
         from ....config.socketio_config import CONNECTION_CONFIG
 
@@ -168,7 +171,9 @@ class ConnectionManager:
         # Use centralized configuration with optional overrides
         self.max_buffer_size = max_buffer_size or CONNECTION_CONFIG["max_events_buffer"]
         self.event_ttl = event_ttl or CONNECTION_CONFIG["event_ttl"]
-        self.global_sequence = 0
+        self.event_log = (
+            event_log if event_log is not None else EventLog(self.max_buffer_size)
+        )
         self.health_check_interval = CONNECTION_CONFIG[
             "health_check_interval"
         ]  # 30 seconds
@@ -209,7 +214,6 @@ class ConnectionManager:
                                 client_id=client_id,
                                 state=ConnectionState.CONNECTED,
                                 connected_at=now,
-                                event_buffer=old_conn.event_buffer,
                                 event_sequence=old_conn.event_sequence,
                                 last_acked_sequence=old_conn.last_acked_sequence,
                                 metrics=old_conn.metrics,
@@ -228,7 +232,7 @@ class ConnectionManager:
 
                             self.logger.info(
                                 f"Client {client_id} reconnected (new sid: {sid}, "
-                                f"buffered events: {len(conn.event_buffer)})"
+                                f"last acked sequence: {conn.last_acked_sequence})"
                             )
                         else:
                             # No old connection found, create new
@@ -308,45 +312,12 @@ class ConnectionManager:
 
             self.logger.info(
                 f"Client {conn.client_id} disconnected (sid: {sid}, reason: {reason}, "
-                f"buffered events: {len(conn.event_buffer)})"
+                f"last acked sequence: {conn.last_acked_sequence})"
             )
 
             # Keep connection for potential reconnection
             # It will be cleaned up by health check if not reconnected
 
-    async def buffer_event(self, sid: str, event: dict[str, Any]) -> bool:
-        """
-        Buffer an event for a client.
-
-        Args:
-            sid: Socket ID
-            event: Event to buffer
-
-        Returns:
-            True if buffered successfully
-        """
-        async with self._lock:
-            if sid not in self.connections:
-                return False
-
-            conn = self.connections[sid]
-
-            # Add sequence number
-            self.global_sequence += 1
-            event["sequence"] = self.global_sequence
-            event["timestamp"] = time.time()
-
-            # Buffer the event
-            conn.event_buffer.append(event)
-            conn.event_sequence = self.global_sequence
-            conn.metrics.events_buffered += 1
-
-            # Drop old events if buffer is full
-            if len(conn.event_buffer) >= self.max_buffer_size:
-                conn.metrics.events_dropped += 1
-
-            return True
-
     async def get_replay_events(
         self, sid: str, last_sequence: int = 0
     ) -> list[dict[str, Any]]:
@@ -365,16 +336,11 @@ class ConnectionManager:
                 return []
 
             conn = self.connections[sid]
-            now = time.time()
 
-            # Filter events by sequence and TTL
-            replay_events = []
-            for event in conn.event_buffer:
-                if event.get("sequence", 0) > last_sequence:
-                    # Check TTL
-                    event_age = now - event.get("timestamp", 0)
-                    if event_age < self.event_ttl:
-                        replay_events.append(event)
+            # Every event after the client's last sequence, within the TTL
+            replay_events = self.event_log.events_after(
+                last_sequence, max_age=self.event_ttl
+            )
 
             self.logger.info(
                 f"Replaying {len(replay_events)} events for {conn.client_id} "
@@ -575,5 +541,5 @@ class ConnectionManager:
             "total_events_buffered": total_events_buffered,
             "total_events_dropped": total_events_dropped,
             "average_quality": avg_quality,
-            "global_sequence": self.global_sequence,
+            "global_sequence": self.event_log.last_sequence,
         }
@@ -492,53 +492,16 @@ class SocketIOServerCore:
                         and hasattr(self.main_server, "broadcaster")
                         and self.main_server.broadcaster
                     ):
-                        # The broadcaster expects raw event data and will normalize it
-                        # Since we already normalized it, we need to pass it in a way that won't double-normalize
-                        # We'll emit directly through the broadcaster's sio with proper handling
-
-                        # Add to event buffer and history
-                        with self.buffer_lock:
-                            self.event_buffer.append(event_data)
-                            self.stats["events_buffered"] = len(self.event_buffer)
-
-                        # Add to main server's event history UNCONDITIONALLY
-                        # WHY: event_history is always initialized in SocketIOServer.__init__
-                        # This ensures events persist for new clients who connect later
-                        if self.main_server and hasattr(
-                            self.main_server, "event_history"
-                        ):
-                            self.main_server.event_history.append(event_data)
-                            self.logger.debug(
-                                f"Added to history (total: {len(self.main_server.event_history)})"
-                            )
-                        else:
-                            # CRITICAL: Log warning if event_history is not available
-                            # This indicates a configuration or initialization problem
-                            self.logger.warning(
-                                "event_history not initialized on main_server! "
-                                "Events will not persist for new clients."
-                            )
-
-                        # Use the broadcaster's sio to emit (it's the same as self.sio)
-                        # This ensures the event goes through the proper channels
-                        # Categorize event so client receives correct event type
-                        event_type = self._categorize_event(
-                            event_data.get("subtype", "unknown")
+                        # Already normalized: publish to the shared event log,
+                        # which keeps it for new clients and fans it out to each
+                        # subscribed client without waiting for delivery
+                        self.main_server.broadcaster.publish(event_data)
+                        self.stats["events_buffered"] = len(
+                            self.main_server.event_history
                         )
-                        await self.sio.emit(event_type, event_data)
-
-                        # Update broadcaster stats
-                        if hasattr(self.main_server.broadcaster, "stats"):
-                            self.main_server.broadcaster.stats["events_sent"] = (
-                                self.main_server.broadcaster.stats.get("events_sent", 0)
-                                + 1
-                            )
 
                         self.logger.info(
-                            f"✅ Event broadcasted: {event_data.get('subtype', 'unknown')} to {len(self.connected_clients)} clients"
-                        )
-                        self.logger.debug(
-                            f"Connected client IDs: {list(self.connected_clients) if self.connected_clients else 'None'}"
+                            f"✅ Event published: {event_data.get('subtype', 'unknown')} to {len(self.connected_clients)} clients"
                         )
                     else:
                         # Fallback: Direct emit if broadcaster not available (shouldn't happen)
@@ -1185,18 +1148,19 @@ class SocketIOServerCore:
                     },
                 }
 
-                # Add to event history UNCONDITIONALLY
-                # WHY: Heartbeat events should persist for new clients too
-                if self.main_server and hasattr(self.main_server, "event_history"):
-                    self.main_server.event_history.append(heartbeat_data)
-                    self.logger.debug(
-                        f"Heartbeat added to history (total: {len(self.main_server.event_history)})"
-                    )
+                # Publish through the broadcaster so the heartbeat is kept for
+                # new clients and honors client subscriptions
+                broadcaster = getattr(self.main_server, "broadcaster", None)
+                if broadcaster:
+                    broadcaster.publish(heartbeat_data, "system_event")
                 else:
-                    self.logger.warning("event_history not initialized for heartbeat!")
-
-                # Emit heartbeat to all connected clients (already using new schema)
-                await self.sio.emit("system_event", heartbeat_data)
+                    if self.main_server and hasattr(self.main_server, "event_history"):
+                        self.main_server.event_history.append(heartbeat_data)
+                    else:
+                        self.logger.warning(
+                            "event_history not initialized for heartbeat!"
+                        )
+                    await self.sio.emit("system_event", heartbeat_data)
 
                 self.logger.info(
                     f"System heartbeat sent - clients: {len(self.connected_clients)}, "
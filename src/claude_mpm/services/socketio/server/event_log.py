@@ -0,0 +1,124 @@
+"""
+Shared event log for the SocketIO server.
+
+WHY: Every broadcast used to be copied into the broadcaster's event buffer,
+the server's event history and each client's connection buffer. One
+append-only log, read through per-client cursors, replaces those copies.
+
+DESIGN DECISIONS:
+- Each entry gets a monotonically increasing sequence number, which is also
+  written into the event as ``"sequence"``. Cursors, replay after
+  reconnection and acknowledgements all refer to it.
+- The log is bounded (``maxlen``); a cursor that falls behind the oldest
+  retained entry has lost the events in between.
+- Entries without a Socket.IO event name are history only: new clients see
+  them in their initial history, but they are not fanned out.
+- ``append``, ``len``, iteration and ``reversed`` behave like the deque the
+  log replaces, so handlers reading ``server.event_history`` are unchanged.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any, NamedTuple
+
+from ....core.constants import SystemLimits
+
+
+class LogEntry(NamedTuple):
+    """One event in the shared log."""
+
+    sequence: int
+    event: dict[str, Any]
+    name: str | None  # Socket.IO event name, None for history-only entries
+    skip_sid: str | None
+    logged_at: float
+
+
+class EventLog:
+    """Thread-safe, bounded, append-only event log with sequence numbers."""
+
+    def __init__(self, maxlen: int = SystemLimits.MAX_EVENTS_BUFFER):
+        """
+        Args:
+            maxlen: Number of most recent events retained
+        """
+        self._entries: deque[LogEntry] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self.last_sequence = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._entries.maxlen
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence of the oldest retained entry (``last_sequence + 1`` if empty)."""
+        with self._lock:
+            if self._entries:
+                return self._entries[0].sequence
+            return self.last_sequence + 1
+
+    def publish(
+        self,
+        event: dict[str, Any],
+        name: str | None,
+        skip_sid: str | None = None,
+    ) -> int:
+        """Append an event to be delivered to clients as *name*.
+
+        Returns:
+            The event's sequence number
+        """
+        with self._lock:
+            self.last_sequence += 1
+            event["sequence"] = self.last_sequence
+            self._entries.append(
+                LogEntry(self.last_sequence, event, name, skip_sid, time.time())
+            )
+            return self.last_sequence
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Record a history-only event (deque compatible)."""
+        self.publish(event, None)
+
+    def read_after(self, sequence: int, limit: int | None = None) -> list[LogEntry]:
+        """Entries with a sequence number greater than *sequence*, oldest first.
+
+        Args:
+            sequence: Cursor position (last sequence already read)
+            limit: Maximum number of entries returned
+        """
+        with self._lock:
+            if not self._entries:
+                return []
+            start = max(0, sequence - self._entries[0].sequence + 1)
+            stop = None if limit is None else start + limit
+            return list(islice(self._entries, start, stop))
+
+    def events_after(self, sequence: int, max_age: float | None = None) -> list[dict]:
+        """Events after *sequence*, optionally only those logged within *max_age* seconds."""
+        entries = self.read_after(sequence)
+        if max_age is not None:
+            cutoff = time.time() - max_age
+            entries = [entry for entry in entries if entry.logged_at >= cutoff]
+        return [entry.event for entry in entries]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [entry.event for entry in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._snapshot())
+
+    def __reversed__(self) -> Iterator[dict[str, Any]]:
+        return reversed(self._snapshot())
@@ -0,0 +1,282 @@
+"""
+Per-client event fan-out for the SocketIO server.
+
+WHY: ``broadcast_event`` blocked the producing thread (hook handlers, the
+EventBus relay) for up to 500 ms waiting for a single emit to all clients,
+so one slow dashboard tab slowed every producer. Channel subscriptions were
+acknowledged but never applied.
+
+DESIGN DECISIONS:
+- Producers publish into the shared ``EventLog`` and schedule a wake-up on
+  the server loop. They never wait for delivery. A burst of events from one
+  thread results in a single ``call_soon_threadsafe``.
+- Each client has a cursor into the log and its own drain task, which emits
+  to that client only. A slow client delays only its own task.
+- A client further behind than ``max_lag`` events has its backlog reduced
+  by the backpressure policy. ``"coalesce"`` keeps only the newest state
+  event of each kind (heartbeat, status, todo list), then drops the oldest
+  remainder. ``"drop"`` drops the oldest events directly.
+- A failed emit leaves the event pending and retries the client after
+  ``retry_delay``. Fanned-out events no longer need the retry queue.
+- Subscriptions (channels and a session) are applied where the cursor is
+  read. Socket.IO rooms are not used for this: a room emit would bypass the
+  client's cursor and with it the backpressure.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from ....core.logging_config import get_logger
+from .event_log import EventLog, LogEntry
+
+BACKPRESSURE_POLICIES = ("coalesce", "drop")
+
+# (type, subtype) of events where only the newest one matters
+COALESCE_KEYS = frozenset(
+    {
+        ("system", "heartbeat"),
+        ("system", "status"),
+        ("claude", "status"),
+        ("todo", "updated"),
+    }
+)
+
+
+@dataclass
+class ClientCursor:
+    """A client's read position in the shared log and its subscription."""
+
+    sid: str
+    sequence: int  # Last log sequence read
+    channels: frozenset[str] = frozenset({"*"})
+    session_id: str | None = None
+    pending: deque[LogEntry] = field(default_factory=deque)
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def wants(self, entry: LogEntry) -> bool:
+        """Whether *entry* matches this client's subscription.
+
+        A channel matches the Socket.IO event name (``tool_event``) or the
+        event type (``hook``). Events without a session id pass the session
+        filter.
+        """
+        if entry.name is None or entry.skip_sid == self.sid:
+            return False
+        if (
+            "*" not in self.channels
+            and entry.name not in self.channels
+            and entry.event.get("type") not in self.channels
+        ):
+            return False
+        if self.session_id is not None:
+            session_id = entry.event.get("session_id")
+            if session_id is not None and session_id != self.session_id:
+                return False
+        return True
+
+
+def _coalesce_key(entry: LogEntry) -> tuple[Any, Any]:
+    return entry.event.get("type"), entry.event.get("subtype")
+
+
+class EventFanout:
+    """Delivers events from the shared log to each client at its own pace."""
+
+    def __init__(
+        self,
+        event_log: EventLog,
+        *,
+        max_lag: int | None = None,
+        policy: str | None = None,
+        batch_size: int = 100,
+        retry_delay: float = 1.0,
+        stats: dict[str, Any] | None = None,
+    ):
+        """
+        Args:
+            event_log: Shared log events are published to
+            max_lag: Events a client may fall behind before backpressure
+                applies (uses config if None)
+            policy: ``"coalesce"`` or ``"drop"`` (uses config if None)
+            batch_size: Entries read from the log at a time
+            retry_delay: Seconds before retrying a client after a failed emit
+            stats: Server stats dict; ``events_sent`` is incremented per emit
+        """
+        from ....config.socketio_config import CONNECTION_CONFIG
+
+        self.logger = get_logger(__name__)
+        self.event_log = event_log
+        self.max_lag = max_lag or CONNECTION_CONFIG["max_client_lag"]
+        self.policy = policy or CONNECTION_CONFIG["backpressure_policy"]
+        if self.policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {self.policy}")
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+        self.stats = stats if stats is not None else {}
+
+        self.sio = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.clients: dict[str, ClientCursor] = {}
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+
+    def attach(self, sio, loop: asyncio.AbstractEventLoop) -> None:
+        """Start delivering through *sio* on *loop* (the server loop)."""
+        self.sio = sio
+        self.loop = loop
+
+    # Producer side - safe to call from any thread
+
+    def publish(
+        self, event: dict[str, Any], name: str, skip_sid: str | None = None
+    ) -> int:
+        """Append an event to the log and wake the client drains.
+
+        Returns:
+            The event's sequence number
+        """
+        sequence = self.event_log.publish(event, name, skip_sid)
+        self._schedule_wake()
+        return sequence
+
+    def _schedule_wake(self) -> None:
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            loop.call_soon_threadsafe(self.wake)
+        except RuntimeError:  # Loop closed in the meantime
+            with self._wake_lock:
+                self._wake_pending = False
+
+    # Loop side
+
+    def add_client(self, sid: str, sequence: int | None = None) -> ClientCursor:
+        """Track a client, reading from *sequence* (default: only new events)."""
+        if sequence is None:
+            sequence = self.event_log.last_sequence
+        cursor = ClientCursor(sid=sid, sequence=sequence)
+        self.clients[sid] = cursor
+        return cursor
+
+    def remove_client(self, sid: str) -> None:
+        cursor = self.clients.pop(sid, None)
+        if cursor and cursor.task and not cursor.task.done():
+            cursor.task.cancel()
+
+    def subscribe(
+        self,
+        sid: str,
+        channels: list[str] | None = None,
+        session_id: str | None = None,
+    ) -> ClientCursor:
+        """Restrict a client to *channels* and, optionally, one session."""
+        cursor = self.clients.get(sid) or self.add_client(sid)
+        cursor.channels = frozenset(channels or ["*"])
+        cursor.session_id = session_id
+        return cursor
+
+    def wake(self) -> None:
+        """Start a drain task for every client with unread events."""
+        with self._wake_lock:
+            self._wake_pending = False
+        for cursor in list(self.clients.values()):
+            self._wake_client(cursor)
+
+    def _wake_client(self, cursor: ClientCursor) -> None:
+        if self.clients.get(cursor.sid) is not cursor or self.sio is None:
+            return
+        if cursor.task is not None and not cursor.task.done():
+            return
+        if cursor.pending or cursor.sequence < self.event_log.last_sequence:
+            cursor.task = asyncio.get_running_loop().create_task(self._drain(cursor))
+
+    async def _drain(self, cursor: ClientCursor) -> None:
+        while self.clients.get(cursor.sid) is cursor:
+            if not cursor.pending and not self._read(cursor):
+                return
+            entry = cursor.pending[0]
+            try:
+                await self.sio.emit(entry.name, entry.event, room=cursor.sid)
+            except Exception as e:
+                self.logger.debug(f"Emit to {cursor.sid} failed, retrying: {e}")
+                asyncio.get_running_loop().call_later(
+                    self.retry_delay, self._wake_client, cursor
+                )
+                return
+            cursor.pending.popleft()
+            cursor.sent += 1
+            self.stats["events_sent"] = self.stats.get("events_sent", 0) + 1
+
+    def _read(self, cursor: ClientCursor) -> bool:
+        """Move the client's next events from the log to its pending queue."""
+        lagging = self.event_log.last_sequence - cursor.sequence > self.max_lag
+        entries = self.event_log.read_after(
+            cursor.sequence, None if lagging else self.batch_size
+        )
+        if not entries:
+            return False
+
+        # Events evicted from the bounded log before this client read them
+        cursor.dropped += max(0, entries[0].sequence - cursor.sequence - 1)
+        cursor.sequence = entries[-1].sequence
+
+        wanted = [entry for entry in entries if cursor.wants(entry)]
+        if lagging:
+            wanted = self._reduce_backlog(cursor, wanted)
+        cursor.pending.extend(wanted)
+        return True
+
+    def _reduce_backlog(
+        self, cursor: ClientCursor, entries: list[LogEntry]
+    ) -> list[LogEntry]:
+        if self.policy == "coalesce":
+            newest = {
+                _coalesce_key(entry): entry.sequence
+                for entry in entries
+                if _coalesce_key(entry) in COALESCE_KEYS
+            }
+            kept = [
+                entry
+                for entry in entries
+                if newest.get(_coalesce_key(entry), entry.sequence) == entry.sequence
+            ]
+            cursor.coalesced += len(entries) - len(kept)
+            entries = kept
+
+        if len(entries) > self.max_lag:
+            cursor.dropped += len(entries) - self.max_lag
+            entries = entries[-self.max_lag :]
+        return entries
+
+    def lag(self, cursor: ClientCursor) -> int:
+        """Events published but not yet delivered to the client."""
+        return self.event_log.last_sequence - cursor.sequence + len(cursor.pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "last_sequence": self.event_log.last_sequence,
+            "policy": self.policy,
+            "max_lag": self.max_lag,
+            "clients": {
+                sid: {
+                    "lag": self.lag(cursor),
+                    "sent": cursor.sent,
+                    "dropped": cursor.dropped,
+                    "coalesced": cursor.coalesced,
+                    "channels": sorted(cursor.channels),
+                    "session_id": cursor.session_id,
+                }
+                for sid, cursor in self.clients.items()
+            },
+        }
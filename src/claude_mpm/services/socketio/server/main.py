@@ -12,7 +12,6 @@ delegates to specialized components rather than inheriting from them.
 import asyncio
 import threading
 import time
-from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 
@@ -37,7 +36,9 @@ from ..handlers import EventHandlerRegistry, FileEventHandler, GitEventHandler
 from .broadcaster import SocketIOEventBroadcaster
 from .connection_manager import ConnectionManager
 from .core import SocketIOServerCore
+from .event_log import EventLog
 from .eventbus_integration import EventBusIntegration
+from .fanout import EventFanout
 
 
 class SocketIOServer(SocketIOServiceInterface):
@@ -71,7 +72,6 @@ class SocketIOServer(SocketIOServiceInterface):
         self.running = False
         self.connected_clients: set[str] = set()
         self.client_info: dict[str, dict[str, Any]] = {}
-        self.event_buffer = deque(maxlen=SystemLimits.MAX_EVENTS_BUFFER)
         self.buffer_lock = threading.Lock()
         self.stats = {
             "events_sent": 0,
@@ -84,7 +84,12 @@ class SocketIOServer(SocketIOServiceInterface):
         self.session_id = None
         self.claude_status = "unknown"
         self.claude_pid = None
-        self.event_history = deque(maxlen=SystemLimits.MAX_EVENTS_BUFFER)
+
+        # One shared event log: history for new clients, replay after
+        # reconnection and the source each client's fan-out cursor reads
+        self.event_history = EventLog(maxlen=SystemLimits.MAX_EVENTS_BUFFER)
+        self.event_buffer = self.event_history  # Legacy name
+        self.fanout = EventFanout(self.event_history, stats=self.stats)
 
         # Active session tracking for heartbeat
         self.active_sessions: dict[str, dict[str, Any]] = {}
@@ -118,7 +123,8 @@ class SocketIOServer(SocketIOServiceInterface):
         # Initialize connection manager for robust connection tracking
         self.connection_manager = ConnectionManager(
             max_buffer_size=getattr(SystemLimits, "MAX_EVENTS_BUFFER", 1000),
-            event_ttl=300,  # 5 minutes TTL for buffered events
+            event_ttl=300,  # 5 minutes TTL for replayed events
+            event_log=self.event_history,
         )
 
         # Initialize broadcaster with core server components and connection manager
@@ -131,6 +137,7 @@ class SocketIOServer(SocketIOServiceInterface):
             logger=self.logger,
             server=self,  # Pass server reference for event history access
             connection_manager=self.connection_manager,  # Pass connection manager
+            fanout=self.fanout,
         )
 
         # Wait for the event loop to be initialized in the background thread
@@ -152,8 +159,9 @@ class SocketIOServer(SocketIOServiceInterface):
         else:
             self.logger.debug(f"Event loop ready after {waited:.1f}s")
 
-            # Set the loop reference for broadcaster
+            # Set the loop reference for broadcaster and client fan-out
             self.broadcaster.loop = self.core.loop
+            self.fanout.attach(self.core.sio, self.core.loop)
 
             # Start the retry processor for resilient event delivery
             self.broadcaster.start_retry_processor()
@@ -13,7 +13,6 @@ Extracted from ClaudeRunner to follow Single Responsibility Principle.
 import contextlib
 import os
 import pty
-import select
 import signal
 import subprocess
 import sys
@@ -25,6 +24,15 @@ from claude_mpm.core.base_service import BaseService
 from claude_mpm.core.enums import OperationResult, ServiceState
 from claude_mpm.core.env_defaults import apply_subprocess_env_defaults
 from claude_mpm.services.core.interfaces import SubprocessLauncherInterface
+from claude_mpm.services.pty_relay import OutputCoalescer, PtyRelay
+
+
+def _fileno(stream) -> int | None:
+    """File descriptor of a stream, or None if it has none (e.g. under capture)."""
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
 
 
 class SubprocessLauncherService(BaseService, SubprocessLauncherInterface):
@@ -234,43 +242,37 @@ class SubprocessLauncherService(BaseService, SubprocessLauncherInterface):
     def _handle_subprocess_io(self, master_fd: int, process: subprocess.Popen) -> None:
         """Handle I/O between the subprocess and the terminal.
 
+        Blocks on readiness of the PTY, stdin and child exit (see PtyRelay);
+        output copies for WebSocket clients are coalesced into frames on a
+        separate thread so terminal echo never waits on the broadcast.
+
         Args:
             master_fd: Master file descriptor for the PTY
             process: The subprocess instance
         """
-        while True:
-            # Check if process is still running
-            if process.poll() is not None:
-                break
-
-            # Check for data from Claude or stdin
-            r, _, _ = select.select([master_fd, sys.stdin], [], [], 0)
+        coalescer = (
+            OutputCoalescer(self._broadcast_output) if self.websocket_server else None
+        )
+        relay = PtyRelay(
+            master_fd,
+            process,
+            stdin_fd=_fileno(sys.stdin),
+            stdout_fd=sys.stdout.fileno(),
+            on_output=coalescer.feed if coalescer else None,
+        )
+        try:
+            stats = relay.run()
+            self.logger.debug(f"PTY relay finished: {stats}")
+        finally:
+            if coalescer:
+                coalescer.close()
 
-            if master_fd in r:
-                try:
-                    data = os.read(master_fd, 4096)
-                    if data:
-                        os.write(sys.stdout.fileno(), data)
-                        # Broadcast output to WebSocket clients
-                        if self.websocket_server:
-                            try:
-                                # Decode and send
-                                output = data.decode("utf-8", errors="replace")
-                                self.websocket_server.claude_output(output, "stdout")
-                            except Exception as e:
-                                self.logger.debug(f"Failed to broadcast output: {e}")
-                    else:
-                        break  # EOF
-                except OSError:
-                    break
-
-            if sys.stdin in r:
-                try:
-                    data = os.read(sys.stdin.fileno(), 4096)
-                    if data:
-                        os.write(master_fd, data)
-                except OSError:
-                    break
+    def _broadcast_output(self, output: str) -> None:
+        """Send one coalesced output frame to WebSocket clients."""
+        try:
+            self.websocket_server.claude_output(output, "stdout")
+        except Exception as e:
+            self.logger.debug(f"Failed to broadcast output: {e}")
 
     def is_subprocess_mode_available(self) -> bool:
         """Check if subprocess mode is available on this platform.
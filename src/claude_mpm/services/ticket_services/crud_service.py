@@ -11,6 +11,7 @@ DESIGN DECISIONS:
   operations should go through the mcp-ticketer MCP server via the
   ticketing_agent.
 - Provides consistent error handling
+- Keeps an optional TicketSearchService index in step with its own writes
 """
 
 import logging
@@ -24,15 +25,18 @@ _deprecation_logger = logging.getLogger(__name__)
 class TicketCRUDService:
     """Service for ticket CRUD operations."""
 
-    def __init__(self, ticket_manager=None):
+    def __init__(self, ticket_manager=None, search_service=None):
         """
         Initialize the CRUD service.
 
         Args:
             ticket_manager: Optional ticket manager instance for testing
+            search_service: Optional TicketSearchService whose index is
+                updated after every successful write
         """
         self.logger = get_logger("services.ticket_crud")
         self._ticket_manager = ticket_manager
+        self.search_service = search_service
 
     @property
     def ticket_manager(self):
@@ -45,6 +49,19 @@ class TicketCRUDService:
             self._ticket_manager = TicketManager()
         return self._ticket_manager
 
+    def _sync_search_index(self, ticket_id: str) -> None:
+        """Re-index a written ticket, or drop it if it no longer exists."""
+        if self.search_service is None:
+            return
+        try:
+            ticket = self.ticket_manager.get_ticket(ticket_id)
+            if ticket:
+                self.search_service.index_ticket(ticket)
+            else:
+                self.search_service.remove_ticket(ticket_id)
+        except Exception as e:
+            self.logger.debug(f"Could not update search index for {ticket_id}: {e}")
+
     def create_ticket(
         self,
         title: str,
@@ -74,6 +91,7 @@ class TicketCRUDService:
             )
 
             if ticket_id:
+                self._sync_search_index(ticket_id)
                 return {
                     "success": True,
                     "ticket_id": ticket_id,
@@ -190,6 +208,7 @@ class TicketCRUDService:
             success = self.ticket_manager.update_task(ticket_id, **updates)
 
             if success:
+                self._sync_search_index(ticket_id)
                 return {"success": True, "message": f"Updated ticket: {ticket_id}"}
 
             return {"success": False, "error": f"Failed to update ticket: {ticket_id}"}
@@ -210,6 +229,7 @@ class TicketCRUDService:
             success = self.ticket_manager.close_task(ticket_id, resolution=resolution)
 
             if success:
+                self._sync_search_index(ticket_id)
                 return {"success": True, "message": f"Closed ticket: {ticket_id}"}
 
             return {"success": False, "error": f"Failed to close ticket: {ticket_id}"}
@@ -222,7 +242,8 @@ class TicketCRUDService:
         Delete a ticket.
 
         Direct CLI deletion via aitrackdown has been removed.
-        Use mcp-ticketer MCP tools via the ticketing_agent instead.
+        Use mcp-ticketer MCP tools via the ticketing_agent instead. Tickets
+        deleted there leave the search index on its next full refresh.
 
         Returns:
             Dict with success status and message
@@ -0,0 +1,360 @@
+"""
+Persistent full-text index for ticket search.
+
+WHY: TicketSearchService used to pull the 100 most recent tickets and scan
+them linearly for every query, so older tickets were silently invisible and
+widening the window turned each search into a full scan.
+
+DESIGN DECISIONS:
+- SQLite FTS5 inverted index over title, description, tags and metadata,
+  stored next to other project caches (.claude-mpm/cache/ticket_index.db)
+- Status and ticket type are plain indexed columns, used as facets/filters
+- Each ticket row keeps a content hash so refreshes only rewrite tickets
+  that actually changed
+- bm25 ranking with column weights mirroring the old relevance scores
+  (title > tags > description > metadata)
+- Query terms are prefix-matched ("log" finds "login") and combined with AND
+- Callers should check TicketSearchIndex.available() and fall back to a
+  linear scan on Python builds without FTS5
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from ...core.logger import get_logger
+from ...core.sqlite_pool import SQLiteConnectionPool
+
+logger = get_logger("services.ticket_search_index")
+
+INDEX_FILENAME = "ticket_index.db"
+
+# Search field -> FTS column
+FTS_COLUMNS = {
+    "title": "title",
+    "description": "description",
+    "tags": "tags",
+    "metadata": "metadata",
+}
+
+# bm25 weights in FTS column order (title, description, tags, metadata)
+BM25_WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _ticket_type(ticket: dict[str, Any]) -> str:
+    return (ticket.get("metadata") or {}).get("ticket_type", "unknown")
+
+
+def _metadata_text(ticket: dict[str, Any]) -> str:
+    metadata = ticket.get("metadata") or {}
+    return " ".join(value for value in metadata.values() if isinstance(value, str))
+
+
+def _content_hash(ticket: dict[str, Any]) -> str:
+    payload = json.dumps(ticket, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TicketSearchIndex:
+    """FTS5-backed ticket index with status/type facets."""
+
+    def __init__(self, db_path: Path):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            db_path: Path to the SQLite index file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
+        self._initialize()
+
+    @staticmethod
+    def available() -> bool:
+        """Whether this Python's SQLite supports FTS5."""
+        try:
+            conn = sqlite3.connect(":memory:")
+            try:
+                conn.execute("CREATE VIRTUAL TABLE probe USING fts5(x)")
+            finally:
+                conn.close()
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _initialize(self) -> None:
+        with self._pool.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tickets (
+                    id TEXT PRIMARY KEY,
+                    status TEXT,
+                    ticket_type TEXT,
+                    priority TEXT,
+                    content_hash TEXT NOT NULL,
+                    indexed_at REAL NOT NULL,
+                    data TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tickets_status_type "
+                "ON tickets(status, ticket_type)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tickets_type ON tickets(ticket_type)"
+            )
+            # rowid of ticket_fts == rowid of tickets
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS ticket_fts USING fts5(
+                    title, description, tags, metadata,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def upsert(self, tickets: list[dict[str, Any]]) -> int:
+        """
+        Add or update tickets, skipping those whose content is unchanged.
+
+        Returns:
+            Number of tickets (re)indexed
+        """
+        changed = 0
+        now = time.time()
+        with self._pool.connection() as conn:
+            for ticket in tickets:
+                ticket_id = ticket.get("id")
+                if not ticket_id:
+                    continue
+                digest = _content_hash(ticket)
+                row = conn.execute(
+                    "SELECT rowid, content_hash FROM tickets WHERE id = ?",
+                    (ticket_id,),
+                ).fetchone()
+                if row and row["content_hash"] == digest:
+                    continue
+
+                values = (
+                    ticket.get("status"),
+                    _ticket_type(ticket),
+                    ticket.get("priority"),
+                    digest,
+                    now,
+                    json.dumps(ticket, default=str),
+                )
+                if row:
+                    rowid = row["rowid"]
+                    conn.execute(
+                        "UPDATE tickets SET status = ?, ticket_type = ?, priority = ?, "
+                        "content_hash = ?, indexed_at = ?, data = ? WHERE rowid = ?",
+                        (*values, rowid),
+                    )
+                    conn.execute("DELETE FROM ticket_fts WHERE rowid = ?", (rowid,))
+                else:
+                    rowid = conn.execute(
+                        "INSERT INTO tickets (id, status, ticket_type, priority, "
+                        "content_hash, indexed_at, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (ticket_id, *values),
+                    ).lastrowid
+                conn.execute(
+                    "INSERT INTO ticket_fts (rowid, title, description, tags, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        rowid,
+                        ticket.get("title", ""),
+                        ticket.get("description", ""),
+                        " ".join(ticket.get("tags", [])),
+                        _metadata_text(ticket),
+                    ),
+                )
+                changed += 1
+        return changed
+
+    def remove(self, ticket_ids: list[str]) -> int:
+        """Remove tickets from the index. Returns number removed."""
+        removed = 0
+        with self._pool.connection() as conn:
+            for ticket_id in ticket_ids:
+                row = conn.execute(
+                    "SELECT rowid FROM tickets WHERE id = ?", (ticket_id,)
+                ).fetchone()
+                if row:
+                    conn.execute("DELETE FROM ticket_fts WHERE rowid = ?", (row[0],))
+                    conn.execute("DELETE FROM tickets WHERE rowid = ?", (row[0],))
+                    removed += 1
+        return removed
+
+    def retain(self, ticket_ids: set[str]) -> int:
+        """Remove every indexed ticket not in *ticket_ids* (after a full sync)."""
+        stale = [tid for tid in self.ticket_ids() if tid not in ticket_ids]
+        return self.remove(stale)
+
+    def ticket_ids(self) -> set[str]:
+        with self._pool.connection() as conn:
+            return {row[0] for row in conn.execute("SELECT id FROM tickets")}
+
+    def count(self) -> int:
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
+
+    def get_meta(self, key: str) -> str | None:
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM index_meta WHERE key = ?", (key,)
+            ).fetchone()
+            return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        type_filter: str = "all",
+        status_filter: str = "all",
+        limit: int = 10,
+        search_fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Rank tickets matching every term of *query*.
+
+        Returns:
+            Matching tickets, most relevant first
+        """
+        fields = search_fields or ["title", "description", "tags"]
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        columns = [FTS_COLUMNS[f] for f in fields if f in FTS_COLUMNS]
+        results: list[dict[str, Any]] = []
+        seen: set[str] = set()
+
+        # Exact/partial ID matches rank first, as in the linear search
+        if "id" in fields:
+            for ticket in self._select(
+                "t.id LIKE ? ESCAPE '\\'",
+                [f"%{self._escape_like(query.lower())}%"],
+                type_filter,
+                status_filter,
+                limit,
+            ):
+                seen.add(ticket["id"])
+                results.append(ticket)
+
+        if columns and len(results) < limit:
+            match = " AND ".join(f'"{term}"*' for term in terms)
+            match = f"{{{' '.join(columns)}}} : ({match})"
+            for ticket in self._match(match, type_filter, status_filter, limit):
+                if ticket["id"] not in seen:
+                    seen.add(ticket["id"])
+                    results.append(ticket)
+
+        return results[:limit]
+
+    def candidates(
+        self, keywords: list[str], exclude_id: str | None = None, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """
+        Return tickets sharing any of *keywords*, best bm25 matches first.
+
+        Used as the candidate set for similarity ranking.
+        """
+        terms = sorted({term for keyword in keywords for term in tokenize(keyword)})
+        if not terms:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+        return [
+            ticket
+            for ticket in self._match(match, "all", "all", limit + 1)
+            if ticket["id"] != exclude_id
+        ][:limit]
+
+    def facets(self) -> dict[str, dict[str, int]]:
+        """Ticket counts per status and per type."""
+        with self._pool.connection() as conn:
+            status = conn.execute(
+                "SELECT status, COUNT(*) FROM tickets GROUP BY status"
+            ).fetchall()
+            types = conn.execute(
+                "SELECT ticket_type, COUNT(*) FROM tickets GROUP BY ticket_type"
+            ).fetchall()
+        return {
+            "status": {row[0] or "unknown": row[1] for row in status},
+            "type": {row[0] or "unknown": row[1] for row in types},
+        }
+
+    def _match(
+        self, match: str, type_filter: str, status_filter: str, limit: int
+    ) -> list[dict[str, Any]]:
+        where = ["ticket_fts MATCH ?"]
+        params: list[Any] = [match]
+        where, params = self._with_facets(where, params, type_filter, status_filter)
+        sql = (
+            "SELECT t.data FROM ticket_fts JOIN tickets t ON t.rowid = ticket_fts.rowid "
+            f"WHERE {' AND '.join(where)} "
+            f"ORDER BY bm25(ticket_fts, {', '.join(map(str, BM25_WEIGHTS))}) LIMIT ?"
+        )
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, [*params, limit]).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _select(
+        self,
+        condition: str,
+        params: list[Any],
+        type_filter: str,
+        status_filter: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        where, params = self._with_facets(
+            [condition], list(params), type_filter, status_filter
+        )
+        sql = f"SELECT t.data FROM tickets t WHERE {' AND '.join(where)} LIMIT ?"
+        with self._pool.connection() as conn:
+            rows = conn.execute(sql, [*params, limit]).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    @staticmethod
+    def _with_facets(
+        where: list[str], params: list[Any], type_filter: str, status_filter: str
+    ) -> tuple[list[str], list[Any]]:
+        if type_filter != "all":
+            where.append("t.ticket_type = ?")
+            params.append(type_filter)
+        if status_filter != "all":
+            where.append("t.status = ?")
+            params.append(status_filter)
+        return where, params
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
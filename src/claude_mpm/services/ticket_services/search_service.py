@@ -9,25 +9,55 @@ DESIGN DECISIONS:
 - Handles filtering by type and status
 - Provides relevance ranking for search results
 - Abstracts search backend (can switch between different implementations)
+- Searches a persistent TicketSearchIndex covering every ticket, refreshed
+  incrementally from the ticket manager; falls back to a linear scan of
+  recent tickets when FTS5 is unavailable
+- Incremental refreshes only see recently updated tickets, so a periodic
+  full refresh reconciles deletions and edits to older tickets made
+  outside TicketCRUDService (which indexes its own writes immediately)
 """
 
+import heapq
+import time
+from pathlib import Path
 from typing import Any
 
 from ...core.logger import get_logger
+from .search_index import INDEX_FILENAME, TicketSearchIndex
+
+# How many recent tickets an incremental refresh re-reads from the manager
+REFRESH_WINDOW = 100
+# Upper bound used to ask the manager for "all" tickets on a full rebuild
+FULL_SYNC_LIMIT = 100_000
+# Minimum seconds between automatic refreshes
+REFRESH_INTERVAL = 30.0
+# Maximum seconds between full reconciling refreshes
+FULL_REFRESH_INTERVAL = 600.0
 
 
 class TicketSearchService:
     """Service for searching tickets."""
 
-    def __init__(self, ticket_manager=None):
+    def __init__(
+        self,
+        ticket_manager=None,
+        index_path: Path | None = None,
+        use_index: bool = True,
+    ):
         """
         Initialize the search service.
 
         Args:
             ticket_manager: Optional ticket manager instance for testing
+            index_path: Override for the search index database
+                (default: project cache dir / ticket_index.db)
+            use_index: Set False to always use the linear scan
         """
         self.logger = get_logger("services.ticket_search")
         self._ticket_manager = ticket_manager
+        self._index_path = index_path
+        self._use_index = use_index
+        self._index: TicketSearchIndex | None = None
 
     @property
     def ticket_manager(self):
@@ -40,6 +70,90 @@ class TicketSearchService:
             self._ticket_manager = TicketManager()
         return self._ticket_manager
 
+    @property
+    def index(self) -> TicketSearchIndex | None:
+        """Lazily open the search index (None if disabled or unavailable)."""
+        if self._index is None and self._use_index:
+            if not TicketSearchIndex.available():
+                self.logger.debug("SQLite FTS5 unavailable, using linear search")
+                self._use_index = False
+                return None
+            try:
+                self._index = TicketSearchIndex(
+                    self._index_path or self._default_index_path()
+                )
+            except Exception as e:
+                self.logger.warning(f"Ticket search index unavailable: {e}")
+                self._use_index = False
+        return self._index
+
+    @staticmethod
+    def _default_index_path() -> Path:
+        from ...core.unified_paths import get_path_manager
+
+        return get_path_manager().get_cache_dir("project") / INDEX_FILENAME
+
+    def refresh_index(self, full: bool = False) -> int:
+        """
+        Bring the index up to date with the ticket manager.
+
+        An incremental refresh re-reads the most recently updated tickets and
+        re-indexes only those whose content changed. A full refresh (also
+        done automatically when the index is empty) reads every ticket and
+        drops tickets that no longer exist.
+
+        Returns:
+            Number of tickets (re)indexed
+        """
+        index = self.index
+        if index is None:
+            return 0
+
+        full = full or index.count() == 0
+        limit = FULL_SYNC_LIMIT if full else REFRESH_WINDOW
+        tickets = self.ticket_manager.list_recent_tickets(limit=limit) or []
+
+        changed = index.upsert(tickets)
+        now = str(time.time())
+        if full:
+            index.retain({t["id"] for t in tickets if t.get("id")})
+            index.set_meta("last_full_refresh", now)
+        index.set_meta("last_refresh", now)
+
+        if changed:
+            self.logger.debug(f"Indexed {changed} changed ticket(s)")
+        return changed
+
+    def index_ticket(self, ticket: dict[str, Any]) -> None:
+        """Index a created or updated ticket immediately."""
+        if self.index is not None:
+            self.index.upsert([ticket])
+
+    def remove_ticket(self, ticket_id: str) -> None:
+        """Drop a deleted ticket from the index."""
+        if self.index is not None:
+            self.index.remove([ticket_id])
+
+    def get_facets(self) -> dict[str, dict[str, int]]:
+        """Ticket counts per status and per type."""
+        if self._ensure_fresh_index() is None:
+            return {"status": {}, "type": {}}
+        return self.index.facets()
+
+    def _ensure_fresh_index(self) -> TicketSearchIndex | None:
+        """Return the index, refreshing it if the last refresh is stale."""
+        index = self.index
+        if index is None:
+            return None
+        now = time.time()
+        last_full = float(index.get_meta("last_full_refresh") or 0)
+        last = float(index.get_meta("last_refresh") or 0)
+        if now - last_full >= FULL_REFRESH_INTERVAL:
+            self.refresh_index(full=True)
+        elif now - last >= REFRESH_INTERVAL:
+            self.refresh_index()
+        return index
+
     def search_tickets(
         self,
         query: str,
@@ -64,6 +178,28 @@ class TicketSearchService:
         if not search_fields:
             search_fields = ["title", "description", "tags"]
 
+        try:
+            index = self._ensure_fresh_index()
+            if index is not None:
+                return index.search(
+                    query, type_filter, status_filter, limit, search_fields
+                )
+        except Exception as e:
+            self.logger.warning(f"Indexed search failed, scanning instead: {e}")
+
+        return self._search_linear(
+            query, type_filter, status_filter, limit, search_fields
+        )
+
+    def _search_linear(
+        self,
+        query: str,
+        type_filter: str,
+        status_filter: str,
+        limit: int,
+        search_fields: list[str],
+    ) -> list[dict[str, Any]]:
+        """Scan the most recent tickets (fallback when no index is available)."""
         try:
             # Get all available tickets
             all_tickets = self.ticket_manager.list_recent_tickets(limit=100)
@@ -217,11 +353,18 @@ class TicketSearchService:
             # Extract keywords from title and tags
             keywords = self._extract_keywords(reference)
 
-            # Search for similar tickets
-            similar = []
-            all_tickets = self.ticket_manager.list_recent_tickets(limit=50)
-
-            for ticket in all_tickets:
+            # Candidates: best keyword matches from the index, or the most
+            # recent tickets without one
+            index = self._ensure_fresh_index()
+            if index is not None:
+                candidates = index.candidates(
+                    keywords, exclude_id=ticket_id, limit=max(50, limit * 10)
+                )
+            else:
+                candidates = self.ticket_manager.list_recent_tickets(limit=50)
+
+            scored = []
+            for position, ticket in enumerate(candidates):
                 if ticket["id"] == ticket_id:
                     continue  # Skip the reference ticket
 
@@ -229,11 +372,15 @@ class TicketSearchService:
                 score = self._calculate_similarity(reference, ticket, keywords)
 
                 if score > 0:
-                    similar.append((score, ticket))
-
-            # Sort by similarity and return top results
-            similar.sort(key=lambda x: x[0], reverse=True)
-            return [ticket for _, ticket in similar[:limit]]
+                    scored.append((score, -position, ticket))
+
+            # Keep the top results (ties keep candidate order)
+            return [
+                ticket
+                for _, _, ticket in heapq.nlargest(
+                    limit, scored, key=lambda item: item[:2]
+                )
+            ]
 
         except Exception as e:
             self.logger.error(f"Error finding similar tickets: {e}")
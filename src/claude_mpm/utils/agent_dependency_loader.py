@@ -9,8 +9,10 @@ installed upfront.
 """
 
 import hashlib
+import importlib.metadata
 import json
 import logging
+import shutil
 import subprocess
 import sys
 import time
@@ -18,11 +20,39 @@ from typing import Any
 
 import yaml
 from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
 
 from ..core.logger import get_logger
+from .dependency_cache import DependencyCache
 
 logger = get_logger(__name__)
 
+# Run by the target interpreter of UV tool installs: prints its import path
+# and every installed distribution in one process.
+DISTRIBUTION_PROBE = (
+    "import importlib.metadata, json, sys; "
+    "print(json.dumps({'paths': sys.path, 'distributions': "
+    "[[d.metadata['Name'], d.version] for d in importlib.metadata.distributions()]}))"
+)
+
+
+def environment_fingerprint(paths: list[str]) -> str:
+    """
+    Fingerprint an environment by the modification times of its import path.
+
+    WHY: Installing, upgrading or removing a distribution adds or removes a
+    ``*.dist-info`` directory in site-packages, which changes the directory's
+    mtime. Comparing mtimes is enough to know a cached snapshot of installed
+    distributions is still valid, without enumerating them again.
+    """
+    stamps = []
+    for path in paths:
+        try:
+            stamps.append([path, Path(path).stat().st_mtime_ns])
+        except (OSError, ValueError):
+            stamps.append([path, None])
+    return hashlib.md5(json.dumps(stamps).encode()).hexdigest()  # nosec
+
 
 class AgentDependencyLoader:
     """
@@ -48,15 +78,22 @@ class AgentDependencyLoader:
         "lxml",  # Can fail if libxml2 dev headers missing
     ]
 
-    def __init__(self, auto_install: bool = False):
+    def __init__(
+        self, auto_install: bool = False, cache: DependencyCache | None = None
+    ):
         """
         Initialize the agent dependency loader.
 
         Args:
             auto_install: If True, automatically install missing dependencies.
                          If False, only check and report missing dependencies.
+            cache: Cache for installed-distribution snapshots
+                   (default: .claude/agents/.dependency_cache)
         """
         self.auto_install = auto_install
+        self.cache = cache or DependencyCache()
+        # Canonical distribution name -> version of the target environment
+        self._installed: dict[str, str] | None = None
         self.deployed_agents: dict[str, Path] = {}
         self.agent_dependencies: dict[str, dict] = {}
         self.missing_dependencies: dict[str, list[str]] = {}
@@ -222,12 +259,78 @@ class AgentDependencyLoader:
 
         return False
 
+    def _get_installed_distributions(self) -> dict[str, str] | None:
+        """
+        Snapshot the distributions installed in the TARGET environment.
+
+        WHY: Checking each package used to spawn a Python interpreter (two
+        for optional packages with alternatives) under UV tool installs.
+        Enumerating all distributions once and resolving every spec against
+        that snapshot costs at most one subprocess per check run, and none
+        while the cached snapshot's environment fingerprint is unchanged.
+
+        Returns:
+            Mapping of canonical distribution name to version, or None if the
+            target environment could not be probed
+        """
+        if self._installed is not None:
+            return self._installed
+
+        target = f"uv-tool:{Path.cwd()}" if self.is_uv_tool else sys.executable
+        snapshot = self.cache.get_environment_snapshot(target)
+        if not snapshot or snapshot.get("fingerprint") != environment_fingerprint(
+            snapshot.get("paths", [])
+        ):
+            snapshot = self._probe_environment()
+            if snapshot is None:
+                return None
+            snapshot["fingerprint"] = environment_fingerprint(snapshot["paths"])
+            self.cache.set_environment_snapshot(target, snapshot)
+
+        installed: dict[str, str] = {}
+        # Earlier import path entries shadow later ones, as at import time
+        for name, version in reversed(snapshot["distributions"]):
+            if name:
+                installed[canonicalize_name(name)] = version
+        self._installed = installed
+        return installed
+
+    def _probe_environment(self) -> dict[str, Any] | None:
+        """Enumerate the import path and installed distributions of the target."""
+        if not self.is_uv_tool:
+            return {
+                "paths": list(sys.path),
+                "distributions": [
+                    [dist.metadata["Name"], dist.version]
+                    for dist in importlib.metadata.distributions()
+                ],
+            }
+
+        try:
+            result = subprocess.run(
+                ["uv", "run", "--no-project", "python", "-c", DISTRIBUTION_PROBE],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                check=False,
+            )
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+            logger.debug(f"UV environment probe failed: {result.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            logger.warning("Timeout probing installed packages in UV environment")
+        except (OSError, ValueError) as e:
+            logger.debug(f"Error probing UV environment: {e}")
+        return None
+
     def check_python_dependency(self, package_spec: str) -> tuple[bool, str | None]:
         """
         Check if a Python package dependency is satisfied in the TARGET environment.
 
         WHY: UV tool environments use a separate Python installation. We must check
         packages in the same environment where they would be installed/used.
+        Specs are resolved against a snapshot of that environment's installed
+        distributions (see _get_installed_distributions).
 
         Args:
             package_spec: Package specification (e.g., "pandas>=2.0.0")
@@ -255,139 +358,37 @@ class AgentDependencyLoader:
                 )
                 return True, "optional-skipped"
 
-            # For UV tool environments, check via UV's Python
-            if self.is_uv_tool:
-                try:
-                    verify_cmd = [
-                        "uv",
-                        "run",
-                        "--no-project",
-                        "python",
-                        "-c",
-                        f"import importlib.metadata; print(importlib.metadata.version('{package_name}'))",
-                    ]
-                    result = subprocess.run(
-                        verify_cmd, capture_output=True, timeout=30, check=False
-                    )
-                    if result.returncode == 0:
-                        version = result.stdout.decode().strip()
-                        self.checked_packages.add(package_name)
-                        if req.specifier.contains(version):
-                            logger.debug(
-                                f"Package {package_name} {version} satisfied in UV environment"
-                            )
-                            return True, version
-                        logger.debug(
-                            f"{package_name} {version} does not satisfy {req.specifier}"
-                        )
-                        return False, version
-                    # Check alternatives for optional packages
-                    if package_name in self.OPTIONAL_DB_PACKAGES:
-                        for alternative in self.OPTIONAL_DB_PACKAGES[package_name]:
-                            alt_cmd = [
-                                "uv",
-                                "run",
-                                "--no-project",
-                                "python",
-                                "-c",
-                                f"import importlib.metadata; print(importlib.metadata.version('{alternative}'))",
-                            ]
-                            alt_result = subprocess.run(
-                                alt_cmd, capture_output=True, timeout=30, check=False
-                            )
-                            if alt_result.returncode == 0:
-                                alt_version = alt_result.stdout.decode().strip()
-                                logger.info(
-                                    f"Using {alternative} as alternative to {package_name}"
-                                )
-                                self.checked_packages.add(package_name)
-                                return True, f"{alternative}:{alt_version}"
-                        # If no alternatives work, mark as optional failure
-                        self.optional_failed[package_name] = "No alternatives available"
-                        logger.warning(
-                            f"Optional package {package_name} not found, marking as optional"
-                        )
-                        return True, "optional-not-found"
-                    return False, None
-                except subprocess.TimeoutExpired:
-                    logger.warning(f"Timeout checking {package_name} in UV environment")
-                    return False, None
-                except Exception as e:
-                    logger.debug(
-                        f"Error checking {package_name} in UV environment: {e}"
-                    )
-                    return False, None
-
-            # For normal Python, try to import and check version
-            try:
-                import importlib.metadata
-
-                try:
-                    version = importlib.metadata.version(package_name)
-                    self.checked_packages.add(package_name)
+            installed = self._get_installed_distributions()
+            if installed is None:
+                return False, None
 
-                    # Check if version satisfies requirement
-                    if req.specifier.contains(version):
-                        return True, version
-                    logger.debug(
-                        f"{package_name} {version} does not satisfy {req.specifier}"
-                    )
-                    return False, version
-
-                except importlib.metadata.PackageNotFoundError:
-                    # Check if there's an alternative for this optional package
-                    if package_name in self.OPTIONAL_DB_PACKAGES:
-                        for alternative in self.OPTIONAL_DB_PACKAGES[package_name]:
-                            try:
-                                alt_version = importlib.metadata.version(alternative)
-                                logger.info(
-                                    f"Using {alternative} as alternative to {package_name}"
-                                )
-                                self.checked_packages.add(package_name)
-                                return True, f"{alternative}:{alt_version}"
-                            except importlib.metadata.PackageNotFoundError:
-                                continue
-                        # If no alternatives work, mark as optional failure
-                        self.optional_failed[package_name] = "No alternatives available"
-                        logger.warning(
-                            f"Optional package {package_name} not found, marking as optional"
-                        )
-                        return True, "optional-not-found"
-                    return False, None
-
-            except ImportError:
-                # Fallback for older Python versions
-                try:
-                    import pkg_resources
-
-                    version = pkg_resources.get_distribution(package_name).version
-                    self.checked_packages.add(package_name)
-
-                    if req.specifier.contains(version):
-                        return True, version
-                    return False, version
-
-                except pkg_resources.DistributionNotFound:
-                    # Check alternatives for optional packages
-                    if package_name in self.OPTIONAL_DB_PACKAGES:
-                        for alternative in self.OPTIONAL_DB_PACKAGES[package_name]:
-                            try:
-                                alt_version = pkg_resources.get_distribution(
-                                    alternative
-                                ).version
-                                logger.info(
-                                    f"Using {alternative} as alternative to {package_name}"
-                                )
-                                self.checked_packages.add(package_name)
-                                return True, f"{alternative}:{alt_version}"
-                            except pkg_resources.DistributionNotFound:
-                                continue
-                        self.optional_failed[package_name] = "No alternatives available"
-                        logger.warning(
-                            f"Optional package {package_name} not found, marking as optional"
+            version = installed.get(canonicalize_name(package_name))
+            if version is not None:
+                self.checked_packages.add(package_name)
+                if req.specifier.contains(version):
+                    return True, version
+                logger.debug(
+                    f"{package_name} {version} does not satisfy {req.specifier}"
+                )
+                return False, version
+
+            # Check if there's an alternative for this optional package
+            if package_name in self.OPTIONAL_DB_PACKAGES:
+                for alternative in self.OPTIONAL_DB_PACKAGES[package_name]:
+                    alt_version = installed.get(canonicalize_name(alternative))
+                    if alt_version is not None:
+                        logger.info(
+                            f"Using {alternative} as alternative to {package_name}"
                         )
-                        return True, "optional-not-found"
-                    return False, None
+                        self.checked_packages.add(package_name)
+                        return True, f"{alternative}:{alt_version}"
+                # If no alternatives work, mark as optional failure
+                self.optional_failed[package_name] = "No alternatives available"
+                logger.warning(
+                    f"Optional package {package_name} not found, marking as optional"
+                )
+                return True, "optional-not-found"
+            return False, None
 
         except InvalidRequirement as e:
             logger.warning(f"Invalid requirement specification: {package_spec}: {e}")
@@ -554,17 +555,7 @@ class AgentDependencyLoader:
         Returns:
             True if command is available, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ["which", command],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=False,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return shutil.which(command) is not None
 
     def analyze_dependencies(self) -> dict[str, dict]:
         """
@@ -862,6 +853,7 @@ class AgentDependencyLoader:
             if success:
                 # Re-analyze after installation
                 self.checked_packages.clear()
+                self._installed = None
                 results = self.analyze_dependencies()
 
         return results
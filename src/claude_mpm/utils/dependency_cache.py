@@ -31,6 +31,8 @@ class DependencyCache:
     """
 
     DEFAULT_TTL_SECONDS = 86400  # 24 hours
+    # Pseudo deployment hash for installed-distribution snapshots
+    ENVIRONMENT_KEY = "installed-distributions"
 
     def __init__(
         self, cache_dir: Path | None = None, ttl_seconds: int = DEFAULT_TTL_SECONDS
@@ -190,6 +192,30 @@ class DependencyCache:
         self._save_cache(cache_data)
         logger.debug(f"Cached results for key {cache_key}")
 
+    def get_environment_snapshot(self, target: str) -> dict | None:
+        """
+        Get the cached installed-distribution snapshot of an environment.
+
+        Args:
+            target: Identifies the environment (e.g., its interpreter path)
+
+        Returns:
+            Snapshot with ``paths``, ``distributions`` and ``fingerprint``,
+            or None if not found/expired. Callers must compare the
+            fingerprint against the live environment before trusting it.
+        """
+        return self.get(self.ENVIRONMENT_KEY, {"target": target})
+
+    def set_environment_snapshot(self, target: str, snapshot: dict) -> None:
+        """
+        Cache the installed-distribution snapshot of an environment.
+
+        Args:
+            target: Identifies the environment (e.g., its interpreter path)
+            snapshot: Snapshot with ``paths``, ``distributions`` and ``fingerprint``
+        """
+        self.set(self.ENVIRONMENT_KEY, snapshot, {"target": target})
+
     def invalidate(self, deployment_hash: str | None = None) -> None:
         """
         Invalidate cache entries.
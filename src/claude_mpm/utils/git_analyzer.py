@@ -4,9 +4,37 @@ Git history analysis utilities for intelligent context reconstruction.
 This module provides utilities to analyze git repository activity for
 context reconstruction and project intelligence. Extracted from the
 session management system to support git-based context approaches.
+
+WHY the streaming analyzer: analyze_recent_activity used to run
+``git branch -a``, a windowed ``git log --all --name-status`` and, for
+low-velocity projects, a second full ``git log``. Each output was buffered
+and re-split line by line, and every helper spawned its own git process.
+
+DESIGN DECISIONS:
+- One ``git log -z`` process whose records are separated by control
+  characters, parsed incrementally as the output streams in. The process
+  is stopped as soon as the adaptive window is satisfied.
+- Branch names, the current branch and ref tips are read from the git
+  directory (HEAD, loose refs, packed-refs) without spawning git. Repos
+  using the reftable backend fall back to ``git for-each-ref``.
+- A per-repo cursor (ref tips plus the newest commits already parsed) is
+  persisted under ~/.claude-mpm/cache/git-activity. A repeat run with
+  unchanged refs spawns no git process. Otherwise it streams only
+  ``<new tips> ^<old tips>`` and merges the result into the cursor.
+  A deleted ref, or a ref that moved to a commit not descending from its
+  old tip (amend, rebase, reset, force push), invalidates the cursor and
+  the next run rescans.
+- ``commits_since`` walks parent links in the cursor when the history is
+  linear and only falls back to ``git log`` otherwise.
 """
 
+import contextlib
+import hashlib
+import json
+import os
 import subprocess
+import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -14,242 +42,470 @@ from claude_mpm.core.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+CURSOR_VERSION = 1
+# Newest parsed commits kept in a repo's cursor
+CURSOR_COMMIT_LIMIT = 2000
+DEFAULT_CURSOR_DIR = Path.home() / ".claude-mpm" / "cache" / "git-activity"
+
+_RECORD = b"\x1e"
+_FIELD = "\x1f"
+_LOG_FORMAT = "%x1e" + "%x1f".join(
+    ["%H", "%h", "%P", "%an", "%ae", "%ai", "%at", "%ct", "%s"]
+)
+_READ_SIZE = 64 * 1024
+# Keys of cached commit records that are not part of the public output
+_INTERNAL_KEYS = ("id", "parents", "author_time", "commit_time")
+
+
+def _parse_record(record: bytes) -> dict[str, Any] | None:
+    """Parse one ``git log -z --name-status`` record (without separator)."""
+    header, _, changes = record.partition(b"\0")
+    fields = header.decode("utf-8", errors="replace").split(_FIELD)
+    if len(fields) != 9:
+        return None
+    full, short, parents, author, email, timestamp, at, ct, message = fields
+    files = []
+    tokens = changes.lstrip(b"\n").split(b"\0")
+    index = 0
+    while index < len(tokens):
+        status = tokens[index].decode("utf-8", errors="replace").strip()
+        index += 1
+        if not status:
+            continue
+        # Renames and copies list the source path first
+        if status[0] in "RC":
+            index += 1
+        if index >= len(tokens):
+            break
+        path = tokens[index].decode("utf-8", errors="replace")
+        index += 1
+        files.append({"status": status, "path": path})
+    return {
+        "id": full,
+        "sha": short,
+        "parents": parents.split(),
+        "author": author,
+        "email": email,
+        "timestamp": timestamp,
+        "author_time": int(at),
+        "commit_time": int(ct),
+        "message": message,
+        "files": files,
+    }
 
-def analyze_recent_activity(
-    repo_path: str = ".", days: int = 7, max_commits: int = 50, min_commits: int = 25
-) -> dict[str, Any]:
-    """
-    Analyze recent git activity for context reconstruction with adaptive time window.
 
-    Strategy:
-    1. Try to get commits from last {days} days
-    2. If fewer than {min_commits} found, expand window to get {min_commits}
-    3. Never exceed {max_commits} total
+def _public(commit: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in commit.items() if k not in _INTERNAL_KEYS}
 
-    This ensures meaningful context for both high-velocity and low-velocity projects.
 
-    Args:
-        repo_path: Path to the git repository (default: current directory)
-        days: Number of days to look back initially (default: 7)
-        max_commits: Maximum number of commits to analyze (default: 50)
-        min_commits: Minimum commits to retrieve, will expand window if needed (default: 25)
+class _ActivityWindow:
+    """Adaptive window selection fed with commits newest-first.
 
-    Returns:
-        Dict containing:
-        - time_range: str - Description of analysis period
-        - commits: List[Dict] - Recent commits with metadata
-        - branches: List[str] - Active branches in the repository
-        - contributors: Dict[str, Dict] - Contributor statistics
-        - file_changes: Dict[str, Dict] - File change statistics
-        - has_activity: bool - Whether any activity was found
-        - adaptive_mode: bool - Whether time window was expanded
-        - actual_time_span: Optional[str] - Actual time span if adaptive mode was used
-        - reason: Optional[str] - Explanation for adaptive mode
-        - error: Optional[str] - Error message if analysis failed
+    Keeps up to ``max_commits`` commits from the last ``days``. If the window
+    holds fewer than ``min_commits`` (but at least one), it extends to the
+    newest ``min_commits`` commits regardless of date.
     """
-    repo_path_obj = Path(repo_path)
-    analysis = {
-        "time_range": f"last {days} days",
-        "commits": [],
-        "branches": [],
-        "contributors": {},
-        "file_changes": {},
-        "has_activity": False,
-        "adaptive_mode": False,
-        "min_commits_target": min_commits,
-    }
 
-    try:
-        # Get all branches
+    def __init__(self, days: int, max_commits: int, min_commits: int):
+        self.cutoff = time.time() - days * 86400
+        self.max_commits = max_commits
+        self.min_commits = min_commits
+        self.commits: list[dict[str, Any]] = []
+        self.in_window = 0
+        self.adaptive = False
+        self.done = False
+
+    def feed(self, commit: dict[str, Any]) -> bool:
+        """Consume a commit; returns False once no more are needed."""
+        if self.adaptive:
+            self.commits.append(commit)
+        elif commit["commit_time"] >= self.cutoff:
+            self.commits.append(commit)
+            self.in_window += 1
+            self.done = self.in_window >= self.max_commits
+        elif self.in_window == 0 or self.in_window >= self.min_commits:
+            self.done = True
+        else:
+            self.adaptive = True
+            self.commits.append(commit)
+        if self.adaptive and len(self.commits) >= self.min_commits:
+            self.done = True
+        return not self.done
+
+
+class GitActivityAnalyzer:
+    """Streaming, cursor-backed analysis of a repository's recent activity.
+
+    Args:
+        repo_path: Path inside the git repository
+        cursor_dir: Where per-repo cursors are stored (None disables them;
+            the module functions use DEFAULT_CURSOR_DIR)
+    """
+
+    def __init__(self, repo_path: str | Path = ".", cursor_dir: Path | None = None):
+        self.repo_path = Path(repo_path)
+        self.cursor_dir = cursor_dir
+        self.git_dir, self.common_dir = self._find_git_dirs(self.repo_path)
+        self.processes_started = 0
+
+    # --- Refs ---
+
+    @staticmethod
+    def _find_git_dirs(path: Path) -> tuple[Path | None, Path | None]:
+        for candidate in [path.resolve(), *path.resolve().parents]:
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # Worktrees and submodules: "gitdir: <path>"
+                content = dot_git.read_text(encoding="utf-8").strip()
+                if not content.startswith("gitdir:"):
+                    continue
+                git_dir = (candidate / content[len("gitdir:") :].strip()).resolve()
+            else:
+                continue
+            common = git_dir
+            commondir_file = git_dir / "commondir"
+            if commondir_file.exists():
+                common = (
+                    git_dir / commondir_file.read_text(encoding="utf-8").strip()
+                ).resolve()
+            return git_dir, common
+        return None, None
+
+    def _require_repo(self) -> None:
+        if self.git_dir is None:
+            raise ValueError(f"Not a git repository: {self.repo_path}")
+
+    def _head(self) -> tuple[str | None, str | None]:
+        """(branch name or None if detached, commit sha or None if unborn)."""
+        self._require_repo()
+        head = (self.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            return None, head
+        ref = head[len("ref:") :].strip()
+        branch = ref.removeprefix("refs/heads/")
+        return branch, self.refs().get(ref)
+
+    def refs(self) -> dict[str, str]:
+        """All refs under refs/ mapped to their commit sha."""
+        self._require_repo()
+        if (self.common_dir / "reftable").exists():
+            return self._refs_from_git()
+
+        refs: dict[str, str] = {}
+        packed = self.common_dir / "packed-refs"
+        if packed.exists():
+            for line in packed.read_text(encoding="utf-8").splitlines():
+                if line and line[0] not in "#^":
+                    sha, _, name = line.partition(" ")
+                    refs[name] = sha
+
+        refs_root = self.common_dir / "refs"
+        for dirpath, _dirnames, filenames in os.walk(refs_root):
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                with contextlib.suppress(OSError, UnicodeDecodeError):
+                    value = path.read_text(encoding="utf-8").strip()
+                    # Symbolic refs (e.g. origin/HEAD) point at listed refs
+                    if value and not value.startswith("ref:"):
+                        refs[path.relative_to(self.common_dir).as_posix()] = value
+        return refs
+
+    def _refs_from_git(self) -> dict[str, str]:
+        self.processes_started += 1
         result = subprocess.run(
-            ["git", "branch", "-a"],
-            cwd=str(repo_path_obj),
+            ["git", "for-each-ref", "--format=%(objectname) %(refname)"],
+            cwd=str(self.repo_path),
             capture_output=True,
             text=True,
             check=True,
         )
-        branches = [
-            line.strip().replace("* ", "").replace("remotes/origin/", "")
-            for line in result.stdout.strip().split("\n")
-            if line.strip()
-        ]
-        analysis["branches"] = list(set(branches))
-
-        # Step 1: Get commits from specified time window
-        result = subprocess.run(
+        return dict(
+            reversed(line.split(" ", 1)) for line in result.stdout.splitlines() if line
+        )
+
+    def _tips(self) -> dict[str, str]:
+        """Refs plus a detached HEAD, i.e. what ``git log --all`` starts from."""
+        tips = self.refs()
+        branch, sha = self._head()
+        if branch is None and sha:
+            tips["HEAD"] = sha
+        return tips
+
+    def branches(self) -> list[str]:
+        """Local and remote branch names (``origin/`` prefix stripped)."""
+        names = set()
+        for ref in self.refs():
+            if ref.startswith("refs/heads/"):
+                names.add(ref.removeprefix("refs/heads/"))
+            elif ref.startswith("refs/remotes/"):
+                remote, _, name = ref.removeprefix("refs/remotes/").partition("/")
+                if name == "HEAD":
+                    continue
+                names.add(name if remote == "origin" else f"remotes/{remote}/{name}")
+        return sorted(names)
+
+    def current_branch(self) -> str:
+        """Current branch name ("" when HEAD is detached)."""
+        branch, _sha = self._head()
+        return branch or ""
+
+    # --- Streaming log ---
+
+    def _stream_log(self, revisions: Iterable[str]) -> Iterator[dict[str, Any]]:
+        """Yield parsed commits from one ``git log`` over ``revisions``.
+
+        Closing the generator early stops the git process.
+        """
+        self.processes_started += 1
+        process = subprocess.Popen(
             [
                 "git",
                 "log",
-                "--all",
-                f"--since={days} days ago",
-                f"--max-count={max_commits}",
-                "--format=%h|%an|%ae|%ai|%s",
+                "--stdin",
+                "-z",
                 "--name-status",
+                "--no-color",
+                f"--format={_LOG_FORMAT}",
             ],
-            cwd=str(repo_path_obj),
-            capture_output=True,
-            text=True,
-            check=True,
+            cwd=str(self.repo_path),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
-
-        if not result.stdout.strip():
+        finished = False
+        try:
+            process.stdin.write("".join(f"{rev}\n" for rev in revisions).encode())
+            process.stdin.close()
+
+            buffer = b""
+            while chunk := process.stdout.read1(_READ_SIZE):
+                buffer += chunk
+                *records, buffer = buffer.split(_RECORD)
+                for record in records:
+                    if record and (commit := _parse_record(record)):
+                        yield commit
+            if buffer and (commit := _parse_record(buffer)):
+                yield commit
+            finished = True
+        finally:
+            if not finished and process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            stderr = process.stderr.read().decode(errors="replace")
+            process.stderr.close()
+            returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, "git log", stderr=stderr)
+
+    # --- Cursor ---
+
+    def _cursor_path(self) -> Path | None:
+        if self.cursor_dir is None or self.common_dir is None:
+            return None
+        digest = hashlib.sha256(str(self.common_dir).encode()).hexdigest()[:16]
+        return self.cursor_dir / f"{digest}.json"
+
+    def _load_cursor(self) -> dict[str, Any] | None:
+        path = self._cursor_path()
+        if path is None or not path.exists():
+            return None
+        try:
+            cursor = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cursor.get("version") != CURSOR_VERSION:
+            return None
+        return cursor
+
+    def _save_cursor(self, cursor: dict[str, Any]) -> None:
+        path = self._cursor_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(cursor), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.debug(f"Could not save git activity cursor: {e}")
+
+    def _updated_cursor(self, refresh: bool = False) -> dict[str, Any] | None:
+        """Cursor brought up to date with the current refs, or None."""
+        cursor = None if refresh else self._load_cursor()
+        if cursor is None:
+            return None
+        tips = self._tips()
+        old_tips = cursor["refs"]
+        if tips == old_tips:
+            return cursor
+        if not set(old_tips) <= set(tips):
+            return None  # a ref was deleted; cached commits may be unreachable
+
+        known = set(old_tips.values())
+        new_tips = {sha for sha in tips.values() if sha not in known}
+        new_commits = (
+            list(
+                self._stream_log(
+                    [*sorted(new_tips), *(f"^{sha}" for sha in sorted(known))]
+                )
+            )
+            if new_tips
+            else []
+        )
+        if not cursor["exhausted"] and cursor["commits"]:
+            # The cursor must stay the newest prefix of history: commits older
+            # than its tail are left for a cold scan to find
+            floor = cursor["commits"][-1]["commit_time"]
+            new_commits = [c for c in new_commits if c["commit_time"] >= floor]
+        commits = sorted(
+            new_commits + cursor["commits"],
+            key=lambda c: c["commit_time"],
+            reverse=True,
+        )
+        moved = {sha for ref, sha in old_tips.items() if tips[ref] != sha}
+        if moved and not moved <= self._reachable(commits, tips.values()):
+            # Amend, rebase, reset or force push: cached commits may be gone
+            return None
+        cursor = {
+            "version": CURSOR_VERSION,
+            "refs": tips,
+            "commits": commits[:CURSOR_COMMIT_LIMIT],
+            "exhausted": cursor["exhausted"] and len(commits) <= CURSOR_COMMIT_LIMIT,
+        }
+        self._save_cursor(cursor)
+        return cursor
+
+    @staticmethod
+    def _reachable(commits: list[dict[str, Any]], tips: Iterable[str]) -> set[str]:
+        """Ids of cached commits reachable from ``tips`` via cached parents.
+
+        Ancestors are older than their children, so walking inside the
+        newest-prefix cursor does not miss paths that leave it.
+        """
+        by_id = {c["id"]: c for c in commits}
+        reachable: set[str] = set()
+        pending = [sha for sha in tips if sha in by_id]
+        while pending:
+            sha = pending.pop()
+            if sha in reachable:
+                continue
+            reachable.add(sha)
+            pending.extend(p for p in by_id[sha]["parents"] if p in by_id)
+        return reachable
+
+    # --- Queries ---
+
+    def recent_commits(
+        self, days: int, max_commits: int, min_commits: int, refresh: bool = False
+    ) -> _ActivityWindow:
+        """Select the adaptive window of recent commits across all refs."""
+        self._require_repo()
+        cursor = self._updated_cursor(refresh)
+        if cursor is not None:
+            window = _ActivityWindow(days, max_commits, min_commits)
+            for commit in cursor["commits"]:
+                if not window.feed(commit):
+                    return window
+            if cursor["exhausted"]:
+                return window
+
+        # Cold scan: stream from every tip and stop once the window is full
+        tips = self._tips()
+        window = _ActivityWindow(days, max_commits, min_commits)
+        streamed: list[dict[str, Any]] = []
+        exhausted = True
+        if tips:
+            stream = self._stream_log(sorted(set(tips.values())))
+            try:
+                for commit in stream:
+                    streamed.append(commit)
+                    if not window.feed(commit):
+                        exhausted = False
+                        break
+            finally:
+                stream.close()
+
+        # The cursor keeps the commit that closed the window too, so the same
+        # query can be answered from it later
+        self._save_cursor(
+            {
+                "version": CURSOR_VERSION,
+                "refs": tips,
+                "commits": streamed[:CURSOR_COMMIT_LIMIT],
+                "exhausted": exhausted and len(streamed) <= CURSOR_COMMIT_LIMIT,
+            }
+        )
+        return window
+
+    def analyze(
+        self, days: int = 7, max_commits: int = 50, min_commits: int = 25
+    ) -> dict[str, Any]:
+        """See analyze_recent_activity()."""
+        analysis: dict[str, Any] = {
+            "time_range": f"last {days} days",
+            "commits": [],
+            "branches": [],
+            "contributors": {},
+            "file_changes": {},
+            "has_activity": False,
+            "adaptive_mode": False,
+            "min_commits_target": min_commits,
+        }
+        try:
+            analysis["branches"] = self.branches()
+            window = self.recent_commits(days, max_commits, min_commits)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Git command failed: {e}")
+            analysis["error"] = f"Git command failed: {e}"
+            return analysis
+        except Exception as e:
+            logger.warning(f"Could not analyze recent activity: {e}")
+            analysis["error"] = str(e)
             return analysis
 
+        if window.in_window == 0:
+            return analysis
         analysis["has_activity"] = True
 
-        # Step 2: Count commit lines (lines with pipe separator) to determine if we need adaptive mode
-        temp_commits = []
-        for line in result.stdout.strip().split("\n"):
-            if "|" in line:
-                temp_commits.append(line)
-
-        # Step 3: Check if we need adaptive mode
-        if len(temp_commits) < min_commits:
+        commits = window.commits
+        if window.adaptive:
             logger.info(
-                f"Only {len(temp_commits)} commits found in last {days} days, "
+                f"Only {window.in_window} commits found in last {days} days, "
                 f"expanding to get at least {min_commits} commits"
             )
-
-            # Get last N commits regardless of date
-            expanded_result = subprocess.run(
-                [
-                    "git",
-                    "log",
-                    "--all",
-                    f"-{min_commits}",
-                    "--format=%h|%an|%ae|%ai|%s",
-                    "--name-status",
-                ],
-                cwd=str(repo_path_obj),
-                capture_output=True,
-                text=True,
-                check=True,
+            analysis["adaptive_mode"] = True
+            days_diff = max(
+                (commits[0]["author_time"] - commits[-1]["author_time"]) // 86400, 1
             )
+            analysis["actual_time_span"] = str(days_diff)
+            if days_diff > days:
+                analysis["reason"] = (
+                    f"Expanded from {days} days to {days_diff} days "
+                    f"to reach minimum {min_commits} commits for meaningful context"
+                )
+            else:
+                # High-velocity project: reached min_commits without expanding time window
+                analysis["reason"] = (
+                    f"Fetched last {min_commits} commits (spanning {days_diff} days) "
+                    f"to ensure meaningful context"
+                )
 
-            if expanded_result.stdout.strip():
-                result = expanded_result
-                analysis["adaptive_mode"] = True
-
-                # Calculate actual time span
-                from datetime import datetime
-
-                commit_lines = [
-                    line for line in result.stdout.strip().split("\n") if "|" in line
-                ]
-                if commit_lines:
-                    # Parse first and last commit dates
-                    try:
-                        first_parts = commit_lines[0].split("|", 4)
-                        last_parts = commit_lines[-1].split("|", 4)
-
-                        if len(first_parts) >= 4 and len(last_parts) >= 4:
-                            # Parse ISO format dates (e.g., "2025-10-20 11:38:20 -0700")
-                            # Extract just the date portion before timezone
-                            first_date_str = first_parts[3].strip()
-                            last_date_str = last_parts[3].strip()
-
-                            # Remove timezone info for parsing
-                            first_date_clean = first_date_str.split(" +")[0].split(
-                                " -"
-                            )[0]
-                            last_date_clean = last_date_str.split(" +")[0].split(" -")[
-                                0
-                            ]
-
-                            # Parse as datetime
-                            first_date = datetime.fromisoformat(
-                                first_date_clean.replace(" ", "T")
-                            )
-                            last_date = datetime.fromisoformat(
-                                last_date_clean.replace(" ", "T")
-                            )
-
-                            days_diff = (first_date - last_date).days
-                            # Handle the case where days_diff might be 0 or 1
-                            if days_diff <= 1:
-                                days_diff = max(days_diff, 1)
-
-                            analysis["actual_time_span"] = str(days_diff)
-
-                            # Provide clear messaging based on the expansion
-                            if days_diff > days:
-                                analysis["reason"] = (
-                                    f"Expanded from {days} days to {days_diff} days "
-                                    f"to reach minimum {min_commits} commits for meaningful context"
-                                )
-                            else:
-                                # High-velocity project: reached min_commits without expanding time window
-                                analysis["reason"] = (
-                                    f"Fetched last {min_commits} commits (spanning {days_diff} days) "
-                                    f"to ensure meaningful context"
-                                )
-                    except Exception as e:
-                        logger.warning(f"Could not calculate actual time span: {e}")
-                        analysis["actual_time_span"] = f">{days} days"
-                        analysis["reason"] = (
-                            f"Expanded beyond {days} days to get minimum {min_commits} commits"
-                        )
-
-        # Parse commit log
-        commits = []
-        current_commit = None
-        file_changes = {}
-
-        for line in result.stdout.strip().split("\n"):
-            if not line.strip():
-                continue
+        file_changes: dict[str, dict[str, Any]] = {}
+        for commit in commits:
+            contributor = analysis["contributors"].setdefault(
+                commit["author"], {"email": commit["email"], "commits": 0}
+            )
+            contributor["commits"] += 1
+            for change in commit["files"]:
+                info = file_changes.setdefault(
+                    change["path"], {"modifications": 0, "contributors": set()}
+                )
+                info["modifications"] += 1
+                info["contributors"].add(commit["author"])
 
-            if "|" in line:
-                # Commit line
-                if current_commit:
-                    commits.append(current_commit)
-
-                parts = line.split("|", 4)
-                if len(parts) == 5:
-                    sha, author, email, timestamp, message = parts
-                    current_commit = {
-                        "sha": sha,
-                        "author": author,
-                        "email": email,
-                        "timestamp": timestamp,
-                        "message": message,
-                        "files": [],
-                    }
-
-                    # Track contributors
-                    if author not in analysis["contributors"]:
-                        analysis["contributors"][author] = {
-                            "email": email,
-                            "commits": 0,
-                        }
-                    analysis["contributors"][author]["commits"] += 1
-            # File change line
-            elif current_commit and "\t" in line:
-                parts = line.split("\t", 1)
-                if len(parts) == 2:
-                    status, file_path = parts
-                    current_commit["files"].append(
-                        {"status": status, "path": file_path}
-                    )
-
-                    # Track file changes
-                    if file_path not in file_changes:
-                        file_changes[file_path] = {
-                            "modifications": 0,
-                            "contributors": set(),
-                        }
-                    file_changes[file_path]["modifications"] += 1
-                    file_changes[file_path]["contributors"].add(
-                        current_commit["author"]
-                    )
-
-        # Add last commit
-        if current_commit:
-            commits.append(current_commit)
-
-        analysis["commits"] = commits
-
-        # Convert file changes to serializable format
+        analysis["commits"] = [_public(commit) for commit in commits]
         analysis["file_changes"] = {
             path: {
                 "modifications": info["modifications"],
@@ -257,15 +513,95 @@ def analyze_recent_activity(
             }
             for path, info in file_changes.items()
         }
+        return analysis
+
+    def commits_since(self, since_sha: str) -> list[dict[str, Any]]:
+        """Commits in ``since_sha..HEAD``, newest first."""
+        _branch, head = self._head()
+        if head is None:
+            return []
+
+        cursor = self._updated_cursor()
+        if cursor is not None:
+            by_id = {c["id"]: c for c in cursor["commits"]}
+            walked = []
+            current = by_id.get(head)
+            # Only linear history can be answered from the cursor exactly
+            while current is not None and len(current["parents"]) <= 1:
+                if current["id"].startswith(since_sha):
+                    return walked
+                walked.append(current)
+                parents = current["parents"]
+                current = by_id.get(parents[0]) if parents else None
+
+        return list(self._stream_log([head, f"^{since_sha}"]))
+
+    def status(self) -> dict[str, Any]:
+        """Working tree status from one ``git status --porcelain -z``."""
+        self.processes_started += 1
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=str(self.repo_path),
+            capture_output=True,
+            check=True,
+        )
+        modified_files = []
+        untracked_files = []
+        entries = result.stdout.decode("utf-8", errors="replace").split("\0")
+        index = 0
+        while index < len(entries):
+            entry = entries[index]
+            index += 1
+            if not entry:
+                continue
+            status_code, file_path = entry[:2], entry[3:]
+            if status_code.startswith("??"):
+                untracked_files.append(file_path)
+            else:
+                modified_files.append(file_path)
+                if status_code[0] in "RC":
+                    index += 1  # skip the rename source
+        return {
+            "clean": not modified_files and not untracked_files,
+            "modified_files": modified_files,
+            "untracked_files": untracked_files,
+        }
 
-    except subprocess.CalledProcessError as e:
-        logger.warning(f"Git command failed: {e}")
-        analysis["error"] = f"Git command failed: {e}"
-    except Exception as e:
-        logger.warning(f"Could not analyze recent activity: {e}")
-        analysis["error"] = str(e)
 
-    return analysis
+def analyze_recent_activity(
+    repo_path: str = ".", days: int = 7, max_commits: int = 50, min_commits: int = 25
+) -> dict[str, Any]:
+    """
+    Analyze recent git activity for context reconstruction with adaptive time window.
+
+    Strategy:
+    1. Try to get commits from last {days} days
+    2. If fewer than {min_commits} found, expand window to get {min_commits}
+    3. Never exceed {max_commits} total
+
+    This ensures meaningful context for both high-velocity and low-velocity projects.
+
+    Args:
+        repo_path: Path to the git repository (default: current directory)
+        days: Number of days to look back initially (default: 7)
+        max_commits: Maximum number of commits to analyze (default: 50)
+        min_commits: Minimum commits to retrieve, will expand window if needed (default: 25)
+
+    Returns:
+        Dict containing:
+        - time_range: str - Description of analysis period
+        - commits: List[Dict] - Recent commits with metadata
+        - branches: List[str] - Active branches in the repository
+        - contributors: Dict[str, Dict] - Contributor statistics
+        - file_changes: Dict[str, Dict] - File change statistics
+        - has_activity: bool - Whether any activity was found
+        - adaptive_mode: bool - Whether time window was expanded
+        - actual_time_span: Optional[str] - Actual time span if adaptive mode was used
+        - reason: Optional[str] - Explanation for adaptive mode
+        - error: Optional[str] - Error message if analysis failed
+    """
+    analyzer = GitActivityAnalyzer(repo_path, cursor_dir=DEFAULT_CURSOR_DIR)
+    return analyzer.analyze(days, max_commits, min_commits)
 
 
 def get_current_branch(repo_path: str = ".") -> str | None:
@@ -279,14 +615,7 @@ def get_current_branch(repo_path: str = ".") -> str | None:
         Current branch name or None if not in a git repository
     """
     try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=str(Path(repo_path)),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
+        return GitActivityAnalyzer(repo_path).current_branch()
     except Exception:
         return None
 
@@ -303,35 +632,20 @@ def get_commits_since(since_sha: str, repo_path: str = ".") -> list[dict[str, st
         List of commit dicts with sha, author, timestamp, and message
     """
     try:
-        result = subprocess.run(
-            ["git", "log", f"{since_sha}..HEAD", "--format=%h|%an|%ai|%s"],
-            cwd=str(Path(repo_path)),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        commits = []
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("|", 3)
-            if len(parts) == 4:
-                sha, author, timestamp, message = parts
-                commits.append(
-                    {
-                        "sha": sha,
-                        "author": author,
-                        "timestamp": timestamp,
-                        "message": message,
-                    }
-                )
-
-        return commits
-
+        analyzer = GitActivityAnalyzer(repo_path, cursor_dir=DEFAULT_CURSOR_DIR)
+        commits = analyzer.commits_since(since_sha)
     except Exception as e:
         logger.warning(f"Could not get commits: {e}")
         return []
+    return [
+        {
+            "sha": commit["sha"],
+            "author": commit["author"],
+            "timestamp": commit["timestamp"],
+            "message": commit["message"],
+        }
+        for commit in commits
+    ]
 
 
 def get_current_status(repo_path: str = ".") -> dict[str, Any]:
@@ -347,41 +661,11 @@ def get_current_status(repo_path: str = ".") -> dict[str, Any]:
         - modified_files: List[str] - Modified files
         - untracked_files: List[str] - Untracked files
     """
-    status = {"clean": True, "modified_files": [], "untracked_files": []}
-
     try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=str(Path(repo_path)),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-
-        modified_files = []
-        untracked_files = []
-
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            status_code = line[:2]
-            file_path = line[3:]
-
-            if status_code.startswith("??"):
-                untracked_files.append(file_path)
-            else:
-                modified_files.append(file_path)
-
-        status = {
-            "clean": len(modified_files) == 0 and len(untracked_files) == 0,
-            "modified_files": modified_files,
-            "untracked_files": untracked_files,
-        }
-
+        return GitActivityAnalyzer(repo_path).status()
     except Exception as e:
         logger.warning(f"Could not get status: {e}")
-
-    return status
+        return {"clean": True, "modified_files": [], "untracked_files": []}
 
 
 def is_git_repository(repo_path: str = ".") -> bool:
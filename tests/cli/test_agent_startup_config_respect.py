@@ -17,7 +17,11 @@ class TestAgentStartupConfigRespect:
     @pytest.fixture(autouse=True)
     def bypass_sync_ttl(self):
         """Ensure tests always exercise the sync path regardless of TTL state."""
-        with patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False):
+        with (
+            patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False),
+            patch("claude_mpm.cli.startup._pending_changes", return_value=["test"]),
+            patch("claude_mpm.cli.startup._mark_reconciled"),
+        ):
             yield
 
     def test_deployment_respects_agents_enabled_list(self):
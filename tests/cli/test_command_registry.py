@@ -0,0 +1,164 @@
+"""Tests for the lazy CLI command registry.
+
+Test Coverage:
+- Registry entries match the subparsers their builders register
+- Only the requested command's parser is built
+- Dispatch through registry handlers, aliases and class-based commands
+- Import budget of lightweight commands (``-X importtime`` based)
+"""
+
+import argparse
+from unittest.mock import patch
+
+import pytest
+
+from claude_mpm.cli.command_registry import (
+    COMMANDS,
+    get_command,
+    load_handler,
+    load_parser_builder,
+    select_commands,
+)
+from claude_mpm.cli.executor import execute_command
+from claude_mpm.cli.import_costs import (
+    measure_command_imports,
+    parse_importtime,
+    top_import_costs,
+    total_import_us,
+)
+from claude_mpm.cli.parser import create_parser
+from claude_mpm.cli.parsers.base_parser import (
+    add_top_level_run_arguments,
+    create_main_parser,
+)
+
+
+@pytest.fixture
+def main_parser() -> argparse.ArgumentParser:
+    parser = create_main_parser()
+    add_top_level_run_arguments(parser)
+    return parser
+
+
+def subcommands(parser: argparse.ArgumentParser) -> list[str]:
+    (action,) = [
+        a for a in parser._actions if isinstance(a, argparse._SubParsersAction)
+    ]
+    return list(action.choices)
+
+
+class TestRegistry:
+    @pytest.mark.parametrize(
+        "spec", [s for s in COMMANDS if s.parser], ids=lambda s: s.name
+    )
+    def test_parser_builder_registers_declared_names(self, spec):
+        subparsers = argparse.ArgumentParser().add_subparsers(dest="command")
+        load_parser_builder(spec)(subparsers)
+
+        assert list(subparsers.choices) == list(spec.names)
+
+    def test_handlers_resolve(self):
+        for spec in COMMANDS:
+            if spec.handler:
+                assert callable(load_handler(spec)), spec.name
+
+    def test_full_parser_lists_every_command(self):
+        names = subcommands(create_parser())
+
+        assert names == [
+            name for spec in COMMANDS if spec.parser for name in spec.names
+        ]
+
+
+class TestSelectCommands:
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            ([], []),
+            (["--logging", "DEBUG"], []),
+            (["--logging", "DEBUG", "doctor", "--json"], ["doctor"]),
+            (["check-health"], ["doctor"]),
+            (["--resume", "run"], []),  # argparse consumes "run" as the value
+            (["--resume", "--monitor", "agents", "list"], ["agents"]),
+        ],
+    )
+    def test_single_command(self, main_parser, argv, expected):
+        selected = select_commands(main_parser, argv)
+
+        assert [spec.name for spec in selected] == expected
+
+    @pytest.mark.parametrize("argv", [None, ["--help"], ["agnets"], ["info"]])
+    def test_all_commands(self, main_parser, argv):
+        assert select_commands(main_parser, argv) == COMMANDS
+
+    def test_only_requested_parser_is_built(self):
+        parser = create_parser(argv=["doctor", "--json"])
+        args = parser.parse_args(["doctor", "--json"])
+
+        assert subcommands(parser) == ["doctor", "diagnose", "check-health"]
+        assert args.command == "doctor"
+        assert args.json
+
+
+class TestDispatch:
+    def test_alias_dispatches_to_handler(self):
+        with patch(
+            "claude_mpm.cli.commands.doctor.run_doctor", return_value=None
+        ) as run_doctor:
+            assert execute_command("check-health", argparse.Namespace()) == 0
+
+        run_doctor.assert_called_once()
+
+    def test_class_command_exit_code(self):
+        spec = get_command("profile")
+        with patch("claude_mpm.cli.commands.profile.ProfileCommand") as command:
+            command.return_value.run.return_value.exit_code = 3
+            assert execute_command("profile", argparse.Namespace()) == 3
+
+        assert spec.method == "run"
+
+    def test_unknown_command(self, capsys):
+        assert execute_command("agnets", argparse.Namespace()) == 1
+
+
+class TestImportCosts:
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     json.decoder\n"
+            "import time:       300 |        420 |   json\n"
+        )
+        costs = parse_importtime(output)
+
+        assert [(c.module, c.self_us, c.cumulative_us, c.depth) for c in costs] == [
+            ("json.decoder", 120, 120, 2),
+            ("json", 300, 420, 1),
+        ]
+        assert total_import_us(costs) == 420
+        assert top_import_costs(costs, limit=1)[0].module == "json"
+
+
+@pytest.mark.performance
+class TestImportBudget:
+    """Lightweight commands import only their own command modules.
+
+    Before the registry, every invocation imported all command modules
+    (about 2 s); these commands now stay well under the budget.
+    """
+
+    BUDGET_MS = 1500
+
+    @pytest.mark.parametrize("command", ["doctor", "config", "debug", "gh"])
+    def test_command_imports(self, command):
+        costs = measure_command_imports([command])
+        spec = get_command(command)
+        command_modules = {
+            cost.module
+            for cost in costs
+            if cost.module.startswith("claude_mpm.cli.commands.")
+        }
+
+        assert command_modules <= set(spec.modules)
+        assert total_import_us(costs) / 1000 < self.BUDGET_MS, "\n".join(
+            f"{c.self_us / 1000:.1f} ms {c.module}" for c in top_import_costs(costs)
+        )
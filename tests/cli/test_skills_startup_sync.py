@@ -9,15 +9,23 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def bypass_sync_ttl():
+    """Ensure tests always exercise the sync path regardless of TTL state.
+
+    Also keeps the tests off the real change journal in ~/.claude-mpm.
+    """
+    with (
+        patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False),
+        patch("claude_mpm.cli.startup._pending_changes", return_value=["test"]),
+        patch("claude_mpm.cli.startup._mark_reconciled"),
+    ):
+        yield
+
+
 class TestSyncRemoteSkillsOnStartup:
     """Test suite for sync_remote_skills_on_startup function."""
 
-    @pytest.fixture(autouse=True)
-    def bypass_sync_ttl(self):
-        """Ensure tests always exercise the sync path regardless of TTL state."""
-        with patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False):
-            yield
-
     @patch("claude_mpm.services.skills.git_skill_source_manager.GitSkillSourceManager")
     @patch("claude_mpm.config.skill_sources.SkillSourceConfiguration")
     def test_successful_skills_sync(self, mock_config_class, mock_manager_class):
@@ -171,7 +179,11 @@ class TestTwoPhaseProgressBars:
     @pytest.fixture(autouse=True)
     def bypass_sync_ttl(self):
         """Ensure tests always exercise the sync path regardless of TTL state."""
-        with patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False):
+        with (
+            patch("claude_mpm.cli.startup._is_sync_fresh", return_value=False),
+            patch("claude_mpm.cli.startup._pending_changes", return_value=["test"]),
+            patch("claude_mpm.cli.startup._mark_reconciled"),
+        ):
             yield
 
     @patch("claude_mpm.utils.progress.ProgressBar")
@@ -23,6 +23,7 @@ from claude_mpm.cli.startup import sync_remote_agents_on_startup
 class TestStartupTTLFresh:
     """Verify TTL-fresh condition skips sync entirely."""
 
+    @patch("claude_mpm.cli.startup._pending_changes", return_value=[])
     @patch(
         "claude_mpm.cli.startup._agent_sources_changed_since_last_sync",
         return_value=False,
@@ -32,6 +33,7 @@ class TestStartupTTLFresh:
         self,
         mock_is_fresh,
         mock_sources_changed,
+        mock_pending,
     ):
         """When last sync is within TTL and sources unchanged, the function
         returns immediately without calling sync_agents_on_startup()."""
@@ -45,9 +47,48 @@ class TestStartupTTLFresh:
             # the TTL check short-circuited the function
             mock_sync.assert_not_called()
 
-        # Verify the TTL helpers were consulted
+        # Verify the TTL helpers and the change journal were consulted
         mock_is_fresh.assert_called_once_with("agents")
         mock_sources_changed.assert_called_once()
+        mock_pending.assert_called_once_with("agents", baseline_only=True)
+
+    @patch("claude_mpm.cli.startup._mark_sync_done")
+    @patch("claude_mpm.cli.startup._mark_reconciled")
+    @patch(
+        "claude_mpm.cli.startup._pending_changes",
+        return_value=["deployed engineer.md changed"],
+    )
+    @patch(
+        "claude_mpm.cli.startup._agent_sources_changed_since_last_sync",
+        return_value=False,
+    )
+    @patch("claude_mpm.cli.startup._is_sync_fresh", return_value=True)
+    def test_ttl_fresh_reconciles_journal_changes(
+        self,
+        mock_is_fresh,
+        mock_sources_changed,
+        mock_pending,
+        mock_mark_reconciled,
+        mock_mark_sync_done,
+    ):
+        """Within the TTL, local changes recorded in the change journal are
+        reconciled without polling remote sources."""
+        with (
+            patch(
+                "claude_mpm.services.agents.startup_sync.sync_agents_on_startup"
+            ) as mock_sync,
+            patch(
+                "claude_mpm.cli.startup._reconcile_agents_from_cache",
+                return_value=True,
+            ) as mock_reconcile,
+        ):
+            sync_remote_agents_on_startup(force_sync=False)
+
+        mock_sync.assert_not_called()
+        mock_reconcile.assert_called_once()
+        mock_mark_reconciled.assert_called_once_with("agents")
+        # No network poll happened, so the TTL window is not extended
+        mock_mark_sync_done.assert_not_called()
 
     @patch(
         "claude_mpm.cli.startup._agent_sources_changed_since_last_sync",
@@ -0,0 +1,170 @@
+"""Tests for FileSystemCache validation, prefix invalidation and disk tier."""
+
+import os
+import pickle
+import time
+
+import pytest
+
+from claude_mpm.core.cache import DISK_MAGIC, FileSystemCache, estimate_size
+
+
+@pytest.fixture
+def persist_path(tmp_path):
+    return tmp_path / "fs_cache.log"
+
+
+def test_ttl_expiry():
+    cache = FileSystemCache(default_ttl=0.01)
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_modified_file_replaces_entry_in_place(tmp_path):
+    cache = FileSystemCache()
+    path = tmp_path / "agent.md"
+    path.write_text("v1")
+    assert cache.get_file(path) == "v1"
+    assert cache.get_file(path) == "v1"
+
+    path.write_text("version 2")
+    assert cache.get_file(path) == "version 2"
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entry_count"]) == (1, 2, 1)
+
+
+def test_same_size_rewrite_detected_by_mtime(tmp_path):
+    cache = FileSystemCache()
+    path = tmp_path / "config.json"
+    path.write_text('{"a": 1}')
+    assert cache.get_json(path) == {"a": 1}
+
+    path.write_text('{"a": 2}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get_json(path) == {"a": 2}
+
+
+def test_deleted_file_drops_entry(tmp_path):
+    cache = FileSystemCache()
+    path = tmp_path / "gone.txt"
+    path.write_bytes(b"data")
+    assert cache.get_file(path, mode="rb") == b"data"
+
+    path.unlink()
+    assert cache.get_file(path, mode="rb") is None
+    assert cache.get_stats()["entry_count"] == 0
+
+
+def test_size_estimate_and_eviction():
+    # The repeated string is counted once
+    assert 1000 < estimate_size({"items": ["x" * 1000] * 3}) < 2000
+
+    cache = FileSystemCache(max_size_mb=0.01)
+    cache.put("a", "x", size_hint=6000)
+    cache.put("b", "y", size_hint=6000)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y"
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_prefix_and_pattern_invalidation():
+    cache = FileSystemCache()
+    for key in ("query:1", "query:2", "queryx", "file:a", "file:b:r"):
+        cache.put(key, key)
+
+    assert cache.invalidate_pattern("query:*") == 2
+    assert cache.invalidate_pattern("file:*:r") == 1
+    assert [k for k in ("queryx", "file:a") if cache.get(k)] == ["queryx", "file:a"]
+
+
+class TestDiskTier:
+    def test_round_trip_loads_lazily(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        cache.put("text", "hello")
+        cache.put("blob", b"\x00\x01")
+        cache.put("doc", {"a": [1, 2]})
+        cache._save_cache()
+
+        reopened = FileSystemCache(persist_path=persist_path)
+        assert reopened.get_stats()["entry_count"] == 0
+        assert reopened.get_stats()["disk_entries"] == 3
+        assert reopened.get("blob") == b"\x00\x01"
+        assert reopened.get("doc") == {"a": [1, 2]}
+        assert reopened.get_stats()["entry_count"] == 2
+
+    def test_non_json_values_stay_in_memory(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        cache.put("obj", object())
+        cache.put("ok", 1)
+        cache._save_cache()
+
+        assert FileSystemCache(persist_path=persist_path).get("obj") is None
+
+    def test_invalidation_and_overwrite_survive_reopen(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        cache.put("query:1", "a")
+        cache.put("query:2", "b")
+        cache.put("keep", "v1")
+        cache._save_cache()
+
+        cache = FileSystemCache(persist_path=persist_path)
+        assert cache.invalidate_prefix("query:") == 2
+        cache.put("keep", "v2")
+        cache._save_cache()
+
+        cache = FileSystemCache(persist_path=persist_path)
+        assert cache.get("query:1") is None
+        assert cache.get("keep") == "v2"
+
+    def test_unsaved_overwrite_never_resurrects_stored_value(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        cache.put("key", "old")
+        cache._save_cache()
+
+        cache = FileSystemCache(persist_path=persist_path, max_entries=1)
+        cache.put("key", "new")
+        cache.put("other", "x")  # evicts the unsaved "new"
+
+        assert cache.get("key") is None
+
+    def test_torn_tail_and_corrupt_records_ignored(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        cache.put("first", "intact")
+        cache.put("second", "will be corrupted")
+        cache._save_cache()
+        data = persist_path.read_bytes()
+        index = data.index(b"corrupted")
+        persist_path.write_bytes(data[:index] + b"X" + data[index + 1 :] + b"\x07\x00")
+
+        cache = FileSystemCache(persist_path=persist_path)
+        assert cache.get("first") == "intact"
+        assert cache.get("second") is None
+
+        cache.put("third", 3)
+        cache._save_cache()
+        assert FileSystemCache(persist_path=persist_path).get("third") == 3
+
+    def test_legacy_pickle_file_is_not_loaded(self, persist_path):
+        persist_path.write_bytes(pickle.dumps({"key": "value"}))
+
+        cache = FileSystemCache(persist_path=persist_path)
+        assert cache.get("key") is None
+
+        cache.put("key", "fresh")
+        cache._save_cache()
+        assert persist_path.read_bytes().startswith(DISK_MAGIC)
+
+    def test_log_compacts_when_mostly_dead(self, persist_path):
+        cache = FileSystemCache(persist_path=persist_path)
+        for round_ in range(10):
+            cache.put("key", "x" * 100 + str(round_))
+            cache._save_cache()
+
+        assert persist_path.stat().st_size < 3 * 220  # ten rounds append ~2 KiB
+        assert FileSystemCache(persist_path=persist_path).get("key").endswith("9")
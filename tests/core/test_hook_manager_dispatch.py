@@ -0,0 +1,170 @@
+"""Tests for in-process hook dispatch in HookManager.
+
+Test Coverage:
+- Events are passed to an in-process handler without spawning a subprocess
+- Queued events are dispatched in batches
+- Queue overflow is counted in the dispatch stats
+- Subprocess mode and fallback when the handler cannot be created
+- Handler exceptions feed the hook error memory
+"""
+
+import logging
+import queue
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from claude_mpm.core import hook_performance_config
+from claude_mpm.core.hook_error_memory import HookErrorMemory
+from claude_mpm.core.hook_manager import HookManager
+
+
+class RecordingHandler:
+    def __init__(self, error=None):
+        self.events = []
+        self.error = error
+
+    def process_event(self, event):
+        if self.error:
+            raise self.error
+        self.events.append(event)
+
+
+def hook(hook_type="PreToolUse", **event_data):
+    return {"hook_type": hook_type, "event_data": event_data}
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    managers = []
+
+    def factory(**env):
+        env.setdefault("CLAUDE_MPM_PERFORMANCE_MODE", "false")
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setattr(hook_performance_config, "_hook_config", None)
+        manager = HookManager()
+        manager.error_memory = HookErrorMemory(memory_file=tmp_path / "errors.json")
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        manager.shutdown()
+
+
+class TestInProcessDispatch:
+    def test_events_dispatched_without_subprocess(self, make_manager):
+        manager = make_manager()
+        handler = RecordingHandler()
+        manager._in_process_handler = handler
+
+        with patch("subprocess.run") as mock_run:
+            manager.trigger_pre_tool_hook("TodoWrite", {"todos": []})
+            manager.trigger_user_prompt_hook("hello")
+            deadline = time.time() + 5
+            while len(handler.events) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+
+        mock_run.assert_not_called()
+        pre, prompt = handler.events
+        assert pre["hook_event_name"] == "PreToolUse"
+        assert pre["tool_name"] == "TodoWrite"
+        assert pre["session_id"] == manager.session_id
+        assert prompt["prompt"] == "hello"
+        assert manager.get_stats()["dispatched"] == 2
+
+    def test_batches_queued_events(self, make_manager):
+        manager = make_manager(CLAUDE_MPM_HOOK_BATCH_SIZE="4")
+        manager.shutdown()
+        handler = RecordingHandler()
+        manager._in_process_handler = handler
+        for index in range(10):
+            manager.trigger_post_tool_hook("Read", 0, index)
+
+        manager.shutdown_event.clear()
+        manager._start_background_processor()
+        deadline = time.time() + 5
+        while len(handler.events) < 10 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert [e["result"] for e in handler.events] == [str(i) for i in range(10)]
+        assert manager.get_stats()["batches"] == 3
+
+    def test_real_handler_keeps_logging_config(self, make_manager):
+        manager = make_manager()
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+
+        handler = manager._get_in_process_handler()
+
+        assert type(handler).__name__ == "ClaudeHookHandler"
+        assert manager._get_in_process_handler() is handler
+        assert root.handlers == handlers
+        assert root.level == level
+
+
+class TestOverflow:
+    def test_full_queue_counts_drops(self, make_manager):
+        manager = make_manager()
+        manager.shutdown()
+        manager.hook_queue = queue.Queue(maxsize=2)
+
+        results = [manager.trigger_pre_tool_hook("Read") for _ in range(5)]
+
+        stats = manager.get_stats()
+        assert results == [True, True, False, False, False]
+        assert (stats["queued"], stats["dropped"]) == (2, 3)
+        assert stats["max_queue_depth"] == 2
+        assert stats["queue_depth"] == 2
+
+
+class TestSubprocessMode:
+    def ok_result(self):
+        return Mock(returncode=0, stdout="", stderr="")
+
+    def test_subprocess_mode(self, make_manager):
+        manager = make_manager(CLAUDE_MPM_HOOK_DISPATCH="subprocess")
+
+        with patch("subprocess.run", return_value=self.ok_result()) as mock_run:
+            manager._process_batch([hook(tool_name="Read")])
+
+        assert manager.get_stats()["dispatch_mode"] == "subprocess"
+        assert mock_run.call_count == 1
+        assert manager._in_process_handler is None
+
+    def test_falls_back_when_handler_unavailable(self, make_manager):
+        manager = make_manager()
+
+        with (
+            patch(
+                "claude_mpm.hooks.claude_hooks.services.get_container",
+                side_effect=RuntimeError("broken"),
+            ),
+            patch("subprocess.run", return_value=self.ok_result()) as mock_run,
+        ):
+            manager._process_batch([hook(), hook()])
+
+        assert manager.dispatch_mode == "subprocess"
+        assert mock_run.call_count == 2
+
+
+class TestErrorMemory:
+    def test_handler_errors_recorded_and_hook_skipped(self, make_manager):
+        manager = make_manager()
+        handler = RecordingHandler(
+            error=FileNotFoundError("no such file or directory: /missing/script.sh")
+        )
+        manager._in_process_handler = handler
+
+        with patch.object(manager, "_publish_error_event") as publish:
+            manager._process_batch([hook(), hook()])
+            assert manager.error_memory.should_skip_hook("PreToolUse")
+
+            handler.error = None
+            manager._process_batch([hook()])
+
+        assert publish.call_count == 2
+        assert handler.events == []
+        assert manager.get_stats()["errors"] == 2
@@ -0,0 +1,118 @@
+"""Tests for the per-thread persistent SQLite connection pool."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from claude_mpm.core.sqlite_pool import SQLiteConnectionPool
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "test.db")
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    yield pool
+    pool.close()
+
+
+def test_pragmas_applied_once_per_connection(pool):
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert pool.connections_opened == 1
+
+
+def test_same_connection_reused_on_thread(pool):
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+
+
+def test_threads_get_their_own_connections(pool):
+    seen = []
+    # Keep all workers alive together so connection ids can't be recycled
+    barrier = threading.Barrier(4)
+
+    def worker():
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('x')")
+            seen.append(id(conn))
+        barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 4
+    assert len(set(seen)) == 4
+
+
+def test_dead_thread_connections_are_closed(pool):
+    def worker():
+        with pool.connection():
+            pass
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert len(pool._connections) == 2
+
+    other = threading.Thread(target=worker)
+    other.start()
+    other.join()
+
+    # Opening the second worker's connection pruned the first one
+    assert len(pool._connections) == 2
+
+
+def test_rollback_on_error(pool):
+    with pytest.raises(sqlite3.IntegrityError), pool.connection() as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('kept?')")
+        conn.execute("INSERT INTO items (name) VALUES (NULL)")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_nested_blocks_share_outer_transaction(pool):
+    with pytest.raises(RuntimeError), pool.connection() as outer:
+        with pool.connection() as inner:
+            inner.execute("INSERT INTO items (name) VALUES ('inner')")
+        assert outer.in_transaction
+        raise RuntimeError("abort outer")
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_executemany_is_single_transaction(pool):
+    assert (
+        pool.executemany(
+            "INSERT INTO items (name) VALUES (?)", [(f"n{i}",) for i in range(50)]
+        )
+        == 50
+    )
+
+    with pytest.raises(sqlite3.IntegrityError):
+        pool.executemany("INSERT INTO items (name) VALUES (?)", [("ok",), (None,)])
+
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 50
+
+
+def test_close_then_reopen(pool):
+    with pool.connection() as conn:
+        pass
+    pool.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    with pool.connection() as conn:
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
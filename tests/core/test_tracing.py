@@ -0,0 +1,201 @@
+"""Tests for opt-in span tracing.
+
+Test Coverage:
+- Disabled tracing returns the shared no-op span
+- Span nesting, explicit ends and Chrome trace file output
+- ``--profile`` / ``CLAUDE_MPM_PROFILE`` enabling
+- Span summaries and the ``debug profile`` command
+"""
+
+import argparse
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from claude_mpm.cli.commands.debug import debug_profile
+from claude_mpm.cli.parser import create_parser
+from claude_mpm.core import tracing
+
+
+@pytest.fixture(autouse=True)
+def isolated_tracing(tmp_path, monkeypatch):
+    monkeypatch.delenv(tracing.PROFILE_ENV, raising=False)
+    tracing.disable()
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        yield tmp_path / ".claude-mpm" / "traces"
+    tracing.disable()
+
+
+def write_trace(directory, process, spans):
+    tracer = tracing.Tracer(process)
+    for name, category, dur_ms in spans:
+        tracer.record(name, category, 0, int(dur_ms * 1_000_000))
+    return tracer.write(directory)
+
+
+class TestSpans:
+    def test_disabled_span_is_noop(self, isolated_tracing):
+        span = tracing.span("startup.x", "startup")
+
+        assert span is tracing._NOOP_SPAN
+        with span:
+            span.set(count=1)
+        assert tracing.flush() is None
+        assert not isolated_tracing.exists()
+
+    def test_nested_spans_written_as_complete_events(self, isolated_tracing):
+        tracing.enable("claude-mpm")
+
+        with tracing.span("outer", "startup"):
+            with tracing.span("inner", "registry", agents=3):
+                pass
+            step = tracing.span("step", "startup")
+            step.end()
+            step.end()
+
+        path = tracing.flush()
+        trace = json.loads(path.read_text())
+        events = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+
+        assert path.parent == isolated_tracing
+        assert path.name.startswith("claude-mpm-")
+        assert list(events) == ["inner", "step", "outer"]
+        assert events["inner"]["args"] == {"agents": 3}
+        outer, inner = events["outer"], events["inner"]
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+        assert trace["otherData"]["process"] == "claude-mpm"
+
+    def test_second_flush_appends(self):
+        tracing.enable("hook")
+        with tracing.span("hook.PreToolUse", "hook"):
+            pass
+        first = tracing.flush()
+        with tracing.span("emit.hook_event", "emit"):
+            pass
+
+        assert tracing.flush() == first
+        names = [e["name"] for e in json.loads(first.read_text())["traceEvents"]]
+        assert names == ["process_name", "hook.PreToolUse", "emit.hook_event"]
+
+    def test_exception_recorded(self):
+        tracer = tracing.enable("claude-mpm")
+
+        with pytest.raises(ValueError), tracing.span("fails"):
+            raise ValueError
+
+        assert tracer._events[0]["args"] == {"error": "ValueError"}
+
+    def test_traced_decorator(self):
+        @tracing.traced("work", "framework")
+        def work(x):
+            return x * 2
+
+        assert work(2) == 4
+        tracer = tracing.enable("claude-mpm")
+        assert work(3) == 6
+        assert [e["name"] for e in tracer._events] == ["work"]
+
+
+class TestEnabling:
+    def test_enable_from_env(self, monkeypatch):
+        assert not tracing.enable_from_env("hook")
+
+        monkeypatch.setenv(tracing.PROFILE_ENV, "1")
+
+        assert tracing.enable_from_env("hook")
+        assert tracing.get_tracer().process_name == "hook"
+
+    def test_enable_exports_env_for_child_processes(self, monkeypatch):
+        tracing.enable("claude-mpm")
+
+        assert tracing.profile_requested()
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["--profile", "doctor"], True),
+            (["agents", "--profile", "list"], True),
+            (["doctor"], False),
+        ],
+    )
+    def test_profile_flag(self, argv, expected):
+        args = create_parser(argv=argv).parse_args(argv)
+
+        assert getattr(args, "trace_profile", False) is expected
+
+
+class TestSummary:
+    def test_summarize_spans(self, isolated_tracing):
+        write_trace(isolated_tracing, "claude-mpm", [("a", "startup", 5)])
+        write_trace(
+            isolated_tracing,
+            "hook",
+            [("a", "startup", 15), ("b", "hook", 10), ("b", "hook", 2)],
+        )
+
+        rows = tracing.summarize_spans(tracing.load_traces())
+
+        assert [(r["name"], r["count"]) for r in rows] == [("a", 2), ("b", 2)]
+        assert rows[0]["max_ms"] == 15
+        assert rows[0]["mean_ms"] == 10
+        assert rows[1]["total_ms"] == 12
+
+        hook_only = tracing.summarize_spans(tracing.load_traces(process="hook"))
+        assert hook_only[0]["max_ms"] == 15
+        assert tracing.summarize_spans(tracing.load_traces(), "hook")[0]["name"] == "b"
+
+    def test_load_traces_limit_and_invalid_files(self, isolated_tracing):
+        for index in range(3):
+            tracer = tracing.Tracer("claude-mpm")
+            tracer.pid = index
+            tracer.record("a", "startup", 0, 1000)
+            tracer.write(isolated_tracing)
+        (isolated_tracing / "broken.json").write_text("{")
+
+        assert len(tracing.load_traces(limit=2)) == 2
+        assert len(tracing.load_traces(limit=10)) == 3
+
+
+def profile_args(**overrides):
+    defaults = {"runs": 10, "top": 20, "process": None, "category": None}
+    defaults["json"] = False
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
+class TestDebugProfile:
+    def test_without_traces(self, capsys):
+        assert debug_profile(profile_args(), logging.getLogger()) == 0
+
+        assert "claude-mpm --profile" in capsys.readouterr().out
+
+    def test_table(self, isolated_tracing, capsys):
+        write_trace(
+            isolated_tracing,
+            "claude-mpm",
+            [("startup.sync_agents", "startup", 120), ("cli.parse", "startup", 4)],
+        )
+
+        assert debug_profile(profile_args(top=1), logging.getLogger()) == 0
+
+        out = capsys.readouterr().out
+        assert "startup.sync_agents" in out
+        assert "cli.parse" not in out
+
+    def test_json(self, isolated_tracing, capsys):
+        path = write_trace(isolated_tracing, "hook", [("hook.Stop", "hook", 3)])
+
+        assert debug_profile(profile_args(json=True), logging.getLogger()) == 0
+
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["runs"] == [str(path)]
+        assert summary["spans"][0]["name"] == "hook.Stop"
+
+    def test_parser(self):
+        argv = ["debug", "profile", "--runs", "5", "--category", "hook"]
+        args = create_parser(argv=argv).parse_args(argv)
+
+        assert (args.debug_command, args.runs, args.category) == ("profile", 5, "hook")
@@ -0,0 +1,327 @@
+"""Tests for pooled, rate-limited integration clients and concurrent bulk runs.
+
+A small aiohttp application stands in for a third-party API so pagination,
+Retry-After handling and connection sharing run over real HTTP.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from claude_mpm.integrations.core.batch import BatchRunner
+from claude_mpm.integrations.core.client import APIError, IntegrationClient
+from claude_mpm.integrations.core.manifest import IntegrationManifest
+from claude_mpm.integrations.core.pool import (
+    ConnectorPool,
+    TokenBucket,
+    parse_retry_after,
+)
+
+ITEMS = [{"id": i} for i in range(250)]
+
+
+class StandInAPI:
+    """Fake list/rate-limited API recording what clients did."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.peers: set[tuple[str, int]] = set()
+        self.active = 0
+        self.peak = 0
+        self.throttled: dict[str, int] = {}
+        self.server: TestServer | None = None
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._track])
+        app.router.add_get("/pages", self.pages)
+        app.router.add_get("/cursor", self.cursor)
+        app.router.add_get("/linked", self.linked)
+        app.router.add_get("/throttled/{key}", self.throttled_endpoint)
+        app.router.add_get("/slow", self.slow)
+        app.router.add_post("/graphql", self.graphql)
+        return app
+
+    @web.middleware
+    async def _track(self, request: web.Request, handler):
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await handler(request)
+        finally:
+            self.active -= 1
+
+    async def pages(self, request: web.Request) -> web.Response:
+        page = int(request.query["page"])
+        size = int(request.query["per_page"])
+        chunk = ITEMS[(page - 1) * size : page * size]
+        return web.json_response({"data": {"items": chunk}})
+
+    async def cursor(self, request: web.Request) -> web.Response:
+        start = int(request.query.get("cursor", 0))
+        size = int(request.query["limit"])
+        chunk = ITEMS[start : start + size]
+        following = start + size if start + size < len(ITEMS) else None
+        return web.json_response({"results": chunk, "meta": {"next": following}})
+
+    async def linked(self, request: web.Request) -> web.Response:
+        page = int(request.query.get("page", 1))
+        size = int(request.query["per_page"])
+        chunk = ITEMS[(page - 1) * size : page * size]
+        headers = {}
+        if page * size < len(ITEMS):
+            url = request.url.with_query(page=page + 1, per_page=size)
+            headers["Link"] = f'<{url}>; rel="next", <{url}>; rel="last"'
+        return web.json_response(chunk, headers=headers)
+
+    async def throttled_endpoint(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        self.throttled[key] = self.throttled.get(key, 0) + 1
+        if self.throttled[key] == 1:
+            return web.json_response(
+                {"error": "slow down"}, status=429, headers={"Retry-After": "0.2"}
+            )
+        if key == "always":
+            return web.json_response({"error": "slow down"}, status=429)
+        return web.json_response({"ok": True})
+
+    async def slow(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(0.1)
+        return web.json_response({"ok": True})
+
+    async def graphql(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"errors": [{"message": "Field 'nope' doesn't exist"}]}, status=400
+        )
+
+
+@pytest.fixture
+async def api():
+    stand_in = StandInAPI()
+    server = TestServer(stand_in.app())
+    await server.start_server()
+    stand_in.server = server
+    yield stand_in
+    await server.close()
+
+
+def make_manifest(
+    base_url: str, name: str = "standin", rate_limit: dict | None = None
+) -> IntegrationManifest:
+    return IntegrationManifest.from_dict(
+        {
+            "name": name,
+            "version": "1.0.0",
+            "description": "Stand-in API",
+            "api_type": "rest",
+            "base_url": base_url,
+            "auth": {"type": "none"},
+            "rate_limit": rate_limit or {},
+            "operations": [
+                {
+                    "name": "list_pages",
+                    "description": "Page-numbered list",
+                    "type": "rest_get",
+                    "endpoint": "/pages",
+                    "pagination": {"items_path": "data.items", "page_size": 100},
+                },
+                {
+                    "name": "list_cursor",
+                    "description": "Cursor list",
+                    "type": "rest_get",
+                    "endpoint": "/cursor",
+                    "pagination": {
+                        "style": "cursor",
+                        "items_path": "results",
+                        "size_param": "limit",
+                        "page_size": 60,
+                        "cursor_path": "meta.next",
+                    },
+                },
+                {
+                    "name": "list_linked",
+                    "description": "Link-header list",
+                    "type": "rest_get",
+                    "endpoint": "/linked",
+                    "pagination": {"style": "link", "page_size": 100},
+                },
+                {
+                    "name": "slow",
+                    "description": "Slow endpoint",
+                    "type": "rest_get",
+                    "endpoint": "/slow",
+                },
+            ],
+        }
+    )
+
+
+def base_url(api: StandInAPI) -> str:
+    return str(api.server.make_url("")).rstrip("/")
+
+
+class TestManifestLimits:
+    def test_parses_rate_limit_and_pagination(self) -> None:
+        manifest = make_manifest(
+            "https://api.test.com", rate_limit={"requests_per_minute": 120}
+        )
+
+        assert manifest.rate_limit.requests_per_second == 2.0
+        assert manifest.get_operation("list_cursor").pagination.page_param == "cursor"
+        assert manifest.to_dict()["rate_limit"]["max_concurrency"] == 10
+        assert manifest.validate() == []
+
+    def test_to_dict_omits_unconfigured_sections(self) -> None:
+        data = make_manifest("https://api.test.com").to_dict()
+
+        assert "rate_limit" not in data
+        assert "cache" not in data
+        assert "pagination" not in data["operations"][3]
+        assert "cache_ttl" not in data["operations"][3]
+        assert data["operations"][0]["pagination"]["page_size"] == 100
+        assert IntegrationManifest.from_dict(data).to_dict() == data
+
+    def test_validates_rate_limit(self) -> None:
+        manifest = make_manifest(
+            "https://api.test.com", rate_limit={"requests_per_second": 0}
+        )
+
+        assert "rate_limit.requests_per_second must be positive" in manifest.validate()
+
+
+class TestPagination:
+    async def test_page_numbers(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            items = [item async for item in client.paginate("list_pages")]
+
+        assert items == ITEMS
+        assert api.requests == 3
+
+    async def test_cursor(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            items = [item async for item in client.paginate("list_cursor")]
+
+        assert items == ITEMS
+        assert api.requests == 5
+
+    async def test_link_header(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            items = [item async for item in client.paginate("list_linked")]
+
+        assert items == ITEMS
+        assert api.requests == 3
+
+    async def test_pages_are_fetched_lazily(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            async for item in client.paginate("list_pages"):
+                if item["id"] == 5:
+                    break
+
+        assert api.requests == 1
+
+
+class TestRateLimiting:
+    async def test_retry_after_is_honored(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            started = time.monotonic()
+            result = await client.rest_request("GET", "/throttled/once")
+
+        assert result == {"ok": True}
+        assert api.throttled["once"] == 2
+        assert time.monotonic() - started >= 0.2
+
+    async def test_graphql_errors_keep_http_status(self, api: StandInAPI) -> None:
+        async with IntegrationClient(make_manifest(base_url(api)), {}) as client:
+            with pytest.raises(APIError, match="GraphQL errors") as raised:
+                await client.graphql_request("{ nope }")
+
+        assert raised.value.status_code == 400
+
+    async def test_gives_up_after_max_retries(self, api: StandInAPI) -> None:
+        manifest = make_manifest(base_url(api), rate_limit={"max_retries": 2})
+        async with IntegrationClient(manifest, {}) as client:
+            with pytest.raises(APIError) as exc_info:
+                await client.rest_request("GET", "/throttled/always")
+
+        assert exc_info.value.status_code == 429
+        assert api.throttled["always"] == 3
+
+    async def test_token_bucket_spaces_requests(self) -> None:
+        bucket = TokenBucket(rate=20, burst=2)
+
+        started = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+
+        # 2 immediate, then 4 more at 20/s
+        assert time.monotonic() - started >= 0.19
+
+    def test_parse_retry_after(self) -> None:
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+
+class TestConnectorPool:
+    async def test_clients_share_connections(self, api: StandInAPI) -> None:
+        manifest = make_manifest(base_url(api), rate_limit={"max_concurrency": 2})
+
+        async with ConnectorPool() as pool:
+            for _ in range(5):
+                async with IntegrationClient(manifest, {}, pool=pool) as client:
+                    await client.call_operation("slow")
+
+        assert api.requests == 5
+        assert len(api.peers) == 1
+
+
+class TestBulkRun:
+    @pytest.fixture
+    def script(self, tmp_path: Path) -> Path:
+        path = tmp_path / "bulk.py"
+        path.write_text(
+            "async def run(ctx):\n"
+            "    result = await ctx.client.call_operation('slow')\n"
+            "    ctx.log_result('slow', result)\n"
+        )
+        return path
+
+    async def test_runs_integrations_concurrently(
+        self, api: StandInAPI, script: Path, tmp_path: Path
+    ) -> None:
+        manifests = [
+            (make_manifest(base_url(api), name=f"api-{i}"), tmp_path / f"{i}.yaml")
+            for i in range(8)
+        ]
+        runner = BatchRunner(tmp_path)
+
+        started = time.monotonic()
+        results = await runner.run_bulk(script, manifests, max_concurrency=4)
+        elapsed = time.monotonic() - started
+
+        assert [r.integration for r in results] == [f"api-{i}" for i in range(8)]
+        assert all(r.success for r in results)
+        assert api.peak == 4
+        # Two waves of 100 ms instead of eight sequential calls
+        assert elapsed < 0.6
+
+    async def test_failures_are_isolated(
+        self, api: StandInAPI, script: Path, tmp_path: Path
+    ) -> None:
+        manifests = [
+            (make_manifest(base_url(api), name="good"), tmp_path / "good.yaml"),
+            (make_manifest("http://127.0.0.1:9", name="down"), tmp_path / "x.yaml"),
+        ]
+
+        results = await BatchRunner(tmp_path).run_bulk(script, manifests)
+
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].errors
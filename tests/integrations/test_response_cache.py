@@ -0,0 +1,309 @@
+"""Tests for the integration response cache and conditional requests.
+
+A small aiohttp application serves ETag/Last-Modified validated resources so
+fresh hits, 304 revalidation and cache bypass for writes run over real HTTP.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from claude_mpm.integrations.core.client import IntegrationClient
+from claude_mpm.integrations.core.manifest import IntegrationManifest
+from claude_mpm.integrations.core.response_cache import (
+    ResponseCache,
+    cache_dir_for,
+    cache_key,
+)
+
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+class ValidatedAPI:
+    """Fake API returning validators and honoring conditional requests."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.not_modified = 0
+        self.stray_304s = 1
+        self.version = 1
+        self.server: TestServer | None = None
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/users/{username}", self.user)
+        app.router.add_get("/dated", self.dated)
+        app.router.add_get("/stray", self.stray)
+        app.router.add_post("/users", self.create)
+        return app
+
+    async def user(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path))
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        body = {"login": request.match_info["username"], "version": self.version}
+        return web.json_response(body, headers={"ETag": etag})
+
+    async def dated(self, request: web.Request) -> web.Response:
+        self.requests.append(("GET", request.path))
+        if request.headers.get("If-Modified-Since") == LAST_MODIFIED:
+            self.not_modified += 1
+            return web.Response(status=304)
+        return web.json_response(
+            {"dated": True}, headers={"Last-Modified": LAST_MODIFIED}
+        )
+
+    async def stray(self, request: web.Request) -> web.Response:
+        """304 without a conditional request (misbehaving proxy)."""
+        self.requests.append(("GET", request.path))
+        if self.stray_304s:
+            self.stray_304s -= 1
+            return web.Response(status=304)
+        return web.json_response({"stray": True})
+
+    async def create(self, request: web.Request) -> web.Response:
+        self.requests.append(("POST", request.path))
+        return web.json_response({"created": True})
+
+
+@pytest.fixture
+async def api():
+    stand_in = ValidatedAPI()
+    server = TestServer(stand_in.app())
+    await server.start_server()
+    stand_in.server = server
+    yield stand_in
+    await server.close()
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    response_cache = ResponseCache(tmp_path / "cache")
+    yield response_cache
+    response_cache.close()
+
+
+def make_manifest(api: ValidatedAPI, ttl: float = 60, **auth: str):
+    return IntegrationManifest.from_dict(
+        {
+            "name": "validated",
+            "version": "1.0.0",
+            "description": "Validated API",
+            "api_type": "rest",
+            "base_url": str(api.server.make_url("")).rstrip("/"),
+            "auth": auth or {"type": "none"},
+            "cache": {"ttl": ttl},
+            "operations": [
+                {
+                    "name": "get_user",
+                    "description": "Get user",
+                    "type": "rest_get",
+                    "endpoint": "/users/{username}",
+                    "parameters": [
+                        {"name": "username", "type": "string", "required": True}
+                    ],
+                },
+                {
+                    "name": "get_dated",
+                    "description": "Last-Modified resource",
+                    "type": "rest_get",
+                    "endpoint": "/dated",
+                },
+                {
+                    "name": "get_stray",
+                    "description": "Answers 304 once",
+                    "type": "rest_get",
+                    "endpoint": "/stray",
+                },
+                {
+                    "name": "uncached",
+                    "description": "Opted out",
+                    "type": "rest_get",
+                    "endpoint": "/dated",
+                    "cache_ttl": 0,
+                },
+                {
+                    "name": "create_user",
+                    "description": "Create user",
+                    "type": "rest_post",
+                    "endpoint": "/users",
+                },
+            ],
+        }
+    )
+
+
+class TestManifestCache:
+    def test_cache_section_enables_caching(self) -> None:
+        data = {
+            "name": "x",
+            "version": "1.0.0",
+            "description": "x",
+            "api_type": "rest",
+            "base_url": "https://api.test.com",
+            "auth": {"type": "none"},
+            "operations": [],
+        }
+
+        assert not IntegrationManifest.from_dict(data).cache.enabled
+        manifest = IntegrationManifest.from_dict({**data, "cache": {"ttl": -1}})
+        assert manifest.cache.enabled
+        assert "cache.ttl must not be negative" in manifest.validate()
+
+
+class TestCachedOperations:
+    async def test_fresh_entry_skips_request(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        async with IntegrationClient(make_manifest(api), {}, cache=cache) as client:
+            first = await client.call_operation("get_user", username="octocat")
+            second = await client.call_operation("get_user", username="octocat")
+            other = await client.call_operation("get_user", username="hubot")
+
+        assert first == second == {"login": "octocat", "version": 1}
+        assert other["login"] == "hubot"
+        assert len(api.requests) == 2
+        stats = cache.stats("validated")["validated"]
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+    async def test_stale_entry_is_revalidated_with_etag(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        manifest = make_manifest(api, ttl=0.05)
+        async with IntegrationClient(manifest, {}, cache=cache) as client:
+            await client.call_operation("get_user", username="octocat")
+            await asyncio.sleep(0.06)
+            result = await client.call_operation("get_user", username="octocat")
+            # Refreshed by the 304
+            await client.call_operation("get_user", username="octocat")
+
+        assert result["version"] == 1
+        assert api.not_modified == 1
+        assert len(api.requests) == 2
+        stats = cache.stats("validated")["validated"]
+        assert stats["revalidated"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    async def test_changed_resource_replaces_entry(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        manifest = make_manifest(api, ttl=0.05)
+        async with IntegrationClient(manifest, {}, cache=cache) as client:
+            await client.call_operation("get_user", username="octocat")
+            api.version = 2
+            await asyncio.sleep(0.06)
+            result = await client.call_operation("get_user", username="octocat")
+
+        assert result["version"] == 2
+        assert api.not_modified == 0
+
+    async def test_last_modified_revalidation(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        manifest = make_manifest(api, ttl=0.05)
+        async with IntegrationClient(manifest, {}, cache=cache) as client:
+            await client.call_operation("get_dated")
+            await asyncio.sleep(0.06)
+            result = await client.call_operation("get_dated")
+
+        assert result == {"dated": True}
+        assert api.not_modified == 1
+
+    async def test_304_without_entry_is_refetched(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        async with IntegrationClient(make_manifest(api), {}, cache=cache) as client:
+            first = await client.call_operation("get_stray")
+            second = await client.call_operation("get_stray")
+
+        assert first == second == {"stray": True}
+        assert len(api.requests) == 2
+
+    async def test_writes_and_opted_out_operations_bypass_cache(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        async with IntegrationClient(make_manifest(api), {}, cache=cache) as client:
+            for _ in range(2):
+                await client.call_operation("create_user")
+                await client.call_operation("uncached")
+
+        assert len(api.requests) == 4
+        assert cache.stats() == {}
+
+    async def test_credentials_do_not_share_entries(
+        self, api: ValidatedAPI, cache: ResponseCache
+    ) -> None:
+        manifest = make_manifest(
+            api, type="bearer", credentials=[{"name": "TOKEN", "prompt": "Token"}]
+        )
+        for token in ("alice", "bob", "alice"):
+            async with IntegrationClient(
+                manifest, {"TOKEN": token}, cache=cache
+            ) as client:
+                await client.call_operation("get_user", username="octocat")
+
+        assert len(api.requests) == 2
+
+
+class TestResponseCache:
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path, max_bytes=350)
+        body = {"blob": "x" * 90}
+        for key in ("a", "b", "c"):
+            cache.put(key, "svc", body, ttl=60)
+        cache.get("a")
+        cache.put("d", "svc", body, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["svc"]["evictions"] == 1
+        cache.close()
+
+    def test_clear_one_integration(self, cache: ResponseCache) -> None:
+        cache.put(cache_key("one", "op"), "one", {}, ttl=60)
+        cache.put(cache_key("two", "op"), "two", {}, ttl=60)
+        cache.record("one", "hits")
+
+        assert cache.clear("one") == 1
+        assert list(cache.stats()) == ["two"]
+
+    def test_client_and_command_share_project_cache(self, tmp_path: Path) -> None:
+        from claude_mpm.integrations.cli.integrate import IntegrationManager
+
+        manifest = IntegrationManifest.from_dict(
+            {
+                "name": "x",
+                "version": "1.0.0",
+                "description": "x",
+                "api_type": "rest",
+                "base_url": "https://api.test.com",
+                "auth": {"type": "none"},
+                "cache": {"ttl": 60},
+                "operations": [],
+            }
+        )
+        client = IntegrationClient(manifest, {}, project_dir=tmp_path)
+        try:
+            manager = IntegrationManager(tmp_path)
+            assert client.cache is ResponseCache.open(
+                cache_dir_for(manager.project_dir)
+            )
+            assert client.cache.directory.is_relative_to(tmp_path.resolve())
+        finally:
+            client.cache.close()
+
+    def test_open_shares_instances(self, tmp_path: Path) -> None:
+        first = ResponseCache.open(tmp_path)
+        try:
+            assert ResponseCache.open(tmp_path) is first
+        finally:
+            first.close()
+        assert ResponseCache.open(tmp_path) is not first
+        ResponseCache.open(tmp_path).close()
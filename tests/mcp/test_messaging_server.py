@@ -346,6 +346,27 @@ class TestMessageCheck:
 
         server.messages.get_unread_count.assert_called_once_with("engineer")
 
+    @pytest.mark.asyncio
+    async def test_check_long_polls_when_waiting(self, server):
+        server.messages.wait_for_messages = MagicMock(return_value=1)
+        server.messages.get_unread_count = MagicMock()
+        server.messages.get_high_priority_messages = MagicMock(return_value=[])
+
+        result = await server._message_check({"agent": "qa", "wait_seconds": 20})
+
+        assert result["unread_count"] == 1
+        server.messages.wait_for_messages.assert_called_once_with("qa", 20.0)
+        server.messages.get_unread_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_wait_is_capped(self, server):
+        server.messages.wait_for_messages = MagicMock(return_value=0)
+        server.messages.get_high_priority_messages = MagicMock(return_value=[])
+
+        await server._message_check({"wait_seconds": 10_000})
+
+        server.messages.wait_for_messages.assert_called_once_with(None, 300.0)
+
 
 # ---------------------------------------------------------------------------
 # shortcut_add
@@ -0,0 +1,245 @@
+"""Tests for incremental, parallel agent builds.
+
+Test Coverage:
+- Input hashes cover the template, the BASE-AGENT.md chain and base config
+- Unchanged agents are skipped; edited inputs or outputs are rebuilt
+- BASE-AGENT.md discovery and content are memoized within a run
+- Parallel builds through AgentDeploymentService and the pipeline step
+  report built/skipped counts
+"""
+
+from pathlib import Path
+
+import pytest
+
+from claude_mpm.core.enums import OperationResult
+from claude_mpm.services.agents.deployment.agent_build_cache import (
+    BUILD_HASHES_FILENAME,
+    AgentBuildCache,
+)
+from claude_mpm.services.agents.deployment.agent_deployment import (
+    AgentDeploymentService,
+)
+from claude_mpm.services.agents.deployment.agent_template_builder import (
+    AgentTemplateBuilder,
+)
+from claude_mpm.services.agents.deployment.agent_version_manager import (
+    AgentVersionManager,
+)
+from claude_mpm.services.agents.deployment.pipeline.pipeline_context import (
+    PipelineContext,
+)
+from claude_mpm.services.agents.deployment.pipeline.steps.agent_processing_step import (
+    AgentProcessingStep,
+)
+
+
+def write_agent(path: Path, name: str, body: str = "Do the work.") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\nname: {name}\nversion: 1.0.0\ndescription: {name} agent\n"
+        f"agent_type: engineer\n---\n\n# {name}\n\n{body}\n"
+    )
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    (root / "BASE-AGENT.md").write_text("# Root base\n")
+    (root / "engineering" / "BASE-AGENT.md").parent.mkdir()
+    (root / "engineering" / "BASE-AGENT.md").write_text("# Engineering base\n")
+    for i in range(6):
+        write_agent(root / "engineering" / f"agent-{i}.md", f"agent-{i}")
+    return root
+
+
+@pytest.fixture
+def templates(repo: Path) -> list[Path]:
+    return sorted((repo / "engineering").glob("agent-*.md"))
+
+
+@pytest.fixture
+def service(tmp_path: Path, repo: Path) -> AgentDeploymentService:
+    return AgentDeploymentService(
+        templates_dir=repo / "engineering",
+        base_agent_path=tmp_path / "base_agent.json",
+        working_directory=tmp_path,
+    )
+
+
+def deploy(service: AgentDeploymentService, templates, agents_dir, **kwargs):
+    results = service.results_manager.initialize_deployment_results(agents_dir, 0.0)
+    options = {
+        "force_rebuild": False,
+        "deployment_mode": "update",
+        "agent_sources": {},
+        "skip_version_check": True,
+    }
+    options.update(kwargs)
+    service._deploy_templates(templates, agents_dir, {}, (1, 0, 0), results, **options)
+    return results
+
+
+class TestInputHash:
+    def test_hash_covers_base_chain_and_config(self, repo: Path, templates) -> None:
+        builder = AgentTemplateBuilder()
+        template = templates[0]
+        original = builder.compute_input_hash(template, {}, "system")
+
+        assert builder.compute_input_hash(template, {}, "system") == original
+        assert builder.compute_input_hash(template, {"x": 1}, "system") != original
+        assert builder.compute_input_hash(template, {}, "project") != original
+
+        (repo / "BASE-AGENT.md").write_text("# Root base, edited\n")
+        builder.clear_base_template_cache()
+        assert builder.compute_input_hash(template, {}, "system") != original
+
+    def test_base_templates_are_read_once_per_run(
+        self, repo: Path, templates, monkeypatch
+    ) -> None:
+        builder = AgentTemplateBuilder()
+        reads: list[Path] = []
+        original_read_text = Path.read_text
+
+        def counting_read_text(path, *args, **kwargs):
+            if path.name == "BASE-AGENT.md":
+                reads.append(path)
+            return original_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        for template in templates:
+            builder.build_agent_markdown(template.stem, template, {}, "system")
+
+        assert len(reads) == 2
+
+
+class TestAgentBuildCache:
+    def test_detects_edited_output(self, tmp_path: Path) -> None:
+        target = tmp_path / "agent.md"
+        target.write_text("built")
+        cache = AgentBuildCache(tmp_path)
+        cache.record("agent", "abc", target)
+        cache.save()
+
+        reloaded = AgentBuildCache(tmp_path)
+        assert reloaded.is_current("agent", "abc", target)
+        assert not reloaded.is_current("agent", "def", target)
+        target.write_text("edited by hand")
+        assert not reloaded.is_current("agent", "abc", target)
+
+    def test_ignores_corrupt_file(self, tmp_path: Path) -> None:
+        (tmp_path / BUILD_HASHES_FILENAME).write_text("{not json")
+
+        assert not AgentBuildCache(tmp_path).is_current("a", "b", tmp_path / "a.md")
+
+
+class TestIncrementalDeployment:
+    def test_unchanged_agents_are_skipped(
+        self, service: AgentDeploymentService, templates, tmp_path: Path
+    ) -> None:
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+
+        first = deploy(service, templates, agents_dir)
+        assert [a["name"] for a in first["deployed"]] == [t.stem for t in templates]
+        assert first["metrics"]["build"]["built"] == 6
+
+        second = deploy(service, templates, agents_dir)
+        assert second["skipped"] == [t.stem for t in templates]
+        assert second["metrics"]["build"]["built"] == 0
+
+        metrics = service.get_deployment_metrics()
+        assert metrics["agents_built"] == 6
+        assert metrics["agents_skipped"] == 6
+        assert metrics["last_build"]["skipped"] == 6
+
+    def test_changed_inputs_are_rebuilt(
+        self, service: AgentDeploymentService, repo: Path, templates, tmp_path: Path
+    ) -> None:
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        deploy(service, templates, agents_dir)
+
+        write_agent(templates[0], "agent-0", body="Do different work.")
+        (agents_dir / "agent-1.md").write_text("hand edited")
+        results = deploy(service, templates, agents_dir)
+
+        assert [a["name"] for a in results["updated"]] == ["agent-0", "agent-1"]
+        assert len(results["skipped"]) == 4
+
+        (repo / "engineering" / "BASE-AGENT.md").write_text("# New rules\n")
+        results = deploy(service, templates, agents_dir)
+        assert len(results["updated"]) == 6
+        assert "# New rules" in (agents_dir / "agent-3.md").read_text()
+
+    def test_force_rebuild_ignores_hashes(
+        self, service: AgentDeploymentService, templates, tmp_path: Path
+    ) -> None:
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        deploy(service, templates, agents_dir)
+
+        results = deploy(service, templates, agents_dir, force_rebuild=True)
+
+        assert len(results["updated"]) == 6
+
+
+class TestPipelineStep:
+    def test_parallel_processing_with_skips(self, templates, tmp_path: Path) -> None:
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        step = AgentProcessingStep(
+            AgentTemplateBuilder(), AgentVersionManager(), max_workers=4
+        )
+
+        def run() -> dict:
+            context = PipelineContext(
+                template_files=templates,
+                actual_target_dir=agents_dir,
+                deployment_mode="project",
+            )
+            context.initialize_results()
+            assert step.execute(context).is_success
+            return context.finalize_results(0.0)
+
+        first = run()
+        assert [r["name"] for r in first["deployed"]] == [t.stem for t in templates]
+        assert first["build"]["built"] == 6
+        assert first["build"]["workers"] == 4
+
+        second = run()
+        assert second["build"] == {**second["build"], "built": 0, "skipped": 6}
+        assert second["skipped"] == [t.stem for t in templates]
+
+    def test_one_failing_agent_does_not_abort_the_step(
+        self, templates, tmp_path: Path
+    ) -> None:
+        agents_dir = tmp_path / "agents"
+        agents_dir.mkdir()
+        step = AgentProcessingStep(
+            AgentTemplateBuilder(), AgentVersionManager(), max_workers=4
+        )
+        process_agent = step.processor.process_agent
+
+        def flaky_process_agent(agent_context):
+            if agent_context.agent_name == "agent-2":
+                raise RuntimeError("disk full")
+            return process_agent(agent_context)
+
+        step.processor.process_agent = flaky_process_agent
+        context = PipelineContext(
+            template_files=templates,
+            actual_target_dir=agents_dir,
+            deployment_mode="project",
+        )
+        context.initialize_results()
+
+        result = step.execute(context)
+        results = context.finalize_results(0.0)
+
+        assert result.status == OperationResult.WARNING
+        assert len(results["deployed"]) == 5
+        assert results["build"]["failed"] == 1
+        assert "agent-2: disk full" in results["errors"][0]
@@ -418,3 +418,65 @@ class TestConnectionManagement:
 
         # Verify nothing was committed
         assert sync_state.get_file_hash("test", "file.md") is None
+
+    def test_connection_reused_within_thread(self, sync_state):
+        """Test operations on one thread share a persistent connection."""
+        sync_state.register_source("test", "https://example.com")
+        for i in range(10):
+            sync_state.track_file("test", f"file{i}.md", f"sha{i}")
+
+        with sync_state._get_connection() as first:
+            pass
+        with sync_state._get_connection() as second:
+            pass
+
+        assert first is second
+        assert sync_state._pool.connections_opened == 1
+
+    def test_close_releases_connections(self, sync_state):
+        """Test close() drops pooled connections and later calls reconnect."""
+        sync_state.register_source("test", "https://example.com")
+        sync_state.close()
+
+        assert sync_state.get_source_info("test")["url"] == "https://example.com"
+        assert sync_state._pool.connections_opened == 2
+
+
+class TestBulkTracking:
+    """Test track_files() batch API."""
+
+    def test_track_files_inserts_and_updates(self, sync_state):
+        """Test bulk tracking inserts new files and upserts existing ones."""
+        sync_state.register_source("test", "https://example.com")
+        sync_state.track_file("test", "a.md", "old")
+
+        count = sync_state.track_files(
+            "test",
+            [
+                {"file_path": "a.md", "content_sha": "new"},
+                {"file_path": "b.md", "content_sha": "sha-b", "file_size": 42},
+            ],
+        )
+
+        assert count == 2
+        assert sync_state.get_file_hash("test", "a.md") == "new"
+        assert not sync_state.has_file_changed("test", "b.md", "sha-b")
+
+    def test_track_files_empty(self, sync_state):
+        """Test bulk tracking with no files is a no-op."""
+        assert sync_state.track_files("test", []) == 0
+
+    def test_track_files_is_atomic(self, sync_state):
+        """Test a failing row rolls back the whole batch."""
+        sync_state.register_source("test", "https://example.com")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            sync_state.track_files(
+                "test",
+                [
+                    {"file_path": "a.md", "content_sha": "sha"},
+                    {"file_path": "b.md", "content_sha": None},
+                ],
+            )
+
+        assert sync_state.get_file_hash("test", "a.md") is None
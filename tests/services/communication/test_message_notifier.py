@@ -0,0 +1,188 @@
+"""
+Tests for push-based message notifications and long-polling.
+"""
+
+import statistics
+import threading
+import time
+
+import pytest
+
+from claude_mpm.services.communication.message_notifier import MessageNotifier
+from claude_mpm.services.communication.message_service import MessageService
+
+
+@pytest.fixture
+def notifier(tmp_path):
+    return MessageNotifier(tmp_path / "notify")
+
+
+@pytest.fixture
+def tmp_projects(tmp_path):
+    """Create two projects sharing isolated messaging databases."""
+    project1 = tmp_path / "project1"
+    project2 = tmp_path / "project2"
+    project1.mkdir()
+    project2.mkdir()
+    return project1, project2, tmp_path / "registry.db", tmp_path / "messaging.db"
+
+
+class TestMessageNotifier:
+    """Test MessageNotifier publish/subscribe."""
+
+    def test_publish_wakes_project_subscriber(self, notifier):
+        with notifier.subscribe("/p/one") as subscription:
+            assert notifier.publish("/p/one", "msg-1", "engineer", "high") == 1
+            received = subscription.wait(1.0)
+
+        assert [n.message_id for n in received] == ["msg-1"]
+        assert received[0].priority == "high"
+        assert received[0].latency >= 0
+
+    def test_other_projects_are_not_woken(self, notifier):
+        with notifier.subscribe("/p/one") as subscription:
+            assert notifier.publish("/p/two", "msg-1") == 0
+            assert subscription.wait(0.05) == []
+
+    def test_agent_filter(self, notifier):
+        with notifier.subscribe("/p/one", agent="qa") as subscription:
+            notifier.publish("/p/one", "msg-eng", "engineer")
+            notifier.publish("/p/one", "msg-qa", "qa")
+            received = subscription.wait(1.0)
+
+        assert [n.message_id for n in received] == ["msg-qa"]
+
+    def test_wait_times_out(self, notifier):
+        with notifier.subscribe("/p/one") as subscription:
+            started = time.monotonic()
+            assert subscription.wait(0.1) == []
+            assert 0.05 < time.monotonic() - started < 1.0
+
+    def test_stale_sockets_are_removed(self, notifier):
+        subscription = notifier.subscribe("/p/one")
+        path = subscription.path
+        # Simulate a crashed session: socket closed, file left behind
+        subscription._sock.close()
+        subscription._sock = None
+
+        assert notifier.publish("/p/one", "msg-1") == 0
+        assert not path.exists()
+
+    def test_close_removes_socket_file(self, notifier):
+        subscription = notifier.subscribe("/p/one")
+        path = subscription.path
+        subscription.close()
+
+        assert not path.exists()
+        assert notifier.publish("/p/one", "msg-1") == 0
+
+    def test_long_notify_dir_falls_back_to_short_path(self, tmp_path):
+        deep = tmp_path / ("x" * 120) / "notify"
+        notifier = MessageNotifier(deep)
+
+        assert notifier.notify_dir != deep
+        with notifier.subscribe("/p/one") as subscription:
+            assert notifier.publish("/p/one", "msg-1") == 1
+            assert subscription.wait(1.0)
+
+
+class TestLongPoll:
+    """Test MessageService.wait_for_messages."""
+
+    def test_returns_immediately_when_unread(self, tmp_projects):
+        project1, project2, registry, messaging_db = tmp_projects
+        sender = MessageService(
+            project1, registry_path=registry, messaging_db_path=messaging_db
+        )
+        receiver = MessageService(
+            project2, registry_path=registry, messaging_db_path=messaging_db
+        )
+        sender.send_message(str(project2), "pm", "task", "s", "b")
+
+        started = time.monotonic()
+        assert receiver.wait_for_messages(timeout=5) == 1
+        assert time.monotonic() - started < 1
+
+    def test_wakes_on_send(self, tmp_projects):
+        project1, project2, registry, messaging_db = tmp_projects
+        sender = MessageService(
+            project1, registry_path=registry, messaging_db_path=messaging_db
+        )
+        receiver = MessageService(
+            project2, registry_path=registry, messaging_db_path=messaging_db
+        )
+
+        timer = threading.Timer(
+            0.1, sender.send_message, args=(str(project2), "pm", "task", "s", "b")
+        )
+        timer.start()
+        started = time.monotonic()
+        # poll_interval longer than the test: only a push can wake us early
+        count = receiver.wait_for_messages(timeout=10, poll_interval=10)
+        elapsed = time.monotonic() - started
+        timer.join()
+
+        assert count == 1
+        assert elapsed < 2
+
+    def test_times_out_without_messages(self, tmp_projects):
+        project1, _project2, registry, messaging_db = tmp_projects
+        receiver = MessageService(
+            project1, registry_path=registry, messaging_db_path=messaging_db
+        )
+
+        assert receiver.wait_for_messages(timeout=0.1) == 0
+
+
+@pytest.mark.performance
+class TestDeliveryLatency:
+    """End-to-end delivery latency across 20 simulated sessions."""
+
+    def test_twenty_sessions(self, tmp_path):
+        sessions = 20
+        messaging_db = tmp_path / "messaging.db"
+        registry = tmp_path / "registry.db"
+        projects = []
+        for i in range(sessions):
+            project = tmp_path / f"session{i:02d}"
+            project.mkdir()
+            projects.append(project)
+
+        services = [
+            MessageService(p, registry_path=registry, messaging_db_path=messaging_db)
+            for p in projects
+        ]
+        sender_root = tmp_path / "sender"
+        sender_root.mkdir()
+        sender = MessageService(
+            sender_root, registry_path=registry, messaging_db_path=messaging_db
+        )
+
+        ready = threading.Barrier(sessions + 1)
+        latencies: list[float] = []
+        lock = threading.Lock()
+
+        def session(service: MessageService) -> None:
+            with service.notifier.subscribe(str(service.project_root)) as sub:
+                ready.wait()
+                received = sub.wait(5.0)
+            # The inbox must already contain the message when woken
+            assert service.get_unread_count() == 1
+            with lock:
+                latencies.extend(n.latency for n in received)
+
+        threads = [threading.Thread(target=session, args=(s,)) for s in services]
+        for thread in threads:
+            thread.start()
+        ready.wait()
+        for service in services:
+            sender.send_message(str(service.project_root), "pm", "task", "s", "b")
+        for thread in threads:
+            thread.join()
+
+        assert len(latencies) == sessions
+        p50 = statistics.median(latencies)
+        worst = max(latencies)
+        print(f"\ndelivery latency p50={p50 * 1000:.2f}ms max={worst * 1000:.2f}ms")
+        # Far below any polling interval
+        assert worst < 1.0
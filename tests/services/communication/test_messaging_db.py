@@ -395,3 +395,114 @@ class TestMessagingDatabase:
         # Should complete quickly (< 100ms even with 100 records)
         assert status_query_time < 0.1
         assert priority_query_time < 0.1
+
+    def test_insert_messages_bulk(self, tmp_db):
+        """Test bulk insert writes all messages in one call."""
+        messages = [
+            {
+                "id": f"msg-bulk-{i}",
+                "from_project": "/p1",
+                "to_project": "/p2",
+                "to_agent": "engineer",
+                "subject": f"Bulk {i}",
+                "body": "body",
+                "metadata": {"i": i},
+            }
+            for i in range(25)
+        ]
+
+        assert tmp_db.insert_messages(messages) == 25
+        assert tmp_db.insert_messages([]) == 0
+        assert tmp_db.get_unread_count_for_project("/p2", "engineer") == 25
+        assert tmp_db.get_message("msg-bulk-7")["metadata"] == {"i": 7}
+
+    def test_connection_persists_across_calls(self, tmp_db, sample_message):
+        """Test operations reuse one connection per thread."""
+        tmp_db.insert_message(sample_message)
+        tmp_db.get_message(sample_message["id"])
+        tmp_db.get_unread_count()
+
+        assert tmp_db._pool.connections_opened == 1
+        with tmp_db.get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_inbox_counts_use_covering_indexes(self, tmp_db):
+        """Test unread count queries are answered from covering indexes."""
+        queries = [
+            (
+                (
+                    "SELECT COUNT(*) FROM messages "
+                    "WHERE to_project = ? AND status = 'unread'"
+                ),
+                ("/p",),
+            ),
+            (
+                (
+                    "SELECT COUNT(*) FROM messages "
+                    "WHERE to_project = ? AND to_agent = ? AND status = 'unread'"
+                ),
+                ("/p", "pm"),
+            ),
+        ]
+        with tmp_db.get_connection() as conn:
+            for sql, params in queries:
+                plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+                assert "COVERING INDEX" in plan[0][3]
+
+
+@pytest.mark.performance
+class TestMessagingThroughput:
+    """Benchmark: messages/sec and heartbeats/sec on the hot paths."""
+
+    def test_message_and_heartbeat_throughput(self, tmp_db):
+        import time
+
+        count = 500
+        session_id = "bench-session"
+        tmp_db.register_session(session_id, "/bench", "bench")
+
+        started = time.perf_counter()
+        for i in range(count):
+            tmp_db.insert_message(
+                {
+                    "id": f"msg-bench-{i}",
+                    "from_project": "/p1",
+                    "to_project": "/bench",
+                    "subject": "s",
+                    "body": "b",
+                }
+            )
+        messages_per_sec = count / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for _ in range(count):
+            tmp_db.update_heartbeat(session_id)
+            tmp_db.get_unread_count_for_project("/bench")
+        heartbeats_per_sec = count / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        tmp_db.insert_messages(
+            [
+                {
+                    "id": f"msg-bulk-bench-{i}",
+                    "from_project": "/p1",
+                    "to_project": "/bench",
+                    "subject": "s",
+                    "body": "b",
+                }
+                for i in range(count)
+            ]
+        )
+        bulk_messages_per_sec = count / (time.perf_counter() - started)
+
+        print(
+            f"\nmessages/sec={messages_per_sec:.0f} "
+            f"bulk messages/sec={bulk_messages_per_sec:.0f} "
+            f"heartbeats/sec={heartbeats_per_sec:.0f}"
+        )
+        assert tmp_db.get_unread_count_for_project("/bench") == 2 * count
+        # Persistent connections keep single-row operations well above the
+        # few hundred per second a connect-per-call design manages on slow disks
+        assert messages_per_sec > 500
+        assert heartbeats_per_sec > 500
+        assert bulk_messages_per_sec > messages_per_sec
@@ -0,0 +1,231 @@
+"""Tests for CheckScheduler and DiagnosticResultCache.
+
+WHY: The doctor command relies on the scheduler to start checks as soon as
+their dependencies finish, to bound slow checks with timeouts, and on the
+result cache to make repeated runs near-instant.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+from claude_mpm.core.enums import OperationResult, ValidationSeverity
+from claude_mpm.services.diagnostics.checks.base_check import BaseDiagnosticCheck
+from claude_mpm.services.diagnostics.diagnostic_runner import DiagnosticRunner
+from claude_mpm.services.diagnostics.models import DiagnosticResult
+from claude_mpm.services.diagnostics.result_cache import DiagnosticResultCache
+from claude_mpm.services.diagnostics.scheduler import CheckScheduler
+
+
+def make_check(name, delay=0.0, depends_on=(), log=None, **attrs):
+    """Build a check class that records start/finish events in ``log``."""
+
+    def run(self):
+        if log is not None:
+            log.append(("start", name))
+        time.sleep(delay)
+        if log is not None:
+            log.append(("end", name))
+        return DiagnosticResult(
+            category=name, status=OperationResult.SUCCESS, message=f"{name} ok"
+        )
+
+    namespace = {
+        "name": property(lambda self: name.lower()),
+        "category": property(lambda self: name),
+        "run": run,
+        "depends_on": tuple(depends_on),
+        **attrs,
+    }
+    return type(name, (BaseDiagnosticCheck,), namespace)
+
+
+class TestCheckScheduler:
+    """Test dependency-driven scheduling."""
+
+    def test_dependent_starts_after_dependency_finishes(self):
+        log = []
+        first = make_check("First", delay=0.05, log=log)
+        second = make_check("Second", depends_on=("First",), log=log)
+
+        results = CheckScheduler([second, first]).run()
+
+        assert log.index(("end", "First")) < log.index(("start", "Second"))
+        # Results follow the declared order, not completion order
+        assert [r.category for r in results] == ["Second", "First"]
+
+    def test_independent_check_does_not_wait_for_unrelated_slow_check(self):
+        log = []
+        slow = make_check("Slow", delay=0.3, log=log)
+        base = make_check("Base", log=log)
+        dependent = make_check("Dependent", depends_on=("Base",), log=log)
+
+        CheckScheduler([slow, base, dependent]).run()
+
+        # Dependent starts as soon as Base is done, while Slow is still running
+        assert log.index(("start", "Dependent")) < log.index(("end", "Slow"))
+
+    def test_timeout_returns_partial_results(self):
+        release = threading.Event()
+        hanging = make_check("Hanging", timeout=0.1)
+        hanging.run = lambda self: release.wait(5)
+        fast = make_check("Fast")
+        after = make_check("After", depends_on=("Hanging",))
+
+        started = time.monotonic()
+        results = CheckScheduler([hanging, fast, after]).run()
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < 2
+        by_category = {r.category: r for r in results}
+        assert by_category["Hanging"].status == ValidationSeverity.WARNING
+        assert by_category["Hanging"].details["timed_out"] is True
+        assert by_category["Fast"].status == OperationResult.SUCCESS
+        assert by_category["After"].status == OperationResult.SUCCESS
+
+    def test_hung_check_does_not_block_interpreter_exit(self):
+        script = """
+import time
+from claude_mpm.core.enums import OperationResult
+from claude_mpm.services.diagnostics.checks.base_check import BaseDiagnosticCheck
+from claude_mpm.services.diagnostics.diagnostic_runner import DiagnosticRunner
+from claude_mpm.services.diagnostics.models import DiagnosticResult
+from claude_mpm.services.diagnostics.scheduler import CheckScheduler
+
+class HungCheck(BaseDiagnosticCheck):
+    name = "hung"
+    category = "Hung"
+
+    def run(self):
+        time.sleep(60)
+        return DiagnosticResult("Hung", OperationResult.SUCCESS, "done")
+
+print(CheckScheduler([HungCheck], timeout=0.2).run()[0].status)
+"""
+        started = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "warning" in result.stdout.lower()
+        assert time.monotonic() - started < 15
+
+    def test_unknown_dependencies_are_ignored(self):
+        orphan = make_check("Orphan", depends_on=("MissingCheck",))
+
+        results = CheckScheduler([orphan]).run()
+
+        assert len(results) == 1
+
+    def test_dependency_cycle_does_not_deadlock(self):
+        a = make_check("A", depends_on=("B",))
+        b = make_check("B", depends_on=("A",))
+
+        results = CheckScheduler([a, b]).run()
+
+        assert {r.category for r in results} == {"A", "B"}
+
+
+class TestDiagnosticResultCache:
+    """Test the on-disk result cache."""
+
+    def test_cacheable_result_is_reused(self, tmp_path):
+        calls = []
+        cached_check = make_check("Cached", cache_ttl=60.0)
+        original_run = cached_check.run
+
+        def counting_run(self):
+            calls.append(1)
+            return original_run(self)
+
+        cached_check.run = counting_run
+
+        first_cache = DiagnosticResultCache(tmp_path)
+        CheckScheduler([cached_check], cache=first_cache).run()
+        first_cache.flush()
+
+        second_cache = DiagnosticResultCache(tmp_path)
+        results = CheckScheduler([cached_check], cache=second_cache).run()
+
+        assert len(calls) == 1
+        assert results[0].cached is True
+        assert results[0].status == OperationResult.SUCCESS
+        assert second_cache.hits == 1
+
+    def test_uncacheable_checks_are_not_stored(self, tmp_path):
+        plain = make_check("Plain")
+        cache = DiagnosticResultCache(tmp_path)
+
+        cache.put(plain(), DiagnosticResult("Plain", OperationResult.SUCCESS, "ok"))
+        cache.flush()
+
+        assert not (tmp_path / "doctor_results.json").exists()
+
+    def test_results_with_issues_are_not_stored(self, tmp_path):
+        check_class = make_check("Flaky", cache_ttl=60.0)
+        cache = DiagnosticResultCache(tmp_path)
+        warning = DiagnosticResult("Flaky", OperationResult.SUCCESS, "ok")
+        warning.sub_results.append(
+            DiagnosticResult("Sub", ValidationSeverity.WARNING, "warn")
+        )
+
+        cache.put(check_class(), warning)
+        cache.put(
+            check_class(), DiagnosticResult("Flaky", ValidationSeverity.ERROR, "bad")
+        )
+
+        assert cache.get(check_class()) is None
+
+    def test_fix_mode_clears_cache(self, tmp_path, monkeypatch):
+        check_class = make_check("Fixable", cache_ttl=60.0)
+        cache = DiagnosticResultCache(tmp_path)
+        cache.put(
+            check_class(), DiagnosticResult("Fixable", OperationResult.SUCCESS, "ok")
+        )
+        cache.flush()
+        monkeypatch.setattr(
+            "claude_mpm.services.diagnostics.diagnostic_runner.DiagnosticResultCache",
+            lambda: DiagnosticResultCache(tmp_path),
+        )
+
+        runner = DiagnosticRunner(fix=True, use_cache=True)
+
+        assert runner.cache.get(check_class()) is None
+        assert DiagnosticResultCache(tmp_path).get(check_class()) is None
+
+    def test_input_change_invalidates_entry(self, tmp_path):
+        watched = tmp_path / "config.json"
+        watched.write_text("{}")
+        check_class = make_check(
+            "Watched", cache_ttl=60.0, cache_inputs=lambda self: [watched]
+        )
+        cache = DiagnosticResultCache(tmp_path)
+        cache.put(
+            check_class(),
+            DiagnosticResult("Watched", OperationResult.SUCCESS, "ok"),
+        )
+
+        hit = cache.get(check_class())
+        assert hit is not None
+        assert hit.status == OperationResult.SUCCESS
+
+        watched.write_text('{"changed": true}')
+        assert cache.get(check_class()) is None
+
+    def test_expired_entry_is_ignored(self, tmp_path):
+        check_class = make_check("Expiring", cache_ttl=0.01)
+        cache = DiagnosticResultCache(tmp_path)
+        cache.put(
+            check_class(), DiagnosticResult("Expiring", OperationResult.SUCCESS, "ok")
+        )
+
+        time.sleep(0.05)
+
+        assert cache.get(check_class()) is None
@@ -12,6 +12,7 @@ from claude_mpm.core.enums import OperationResult, ValidationSeverity
 from claude_mpm.services.diagnostics.checks.base_check import BaseDiagnosticCheck
 from claude_mpm.services.diagnostics.diagnostic_runner import DiagnosticRunner
 from claude_mpm.services.diagnostics.models import DiagnosticResult, DiagnosticSummary
+from claude_mpm.services.diagnostics.scheduler import CheckScheduler
 
 
 class MockCheck(BaseDiagnosticCheck):
@@ -357,33 +358,40 @@ class TestDiagnosticRunner:
             # _attempt_fix should not be called
             mock_fix.assert_not_called()
 
-    def test_run_diagnostics_parallel_executes_levels(self):
-        """Test that parallel execution runs checks in dependency levels."""
+    def test_run_diagnostics_parallel_uses_scheduler(self):
+        """Test that parallel execution runs every registered check once."""
         runner = DiagnosticRunner()
 
-        # Mock _run_level_parallel to track execution
-        level_results = []
-
-        def mock_run_level(checks):
-            level_results.append(len(checks))
-            return [
-                DiagnosticResult(
-                    category="Test", status=OperationResult.SUCCESS, message="Test"
+        Check1 = type(
+            "Check1",
+            (MockCheck,),
+            {
+                "__init__": lambda self, verbose=False: MockCheck.__init__(
+                    self, verbose, "check1", "Check1"
                 )
-            ]
-
-        with patch.object(runner, "_run_level_parallel", side_effect=mock_run_level):
-            summary = runner.run_diagnostics_parallel()
+            },
+        )
+        Check2 = type(
+            "Check2",
+            (MockCheck,),
+            {
+                "depends_on": ("Check1",),
+                "__init__": lambda self, verbose=False: MockCheck.__init__(
+                    self, verbose, "check2", "Check2"
+                ),
+            },
+        )
 
-            # Should execute 3 levels
-            assert len(level_results) == 3
-            # Level 1 should have 4 checks (Installation, Filesystem, Configuration, Instructions)
-            assert level_results[0] == 4
+        runner.check_classes = [Check1, Check2]
+        summary = runner.run_diagnostics_parallel()
 
-    def test_run_level_parallel_executes_checks(self):
-        """Test that _run_level_parallel executes all checks in parallel."""
-        runner = DiagnosticRunner()
+        assert summary.total_checks == 2
+        assert [r.category for r in summary.results] == ["Check1", "Check2"]
+        assert summary.duration_ms is not None
+        assert all(r.duration_ms is not None for r in summary.results)
 
+    def test_scheduler_executes_checks(self):
+        """Test that CheckScheduler executes all checks in parallel."""
         Check1 = type(
             "Check1",
             (MockCheck,),
@@ -403,27 +411,23 @@ class TestDiagnosticRunner:
             },
         )
 
-        results = runner._run_level_parallel([Check1, Check2])
+        results = CheckScheduler([Check1, Check2]).run()
 
         assert len(results) == 2
         assert all(isinstance(r, DiagnosticResult) for r in results)
 
-    def test_run_level_parallel_handles_exceptions(self):
+    def test_scheduler_handles_exceptions(self):
         """Test that parallel execution handles check exceptions."""
-        runner = DiagnosticRunner()
-
-        results = runner._run_level_parallel([FailingCheck])
+        results = CheckScheduler([FailingCheck]).run()
 
         assert len(results) == 1
         assert results[0].status == ValidationSeverity.ERROR
         assert "failed" in results[0].message.lower()
 
-    def test_run_level_parallel_timeout_handling(self):
+    def test_scheduler_timeout_handling(self):
         """Test that parallel execution applies timeout to check execution."""
-        runner = DiagnosticRunner()
-
         # Create a check that completes within timeout
-        # Note: ThreadPoolExecutor timeout (10s) allows checks to complete,
+        # Note: The default per-check timeout (10s) allows checks to complete,
         # but timeout mechanism is in place for hanging checks
         FastCheck = type(
             "FastCheck",
@@ -436,16 +440,14 @@ class TestDiagnosticRunner:
         )
 
         # This should complete successfully within timeout
-        results = runner._run_level_parallel([FastCheck])
+        results = CheckScheduler([FastCheck]).run()
 
         assert len(results) == 1
         # Check completes before timeout
         assert results[0].status == OperationResult.SUCCESS
 
-    def test_run_level_parallel_skips_should_not_run(self):
+    def test_scheduler_skips_should_not_run(self):
         """Test that parallel execution respects should_run."""
-        runner = DiagnosticRunner()
-
         SkippedCheck = type(
             "SkippedCheck",
             (MockCheck,),
@@ -456,7 +458,7 @@ class TestDiagnosticRunner:
             },
         )
 
-        results = runner._run_level_parallel([SkippedCheck])
+        results = CheckScheduler([SkippedCheck]).run()
 
         # Should return empty list since check is skipped
         assert len(results) == 0
@@ -618,7 +620,6 @@ class TestDiagnosticRunner:
 
     def test_parallel_execution_handles_check_init_failure(self):
         """Test that parallel execution handles check initialization failures."""
-        runner = DiagnosticRunner()
 
         # Create a check class that fails during __init__
         class FailingInitCheck(BaseDiagnosticCheck):
@@ -640,7 +641,7 @@ class TestDiagnosticRunner:
                     message="Should not reach here",
                 )
 
-        results = runner._run_level_parallel([FailingInitCheck])
+        results = CheckScheduler([FailingInitCheck]).run()
 
         # Should have an error result for the failed initialization
         assert len(results) == 1
@@ -0,0 +1,199 @@
+"""Tests for the persistent kuzu-memory recall client.
+
+A fake worker (serving the real kuzu_worker protocol loop) and a fake
+kuzu-memory CLI stand in for the real package.
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from claude_mpm.services.memory.kuzu_recall import KuzuRecallClient
+
+FAKE_WORKER = """
+import json, sys
+from claude_mpm.services.memory.kuzu_worker import serve
+
+class Fake:
+    def recall(self, query, limit=10):
+        return {"memories": [{"content": "worker: " + query}]}
+
+    def learn(self, items):
+        with open(sys.argv[1], "a") as f:
+            f.write(json.dumps(items) + "\\n")
+        return {"stored": len(items)}
+
+serve(Fake())
+"""
+
+FAKE_CLI = """#!{python}
+import json, sys
+args = sys.argv[1:]
+if args[:2] == ["memory", "recall"]:
+    print(json.dumps({{"memories": [{{"content": "cli: " + args[2]}}]}}))
+elif args[:2] == ["memory", "learn"]:
+    with open({log!r}, "a") as f:
+        f.write(json.dumps([{{"content": args[2]}}]) + "\\n")
+"""
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def read_batches(path: Path) -> list[list[dict]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def env(tmp_path):
+    worker_log = tmp_path / "worker_learn.jsonl"
+    cli_log = tmp_path / "cli_learn.jsonl"
+    worker = tmp_path / "fake_worker.py"
+    worker.write_text(FAKE_WORKER)
+    cli = tmp_path / "kuzu-memory"
+    cli.write_text(FAKE_CLI.format(python=sys.executable, log=str(cli_log)))
+    cli.chmod(0o755)
+    return {
+        "cli": str(cli),
+        "worker_cmd": [sys.executable, str(worker), str(worker_log)],
+        "worker_log": worker_log,
+        "cli_log": cli_log,
+        "db_path": tmp_path / "kuzu-memories",
+        "project": tmp_path,
+    }
+
+
+@pytest.fixture
+def make_client(env):
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("worker_cmd", env["worker_cmd"])
+        kwargs.setdefault("db_path", env["db_path"])
+        client = KuzuRecallClient(env["cli"], env["project"], **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def started(client):
+    """Recall once (starting the worker) and wait until it is ready."""
+    client.recall("warm up")
+    assert client._worker_ready.wait(5)
+    return client
+
+
+def test_cli_answers_until_worker_is_ready(make_client):
+    client = make_client()
+
+    assert client.recall("first") == [{"content": "cli: first"}]
+    assert client._worker_ready.wait(5)
+    assert client.recall("second") == [{"content": "worker: second"}]
+    assert (client.stats["cli_calls"], client.stats["worker_calls"]) == (1, 1)
+
+
+def test_recall_cached_by_normalized_prompt(make_client):
+    client = started(make_client())
+
+    first = client.recall("Fix the  login\nbug")
+    second = client.recall("  fix THE login bug ")
+
+    assert first == second
+    assert client.stats["cache_hits"] == 1
+
+
+def test_database_change_invalidates_cache(make_client, env):
+    env["db_path"].mkdir()
+    client = started(make_client())
+    client.recall("query")
+
+    (env["db_path"] / "memories.db.wal").write_bytes(b"new data")
+    client.recall("query")
+
+    assert client.stats["cache_hits"] == 0
+
+
+def test_stores_are_written_in_groups(make_client, env):
+    client = started(make_client(flush_interval=60, max_batch=3))
+    client.recall("query")
+
+    for index in range(3):
+        assert client.store(f"learning {index}", ["general"])
+    wait_for(lambda: read_batches(env["worker_log"]))
+
+    (batch,) = read_batches(env["worker_log"])
+    assert [item["content"] for item in batch] == [f"learning {i}" for i in range(3)]
+    # Our own writes invalidate cached recalls
+    client.recall("query")
+    assert client.stats["cache_hits"] == 0
+
+
+def test_close_flushes_pending_stores(make_client, env):
+    client = started(make_client(flush_interval=60))
+    client.store("remember this")
+
+    client.close()
+
+    assert read_batches(env["worker_log"]) == [
+        [{"content": "remember this", "tags": []}]
+    ]
+    assert not client.store("too late")
+
+
+def test_falls_back_to_cli_when_worker_fails(make_client, env):
+    client = make_client(worker_cmd=[sys.executable, "-c", "raise SystemExit(1)"])
+
+    assert client.recall("one") == [{"content": "cli: one"}]
+    time.sleep(0.2)  # let the worker die
+    assert client.recall("two") == [{"content": "cli: two"}]
+    client.store("fallback learning")
+    client.close()
+
+    wait_for(lambda: read_batches(env["cli_log"]))
+    assert read_batches(env["cli_log"]) == [[{"content": "fallback learning"}]]
+
+
+def test_worker_crash_mid_session(make_client):
+    client = started(make_client())
+    client._worker.kill()
+
+    assert client.recall("after crash") == [{"content": "cli: after crash"}]
+
+
+@pytest.mark.performance
+def test_recall_latency(make_client):
+    """p50 of CLI forks vs. worker round trips vs. cache hits."""
+
+    def p50(client, prompts):
+        samples = []
+        for prompt in prompts:
+            started_at = time.perf_counter()
+            client.recall(prompt)
+            samples.append(time.perf_counter() - started_at)
+        return statistics.median(samples)
+
+    cli_only = make_client(worker_cmd=[sys.executable, "-c", "raise SystemExit(1)"])
+    cli = p50(cli_only, [f"cli prompt {i}" for i in range(10)])
+    cached = p50(cli_only, [f"CLI  prompt {i}" for i in range(10)] * 10)
+    worker = p50(started(make_client()), [f"worker prompt {i}" for i in range(50)])
+
+    print(
+        f"\nCLI fork p50:   {cli * 1e3:.2f} ms"
+        f"\nworker p50:     {worker * 1e3:.3f} ms"
+        f"\ncache hit p50:  {cached * 1e3:.3f} ms"
+    )
+    assert cached < 0.001
+    assert worker < cli
@@ -0,0 +1,173 @@
+"""Tests for persistent skill catalogs.
+
+Test Coverage:
+- Unchanged skill files are served from the catalog, not reparsed
+- Edited, added and removed files and resources refresh the catalog
+- Merged, priority-resolved index across sources and lookups by name
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_mpm.config.skill_sources import SkillSource, SkillSourceConfiguration
+from claude_mpm.services.skills.git_skill_source_manager import GitSkillSourceManager
+from claude_mpm.services.skills.skill_catalog import (
+    CATALOG_FILENAME,
+    INDEX_FILENAME,
+    SkillCatalog,
+)
+from claude_mpm.services.skills.skill_discovery_service import SkillDiscoveryService
+
+
+def write_skill(root: Path, relative: str, name: str, description: str = "A skill"):
+    path = root / relative / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n")
+    return path
+
+
+@pytest.fixture
+def skills_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "system"
+    write_skill(root, "testing/tdd", "tdd")
+    write_skill(root, "debugging/systematic", "systematic-debugging")
+    return root
+
+
+def parse_count(service: SkillDiscoveryService) -> tuple[list, int]:
+    with patch.object(
+        service, "_parse_skill_file", wraps=service._parse_skill_file
+    ) as parse:
+        skills = service.discover_skills()
+    return skills, parse.call_count
+
+
+class TestSkillCatalog:
+    def test_unchanged_files_are_not_reparsed(self, skills_dir: Path) -> None:
+        first, parsed = parse_count(SkillDiscoveryService(skills_dir))
+        assert parsed == 2
+        assert (skills_dir / CATALOG_FILENAME).exists()
+
+        second, parsed = parse_count(SkillDiscoveryService(skills_dir))
+        assert parsed == 0
+        assert second == first
+
+    def test_changes_are_picked_up(self, skills_dir: Path) -> None:
+        SkillDiscoveryService(skills_dir).discover_skills()
+
+        write_skill(skills_dir, "testing/tdd", "tdd", description="Edited, longer")
+        write_skill(skills_dir, "testing/new", "new-skill")
+        (skills_dir / "debugging" / "systematic" / "SKILL.md").unlink()
+        skills, parsed = parse_count(SkillDiscoveryService(skills_dir))
+
+        assert parsed == 2
+        by_name = {skill["name"]: skill for skill in skills}
+        assert set(by_name) == {"tdd", "new-skill"}
+        assert by_name["tdd"]["description"] == "Edited, longer"
+        assert [s["name"] for s in SkillCatalog(skills_dir).skills()] == [
+            s["name"] for s in skills
+        ]
+
+    def test_new_resources_invalidate_entry(self, tmp_path: Path) -> None:
+        root = tmp_path / "legacy"
+        root.mkdir()
+        (root / "review.md").write_text("---\nname: review\ndescription: R\n---\n")
+        SkillDiscoveryService(root).discover_skills()
+
+        (root / "scripts" / "review").mkdir(parents=True)
+        (root / "scripts" / "review" / "lint.sh").write_text("echo lint")
+        skills = SkillDiscoveryService(root).discover_skills()
+
+        assert skills[0]["resources"] == [str(root / "scripts" / "review" / "lint.sh")]
+
+    def test_catalog_can_be_disabled(self, skills_dir: Path) -> None:
+        SkillDiscoveryService(skills_dir, use_catalog=False).discover_skills()
+
+        assert not (skills_dir / CATALOG_FILENAME).exists()
+
+
+class TestMergedSkillIndex:
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> GitSkillSourceManager:
+        config = SkillSourceConfiguration(config_path=tmp_path / "sources.yaml")
+        config.save(
+            [
+                SkillSource(
+                    id="system",
+                    type="git",
+                    url="https://github.com/owner/system-skills",
+                    priority=0,
+                ),
+                SkillSource(
+                    id="custom",
+                    type="git",
+                    url="https://github.com/owner/custom-skills",
+                    priority=100,
+                ),
+            ]
+        )
+        cache_dir = tmp_path / "cache"
+        write_skill(cache_dir / "system", "testing/tdd", "tdd", "System TDD")
+        write_skill(cache_dir / "custom", "testing/tdd", "tdd", "Custom TDD")
+        write_skill(cache_dir / "custom", "ops/deploy", "deploy")
+        return GitSkillSourceManager(config=config, cache_dir=cache_dir)
+
+    def test_priority_resolution_is_persisted(
+        self, manager: GitSkillSourceManager
+    ) -> None:
+        skills = manager.get_all_skills()
+
+        assert {s["name"]: s["source_id"] for s in skills} == {
+            "tdd": "system",
+            "deploy": "custom",
+        }
+        assert (manager.cache_dir / INDEX_FILENAME).exists()
+
+        fresh = GitSkillSourceManager(
+            config=manager.config, cache_dir=manager.cache_dir
+        )
+        with patch.object(SkillDiscoveryService, "discover_skills") as discover:
+            assert fresh.get_all_skills() == skills
+        discover.assert_not_called()
+
+    def test_lookup_by_name_and_deployment_name(
+        self, manager: GitSkillSourceManager
+    ) -> None:
+        assert manager.get_skill("tdd")["description"] == "System TDD"
+        assert manager.get_skill("ops-deploy")["name"] == "deploy"
+        assert manager.get_skill("missing") is None
+
+    def test_resync_refreshes_index(self, manager: GitSkillSourceManager) -> None:
+        manager.get_all_skills()
+
+        # A sync rescans the source, which rewrites its catalog
+        write_skill(manager.cache_dir / "system", "ops/monitor", "monitor")
+        SkillDiscoveryService(manager.cache_dir / "system").discover_skills()
+
+        assert manager.get_skill("monitor")["source_id"] == "system"
+
+    def test_root_skill_deploys_without_cache_metadata(
+        self, manager: GitSkillSourceManager, tmp_path: Path
+    ) -> None:
+        root = tmp_path / "solo"
+        write_skill(root, "", "solo")
+        (root / "reference.md").write_text("# Reference")
+        SkillDiscoveryService(root).discover_skills()
+        (root / ".etag-cache.json").write_text("{}")
+        assert (root / CATALOG_FILENAME).exists()
+
+        target = tmp_path / "deployed"
+        result = manager._deploy_single_skill(
+            {"name": "solo", "source_file": str(root / "SKILL.md")},
+            target,
+            "solo",
+            force=False,
+        )
+
+        assert result["deployed"]
+        assert sorted(p.name for p in (target / "solo").iterdir()) == [
+            "SKILL.md",
+            "reference.md",
+        ]
@@ -0,0 +1,220 @@
+"""Tests for the startup change journal."""
+
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from claude_mpm.services.change_journal import ChangeJournal, source_revision
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch) -> Path:
+    home_dir = tmp_path / "home"
+    (home_dir / ".claude-mpm" / "config").mkdir(parents=True)
+    monkeypatch.setattr(Path, "home", lambda: home_dir)
+    return home_dir
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    agents = root / ".claude" / "agents"
+    agents.mkdir(parents=True)
+    (agents / "engineer.md").write_text("---\nname: engineer\n---\n")
+    skill = root / ".claude" / "skills" / "tdd"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: tdd\n---\n")
+    (root / ".claude-mpm").mkdir()
+    (root / ".claude-mpm" / "configuration.yaml").write_text("agents: {}\n")
+    return root
+
+
+@pytest.fixture
+def journal(home: Path) -> ChangeJournal:
+    return ChangeJournal()
+
+
+def touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestChangeJournal:
+    def test_untracked_project_needs_reconciliation(self, journal, project):
+        assert not journal.is_tracked("agents", project)
+        assert journal.pending_changes("agents", project) == ["not reconciled yet"]
+
+    def test_clean_after_reconciliation(self, journal, project):
+        for kind in ("agents", "skills"):
+            journal.mark_reconciled(kind, project)
+
+            assert journal.is_tracked(kind, project)
+            assert journal.pending_changes(kind, project) == []
+
+    def test_deployed_file_changes(self, journal, project):
+        journal.mark_reconciled("agents", project)
+        agent = project / ".claude" / "agents" / "engineer.md"
+
+        # Same content with a new mtime is not a change
+        touch_later(agent)
+        assert journal.pending_changes("agents", project) == []
+
+        agent.write_text("edited by hand")
+        assert journal.pending_changes("agents", project) == [
+            "deployed engineer.md changed"
+        ]
+
+        agent.unlink()
+        assert journal.pending_changes("agents", project) == [
+            "deployed engineer.md changed"
+        ]
+
+    def test_touched_file_is_hashed_once(self, journal, project, monkeypatch):
+        journal.mark_reconciled("agents", project)
+        touch_later(project / ".claude" / "agents" / "engineer.md")
+        touch_later(project / ".claude-mpm" / "configuration.yaml")
+        assert journal.pending_changes("agents", project) == []
+
+        hashed = []
+        monkeypatch.setattr(
+            "claude_mpm.services.change_journal._sha256",
+            hashed.append,
+        )
+
+        assert journal.pending_changes("agents", project) == []
+        assert hashed == []
+
+    def test_config_and_local_template_changes(self, journal, project, home):
+        journal.mark_reconciled("agents", project)
+
+        (project / ".claude-mpm" / "configuration.yaml").write_text("agents: [qa]\n")
+        (project / ".claude-mpm" / "agents").mkdir()
+        (project / ".claude-mpm" / "agents" / "custom.md").write_text("custom")
+        (home / ".claude-mpm" / "config" / "agent_sources.yaml").write_text("x: 1")
+
+        assert sorted(journal.pending_changes("agents", project)) == [
+            "agent_sources.yaml changed",
+            "configuration.yaml changed",
+            "custom.md changed",
+        ]
+
+    def test_skills_follow_deployed_agents(self, journal, project):
+        journal.mark_reconciled("skills", project)
+
+        (project / ".claude" / "agents" / "qa.md").write_text("---\nname: qa\n---\n")
+
+        assert journal.pending_changes("skills", project) == ["qa.md changed"]
+
+    def test_source_revisions(self, journal, project, tmp_path):
+        cache = tmp_path / "cache" / "owner" / "repo"
+        cache.mkdir(parents=True)
+        (cache / "engineer.md").write_text("v1")
+        journal.record_source("agents", "owner/repo", source_revision(cache))
+        journal.mark_reconciled("agents", project)
+
+        # Sync bookkeeping does not change the revision
+        (cache / ".etag-cache.json").write_text("{}")
+        journal.record_source("agents", "owner/repo", source_revision(cache))
+        assert journal.pending_changes("agents", project) == []
+
+        (cache / "engineer.md").write_text("version 2")
+        journal.record_source("agents", "owner/repo", source_revision(cache))
+        assert journal.pending_changes("agents", project) == [
+            "source owner/repo changed"
+        ]
+        assert journal.pending_changes("skills", project) == ["not reconciled yet"]
+
+    def test_watcher_events_after_reconciliation(self, journal, project):
+        journal.record_event("agents", "/old/change.md", "modify")
+        journal.mark_reconciled("agents", project)
+        assert journal.pending_changes("agents", project) == []
+
+        journal.record_modification(
+            SimpleNamespace(
+                file_path="/home/user/.claude-mpm/agents/custom.md",
+                modification_type=SimpleNamespace(value="create"),
+                tier=SimpleNamespace(value="user"),
+            )
+        )
+
+        assert journal.pending_changes("agents", project) == [
+            "/home/user/.claude-mpm/agents/custom.md create"
+        ]
+        assert journal.pending_changes("skills", project) == ["not reconciled yet"]
+
+    def test_project_events_stay_in_their_project(
+        self, journal, project, tmp_path, monkeypatch
+    ):
+        other = tmp_path / "other"
+        other.mkdir()
+        journal.mark_reconciled("agents", project)
+        journal.mark_reconciled("agents", other)
+
+        monkeypatch.chdir(other)
+        journal.record_modification(
+            SimpleNamespace(
+                file_path="agents/local.md",
+                modification_type=SimpleNamespace(value="modify"),
+                tier=SimpleNamespace(value="project"),
+            )
+        )
+
+        assert journal.pending_changes("agents", project) == []
+        assert journal.pending_changes("agents", other) == ["agents/local.md modify"]
+
+    def test_concurrent_writers_keep_every_event(self, journal, project):
+        journal.mark_reconciled("agents", project)
+
+        def record(index: int) -> None:
+            ChangeJournal().record_event("agents", f"/agents/{index}.md", "create")
+
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(journal.pending_changes("agents", project)) == 20
+
+    def test_profile_switch_and_edit(self, journal, project, home):
+        profiles = project / ".claude-mpm" / "profiles"
+        profiles.mkdir()
+        (profiles / "minimal.yaml").write_text("agents: {enabled: [engineer]}\n")
+        for kind in ("agents", "skills"):
+            journal.mark_reconciled(kind, project)
+
+        user_config = home / ".config" / "claude-mpm" / "claude-mpm.yaml"
+        user_config.parent.mkdir(parents=True)
+        user_config.write_text("active_profile: minimal\n")
+
+        for kind in ("agents", "skills"):
+            assert journal.pending_changes(kind, project) == ["claude-mpm.yaml changed"]
+            journal.mark_reconciled(kind, project)
+
+        (profiles / "minimal.yaml").write_text("agents: {enabled: [qa]}\n")
+        assert journal.pending_changes("agents", project) == ["minimal.yaml changed"]
+
+    def test_version_upgrade(self, journal, project, monkeypatch):
+        journal.mark_reconciled("agents", project)
+
+        monkeypatch.setattr("claude_mpm.services.change_journal.__version__", "99.0")
+
+        assert journal.pending_changes("agents", project) == [
+            "claude-mpm version changed to 99.0"
+        ]
+
+    def test_startup_redeploys_after_profile_switch(
+        self, journal, project, monkeypatch
+    ):
+        from claude_mpm.cli.startup import _mark_reconciled, _pending_changes
+
+        monkeypatch.chdir(project)
+        _mark_reconciled("agents")
+        assert _pending_changes("agents") == []
+
+        (project / ".claude-mpm.yaml").write_text("active_profile: frontend\n")
+
+        assert _pending_changes("agents") == [".claude-mpm.yaml changed"]
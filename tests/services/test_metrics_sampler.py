@@ -0,0 +1,161 @@
+"""Tests for the background metrics sampler and the checks that read it.
+
+Test Coverage:
+- Ring buffer capacity, EWMA and percentile summaries
+- Inline sampling only when the background data is stale
+- Resource checks never sleeping on the event loop (stub psutil)
+- Aggregator running services concurrently in registration order
+"""
+
+import asyncio
+import threading
+import time
+from collections import namedtuple
+from unittest.mock import patch
+
+import pytest
+
+from claude_mpm.services.infrastructure.monitoring import (
+    HealthMetric,
+    HealthStatus,
+    MonitoringAggregatorService,
+    ResourceMonitorService,
+)
+from claude_mpm.services.infrastructure.monitoring.base import BaseMonitoringService
+from claude_mpm.services.infrastructure.monitoring.sampler import MetricsSampler
+
+VirtualMemory = namedtuple("VirtualMemory", "percent available total")
+DiskUsage = namedtuple("DiskUsage", "percent free")
+NetIO = namedtuple("NetIO", "bytes_sent bytes_recv")
+
+
+class StubPsutil:
+    """psutil stand-in whose interval sampling really sleeps, like psutil."""
+
+    def __init__(self):
+        self.cpu_calls = []
+        self.sent = 0
+
+    def cpu_percent(self, interval=None):
+        self.cpu_calls.append((interval, threading.current_thread()))
+        if interval:
+            time.sleep(interval)
+        return 42.0
+
+    def virtual_memory(self):
+        return VirtualMemory(percent=50.0, available=4 * 1024**3, total=8 * 1024**3)
+
+    def disk_usage(self, path):
+        return DiskUsage(percent=30.0, free=100 * 1024**3)
+
+    def net_io_counters(self):
+        self.sent += 2048
+        return NetIO(bytes_sent=self.sent, bytes_recv=0)
+
+    def cpu_count(self):
+        return 4
+
+    def getloadavg(self):
+        return (0.5, 0.5, 0.5)
+
+
+@pytest.fixture
+def sampler():
+    sampler = MetricsSampler(interval=0.01)
+    yield sampler
+    sampler.stop()
+
+
+class TestMetricsSampler:
+    def test_ring_buffer_and_summary(self, sampler):
+        values = iter(range(1, 11))
+        sampler.capacity = 5
+        sampler.add_source("src", lambda: {"value": next(values)})
+
+        for _ in range(10):
+            sampler.sample_now("src")
+
+        summary = sampler.summary("src.value")
+        assert [v for _, v in sampler.window("src.value")] == [6, 7, 8, 9, 10]
+        assert (summary.latest, summary.minimum, summary.maximum) == (10, 6, 10)
+        assert (summary.p50, summary.p95, summary.samples) == (8, 10, 5)
+        assert 6 < summary.ewma < 10
+
+    def test_inline_sample_only_when_stale(self, sampler):
+        calls = []
+        sampler.add_source("src", lambda: calls.append(1) or {"value": 1})
+
+        sampler.ensure_fresh("src")
+        assert len(calls) == 1  # not running: sampled inline
+
+        sampler.interval = 60
+        sampler.start()
+        time.sleep(0.05)
+        before = len(calls)
+        sampler.ensure_fresh("src")
+        assert len(calls) == before
+
+    def test_failing_source_and_removal(self, sampler):
+        sampler.add_source("bad", lambda: 1 / 0)
+        sampler.add_source("good", lambda: {"value": 1})
+
+        sampler.sample_now()
+        sampler.remove_source("good")
+
+        assert sampler.summary("bad.value") is None
+        assert sampler.summary("good.value") is None
+
+
+class TestNonBlockingChecks:
+    async def test_concurrent_checks_never_sleep_on_loop(self, sampler):
+        stub = StubPsutil()
+        with (
+            patch(
+                "claude_mpm.services.infrastructure.monitoring.resources.psutil", stub
+            ),
+            patch(
+                "claude_mpm.services.infrastructure.monitoring.resources.PSUTIL_AVAILABLE",
+                True,
+            ),
+        ):
+            service = ResourceMonitorService(sampler=sampler)
+            sampler.start()
+            time.sleep(0.05)  # a few background passes
+
+            started = time.perf_counter()
+            results = await asyncio.gather(*(service.check_health() for _ in range(50)))
+            elapsed = time.perf_counter() - started
+            summary = service.get_resource_summary()
+
+        # The old code slept 0.1 s per check: 5 s for 50 checks
+        assert elapsed < 0.5
+        # Only non-blocking reads; after priming, the sampler thread does them
+        assert all(interval is None for interval, _ in stub.cpu_calls)
+        assert any(thread.name == "metrics-sampler" for _, thread in stub.cpu_calls)
+        metrics = {m.name: m for m in results[-1]}
+        assert metrics["system_cpu_usage"].value == 42.0
+        assert metrics["system_cpu_usage_avg"].value == 42.0
+        assert metrics["system_memory_usage"].status == HealthStatus.HEALTHY
+        assert summary["cpu_percent"] == 42.0
+
+
+class SlowService(BaseMonitoringService):
+    def __init__(self, name, delay):
+        super().__init__(name)
+        self.delay = delay
+
+    async def check_health(self):
+        await asyncio.sleep(self.delay)
+        return [HealthMetric(self.name, self.delay, HealthStatus.HEALTHY)]
+
+
+async def test_aggregator_runs_services_concurrently():
+    aggregator = MonitoringAggregatorService()
+    for index in range(3):
+        aggregator.add_service(SlowService(f"slow{index}", 0.2 - index * 0.05))
+
+    started = time.perf_counter()
+    result = await aggregator.perform_health_check()
+
+    assert time.perf_counter() - started < 0.35
+    assert [m.name for m in result.metrics] == ["slow0", "slow1", "slow2"]
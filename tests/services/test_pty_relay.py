@@ -0,0 +1,222 @@
+"""Tests for the readiness-driven PTY relay and output coalescer.
+
+Drives real children (head, sleep, yes) through a PTY; output is written
+to a pipe drained by a reader thread.
+"""
+
+import os
+import pty
+import subprocess
+import threading
+import time
+
+import pytest
+
+from claude_mpm.services.pty_relay import OutputCoalescer, PtyRelay
+
+
+class Sink:
+    """Pipe standing in for the terminal; collects everything written."""
+
+    def __init__(self):
+        self.read_fd, self.fd = os.pipe()
+        self.chunks = []
+        self._thread = threading.Thread(target=self._drain)
+        self._thread.start()
+
+    def _drain(self):
+        while data := os.read(self.read_fd, 1 << 20):
+            self.chunks.append(data)
+
+    def close(self) -> bytes:
+        os.close(self.fd)
+        self._thread.join(5)
+        os.close(self.read_fd)
+        return b"".join(self.chunks)
+
+
+def spawn_pty(cmd):
+    master_fd, slave_fd = pty.openpty()
+    process = subprocess.Popen(cmd, stdin=slave_fd, stdout=slave_fd, stderr=slave_fd)
+    os.close(slave_fd)
+    return master_fd, process
+
+
+def run_relay(cmd, stdin_fd=None, **kwargs):
+    master_fd, process = spawn_pty(cmd)
+    sink = Sink()
+    try:
+        relay = PtyRelay(master_fd, process, stdin_fd, sink.fd, **kwargs)
+        stats = relay.run()
+        process.wait(timeout=5)
+    finally:
+        os.close(master_fd)
+    return sink.close(), stats
+
+
+class TestPtyRelay:
+    def test_forwards_input_and_output(self):
+        stdin_read, stdin_write = os.pipe()
+        os.write(stdin_write, b"hello\n")
+        os.close(stdin_write)
+
+        output, stats = run_relay(["head", "-n", "1"], stdin_fd=stdin_read)
+        os.close(stdin_read)
+
+        assert output.count(b"hello") == 2  # terminal echo + head's output
+        assert stats["bytes_in"] == 6
+        assert stats["exit_source"] == "pidfd"
+
+    def test_idle_child_costs_no_cpu(self):
+        started = time.process_time()
+        output, stats = run_relay(["sleep", "0.5"])
+        cpu = time.process_time() - started
+
+        assert output == b""
+        assert cpu < 0.05
+        assert stats["wakeups"] <= 2
+
+    def test_output_written_before_exit_is_drained(self):
+        output, _ = run_relay(["sh", "-c", "printf partial; exit 3"])
+
+        assert output == b"partial"
+
+    def test_sigchld_fallback(self, monkeypatch):
+        def no_pidfd(pid):
+            raise OSError("pidfd unsupported")
+
+        monkeypatch.setattr(os, "pidfd_open", no_pidfd)
+
+        output, stats = run_relay(["sh", "-c", "sleep 0.1; printf bye"])
+
+        assert output == b"bye"
+        assert stats["exit_source"] == "sigchld"
+
+    def test_poll_fallback_off_main_thread(self, monkeypatch):
+        monkeypatch.delattr(os, "pidfd_open")
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(run_relay(["printf", "x"]))
+        )
+        thread.start()
+        thread.join(10)
+
+        ((output, stats),) = results
+        assert output == b"x"
+        assert stats["exit_source"] == "poll"
+
+    def test_output_copies_go_to_callback(self):
+        copies = []
+        output, _ = run_relay(["printf", "copied"], on_output=copies.append)
+
+        assert b"".join(copies) == output == b"copied"
+
+
+class TestOutputCoalescer:
+    def test_small_chunks_coalesce_into_frames(self):
+        frames = []
+        coalescer = OutputCoalescer(frames.append, max_delay=0.2)
+        for index in range(100):
+            coalescer.feed(f"{index},".encode())
+        coalescer.close()
+
+        assert "".join(frames) == "".join(f"{i}," for i in range(100))
+        assert len(frames) <= 2
+        assert coalescer.stats["chunks"] == 100
+
+    def test_size_bound_emits_before_delay(self):
+        frames = []
+        emitted = threading.Event()
+        coalescer = OutputCoalescer(
+            lambda text: (frames.append(text), emitted.set()),
+            max_bytes=10,
+            max_delay=30,
+        )
+        coalescer.feed(b"0123456789abcdef")
+
+        assert emitted.wait(2)
+        coalescer.close()
+        assert frames == ["0123456789abcdef"]
+
+    def test_split_multibyte_characters(self):
+        frames = []
+        coalescer = OutputCoalescer(frames.append, max_delay=0.01)
+        encoded = "é✓".encode()
+        coalescer.feed(encoded[:1])
+        time.sleep(0.05)
+        coalescer.feed(encoded[1:])
+        coalescer.close()
+
+        assert "".join(frames) == "é✓"
+
+    def test_sink_errors_are_contained(self):
+        def broken(text):
+            raise ConnectionError("socket gone")
+
+        coalescer = OutputCoalescer(broken, max_delay=0.01)
+        coalescer.feed(b"data")
+        coalescer.close()
+
+        assert coalescer.stats["frames"] == 1
+
+
+@pytest.mark.performance
+class TestRelayThroughput:
+    """32 MiB of ``yes`` output: relay vs. reading the same source directly."""
+
+    CMD = ["sh", "-c", "yes | head -c 33554432"]
+
+    def direct_read(self, fd):
+        total, started = 0, time.perf_counter()
+        while True:
+            try:
+                data = os.read(fd, 1 << 20)
+            except OSError:  # EIO once the PTY child side closes
+                break
+            if not data:
+                break
+            total += len(data)
+        return total, time.perf_counter() - started
+
+    def relay(self, fd, process):
+        sink = Sink()
+        started = time.perf_counter()
+        stats = PtyRelay(fd, process, None, sink.fd).run()
+        elapsed = time.perf_counter() - started
+        return len(sink.close()), elapsed, stats
+
+    def test_pipe_parity(self):
+        process = subprocess.Popen(self.CMD, stdout=subprocess.PIPE)
+        direct_bytes, direct_time = self.direct_read(process.stdout.fileno())
+        process.wait()
+
+        process = subprocess.Popen(self.CMD, stdout=subprocess.PIPE)
+        relay_bytes, relay_time, stats = self.relay(process.stdout.fileno(), process)
+        process.wait()
+
+        print(
+            f"\ndirect pipe: {direct_bytes / direct_time / 1e6:,.0f} MB/s"
+            f"\nrelay pipe:  {relay_bytes / relay_time / 1e6:,.0f} MB/s"
+            f" (read size grew to {stats['read_size']})"
+        )
+        assert relay_bytes == direct_bytes == 32 * 1024 * 1024
+        assert stats["read_size"] > 16 * 1024
+        assert relay_time < max(direct_time * 3, 0.5)
+
+    def test_pty_parity(self):
+        master_fd, process = spawn_pty(self.CMD)
+        direct_bytes, direct_time = self.direct_read(master_fd)
+        process.wait()
+        os.close(master_fd)
+
+        master_fd, process = spawn_pty(self.CMD)
+        relay_bytes, relay_time, _ = self.relay(master_fd, process)
+        process.wait()
+        os.close(master_fd)
+
+        print(
+            f"\ndirect PTY read: {direct_bytes / direct_time / 1e6:,.1f} MB/s"
+            f"\nPTY relay:       {relay_bytes / relay_time / 1e6:,.1f} MB/s"
+        )
+        assert relay_bytes == direct_bytes
+        assert relay_time < direct_time * 2
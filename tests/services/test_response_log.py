@@ -0,0 +1,239 @@
+"""Tests for the segmented response log and its use by AsyncSessionLogger."""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from claude_mpm.services.async_session_logger import AsyncSessionLogger, LogFormat
+from claude_mpm.services.cli.resume_service import ResumeService
+from claude_mpm.services.response_log import (
+    INDEX_FILENAME,
+    ResponseLogReader,
+    SegmentedResponseLog,
+    migrate_legacy_responses,
+)
+
+
+def record(session_id, agent, second, response="done", **metadata):
+    return {
+        "timestamp": f"2026-01-01T00:00:{second:02d}+00:00",
+        "agent": agent,
+        "session_id": session_id,
+        "request": f"request {second}",
+        "response": response,
+        "metadata": metadata,
+    }
+
+
+def segment_files(base_dir):
+    return sorted((base_dir / "segments").glob("*/*.jsonl*"))
+
+
+class TestSegmentedResponseLog:
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_batches_append_to_session_segments(self, tmp_path, compress):
+        log = SegmentedResponseLog(tmp_path, compress=compress)
+        log.append_batch(
+            [record("s1", "pm", 1), record("s2", "engineer", 2), record("s1", "qa", 3)]
+        )
+        log.append_batch([record("s1", "pm", 4)])
+
+        assert len(segment_files(tmp_path)) == 2
+        assert log.stats == {"batches": 2, "records": 4, "segments_created": 2}
+
+        reader = ResponseLogReader(tmp_path)
+        assert [e["request"] for e in reader.entries(session_id="s1")] == [
+            "request 1",
+            "request 3",
+            "request 4",
+        ]
+        assert [e["agent"] for e in reader.entries(agent="engineer")] == ["engineer"]
+
+    def test_compressed_segment_is_one_gzip_stream(self, tmp_path):
+        log = SegmentedResponseLog(tmp_path, compress=True)
+        log.append_batch([record("s1", "pm", 1)])
+        log.append_batch([record("s1", "pm", 2)])
+
+        (path,) = segment_files(tmp_path)
+        with gzip.open(path, "rt") as f:
+            assert [json.loads(line)["request"] for line in f] == [
+                "request 1",
+                "request 2",
+            ]
+
+    def test_rotation_by_size_and_age(self, tmp_path):
+        log = SegmentedResponseLog(tmp_path, max_segment_bytes=1)
+        for second in range(3):
+            log.append_batch([record("s1", "pm", second)])
+        assert len(segment_files(tmp_path)) == 3
+
+        aged = SegmentedResponseLog(tmp_path / "aged", max_segment_age=0)
+        aged.append_batch([record("s1", "pm", 1)])
+        aged.append_batch([record("s1", "pm", 2)])
+        assert len(segment_files(tmp_path / "aged")) == 2
+
+    def test_new_writer_continues_latest_segment(self, tmp_path):
+        SegmentedResponseLog(tmp_path).append_batch([record("s1", "pm", 1)])
+        SegmentedResponseLog(tmp_path).append_batch([record("s1", "pm", 2)])
+
+        assert len(segment_files(tmp_path)) == 1
+        assert len(list(ResponseLogReader(tmp_path).entries())) == 2
+
+
+class TestResponseLogReader:
+    @pytest.fixture
+    def reader(self, tmp_path):
+        log = SegmentedResponseLog(tmp_path)
+        log.append_batch([record("s1", "pm", 1), record("s2", "qa", 2)])
+        log.append_batch([record("s1", "engineer", 3, stop_reason="end_turn")])
+        return ResponseLogReader(tmp_path)
+
+    def test_time_filters(self, reader):
+        since = [e["request"] for e in reader.entries(since="2026-01-01T00:00:02Z")]
+        until = [e["request"] for e in reader.entries(until="2026-01-01T00:00:02Z")]
+
+        assert since == ["request 2", "request 3"]
+        assert until == ["request 1", "request 2"]
+
+    def test_sessions_and_latest(self, reader):
+        sessions = reader.sessions()
+
+        assert [s["session_id"] for s in sessions] == ["s1", "s2"]
+        assert sessions[0]["entries"] == 2
+        assert sessions[0]["agents"] == ["engineer", "pm"]
+        assert sessions[0]["last_agent"] == "engineer"
+        assert reader.latest("s1")["metadata"] == {"stop_reason": "end_turn"}
+        assert reader.latest("missing") is None
+
+    def test_index_rebuilt_when_missing(self, reader, tmp_path):
+        (tmp_path / INDEX_FILENAME).unlink()
+
+        assert len(reader.index()) == 3
+        assert reader.latest("s1")["request"] == "request 3"
+
+    def test_torn_index_line_is_skipped(self, reader, tmp_path):
+        with (tmp_path / INDEX_FILENAME).open("a") as f:
+            f.write('{"session_id": "s1", "ag')
+
+        assert len(reader.index(session_id="s1")) == 2
+
+
+class TestMigration:
+    def write_legacy(self, base_dir, rec, compressed=False):
+        name = f"{rec['session_id']}-{rec['agent']}-{rec['timestamp'][-8:-6]}.json"
+        if compressed:
+            path = base_dir / f"{name}.gz"
+            with gzip.open(path, "wt") as f:
+                json.dump(rec, f)
+        else:
+            path = base_dir / name
+            path.write_text(json.dumps(rec, indent=2))
+        return path
+
+    def test_migrates_legacy_files_in_time_order(self, tmp_path):
+        self.write_legacy(tmp_path, record("s1", "qa", 3))
+        self.write_legacy(tmp_path, record("s1", "pm", 1), compressed=True)
+        self.write_legacy(tmp_path, record("s2", "pm", 2))
+        (tmp_path / "broken.json").write_text("{")
+
+        assert migrate_legacy_responses(tmp_path, dry_run=True)["migrated"] == 3
+        stats = migrate_legacy_responses(tmp_path)
+
+        assert stats == {"migrated": 3, "failed": 1, "segments_created": 2}
+        assert [p.name for p in tmp_path.glob("*.json")] == ["broken.json"]
+        assert not list(tmp_path.glob("*.json.gz"))
+        reader = ResponseLogReader(tmp_path)
+        assert [e["agent"] for e in reader.entries(session_id="s1")] == ["pm", "qa"]
+
+    def test_resume_service_reads_segments(self, tmp_path):
+        responses = tmp_path / ".claude-mpm" / "responses"
+        responses.mkdir(parents=True)
+        self.write_legacy(responses, record("old", "pm", 1))
+        log = SegmentedResponseLog(responses)
+        log.append_batch(
+            [
+                record("new", "engineer", 2),
+                record("new", "pm", 5, stop_reason="end_turn", git_branch="main"),
+            ]
+        )
+
+        service = ResumeService(tmp_path)
+        sessions = service.list_sessions()
+        context = service.get_session_context("new")
+
+        assert [(s.session_id, s.agent_count) for s in sessions] == [
+            ("new", 2),
+            ("old", 1),
+        ]
+        assert sessions[0].last_agent == "pm"
+        assert context.stop_reason == "end_turn"
+        assert context.git_branch == "main"
+        assert context.request == "request 5"
+        assert service.get_session_context("old").request == "request 1"
+
+
+def make_logger(base_dir, log_format):
+    logger = AsyncSessionLogger(
+        base_dir=base_dir, log_format=log_format, enable_async=True
+    )
+    logger.set_session_id("bench-session")
+    return logger
+
+
+class TestAsyncSegmentedLogging:
+    def test_worker_group_commits_batches(self, tmp_path):
+        logger = make_logger(tmp_path, LogFormat.SEGMENTED)
+        for i in range(50):
+            logger.log_response(f"request {i}", "response", agent="Engineer")
+
+        assert logger.flush(timeout=5.0)
+        stats = logger.get_stats()
+        logger.shutdown()
+
+        assert stats["logged"] == 50
+        assert stats["batches"] < 50
+        assert stats["files_created"] == 1
+        entries = list(ResponseLogReader(tmp_path).entries(session_id="bench-session"))
+        assert [e["request"] for e in entries] == [f"request {i}" for i in range(50)]
+        assert entries[0]["agent"] == "engineer"
+        assert "microseconds" not in entries[0]
+
+    def test_shutdown_writes_queued_entries(self, tmp_path):
+        logger = make_logger(tmp_path, LogFormat.SEGMENTED)
+        for i in range(20):
+            logger.log_response(f"request {i}", "response")
+        logger.shutdown()
+
+        assert len(ResponseLogReader(tmp_path).index()) == 20
+
+
+@pytest.mark.performance
+class TestResponseLogThroughput:
+    """2,000 responses: segmented group commits vs. one JSON file per response."""
+
+    def run(self, base_dir, log_format):
+        logger = make_logger(base_dir, log_format)
+        started = time.perf_counter()
+        for i in range(2000):
+            logger.log_response(f"request {i}", "response text " * 50, agent="pm")
+        assert logger.flush(timeout=60.0)
+        elapsed = time.perf_counter() - started
+        stats = logger.get_stats()
+        logger.shutdown()
+        return stats["logged"] / elapsed, stats["files_created"]
+
+    def test_segmented_throughput(self, tmp_path):
+        json_rate, json_files = self.run(tmp_path / "json", LogFormat.JSON)
+        segmented_rate, segmented_files = self.run(
+            tmp_path / "segmented", LogFormat.SEGMENTED
+        )
+
+        print(
+            f"\nJSON files: {json_rate:,.0f} entries/s, {json_files} files"
+            f"\nSegmented: {segmented_rate:,.0f} entries/s, {segmented_files} files"
+        )
+        assert json_files == 2000
+        assert segmented_files == 1
+        assert segmented_rate > json_rate
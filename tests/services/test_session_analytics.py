@@ -0,0 +1,210 @@
+"""Tests for the cross-session analytics store and `aggregate query`."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from claude_mpm.models.agent_session import AgentSession
+from claude_mpm.services.event_aggregator import EventAggregator
+from claude_mpm.services.session_analytics import (
+    Metric,
+    SessionAnalyticsStore,
+    parse_timestamp,
+)
+
+
+def iso(moment: datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def make_session(
+    session_id: str,
+    tool_durations: dict[str, list[int]],
+    days_ago: float = 0,
+    project: str = "/work/alpha",
+) -> AgentSession:
+    """Session with one delegation per agent, each running Read tool calls."""
+    start = datetime.now(UTC) - timedelta(days=days_ago)
+    session = AgentSession(
+        session_id=session_id, start_time=iso(start), working_directory=project
+    )
+    clock = start
+    for agent, durations in tool_durations.items():
+        session.add_event("Task", {"agent_type": agent}, iso(clock))
+        for duration in durations:
+            session.add_event("PreToolUse", {"tool_name": "Read"}, iso(clock))
+            clock += timedelta(milliseconds=duration)
+            session.add_event("PostToolUse", {"tool_name": "Read"}, iso(clock))
+        session.add_event("SubagentStop", {"response": "done"}, iso(clock))
+    session.finalize()
+    return session
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionAnalyticsStore(tmp_path / "analytics.db")
+
+
+class TestMetricParsing:
+    def test_parses_percentile(self):
+        metric = Metric.parse("p95:duration_ms")
+        assert (metric.function, metric.percentile) == ("percentile", 95.0)
+        assert metric.label == "p95_duration_ms"
+
+    @pytest.mark.parametrize("spec", ["median", "sum", "p0:duration_ms", "p1000:x"])
+    def test_rejects_invalid(self, spec):
+        with pytest.raises(ValueError):
+            Metric.parse(spec)
+
+
+class TestSessionAnalyticsStore:
+    def test_timestamp_formats(self):
+        assert parse_timestamp("2026-01-01T00:00:00Z") == parse_timestamp(
+            "2026-01-01T00:00:00.000000+00:00Z"
+        )
+        assert parse_timestamp("not a time") is None
+
+    def test_tool_percentiles_by_agent(self, store):
+        store.ingest(
+            make_session(
+                "s1",
+                {"engineer": list(range(10, 110, 10)), "qa": [5, 5, 500]},
+            )
+        )
+
+        rows = store.query(
+            "tools",
+            ["count", "p50:duration_ms", "p95:duration_ms", "max:duration_ms"],
+            group_by=["agent"],
+        )
+
+        assert rows == [
+            {
+                "agent": "engineer",
+                "count": 10,
+                "p50_duration_ms": 50,
+                "p95_duration_ms": 100,
+                "max_duration_ms": 100,
+            },
+            {
+                "agent": "qa",
+                "count": 3,
+                "p50_duration_ms": 5,
+                "p95_duration_ms": 500,
+                "max_duration_ms": 500,
+            },
+        ]
+
+    def test_ingest_is_idempotent(self, store):
+        session = make_session("s1", {"engineer": [10, 20]})
+        store.ingest(session)
+        store.ingest(session)
+
+        assert store.query("tools") == [{"count": 2}]
+        assert store.query("sessions", ["sum:tool_calls"]) == [{"sum_tool_calls": 2}]
+
+    def test_since_and_filters(self, store):
+        store.ingest(make_session("old", {"engineer": [10]}, days_ago=40))
+        store.ingest(
+            make_session("new", {"engineer": [20], "qa": [30]}, project="/work/beta")
+        )
+
+        assert store.query("tools", since_days=30) == [{"count": 2}]
+        assert store.query("tools", filters={"agent": "qa"}) == [{"count": 1}]
+        assert store.query(
+            "delegations", group_by=["project"], filters={"success": "1"}
+        ) == [
+            {"project": "/work/alpha", "count": 1},
+            {"project": "/work/beta", "count": 2},
+        ]
+
+    def test_percentile_ignores_unfinished_tools(self, store):
+        session = make_session("s1", {"engineer": [10, 20, 30]})
+        session.add_event("PreToolUse", {"tool_name": "Bash"})
+        store.ingest(session)
+
+        rows = store.query("tools", ["count", "p100:duration_ms"], group_by=["tool"])
+
+        assert rows == [
+            {"tool": "Bash", "count": 1, "p100_duration_ms": None},
+            {"tool": "Read", "count": 3, "p100_duration_ms": 30},
+        ]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"table": "users"}, "Unknown table"),
+            ({"group_by": ["file_path"]}, "Cannot group"),
+            ({"filters": {"1=1; --": "x"}}, "Cannot group"),
+            ({"metrics": ["avg:tool"]}, "Cannot aggregate"),
+        ],
+    )
+    def test_rejects_unknown_columns(self, store, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            store.query(**kwargs)
+
+
+class TestAggregatorQuery:
+    def test_saved_and_legacy_sessions_are_queryable(self, tmp_path, capsys):
+        from claude_mpm.cli.commands import aggregate
+
+        # Saved before the analytics store existed
+        make_session("legacy-1", {"qa": [40]}).save_to_file(tmp_path)
+        aggregator = EventAggregator(save_dir=str(tmp_path))
+        aggregator._save_session(make_session("live-1", {"engineer": [10, 30]}))
+
+        rows = aggregator.query_sessions(
+            table="tools", metrics=["count"], group_by=["agent"]
+        )
+        assert rows == [
+            {"agent": "engineer", "count": 2},
+            {"agent": "qa", "count": 1},
+        ]
+
+        args = SimpleNamespace(
+            table="tools",
+            metric=["avg:duration_ms"],
+            group_by=["agent"],
+            since=None,
+            where=["tool=Read"],
+            limit=None,
+            json=False,
+        )
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(aggregate, "get_aggregator", lambda: aggregator)
+            assert aggregate.query_command_legacy(args) == 0
+        output = capsys.readouterr().out
+        assert "avg_duration_ms" in output
+        assert "engineer  20.0" in output
+
+
+@pytest.mark.performance
+class TestAnalyticsThroughput:
+    def test_percentiles_over_50k_tool_calls(self, store):
+        agents = ["engineer", "qa", "research", "ops"]
+        for i in range(50):
+            store.ingest(
+                make_session(
+                    f"s{i}",
+                    {
+                        agent: [(i * j) % 997 + 1 for j in range(250)]
+                        for agent in agents
+                    },
+                    days_ago=i % 60,
+                )
+            )
+
+        started = time.perf_counter()
+        rows = store.query(
+            "tools",
+            ["count", "p95:duration_ms", "avg:duration_ms"],
+            group_by=["agent"],
+            since_days=30,
+        )
+        elapsed = time.perf_counter() - started
+
+        assert [row["agent"] for row in rows] == sorted(agents)
+        assert sum(row["count"] for row in rows) > 0
+        assert elapsed < 2.0
@@ -0,0 +1,177 @@
+"""Tests for the saved-session catalog and compressed session storage."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from claude_mpm.models.agent_session import AgentSession
+from claude_mpm.services.event_aggregator import EventAggregator
+from claude_mpm.services.session_catalog import SessionCatalog
+
+
+def make_session(index: int, events: int = 20) -> AgentSession:
+    session = AgentSession(
+        session_id=f"{index:08d}-aaaa-bbbb-cccc-dddddddddddd",
+        start_time=f"2026-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}.000Z",
+        working_directory="/tmp/project",
+    )
+    session.add_event("user_prompt", {"prompt": f"Prompt number {index} " * 5})
+    for i in range(events):
+        session.add_event(
+            "pre_tool",
+            {"tool_name": "Read", "tool_parameters": {"file_path": f"/src/f{i}.py"}},
+        )
+    session.finalize()
+    return session
+
+
+def save_legacy(session: AgentSession, directory: Path, mtime: float) -> Path:
+    path = Path(session.save_to_file(directory))
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def aggregator(tmp_path):
+    return EventAggregator(save_dir=str(tmp_path))
+
+
+class TestCompressedSessionFiles:
+    def test_round_trip(self, tmp_path):
+        session = make_session(1)
+
+        path = Path(session.save_to_file(tmp_path, compress=True))
+        loaded = AgentSession.load_from_file(str(path))
+
+        assert path.name.endswith(".json.gz")
+        assert loaded.session_id == session.session_id
+        assert len(loaded.events) == len(session.events)
+
+    def test_compressed_is_smaller(self, tmp_path):
+        session = make_session(1, events=200)
+
+        plain = Path(session.save_to_file(tmp_path / "plain"))
+        packed = Path(session.save_to_file(tmp_path / "packed", compress=True))
+
+        assert packed.stat().st_size * 5 < plain.stat().st_size
+
+
+class TestSessionCatalog:
+    def test_sync_catalogs_existing_files(self, tmp_path):
+        for i in range(3):
+            save_legacy(make_session(i), tmp_path, 1000 + i)
+
+        catalog = SessionCatalog(tmp_path)
+
+        assert catalog.sync() == 3
+        assert catalog.sync() == 0
+        rows = catalog.list(limit=2)
+        assert [row["session_id"][:8] for row in rows] == ["00000002", "00000001"]
+        assert rows[0]["events"] == 21
+
+    def test_sync_drops_deleted_files(self, tmp_path):
+        path = save_legacy(make_session(1), tmp_path, 1000)
+        catalog = SessionCatalog(tmp_path)
+        catalog.sync()
+
+        path.unlink()
+
+        assert catalog.sync() == 1
+        assert catalog.count() == 0
+
+    def test_find_by_id_prefix_and_filename(self, tmp_path):
+        save_legacy(make_session(7), tmp_path, 1000)
+        catalog = SessionCatalog(tmp_path)
+        catalog.sync()
+
+        assert catalog.find("0000000").name.startswith("session_00000007")
+        assert catalog.find("00-01-00-07") is None
+        assert catalog.find("00-00-07") is not None
+        assert catalog.find("%") is None
+
+    def test_migrate_compresses_and_preserves_order(self, tmp_path):
+        for i in range(3):
+            save_legacy(make_session(i), tmp_path, 1000 + i)
+        catalog = SessionCatalog(tmp_path)
+        catalog.sync()
+
+        stats = catalog.migrate()
+
+        assert stats["migrated"] == 3
+        assert stats["bytes_after"] < stats["bytes_before"]
+        assert not list(tmp_path.glob("session_*.json"))
+        rows = catalog.list()
+        assert [row["session_id"][:8] for row in rows] == [
+            "00000002",
+            "00000001",
+            "00000000",
+        ]
+        assert all(row["compressed"] for row in rows)
+        assert catalog.sync() == 0
+
+
+class TestEventAggregatorCatalog:
+    def test_saved_sessions_are_compressed_and_cataloged(self, aggregator):
+        session = make_session(3)
+
+        path = Path(aggregator._save_session(session))
+
+        assert path.suffix == ".gz"
+        assert aggregator.catalog.count() == 1
+        listed = aggregator.list_sessions()
+        assert listed[0]["session_id"] == "00000003..."
+        assert listed[0]["initial_prompt"].endswith("...")
+        assert aggregator.load_session("00000003").session_id == session.session_id
+
+    def test_legacy_files_are_listed_and_loadable(self, aggregator):
+        save_legacy(make_session(4), aggregator.save_dir, 1000)
+
+        assert aggregator.list_sessions()[0]["events"] == 21
+        assert aggregator.load_session("00000004") is not None
+        assert aggregator.load_session("ffffffff") is None
+
+    def test_list_sessions_keeps_summary_format(self, aggregator):
+        save_legacy(make_session(5), aggregator.save_dir, 1000)
+
+        summary = aggregator.list_sessions()[0]
+
+        assert set(summary) == {
+            "file",
+            "session_id",
+            "start_time",
+            "end_time",
+            "events",
+            "delegations",
+            "initial_prompt",
+        }
+
+
+@pytest.mark.performance
+class TestSessionListingLatency:
+    """Listing 10 of 500 saved sessions: catalog vs. parsing every file."""
+
+    def test_catalog_listing_beats_full_scan(self, aggregator):
+        save_dir = aggregator.save_dir
+        for i in range(500):
+            save_legacy(make_session(i, events=50), save_dir, 1000 + i)
+        aggregator.list_sessions()  # initial catalog build
+
+        started = time.perf_counter()
+        files = sorted(
+            save_dir.glob("session_*.json"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        summaries = [json.loads(path.read_text()) for path in files]
+        scan_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        listed = aggregator.list_sessions(limit=10)
+        catalog_seconds = time.perf_counter() - started
+
+        assert len(summaries) == 500
+        assert listed[0]["session_id"] == "00000499..."
+        assert catalog_seconds * 5 < scan_seconds
@@ -4,6 +4,8 @@ Tests the extracted subprocess launcher service to ensure it maintains
 the same behavior as the original ClaudeRunner methods.
 """
 
+import os
+import pty
 import subprocess
 import sys
 from unittest.mock import Mock, patch
@@ -181,66 +183,50 @@ class TestSubprocessLauncherService:
         # The actual implementation uses termios.TCSADRAIN (which is 1)
         mock_tcsetattr.assert_called_with(sys.stdin, 1, mock_original_tty)
 
-    @patch("os.write")
-    @patch("os.read")
-    @patch("select.select")
-    def test_handle_subprocess_io(self, mock_select, mock_read, mock_write, service):
-        """Test subprocess I/O handling."""
-        master_fd = 10
-        mock_process = Mock()
-
-        # Simulate process completion after one iteration
-        mock_process.poll.side_effect = [None, 0]  # Running, then completed
-
-        # Mock select to return master_fd has data
-        mock_select.return_value = ([master_fd], [], [])
-
-        # Mock reading data from subprocess
-        mock_read.return_value = b"Hello from subprocess\n"
-
-        service._handle_subprocess_io(master_fd, mock_process)
-
-        # Verify data was read and written
-        mock_read.assert_called_with(master_fd, 4096)
-        mock_write.assert_called_with(sys.stdout.fileno(), b"Hello from subprocess\n")
-
-    @patch("os.read")
-    @patch("select.select")
-    def test_handle_subprocess_io_eof(self, mock_select, mock_read, service):
-        """Test subprocess I/O handling with EOF."""
-        master_fd = 10
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # Still running
-
-        # Mock select to return master_fd has data
-        mock_select.return_value = ([master_fd], [], [])
-
-        # Mock EOF (empty read)
-        mock_read.return_value = b""
-
-        service._handle_subprocess_io(master_fd, mock_process)
-
-        # Should break on EOF
-        mock_read.assert_called_once_with(master_fd, 4096)
-
-    @patch("os.read")
-    @patch("select.select")
-    def test_handle_subprocess_io_os_error(self, mock_select, mock_read, service):
-        """Test subprocess I/O handling with OS error."""
-        master_fd = 10
-        mock_process = Mock()
-        mock_process.poll.return_value = None  # Still running
-
-        # Mock select to return master_fd has data
-        mock_select.return_value = ([master_fd], [], [])
+    def run_io(self, service, cmd):
+        """Run _handle_subprocess_io against a real PTY child."""
+        master_fd, slave_fd = pty.openpty()
+        process = subprocess.Popen(cmd, stdin=slave_fd, stdout=slave_fd)
+        os.close(slave_fd)
+        out_read, out_write = os.pipe()
+        stdout = Mock(fileno=Mock(return_value=out_write))
+        try:
+            with patch("sys.stdout", stdout), patch("sys.stdin", None):
+                service._handle_subprocess_io(master_fd, process)
+            process.wait(timeout=5)
+        finally:
+            os.close(master_fd)
+            os.close(out_write)
+        with os.fdopen(out_read, "rb") as f:
+            return f.read()
+
+    def test_handle_subprocess_io(self, service):
+        """Test subprocess output is relayed to stdout until the child exits."""
+        output = self.run_io(service, ["printf", "Hello from subprocess"])
+
+        assert output == b"Hello from subprocess"
+
+    def test_handle_subprocess_io_broadcasts_coalesced_output(
+        self, service_with_logger_and_websocket
+    ):
+        """Test output reaches WebSocket clients in coalesced frames."""
+        service = service_with_logger_and_websocket
+        output = self.run_io(service, ["sh", "-c", "printf one; printf two"])
 
-        # Mock OS error
-        mock_read.side_effect = OSError("Broken pipe")
+        frames = [
+            call.args[0] for call in service.websocket_server.claude_output.mock_calls
+        ]
+        assert "".join(frames) == output.decode() == "onetwo"
+        service.websocket_server.claude_output.assert_called_with(frames[-1], "stdout")
 
-        service._handle_subprocess_io(master_fd, mock_process)
+    def test_handle_subprocess_io_broadcast_failure(
+        self, service_with_logger_and_websocket
+    ):
+        """Test broadcast errors do not interrupt the terminal relay."""
+        service = service_with_logger_and_websocket
+        service.websocket_server.claude_output.side_effect = ConnectionError("gone")
 
-        # Should handle the error gracefully
-        mock_read.assert_called_once_with(master_fd, 4096)
+        assert self.run_io(service, ["printf", "still shown"]) == b"still shown"
 
     @patch("pty.openpty")
     @patch("subprocess.Popen")
@@ -0,0 +1,316 @@
+"""
+Tests for indexed ticket search.
+
+WHY: TicketSearchService now answers queries from a persistent FTS index
+instead of scanning the 100 most recent tickets, so these tests cover index
+maintenance (incremental and full refresh), facets, ranking, similarity and
+the linear fallback.
+"""
+
+import random
+import statistics
+import time
+
+import pytest
+
+from claude_mpm.services.ticket_services.crud_service import TicketCRUDService
+from claude_mpm.services.ticket_services.search_index import TicketSearchIndex
+from claude_mpm.services.ticket_services.search_service import TicketSearchService
+
+pytestmark = pytest.mark.skipif(
+    not TicketSearchIndex.available(), reason="SQLite built without FTS5"
+)
+
+
+def make_ticket(ticket_id, title, description="", tags=(), status="open", **meta):
+    return {
+        "id": ticket_id,
+        "title": title,
+        "description": description,
+        "tags": list(tags),
+        "status": status,
+        "priority": meta.pop("priority", "medium"),
+        "metadata": {"ticket_type": meta.pop("ticket_type", "task"), **meta},
+    }
+
+
+class FakeTicketManager:
+    """In-memory ticket store returning tickets newest first."""
+
+    def __init__(self, tickets):
+        self.tickets = {t["id"]: t for t in tickets}
+        self.list_calls = []
+
+    def list_recent_tickets(self, limit=10):
+        self.list_calls.append(limit)
+        return list(reversed(list(self.tickets.values())))[:limit]
+
+    def get_ticket(self, ticket_id):
+        return self.tickets.get(ticket_id)
+
+    def put(self, ticket):
+        self.tickets.pop(ticket["id"], None)
+        self.tickets[ticket["id"]] = ticket
+
+    def update_task(self, ticket_id, **updates):
+        if ticket_id not in self.tickets:
+            return False
+        self.put(dict(self.tickets[ticket_id], **updates))
+        return True
+
+
+@pytest.fixture
+def tickets():
+    return [
+        make_ticket(
+            "TSK-001",
+            "Login page crashes",
+            "Crash when submitting the login form",
+            tags=["auth", "frontend"],
+            ticket_type="bug",
+        ),
+        make_ticket(
+            "TSK-002",
+            "Add OAuth login",
+            "Support OAuth providers",
+            tags=["auth"],
+            status="in_progress",
+            ticket_type="feature",
+        ),
+        make_ticket(
+            "TSK-003",
+            "Update docs",
+            "Document the login flow",
+            tags=["docs"],
+            status="closed",
+        ),
+        make_ticket("TSK-004", "Refactor billing", "Split invoices module"),
+    ]
+
+
+@pytest.fixture
+def service(tmp_path, tickets):
+    return TicketSearchService(
+        FakeTicketManager(tickets), index_path=tmp_path / "ticket_index.db"
+    )
+
+
+class TestIndexedSearch:
+    def test_title_matches_rank_first(self, service):
+        results = service.search_tickets("login")
+
+        ids = [t["id"] for t in results]
+        assert set(ids) == {"TSK-001", "TSK-002", "TSK-003"}
+        assert ids[-1] == "TSK-003"  # description-only match ranks last
+
+    def test_prefix_and_multi_term(self, service):
+        assert [t["id"] for t in service.search_tickets("bill")] == ["TSK-004"]
+        assert [t["id"] for t in service.search_tickets("login crash")] == ["TSK-001"]
+
+    def test_facet_filters(self, service):
+        results = service.search_tickets("login", type_filter="feature")
+        assert [t["id"] for t in results] == ["TSK-002"]
+
+        results = service.search_tickets("login", status_filter="closed")
+        assert [t["id"] for t in results] == ["TSK-003"]
+
+    def test_search_fields(self, service):
+        assert service.search_tickets("auth", search_fields=["title"]) == []
+        assert len(service.search_tickets("auth", search_fields=["tags"])) == 2
+        assert [
+            t["id"] for t in service.search_tickets("tsk-004", search_fields=["id"])
+        ] == ["TSK-004"]
+
+    def test_older_tickets_are_searchable(self, tmp_path):
+        old = make_ticket("OLD-1", "Ancient migration bug")
+        recent = [make_ticket(f"NEW-{i}", f"Recent work {i}") for i in range(150)]
+        service = TicketSearchService(
+            FakeTicketManager([old, *recent]), index_path=tmp_path / "idx.db"
+        )
+
+        assert [t["id"] for t in service.search_tickets("migration")] == ["OLD-1"]
+
+    def test_facets(self, service):
+        facets = service.get_facets()
+
+        assert facets["status"] == {"open": 2, "in_progress": 1, "closed": 1}
+        assert facets["type"]["bug"] == 1
+
+    def test_empty_query(self, service):
+        assert service.search_tickets("  ") == []
+
+
+class TestIncrementalRefresh:
+    def test_only_changed_tickets_are_reindexed(self, service):
+        service.refresh_index()
+        manager = service.ticket_manager
+
+        assert service.refresh_index() == 0
+
+        updated = dict(manager.tickets["TSK-004"], title="Refactor payments")
+        manager.put(updated)
+        assert service.refresh_index() == 1
+        assert [t["id"] for t in service.search_tickets("payments")] == ["TSK-004"]
+        assert service.search_tickets("billing") == []
+
+    def test_full_refresh_drops_deleted_tickets(self, service):
+        service.refresh_index()
+        del service.ticket_manager.tickets["TSK-004"]
+
+        service.refresh_index(full=True)
+
+        assert service.search_tickets("billing") == []
+
+    def test_index_ticket_and_remove_ticket(self, service):
+        service.refresh_index()
+        service.index_ticket(make_ticket("TSK-100", "Flaky websocket test"))
+
+        assert [t["id"] for t in service.search_tickets("websocket")] == ["TSK-100"]
+
+        service.remove_ticket("TSK-100")
+        assert service.search_tickets("websocket") == []
+
+    def test_refresh_is_throttled(self, service):
+        service.search_tickets("login")
+        calls = len(service.ticket_manager.list_calls)
+
+        service.search_tickets("docs")
+
+        assert len(service.ticket_manager.list_calls) == calls
+
+    def test_periodic_full_refresh_reconciles_old_tickets(self, tmp_path):
+        old = [make_ticket("OLD-1", "Ancient migration bug")]
+        old.append(make_ticket("OLD-2", "Legacy billing export"))
+        recent = [make_ticket(f"NEW-{i}", f"Recent work {i}") for i in range(150)]
+        manager = FakeTicketManager([*old, *recent])
+        service = TicketSearchService(manager, index_path=tmp_path / "idx.db")
+        assert service.search_tickets("migration")
+
+        # Changed outside the CRUD service, beyond the incremental window
+        del manager.tickets["OLD-1"]
+        manager.tickets["OLD-2"] = dict(old[1], title="Legacy invoice export")
+        service.index.set_meta("last_refresh", "0")
+        assert service.search_tickets("migration")  # incremental misses both
+
+        service.index.set_meta("last_full_refresh", "0")
+        assert service.search_tickets("migration") == []
+        assert service.search_tickets("billing") == []
+        assert [t["id"] for t in service.search_tickets("invoice")] == ["OLD-2"]
+
+    def test_crud_writes_update_index(self, service):
+        service.refresh_index()
+        crud = TicketCRUDService(service.ticket_manager, search_service=service)
+
+        assert crud.update_ticket("TSK-004", description="Move to Stripe")["success"]
+        assert [t["id"] for t in service.search_tickets("stripe")] == ["TSK-004"]
+
+    def test_index_persists_across_instances(self, tmp_path, tickets):
+        path = tmp_path / "ticket_index.db"
+        TicketSearchService(FakeTicketManager(tickets), index_path=path).refresh_index()
+
+        reopened = TicketSearchService(FakeTicketManager([]), index_path=path)
+        reopened.index.set_meta("last_refresh", str(time.time()))
+
+        assert [t["id"] for t in reopened.search_tickets("billing")] == ["TSK-004"]
+
+
+class TestSimilarTickets:
+    def test_top_k_similar(self, service):
+        similar = service.find_similar_tickets("TSK-001", limit=2)
+
+        ids = [t["id"] for t in similar]
+        assert "TSK-001" not in ids
+        assert ids[0] == "TSK-002"  # shares "login" and the auth tag
+        assert len(ids) == 2
+
+    def test_unknown_reference(self, service):
+        assert service.find_similar_tickets("NOPE") == []
+
+
+class TestLinearFallback:
+    def test_disabled_index_uses_scan(self, tickets):
+        service = TicketSearchService(FakeTicketManager(tickets), use_index=False)
+
+        results = service.search_tickets("login")
+
+        assert service.index is None
+        assert {t["id"] for t in results} == {"TSK-001", "TSK-002", "TSK-003"}
+
+
+WORDS = [
+    "auth",
+    "login",
+    "billing",
+    "invoice",
+    "docs",
+    "cache",
+    "socket",
+    "agent",
+    "deploy",
+    "memory",
+    "config",
+    "skill",
+    "hook",
+    "session",
+    "monitor",
+    "dashboard",
+    "ticket",
+    "search",
+    "index",
+    "parser",
+    "runner",
+    "pipeline",
+    "token",
+    "budget",
+    "retry",
+    "timeout",
+    "worker",
+    "queue",
+]
+
+
+def synthetic_tickets(count):
+    rng = random.Random(42)
+    return [
+        make_ticket(
+            f"T-{i:05d}",
+            " ".join(rng.sample(WORDS, 4)),
+            " ".join(rng.choices(WORDS, k=30)),
+            tags=rng.sample(WORDS, 2),
+            status=rng.choice(["open", "in_progress", "closed"]),
+            ticket_type=rng.choice(["bug", "task", "feature"]),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_query_latency(tmp_path, count):
+    tickets = synthetic_tickets(count)
+    service = TicketSearchService(
+        FakeTicketManager(tickets), index_path=tmp_path / "bench.db"
+    )
+
+    started = time.perf_counter()
+    service.refresh_index(full=True)
+    build_seconds = time.perf_counter() - started
+
+    latencies = []
+    for word in WORDS:
+        started = time.perf_counter()
+        service.search_tickets(f"{word} pipe", status_filter="open", limit=10)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    similar = service.find_similar_tickets("T-00000", limit=5)
+    similar_seconds = time.perf_counter() - started
+
+    p50 = statistics.median(latencies) * 1000
+    print(
+        f"\n{count} tickets: build={build_seconds:.2f}s "
+        f"query p50={p50:.2f}ms max={max(latencies) * 1000:.2f}ms "
+        f"similar={similar_seconds * 1000:.2f}ms"
+    )
+    assert len(similar) == 5
+    assert p50 < 50
@@ -0,0 +1,336 @@
+"""Tests for the shared event log and per-client fan-out.
+
+Test Coverage:
+- Sequence numbers, bounded retention and deque compatibility of EventLog
+- Replay from the shared log in ConnectionManager
+- Per-client delivery, subscriptions and session filters
+- Backpressure: one slow client neither blocks producers nor other clients
+- Coalesce and drop policies, retry after a failed emit
+- Client registration on connect, before the welcome and history emits
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from claude_mpm.services.socketio.handlers.connection import ConnectionEventHandler
+from claude_mpm.services.socketio.server.broadcaster import SocketIOEventBroadcaster
+from claude_mpm.services.socketio.server.connection_manager import ConnectionManager
+from claude_mpm.services.socketio.server.event_log import EventLog
+from claude_mpm.services.socketio.server.fanout import EventFanout
+
+
+def hook_event(index, session_id="s1"):
+    return {"type": "hook", "subtype": "pre_tool", "session_id": session_id, "i": index}
+
+
+def heartbeat(index):
+    return {"type": "system", "subtype": "heartbeat", "i": index}
+
+
+class RecordingSio:
+    """Socket.IO stand-in recording emits; clients in ``slow`` wait for ``release``."""
+
+    def __init__(self):
+        self.emitted: dict[str, list] = {}
+        self.slow: set[str] = set()
+        self.failing: set[str] = set()
+        self.release = asyncio.Event()
+
+    async def emit(self, name, data, room=None, **kwargs):
+        if room in self.failing:
+            raise ConnectionError("transport closed")
+        if room in self.slow:
+            await self.release.wait()
+        self.emitted.setdefault(room, []).append((name, data))
+
+    def received(self, sid):
+        return [data.get("i") for _, data in self.emitted.get(sid, [])]
+
+
+async def settle(fanout):
+    for _ in range(50):
+        await asyncio.sleep(0)
+    tasks = [c.task for c in fanout.clients.values() if c.task and not c.task.done()]
+    if tasks:
+        await asyncio.wait(tasks, timeout=0.05)
+
+
+@pytest.fixture
+async def fanout():
+    log = EventLog(maxlen=100)
+    fanout = EventFanout(log, max_lag=10, policy="coalesce")
+    fanout.attach(RecordingSio(), asyncio.get_running_loop())
+    return fanout
+
+
+class TestEventLog:
+    def test_sequences_and_retention(self):
+        log = EventLog(maxlen=3)
+        for index in range(5):
+            log.publish({"i": index}, "claude_event")
+
+        assert log.last_sequence == 5
+        assert log.first_sequence == 3
+        assert [e.event["i"] for e in log.read_after(0)] == [2, 3, 4]
+        assert [e.sequence for e in log.read_after(3, limit=1)] == [4]
+        assert log.read_after(5) == []
+
+    def test_deque_compatible_history(self):
+        log = EventLog(maxlen=10)
+        log.append({"type": "history"})
+        log.publish({"type": "live"}, "claude_event")
+
+        assert len(log) == 2
+        assert [e["type"] for e in log] == ["history", "live"]
+        assert [e["type"] for e in reversed(log)] == ["live", "history"]
+        assert [e["sequence"] for e in log] == [1, 2]
+
+    def test_events_after_respects_age(self):
+        log = EventLog()
+        log.publish({"i": 1}, "claude_event")
+
+        assert log.events_after(0, max_age=60) == [{"i": 1, "sequence": 1}]
+        assert log.events_after(0, max_age=-1) == []
+
+
+class TestConnectionManagerReplay:
+    async def test_replay_reads_shared_log(self):
+        log = EventLog()
+        manager = ConnectionManager(max_buffer_size=10, event_ttl=60, event_log=log)
+        await manager.register_connection("sid1", client_id="client")
+        for index in range(3):
+            log.publish({"i": index}, "claude_event")
+
+        events = await manager.get_replay_events("sid1", last_sequence=1)
+
+        assert [e["i"] for e in events] == [1, 2]
+        assert manager.get_metrics()["global_sequence"] == 3
+
+
+class TestFanout:
+    async def test_each_client_receives_new_events(self, fanout):
+        fanout.event_log.publish(hook_event(0), "hook_event")  # before connect
+        fanout.add_client("a")
+        fanout.add_client("b")
+
+        for index in range(1, 4):
+            fanout.publish(hook_event(index), "hook_event")
+        await settle(fanout)
+
+        assert fanout.sio.received("a") == [1, 2, 3]
+        assert fanout.sio.received("b") == [1, 2, 3]
+        assert fanout.stats["events_sent"] == 6
+
+    async def test_history_only_entries_are_not_fanned_out(self, fanout):
+        fanout.add_client("a")
+        fanout.event_log.append(hook_event(0))
+        fanout.publish(hook_event(1), "hook_event")
+        await settle(fanout)
+
+        assert fanout.sio.received("a") == [1]
+
+    async def test_subscription_filters(self, fanout):
+        fanout.subscribe("tools", ["tool_event"])
+        fanout.subscribe("hooks", ["hook"])
+        fanout.subscribe("session2", ["*"], session_id="s2")
+        fanout.add_client("skipped")
+
+        fanout.publish({"type": "tool", "i": 1, "session_id": "s1"}, "tool_event")
+        fanout.publish(hook_event(2, session_id="s2"), "hook_event")
+        fanout.publish(heartbeat(3), "system_event")
+        fanout.publish(hook_event(4), "hook_event", skip_sid="skipped")
+        await settle(fanout)
+
+        assert fanout.sio.received("tools") == [1]
+        assert fanout.sio.received("hooks") == [2, 4]
+        assert fanout.sio.received("session2") == [2, 3]
+        assert fanout.sio.received("skipped") == [1, 2, 3]
+
+    async def test_slow_client_does_not_block_others_or_producers(self, fanout):
+        fanout.add_client("slow")
+        fanout.add_client("fast")
+        fanout.sio.slow.add("slow")
+
+        producer_times = []
+
+        def produce():
+            for index in range(5):
+                start = time.perf_counter()
+                fanout.publish(hook_event(index), "hook_event")
+                producer_times.append(time.perf_counter() - start)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.001)
+        await settle(fanout)
+
+        assert max(producer_times) < 0.05
+        assert fanout.sio.received("fast") == [0, 1, 2, 3, 4]
+        assert fanout.sio.received("slow") == []
+        assert fanout.lag(fanout.clients["slow"]) == 5
+
+        fanout.sio.release.set()
+        await settle(fanout)
+        assert fanout.sio.received("slow") == [0, 1, 2, 3, 4]
+
+    async def test_coalesce_policy(self, fanout):
+        cursor = fanout.add_client("slow")
+        fanout.sio.slow.add("slow")
+        fanout.publish(hook_event(0), "hook_event")
+        await settle(fanout)  # event 0 in flight
+
+        for index in range(1, 13):
+            fanout.publish(heartbeat(index), "system_event")
+        fanout.publish(hook_event(13), "hook_event")
+        fanout.sio.release.set()
+        await settle(fanout)
+
+        assert fanout.sio.received("slow") == [0, 12, 13]
+        assert cursor.coalesced == 11
+        assert fanout.get_stats()["clients"]["slow"]["lag"] == 0
+
+    async def test_drop_policy_keeps_newest(self, fanout):
+        fanout.policy = "drop"
+        cursor = fanout.add_client("slow")
+        fanout.sio.slow.add("slow")
+        fanout.publish(hook_event(0), "hook_event")
+        await settle(fanout)
+
+        for index in range(1, 21):
+            fanout.publish(hook_event(index), "hook_event")
+        fanout.sio.release.set()
+        await settle(fanout)
+
+        assert fanout.sio.received("slow") == [0, *range(11, 21)]
+        assert cursor.dropped == 10
+
+    async def test_events_evicted_from_log_count_as_dropped(self):
+        fanout = EventFanout(EventLog(maxlen=5), max_lag=100)
+        fanout.attach(RecordingSio(), asyncio.get_running_loop())
+        cursor = fanout.add_client("late")
+        for index in range(8):
+            fanout.event_log.publish(hook_event(index), "hook_event")
+
+        fanout.wake()
+        await settle(fanout)
+
+        assert fanout.sio.received("late") == [3, 4, 5, 6, 7]
+        assert cursor.dropped == 3
+
+    async def test_failed_emit_is_retried(self, fanout):
+        fanout.retry_delay = 0.01
+        fanout.add_client("flaky")
+        fanout.sio.failing.add("flaky")
+        fanout.publish(hook_event(1), "hook_event")
+        await settle(fanout)
+        assert fanout.sio.received("flaky") == []
+
+        fanout.sio.failing.clear()
+        await asyncio.sleep(0.03)
+        await settle(fanout)
+
+        assert fanout.sio.received("flaky") == [1]
+
+    async def test_removed_client_stops_receiving(self, fanout):
+        fanout.add_client("a")
+        fanout.remove_client("a")
+        fanout.publish(hook_event(1), "hook_event")
+        await settle(fanout)
+
+        assert fanout.sio.received("a") == []
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            EventFanout(EventLog(), policy="block")
+
+
+class TestBroadcaster:
+    async def test_broadcast_publishes_without_waiting(self, fanout):
+        fanout.add_client("a")
+        stats = {"events_sent": 0, "events_buffered": 0}
+        broadcaster = SocketIOEventBroadcaster(
+            sio=fanout.sio,
+            connected_clients={"a"},
+            event_buffer=fanout.event_log,
+            buffer_lock=threading.Lock(),
+            stats=stats,
+            logger=fanout.logger,
+            fanout=fanout,
+        )
+
+        broadcaster.broadcast_event("pre_tool", {"session_id": "s1"})
+        await settle(fanout)
+
+        ((name, event),) = fanout.sio.emitted["a"]
+        assert name == "tool_event"
+        assert event["sequence"] == 1
+        assert event["session_id"] == "s1"
+        assert stats["events_buffered"] == 1
+        assert len(fanout.event_log) == 1
+
+
+class EventRegisteringSio(RecordingSio):
+    def __init__(self):
+        super().__init__()
+        self.handlers = {}
+
+    def event(self, func):
+        self.handlers[func.__name__] = func
+        return func
+
+
+class TestConnectHandler:
+    @pytest.fixture
+    async def connect(self, fanout):
+        fanout.sio = EventRegisteringSio()
+        server = SimpleNamespace(
+            sio=fanout.sio,
+            clients=set(),
+            event_history=fanout.event_log,
+            fanout=fanout,
+            session_id="s1",
+            claude_status="running",
+            claude_pid=None,
+        )
+        handler = ConnectionEventHandler(server)
+        handler.register_events()
+        return handler, fanout.sio.handlers["connect"]
+
+    async def test_events_published_during_welcome_are_delivered_once(
+        self, connect, fanout
+    ):
+        handler, on_connect = connect
+        fanout.publish(hook_event(0), "hook_event")
+        emit = handler.emit_to_client
+
+        async def emit_and_publish(sid, event, data):
+            await emit(sid, event, data)
+            if event == "welcome":
+                fanout.publish(hook_event(1), "hook_event")
+
+        handler.emit_to_client = emit_and_publish
+        await on_connect("a", {})
+        await settle(fanout)
+
+        ((_, history),) = [e for e in fanout.sio.emitted["a"] if e[0] == "history"]
+        assert [event["i"] for event in history["events"]] == [0]
+        assert fanout.sio.received("a")[-1:] == [1]
+
+    async def test_client_registered_when_history_fails(self, connect, fanout):
+        handler, on_connect = connect
+
+        async def broken_history(*args, **kwargs):
+            raise RuntimeError("history unavailable")
+
+        handler._send_event_history = broken_history
+        await on_connect("a", {})
+        fanout.publish(hook_event(1), "hook_event")
+        await settle(fanout)
+
+        assert "a" in fanout.clients
+        assert fanout.sio.received("a")[-1:] == [1]
@@ -0,0 +1,283 @@
+"""Tests for the concurrent fan-out executor.
+
+A fake ``sdk_query`` stands in for the claude-agent-sdk client so the
+executor can be driven through a real ``SDKAgentRunner`` without Claude
+Code installed. Each fake query sleeps for a fixed latency, which lets the
+tests measure throughput and observe the concurrency cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from claude_mpm.services.agents.agent_runtime import AgentConfig
+from claude_mpm.services.agents.fanout_executor import (
+    FanOutExecutor,
+    FanOutTask,
+    ModelRateLimiter,
+    RetryPolicy,
+)
+
+
+@dataclass
+class FakeTextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class FakeToolUseBlock:
+    id: str
+    name: str
+    input: dict[str, Any]
+    type: str = "tool_use"
+
+
+@dataclass
+class FakeAssistantMessage:
+    content: list[Any]
+
+
+@dataclass
+class FakeResultMessage:
+    session_id: str | None = "sess"
+    total_cost_usd: float | None = 0.001
+    num_turns: int | None = 1
+    duration_ms: int | None = 10
+    is_error: bool = False
+    result: str | None = None
+
+
+class FakeSDKClient:
+    """Fake ``sdk_query`` that tracks concurrency and injects failures."""
+
+    def __init__(self, latency: float = 0.02, failures: dict[str, int] | None = None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.active = 0
+        self.peak = 0
+        self.calls: list[tuple[str, float]] = []
+
+    async def query(self, prompt: str, options: Any = None):
+        self.calls.append((prompt, time.monotonic()))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.failures.get(prompt, 0) > 0:
+                self.failures[prompt] -= 1
+                raise ConnectionError(f"transient failure for {prompt}")
+            yield FakeAssistantMessage(
+                content=[
+                    FakeToolUseBlock(id="t1", name="Read", input={"path": prompt}),
+                    FakeTextBlock(text=f"done: {prompt}"),
+                ]
+            )
+            yield FakeResultMessage(session_id=f"sess-{prompt}")
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch: pytest.MonkeyPatch):
+    """Install a FakeSDKClient in place of the SDK and return a factory."""
+    from claude_mpm.services.agents import sdk_runtime
+
+    monkeypatch.setattr(sdk_runtime, "SDK_AVAILABLE", True)
+    monkeypatch.setattr(sdk_runtime, "AssistantMessage", FakeAssistantMessage)
+    monkeypatch.setattr(sdk_runtime, "ResultMessage", FakeResultMessage)
+    monkeypatch.setattr(sdk_runtime, "TextBlock", FakeTextBlock)
+    monkeypatch.setattr(sdk_runtime, "ToolUseBlock", FakeToolUseBlock)
+    monkeypatch.setattr(sdk_runtime, "ToolResultBlock", type("Unused", (), {}))
+    monkeypatch.setattr(sdk_runtime, "ClaudeAgentOptions", MagicMock)
+    monkeypatch.setattr(
+        sdk_runtime.SDKAgentRunner,
+        "_get_output_style_content",
+        staticmethod(lambda: None),
+    )
+
+    def _install(**kwargs: Any) -> tuple[FakeSDKClient, Any]:
+        client = FakeSDKClient(**kwargs)
+        monkeypatch.setattr(sdk_runtime, "sdk_query", client.query)
+        runner = sdk_runtime.SDKAgentRunner(model="claude-sonnet-4-20250514")
+        return client, runner
+
+    return _install
+
+
+def make_tasks(count: int) -> list[FanOutTask]:
+    return [FanOutTask(task_id=f"mod-{i}", prompt=f"mod-{i}") for i in range(count)]
+
+
+class TestFanOutExecutor:
+    async def test_results_returned_in_submission_order(self, fake_sdk) -> None:
+        _client, runner = fake_sdk()
+        executor = FanOutExecutor(runner, max_concurrency=4)
+
+        results = await executor.run(make_tasks(10))
+
+        assert [r.task_id for r in results] == [f"mod-{i}" for i in range(10)]
+        assert all(r.ok for r in results)
+        assert results[3].result.text == "done: mod-3"
+        assert executor.stats.succeeded == 10
+
+    async def test_concurrency_cap_is_respected(self, fake_sdk) -> None:
+        client, runner = fake_sdk(latency=0.02)
+        executor = FanOutExecutor(runner, max_concurrency=3)
+
+        await executor.run(make_tasks(12))
+
+        assert client.peak == 3
+
+    async def test_events_are_aggregated_through_bridges(self, fake_sdk) -> None:
+        _client, runner = fake_sdk()
+        executor = FanOutExecutor(runner, max_concurrency=5)
+        events = []
+        executor.on_event(events.append)
+
+        await executor.run(make_tasks(5))
+
+        by_type: dict[str, int] = {}
+        for event in events:
+            by_type[event.event_type] = by_type.get(event.event_type, 0) + 1
+        assert by_type == {"tool_start": 5, "text": 5, "result": 5}
+        assert {e.agent_id for e in events} == {f"mod-{i}" for i in range(5)}
+        assert executor.bridges["mod-0"].summary()["total_events"] == 3
+
+    async def test_transient_failures_are_retried(self, fake_sdk) -> None:
+        _client, runner = fake_sdk(failures={"mod-1": 2})
+        executor = FanOutExecutor(
+            runner,
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0.001, jitter=0),
+        )
+
+        results = await executor.run(make_tasks(3))
+
+        assert all(r.ok for r in results)
+        assert results[1].attempts == 3
+        assert executor.stats.retries == 2
+
+    async def test_retry_uses_fresh_bridge(self) -> None:
+        class FlakyRuntime:
+            attempts = 0
+
+            async def run_streaming(self, prompt, on_text, on_tool_call, config):
+                self.attempts += 1
+                await on_text(f"partial {self.attempts}")
+                if self.attempts == 1:
+                    raise ConnectionError("dropped")
+                return MagicMock(text="done")
+
+        executor = FanOutExecutor(
+            FlakyRuntime(),
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0.001, jitter=0),
+        )
+
+        await executor.run([FanOutTask("a", "x")])
+
+        texts = [e.data for e in executor.bridges["a"].events if e.event_type == "text"]
+        assert texts == [{"text": "partial 2"}]
+
+    async def test_bridges_are_scoped_to_one_run(self, fake_sdk) -> None:
+        _client, runner = fake_sdk()
+        executor = FanOutExecutor(runner)
+
+        await executor.run(make_tasks(3))
+        await executor.run([FanOutTask(task_id="next", prompt="next")])
+
+        assert list(executor.bridges) == ["next"]
+
+    async def test_exhausted_retries_report_error(self, fake_sdk) -> None:
+        _client, runner = fake_sdk(failures={"mod-0": 5})
+        executor = FanOutExecutor(
+            runner,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0.001, jitter=0),
+        )
+
+        results = await executor.run(make_tasks(2))
+
+        assert not results[0].ok
+        assert "ConnectionError" in results[0].error
+        assert results[1].ok
+        assert executor.stats.failed == 1
+
+    async def test_cancel_stops_queued_tasks(self, fake_sdk) -> None:
+        client, runner = fake_sdk(latency=0.05)
+        executor = FanOutExecutor(runner, max_concurrency=2)
+        seen = []
+
+        async for item in executor.stream(make_tasks(10)):
+            seen.append(item)
+            if len(seen) == 2:
+                executor.cancel()
+
+        cancelled = [item for item in seen if item.cancelled]
+        assert len(client.calls) < 10
+        assert cancelled
+        assert executor.stats.cancelled == len(cancelled)
+
+    async def test_duplicate_task_ids_rejected(self, fake_sdk) -> None:
+        _client, runner = fake_sdk()
+        executor = FanOutExecutor(runner)
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            await executor.run([FanOutTask("a", "x"), FanOutTask("a", "y")])
+
+    async def test_per_model_rate_limit(self, fake_sdk) -> None:
+        client, runner = fake_sdk(latency=0)
+        # 600 rpm == 10/s with a burst of 1 for sonnet; haiku unlimited
+        executor = FanOutExecutor(
+            runner, max_concurrency=10, rate_limits={"sonnet": 600}
+        )
+        tasks = make_tasks(4) + [
+            FanOutTask(f"h-{i}", f"h-{i}", AgentConfig(model="haiku")) for i in range(4)
+        ]
+
+        await executor.run(tasks)
+
+        sonnet_times = sorted(t for p, t in client.calls if p.startswith("mod-"))
+        haiku_times = sorted(t for p, t in client.calls if p.startswith("h-"))
+        assert sonnet_times[-1] - sonnet_times[0] >= 0.25
+        assert haiku_times[-1] - haiku_times[0] < 0.05
+        assert executor.stats.per_model == {
+            "claude-sonnet-4-20250514": 4,
+            "claude-haiku-3-20250307": 4,
+        }
+
+
+class TestModelRateLimiter:
+    async def test_unlimited_model_does_not_wait(self) -> None:
+        limiter = ModelRateLimiter({"sonnet": 60})
+        started = time.monotonic()
+        for _ in range(20):
+            await limiter.acquire("other-model")
+        assert time.monotonic() - started < 0.05
+        assert limiter.has_limit("claude-sonnet-4-20250514")
+
+
+@pytest.mark.performance
+class TestFanOutThroughput:
+    """Throughput harness: 50 fake agent runs with 20 ms latency each."""
+
+    async def test_fanout_beats_sequential(self, fake_sdk) -> None:
+        _client, runner = fake_sdk(latency=0.02)
+        tasks = make_tasks(50)
+
+        started = time.perf_counter()
+        for task in tasks[:10]:
+            await runner.run(task.prompt)
+        sequential_per_task = (time.perf_counter() - started) / 10
+
+        executor = FanOutExecutor(runner, max_concurrency=10)
+        results = await executor.run(tasks)
+        stats = executor.stats.to_dict()
+
+        assert all(r.ok for r in results)
+        # 10-way concurrency should give several times sequential throughput
+        assert stats["throughput_per_second"] > 4 / sequential_per_task
@@ -9,6 +9,7 @@ import pytest
 from claude_mpm.services.agents.agent_runtime import AgentConfig, AgentResult
 from claude_mpm.services.agents.runtime_bridge import (
     execute_agent_prompt,
+    execute_agent_prompts,
     print_runtime_status,
 )
 
@@ -154,3 +155,24 @@ def test_print_runtime_status_cli(capsys: pytest.CaptureFixture[str]) -> None:
     captured = capsys.readouterr()
     assert "Runtime: cli" in captured.out
     assert "SDK available:" in captured.out
+
+
+@pytest.mark.asyncio
+async def test_execute_agent_prompts_fans_out(mock_runtime: MagicMock) -> None:
+    """Test that execute_agent_prompts runs every prompt and keys results by id."""
+    del mock_runtime.run_streaming  # exercise the plain run() path
+    with (
+        patch(_PATCH_GET_RUNTIME, return_value=mock_runtime),
+        patch(_PATCH_GET_RUNTIME_TYPE, return_value="cli"),
+    ):
+        results = await execute_agent_prompts(
+            {"a": "Summarize a.py", "b": "Summarize b.py"},
+            model="sonnet",
+            max_concurrency=2,
+        )
+
+    assert set(results) == {"a", "b"}
+    assert results["a"]["text"] == "4"
+    assert results["b"]["attempts"] == 1
+    assert results["b"]["runtime"] == "cli"
+    assert mock_runtime.run.await_count == 2
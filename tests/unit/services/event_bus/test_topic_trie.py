@@ -0,0 +1,182 @@
+"""Tests for TopicTrie and the EventBus dispatch built on it.
+
+Test Coverage:
+- Trie matches agree with the original startswith()/equality semantics
+- Registration order, removal and the per-topic match cache
+- EventBus wildcard removal, async handler scheduling and history ring
+- Publish cost staying flat as wildcard subscriptions grow (benchmark)
+"""
+
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from claude_mpm.services.event_bus.event_bus import EventBus
+from claude_mpm.services.event_bus.topic_trie import TopicTrie
+
+
+def legacy_match(patterns, topic):
+    """The linear scan EventBus used before the trie."""
+    return [
+        p
+        for p in patterns
+        if (topic.startswith(p[:-1]) if p.endswith("*") else topic == p)
+    ]
+
+
+@pytest.fixture
+def event_bus():
+    EventBus._instance = None
+    bus = EventBus()
+    yield bus
+    bus.remove_all_listeners()
+    EventBus._instance = None
+
+
+class TestTopicTrie:
+    @pytest.mark.parametrize(
+        ("pattern", "matches", "misses"),
+        [
+            ("hook.*", ["hook.pre_tool", "hook.a.b"], ["hook", "hooks.x"]),
+            ("hook.pre_*", ["hook.pre_tool", "hook.pre_.x"], ["hook.post_tool"]),
+            ("hook*", ["hook", "hooks.x", "hook.pre"], ["hoo"]),
+            ("*", ["", "anything.at.all"], []),
+            ("hook.pre_tool", ["hook.pre_tool"], ["hook.pre_tool.x", "hook.pre"]),
+            ("a*b", ["a*b"], ["axb"]),
+        ],
+    )
+    def test_pattern_semantics(self, pattern, matches, misses):
+        trie = TopicTrie()
+        trie.add(pattern, pattern)
+
+        assert [t for t in matches if trie.match(t)] == matches
+        assert [t for t in misses if trie.match(t)] == []
+
+    def test_agrees_with_linear_scan(self):
+        rng = random.Random(7)
+        alphabet = "ab._*"
+        for _ in range(500):
+            patterns = {
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                for _ in range(6)
+            }
+            trie = TopicTrie()
+            for pattern in patterns:
+                trie.add(pattern, pattern)
+            for _ in range(10):
+                topic = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+                assert sorted(trie.match(topic)) == sorted(
+                    legacy_match(patterns, topic)
+                )
+
+    def test_registration_order_and_removal(self):
+        trie = TopicTrie()
+        trie.add("hook.*", "first")
+        trie.add("hook.pre_tool", "exact")
+        trie.add("*", "all")
+        assert trie.match("hook.pre_tool") == ("first", "exact", "all")
+
+        assert trie.remove("hook.*", "first")
+        assert not trie.remove("hook.*", "first")
+        assert trie.match("hook.pre_tool") == ("exact", "all")
+        assert trie.patterns == ["hook.pre_tool", "*"]
+        assert len(trie) == 2
+
+    def test_same_value_under_two_keys(self):
+        trie = TopicTrie()
+        trie.add("a.*", "handler", key=1)
+        trie.add("a.*", "handler", key=2)
+        assert trie.match("a.b") == ("handler", "handler")
+
+        trie.remove("a.*")
+        assert trie.match("a.b") == ()
+        assert not trie
+
+
+class TestEventBusDispatch:
+    def test_remove_wildcard_listener(self, event_bus):
+        kept, removed = Mock(), Mock()
+        event_bus.on("hook.*", kept)
+        event_bus.on("hook.*", removed)
+
+        event_bus.remove_listener("hook.*", removed)
+        event_bus.publish("hook.pre_tool", {"n": 1})
+
+        kept.assert_called_once_with("hook.pre_tool", {"n": 1})
+        removed.assert_not_called()
+
+    def test_remove_all_listeners_for_wildcard(self, event_bus):
+        handler = Mock()
+        event_bus.on("hook.*", handler)
+
+        event_bus.remove_all_listeners("hook.*")
+        event_bus.publish("hook.pre_tool", {})
+
+        handler.assert_not_called()
+
+    async def test_async_handlers_scheduled_on_running_loop(self, event_bus):
+        wildcard, exact = AsyncMock(), AsyncMock()
+        event_bus.on("hook.*", wildcard)
+        event_bus.on("hook.pre_tool", exact)
+
+        event_bus.publish("hook.pre_tool", {"n": 1})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        wildcard.assert_awaited_once_with("hook.pre_tool", {"n": 1})
+        exact.assert_awaited_once_with({"n": 1})
+
+    def test_async_handler_without_loop_runs_to_completion(self, event_bus):
+        handler = AsyncMock()
+        event_bus.on("hook.*", handler)
+
+        event_bus.publish("hook.stop", {})
+
+        handler.assert_awaited_once_with("hook.stop", {})
+
+    def test_history_is_a_ring_buffer(self, event_bus):
+        event_bus._max_history_size = 3
+        for index in range(5):
+            event_bus.publish(f"event{index}", index)
+
+        assert [e["type"] for e in event_bus.get_recent_events(10)] == [
+            "event2",
+            "event3",
+            "event4",
+        ]
+
+
+@pytest.mark.performance
+class TestPublishScaling:
+    """Publish cost with 1 to 1,000 non-matching wildcard subscriptions."""
+
+    def publish_cost(self, subscriptions, topics, rounds=20):
+        EventBus._instance = None
+        bus = EventBus()
+        handler = Mock()
+        bus.on("hook.*", handler)
+        for index in range(subscriptions - 1):
+            bus.on(f"agent{index}.*", handler)
+        bus.add_filter("hook.*")
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for topic in topics:
+                bus.publish(topic, None)
+        elapsed = time.perf_counter() - started
+        bus.remove_all_listeners()
+        EventBus._instance = None
+        assert handler.call_count == rounds * len(topics)
+        return elapsed / (rounds * len(topics))
+
+    def test_publish_cost_is_flat(self):
+        topics = [f"hook.event_{i}" for i in range(50)]
+        costs = {n: self.publish_cost(n, topics) for n in (1, 10, 100, 1000)}
+
+        print()
+        for count, cost in costs.items():
+            print(f"{count:>5} wildcard subscriptions: {cost * 1e6:.2f} us/publish")
+        assert costs[1000] < costs[1] * 3
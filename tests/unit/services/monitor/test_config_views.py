@@ -0,0 +1,221 @@
+"""Tests for the materialized config API views.
+
+Test Coverage:
+- Unwatched registries rebuild per request; watched ones serve from memory
+- Filesystem changes invalidate views and report added/removed/changed keys
+- Missing roots are picked up once created; .git churn is ignored
+- ETag / If-None-Match handling on the config list endpoints
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from claude_mpm.services.monitor.config_routes import (
+    VIEW_AGENTS_AVAILABLE,
+    register_config_routes,
+)
+from claude_mpm.services.monitor.config_views import (
+    ConfigViews,
+    compute_etag,
+    diff_items,
+    get_config_views,
+)
+
+
+def dir_listing(root: Path):
+    def build(_param):
+        return {p.stem: p.read_text() for p in sorted(root.glob("*.md"))}
+
+    return build
+
+
+@pytest.fixture
+def changes():
+    return []
+
+
+@pytest.fixture
+async def views(changes):
+    async def on_change(name, param, snapshot, delta):
+        changes.append((name, param, snapshot.etag, delta))
+
+    views = ConfigViews(debounce_delay=0.05)
+    views.start(asyncio.get_running_loop(), on_change=on_change)
+    yield views
+    views.stop()
+
+
+def register_listing(views, root):
+    views.register(
+        "listing", dir_listing(root), roots=lambda _p: [root], items=lambda d: d
+    )
+
+
+async def wait_for(predicate, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.02)
+
+
+class TestHelpers:
+    def test_etag_is_content_hash(self):
+        assert compute_etag({"a": 1, "b": 2}) == compute_etag({"b": 2, "a": 1})
+        assert compute_etag({"a": 1}) != compute_etag({"a": 2})
+
+    def test_diff_items(self):
+        delta = diff_items({"a": 1, "b": 1, "c": 1}, {"b": 1, "c": 2, "d": 1})
+
+        assert delta == {"added": ["d"], "removed": ["a"], "changed": ["c"]}
+
+
+class TestConfigViews:
+    async def test_unwatched_views_rebuild_every_time(self, tmp_path):
+        views = ConfigViews()
+        register_listing(views, tmp_path)
+        (tmp_path / "one.md").write_text("1")
+
+        first = await views.get("listing")
+        second = await views.get("listing")
+
+        assert views.stats["builds"] == 2
+        assert first.etag == second.etag
+
+    async def test_watched_view_served_from_memory(self, views, tmp_path):
+        register_listing(views, tmp_path)
+
+        await views.get("listing")
+        await views.get("listing")
+
+        assert views.stats == {"hits": 1, "builds": 1, "invalidations": 0, "deltas": 0}
+
+    async def test_file_change_pushes_delta(self, views, changes, tmp_path):
+        register_listing(views, tmp_path)
+        (tmp_path / "keep.md").write_text("v1")
+        (tmp_path / "gone.md").write_text("x")
+        before = await views.get("listing")
+
+        (tmp_path / "keep.md").write_text("v2")
+        (tmp_path / "gone.md").unlink()
+        (tmp_path / "new.md").write_text("n")
+        await wait_for(lambda: changes)
+
+        ((name, param, etag, delta),) = changes
+        assert (name, param) == ("listing", None)
+        assert delta == {"added": ["new"], "removed": ["gone"], "changed": ["keep"]}
+        after = await views.get("listing")
+        assert after.etag == etag != before.etag
+        assert after.data == {"keep": "v2", "new": "n"}
+
+    async def test_git_metadata_changes_are_ignored(self, views, tmp_path):
+        register_listing(views, tmp_path)
+        (tmp_path / ".git").mkdir()
+        await views.get("listing")
+
+        (tmp_path / ".git" / "FETCH_HEAD").write_text("abc")
+        await asyncio.sleep(0.3)
+
+        assert views.stats["invalidations"] == 0
+
+    async def test_missing_root_is_watched_once_created(self, views, changes, tmp_path):
+        root = tmp_path / "later" / "skills"
+        register_listing(views, root)
+        assert (await views.get("listing")).data == {}
+
+        root.mkdir(parents=True)
+        await wait_for(lambda: views.stats["invalidations"])
+        (root / "skill.md").write_text("s")
+        await views.get("listing")  # re-schedules a recursive watch on root
+        await wait_for(lambda: changes and changes[-1][3]["added"] == ["skill"])
+
+    async def test_build_racing_invalidation_is_not_cached(self, views, tmp_path):
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def slow_build(_param):
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return {"built": True}
+
+        views.register(
+            "slow", slow_build, roots=lambda _p: [tmp_path], items=lambda d: d
+        )
+        pending = asyncio.ensure_future(views.get("slow"))
+        await asyncio.sleep(0.05)
+        views.invalidate("slow")
+        release.set()
+        await pending
+
+        await views.get("slow")
+        assert views.stats["builds"] == 2
+
+
+class TestConfigRoutesETags:
+    @pytest.fixture
+    async def client(self):
+        app = web.Application()
+        register_config_routes(app)
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        yield client
+        get_config_views(app).stop()
+        await client.close()
+
+    @pytest.fixture
+    def services(self):
+        git_mgr = MagicMock()
+        git_mgr.list_cached_agents.side_effect = lambda: [
+            {"agent_id": "engineer", "metadata": {"name": "Engineer"}},
+            {"agent_id": "qa", "metadata": {"name": "QA"}},
+        ]
+        git_mgr.cache_root = Path("/nonexistent/cache/agents")
+        agent_mgr = MagicMock()
+        agent_mgr.list_agent_names.return_value = {"engineer"}
+        with (
+            patch(
+                "claude_mpm.services.monitor.config_routes._get_git_source_manager",
+                return_value=git_mgr,
+            ),
+            patch(
+                "claude_mpm.services.monitor.config_routes._get_agent_manager",
+                return_value=agent_mgr,
+            ),
+        ):
+            yield git_mgr
+
+    async def test_if_none_match_returns_304(self, client, services):
+        resp = await client.get("/api/config/agents/available")
+        etag = resp.headers["ETag"]
+        assert resp.status == 200
+
+        cached = await client.get(
+            "/api/config/agents/available", headers={"If-None-Match": etag}
+        )
+        other_query = await client.get(
+            "/api/config/agents/available?search=qa", headers={"If-None-Match": etag}
+        )
+
+        assert cached.status == 304
+        assert cached.headers["ETag"] == etag
+        assert other_query.status == 200
+        assert [a["name"] for a in (await other_query.json())["agents"]] == ["QA"]
+
+    async def test_watched_view_shared_across_queries(self, client, services):
+        views = get_config_views(client.app)
+        views.start(asyncio.get_running_loop())
+
+        for query in ("", "?search=eng", "?limit=1"):
+            resp = await client.get(f"/api/config/agents/available{query}")
+            assert resp.status == 200
+
+        data = json.loads(await resp.text())
+        assert data["agents"][0]["is_deployed"] is True
+        assert services.list_cached_agents.call_count == 1
+        assert views.stats["hits"] == 2
+        assert (VIEW_AGENTS_AVAILABLE, None) in views._cache
@@ -0,0 +1,64 @@
+"""Shared helpers for utils tests."""
+
+import os
+import subprocess
+import time
+from pathlib import Path
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Author",
+    "GIT_AUTHOR_EMAIL": "author@test.com",
+    "GIT_COMMITTER_NAME": "Author",
+    "GIT_COMMITTER_EMAIL": "author@test.com",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **GIT_ENV},
+    )
+    return result.stdout
+
+
+def make_git_repo(
+    repo: Path, days_ago: list[float], branch: str = "main", authors: int = 1
+) -> Path:
+    """Create a repo with one commit per entry of ``days_ago`` (oldest first).
+
+    Commits are generated with ``git fast-import`` so large histories with
+    controlled dates take seconds. Commit ``i`` modifies ``src/file{i % 50}.py``.
+    """
+    repo.mkdir(parents=True, exist_ok=True)
+    git(repo, "init", "-q", "-b", branch)
+    now = int(time.time())
+    stream = []
+    for index, age in enumerate(days_ago):
+        stamp = now - int(age * 86400)
+        author = f"Author{index % authors} <author{index % authors}@test.com>"
+        message = f"Commit {index}\n".encode()
+        content = f"change {index}\n".encode()
+        stream.append(
+            f"commit refs/heads/{branch}\nmark :{index + 1}\n"
+            f"author {author} {stamp} +0000\ncommitter {author} {stamp} +0000\n"
+            f"data {len(message)}\n".encode()
+            + message
+            + (f"from :{index}\n".encode() if index else b"")
+            + f"M 644 inline src/file{index % 50}.py\ndata {len(content)}\n".encode()
+            + content
+        )
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        cwd=repo,
+        input=b"".join(stream),
+        check=True,
+        env={**os.environ, **GIT_ENV},
+    )
+    if days_ago:
+        git(repo, "reset", "-q", "--hard")
+    return repo
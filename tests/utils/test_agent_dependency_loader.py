@@ -16,6 +16,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from claude_mpm.utils.agent_dependency_loader import AgentDependencyLoader
+from claude_mpm.utils.dependency_cache import DependencyCache
 
 
 class TestYAMLFrontmatterParsing:
@@ -498,3 +499,88 @@ dependencies:
 
         assert "unicode_agent" in agent_dependencies
         assert "pytest>=7.0.0" in agent_dependencies["unicode_agent"]["python"]
+
+
+class TestBatchedDependencyProbe:
+    """Test resolving specs against one cached snapshot of the environment."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DependencyCache(cache_dir=tmp_path)
+
+    @pytest.fixture
+    def uv_loader(self, cache, tmp_path):
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        snapshot = {
+            "paths": [str(site_packages)],
+            "distributions": [
+                ["PyYAML", "6.0.1"],
+                ["pymysql", "1.1.0"],
+                ["old_package", "0.5"],
+            ],
+        }
+        loader = AgentDependencyLoader(cache=cache)
+        loader.is_uv_tool = True
+        return loader, snapshot, site_packages
+
+    def test_single_probe_for_all_specs(self, uv_loader):
+        """All specs of a run are resolved with one subprocess."""
+        loader, snapshot, _ = uv_loader
+        probe = MagicMock(returncode=0, stdout=json.dumps(snapshot))
+
+        with patch(
+            "claude_mpm.utils.agent_dependency_loader.subprocess.run",
+            return_value=probe,
+        ) as run:
+            assert loader.check_python_dependency("pyyaml>=6") == (True, "6.0.1")
+            assert loader.check_python_dependency("old-package>=1") == (False, "0.5")
+            assert loader.check_python_dependency("mysqlclient") == (
+                True,
+                "pymysql:1.1.0",
+            )
+            assert loader.check_python_dependency("not-installed") == (False, None)
+
+        run.assert_called_once()
+
+    def test_snapshot_cached_until_environment_changes(self, uv_loader, cache):
+        """Later runs reuse the snapshot while site-packages is unchanged."""
+        loader, snapshot, site_packages = uv_loader
+        probe = MagicMock(returncode=0, stdout=json.dumps(snapshot))
+        with patch(
+            "claude_mpm.utils.agent_dependency_loader.subprocess.run",
+            return_value=probe,
+        ) as run:
+            loader.check_python_dependency("pyyaml")
+
+            fresh = AgentDependencyLoader(cache=DependencyCache(cache.cache_dir))
+            fresh.is_uv_tool = True
+            assert fresh.check_python_dependency("pyyaml") == (True, "6.0.1")
+            assert run.call_count == 1
+
+            (site_packages / "new_package-1.0.dist-info").mkdir()
+            fresh = AgentDependencyLoader(cache=DependencyCache(cache.cache_dir))
+            fresh.is_uv_tool = True
+            fresh.check_python_dependency("pyyaml")
+            assert run.call_count == 2
+
+    def test_failed_probe_reports_missing(self, uv_loader):
+        loader, _, _ = uv_loader
+        with patch(
+            "claude_mpm.utils.agent_dependency_loader.subprocess.run",
+            return_value=MagicMock(returncode=1, stdout="", stderr="no uv"),
+        ):
+            assert loader.check_python_dependency("pyyaml") == (False, None)
+
+    def test_current_environment_without_subprocess(self, cache):
+        loader = AgentDependencyLoader(cache=cache)
+        loader.is_uv_tool = False
+
+        with patch("claude_mpm.utils.agent_dependency_loader.subprocess.run") as run:
+            satisfied, version = loader.check_python_dependency("packaging>=20")
+            assert loader.check_python_dependency("pyyaml")[0]
+            assert loader.check_system_dependency("python-not-a-real-command") is False
+
+        assert satisfied
+        assert version
+        run.assert_not_called()
@@ -0,0 +1,249 @@
+"""Tests for the streaming, cursor-backed git activity analyzer.
+
+Test Coverage:
+- Refs, branches and the current branch read without spawning git
+- Cursor reuse (no process when refs are unchanged) and incremental updates
+- Rename/copy parsing of the NUL-delimited log
+- commits_since from the cursor and via git log, status parsing
+- Process count and wall time against the previous algorithm (benchmark)
+"""
+
+import subprocess
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from claude_mpm.utils.git_analyzer import (
+    GitActivityAnalyzer,
+    analyze_recent_activity,
+    get_commits_since,
+    get_current_branch,
+    get_current_status,
+)
+
+from .conftest import git, make_git_repo
+
+
+@pytest.fixture(autouse=True)
+def cursor_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cursors"
+    monkeypatch.setattr("claude_mpm.utils.git_analyzer.DEFAULT_CURSOR_DIR", path)
+    return path
+
+
+@contextmanager
+def count_processes():
+    """Count every process spawned (subprocess.run goes through Popen too)."""
+    started = []
+    original = subprocess.Popen
+
+    class CountingPopen(original):
+        def __init__(self, args, *rest, **kwargs):
+            started.append(args)
+            super().__init__(args, *rest, **kwargs)
+
+    subprocess.Popen = CountingPopen
+    try:
+        yield started
+    finally:
+        subprocess.Popen = original
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return make_git_repo(tmp_path / "repo", [30 - i for i in range(30)])
+
+
+def test_refs_and_branches_read_without_git(repo):
+    git(repo, "branch", "feature")
+    git(repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+    git(repo, "update-ref", "refs/remotes/upstream/dev", "HEAD")
+    git(repo, "pack-refs", "--all")
+    git(repo, "branch", "loose")
+
+    with count_processes() as started:
+        analyzer = GitActivityAnalyzer(repo)
+        branches = analyzer.branches()
+        current = get_current_branch(str(repo))
+
+    assert started == []
+    assert branches == ["feature", "loose", "main", "remotes/upstream/dev"]
+    assert current == "main"
+    assert analyzer.refs()["refs/heads/loose"] == git(repo, "rev-parse", "HEAD").strip()
+
+
+def test_current_branch_detached_and_outside_repo(repo, tmp_path):
+    git(repo, "checkout", "-q", "--detach")
+
+    assert get_current_branch(str(repo)) == ""
+    assert get_current_branch(str(tmp_path / "nowhere")) is None
+
+
+def test_warm_run_spawns_no_process(repo):
+    first = analyze_recent_activity(str(repo), days=7, min_commits=10)
+
+    with count_processes() as started:
+        second = analyze_recent_activity(str(repo), days=7, min_commits=10)
+
+    assert started == []
+    assert second == first
+    assert len(second["commits"]) == 10
+
+
+def test_new_commits_are_read_incrementally(repo):
+    analyze_recent_activity(str(repo), days=7, min_commits=10)
+    (repo / "new.py").write_text("new\n")
+    git(repo, "add", "new.py")
+    git(repo, "commit", "-q", "-m", "Add new module")
+
+    with count_processes() as started:
+        result = analyze_recent_activity(str(repo), days=7, min_commits=10)
+
+    assert [args[:2] for args in started] == [["git", "log"]]
+    assert result["commits"][0]["message"] == "Add new module"
+    assert result["file_changes"]["new.py"]["modifications"] == 1
+    assert result == analyze_recent_activity(str(repo), days=7, min_commits=10)
+
+
+def test_deleted_ref_forces_rescan(repo):
+    git(repo, "checkout", "-q", "-b", "topic")
+    (repo / "topic.py").write_text("topic\n")
+    git(repo, "add", "topic.py")
+    git(repo, "commit", "-q", "-m", "Topic work")
+    git(repo, "checkout", "-q", "main")
+    assert analyze_recent_activity(str(repo))["commits"][0]["message"] == "Topic work"
+
+    git(repo, "branch", "-q", "-D", "topic")
+    result = analyze_recent_activity(str(repo))
+
+    assert "Topic work" not in [c["message"] for c in result["commits"]]
+    assert "topic" not in result["branches"]
+
+
+def test_rewritten_history_forces_rescan(repo):
+    def messages():
+        return [c["message"] for c in analyze_recent_activity(str(repo))["commits"]]
+
+    assert messages()[:2] == ["Commit 29", "Commit 28"]
+
+    git(repo, "commit", "-q", "--amend", "--allow-empty", "-m", "Commit 29 amended")
+    assert messages()[:3] == ["Commit 29 amended", "Commit 28", "Commit 27"]
+
+    git(repo, "reset", "-q", "--hard", "HEAD~1")
+    assert messages()[:2] == ["Commit 28", "Commit 27"]
+    assert messages() == git(repo, "log", "--all", "--format=%s").splitlines()[:25]
+
+
+def test_rename_reports_new_path(repo):
+    git(repo, "mv", "src/file0.py", "src/renamed.py")
+    git(repo, "commit", "-q", "-m", "Rename file0")
+
+    commit = analyze_recent_activity(str(repo))["commits"][0]
+
+    assert commit["message"] == "Rename file0"
+    assert commit["files"] == [{"status": "R100", "path": "src/renamed.py"}]
+    assert set(commit) == {"sha", "author", "email", "timestamp", "message", "files"}
+
+
+def test_commits_since(repo):
+    base = git(repo, "rev-parse", "--short", "HEAD~3").strip()
+    analyze_recent_activity(str(repo))
+
+    with count_processes() as started:
+        commits = get_commits_since(base, str(repo))
+
+    assert started == []  # linear history is answered from the cursor
+    assert [c["message"] for c in commits] == ["Commit 29", "Commit 28", "Commit 27"]
+
+    git(repo, "checkout", "-q", "-b", "side", "HEAD~1")
+    git(repo, "commit", "-q", "--allow-empty", "-m", "Side")
+    git(repo, "checkout", "-q", "main")
+    git(repo, "merge", "-q", "--no-ff", "-m", "Merge side", "side")
+
+    messages = [c["message"] for c in get_commits_since(base, str(repo))]
+    assert messages[0] == "Merge side"
+    assert sorted(messages[1:]) == ["Commit 27", "Commit 28", "Commit 29", "Side"]
+    assert get_commits_since("0" * 40, str(repo)) == []
+
+
+def test_current_status(repo):
+    assert get_current_status(str(repo))["clean"] is True
+
+    (repo / "src" / "file1.py").write_text("edited\n")
+    (repo / "untracked file.txt").write_text("new\n")
+    git(repo, "mv", "src/file2.py", "src/moved.py")
+
+    status = get_current_status(str(repo))
+
+    assert status["clean"] is False
+    assert sorted(status["modified_files"]) == ["src/file1.py", "src/moved.py"]
+    assert status["untracked_files"] == ["untracked file.txt"]
+
+
+def test_linked_worktree(repo, tmp_path):
+    worktree = tmp_path / "wt"
+    git(repo, "worktree", "add", "-q", "-b", "wt-branch", str(worktree))
+
+    analyzer = GitActivityAnalyzer(worktree)
+
+    assert analyzer.current_branch() == "wt-branch"
+    assert "main" in analyzer.branches()
+
+
+def legacy_analyze(repo_path, days=7, max_commits=50, min_commits=25):
+    """The previous algorithm's git calls, for comparison."""
+
+    def run(*args):
+        return subprocess.run(
+            ["git", *args], cwd=repo_path, capture_output=True, text=True, check=True
+        ).stdout
+
+    run("branch", "-a")
+    log_format = "--format=%h|%an|%ae|%ai|%s"
+    output = run(
+        "log",
+        "--all",
+        f"--since={days} days ago",
+        f"--max-count={max_commits}",
+        log_format,
+        "--name-status",
+    )
+    if sum("|" in line for line in output.splitlines()) < min_commits:
+        output = run("log", "--all", f"-{min_commits}", log_format, "--name-status")
+    run("rev-parse", "--abbrev-ref", "HEAD")
+    return output
+
+
+@pytest.mark.performance
+def test_activity_analysis_benchmark(tmp_path):
+    """Processes and wall time on a 50k-commit, low-velocity history."""
+    ages = [400 - i * 0.007 for i in range(50_000)] + [3, 2, 1]
+    repo = make_git_repo(tmp_path / "big", ages, authors=20)
+
+    def timed(func, runs=5):
+        samples = []
+        with count_processes() as started:
+            for _ in range(runs):
+                started_at = time.perf_counter()
+                func()
+                samples.append(time.perf_counter() - started_at)
+        return min(samples), len(started) / runs
+
+    legacy, legacy_procs = timed(lambda: legacy_analyze(str(repo)))
+    cold, cold_procs = timed(
+        lambda: GitActivityAnalyzer(repo).analyze() and get_current_branch(str(repo))
+    )
+    analyze_recent_activity(str(repo))
+    warm, warm_procs = timed(
+        lambda: analyze_recent_activity(str(repo)) and get_current_branch(str(repo))
+    )
+
+    print(
+        f"\nlegacy: {legacy * 1e3:.1f} ms, {legacy_procs:.0f} processes"
+        f"\ncold:   {cold * 1e3:.1f} ms, {cold_procs:.0f} processes"
+        f"\nwarm:   {warm * 1e3:.1f} ms, {warm_procs:.0f} processes"
+    )
+    assert (legacy_procs, cold_procs, warm_procs) == (4, 1, 0)
+    assert warm < cold
+    assert warm < legacy